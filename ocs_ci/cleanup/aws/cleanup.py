@@ -5,6 +5,7 @@ import datetime
 import threading
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from botocore.exceptions import ClientError
 from ocs_ci.framework import config
@@ -28,6 +29,7 @@ from ocs_ci.utility.aws import (
 )
 
 from ocs_ci.cleanup.aws import defaults
+from ocs_ci.cleanup.aws.inventory import AWSInventory, get_tag
 
 
 FORMAT = "%(asctime)s - %(threadName)s - %(name)s - %(levelname)s - %(message)s"
@@ -35,7 +37,66 @@ logging.basicConfig(format=FORMAT, level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
-def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
+def get_stack_names(aws, cluster_name, stack_types, inventory=None):
+    """
+    Get names of the existing cloudformation stacks of the cluster
+
+    Args:
+        aws (AWS): AWS object
+        cluster_name (str): Name of the cluster
+        stack_types (list): Suffixes of the stacks, e.g. ['ma', 'bs']
+        inventory (AWSInventory): Snapshot of the resources, the stacks are
+            described one by one without it
+
+    Returns:
+        list: Names of the stacks
+
+    """
+    if inventory is not None:
+        return inventory.get_stack_names(cluster_name, stack_types)
+    stack_names = list()
+    for stack_type in stack_types:
+        pattern = f"{cluster_name}-{stack_type}"
+        try:
+            stack_names.append(aws.get_cloudformation_stacks(pattern)[0]["StackName"])
+        except ClientError:
+            continue
+    return stack_names
+
+
+def get_worker_stack_names(aws, cluster_name, inventory=None):
+    """
+    Get names of the cloudformation stacks of the workers of the cluster
+
+    Args:
+        aws (AWS): AWS object
+        cluster_name (str): Name of the cluster
+        inventory (AWSInventory): Snapshot of the resources, the stacks are
+            described one by one without it
+
+    Returns:
+        list: Names of the stacks
+
+    """
+    if inventory is not None:
+        return inventory.get_worker_stack_names(cluster_name)
+    stack_names = list()
+    worker_index = 0
+    worker_stack_exists = True
+    while worker_stack_exists:
+        try:
+            stack_names.append(
+                aws.get_cloudformation_stacks(
+                    pattern=f"{cluster_name}-no{worker_index}"
+                )[0]["StackName"]
+            )
+            worker_index += 1
+        except ClientError:
+            worker_stack_exists = False
+    return stack_names
+
+
+def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None, inventory=None):
     """
     Cleanup existing cluster in AWS
 
@@ -45,6 +106,9 @@ def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
         upi (bool): True for UPI cluster, False otherwise
         failed_deletions (list): list of clusters we failed to delete, used
             for reporting purposes
+        inventory (AWSInventory): Snapshot of the resources of the region, used
+            to find the volumes and stacks of UPI cluster instead of looking
+            them up
 
     """
     data = {"cluster_name": cluster_name, "cluster_id": cluster_id}
@@ -64,34 +128,20 @@ def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
         if rhel_workers:
             terminate_rhel_workers(rhel_workers)
         # Destroy extra volumes
-        destroy_volumes(cluster_name)
-        aws.delete_apps_record_set(cluster_name)
-
-        stack_names = list()
-        # Get master, bootstrap and security group stacks
-        for stack_type in ["ma", "bs", "sg"]:
-            try:
-                stack_names.append(
-                    aws.get_cloudformation_stacks(
-                        pattern=f"{cluster_name}-{stack_type}"
-                    )[0]["StackName"]
-                )
-            except ClientError:
-                continue
+        if inventory is not None:
+            destroy_volumes(
+                cluster_name,
+                inventory.get_volumes_by_name_pattern(f"{cluster_name}*"),
+            )
+        else:
+            destroy_volumes(cluster_name)
+        if inventory is None or inventory.has_hosted_zone(cluster_name):
+            aws.delete_apps_record_set(cluster_name)
 
-        # Get the worker stacks
-        worker_index = 0
-        worker_stack_exists = True
-        while worker_stack_exists:
-            try:
-                stack_names.append(
-                    aws.get_cloudformation_stacks(
-                        pattern=f"{cluster_name}-no{worker_index}"
-                    )[0]["StackName"]
-                )
-                worker_index += 1
-            except ClientError:
-                worker_stack_exists = False
+        # Get master, bootstrap and security group stacks and the worker stacks
+        stack_names = get_stack_names(
+            aws, cluster_name, ["ma", "bs", "sg"], inventory
+        ) + get_worker_stack_names(aws, cluster_name, inventory)
 
         logger.info(f"Deleting stacks: {stack_names}")
         aws.delete_cloudformation_stacks(stack_names)
@@ -100,20 +150,12 @@ def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
         logger.info(f"cleaning up {cluster_id}")
         destroy_cluster(installer=oc_bin, cluster_path=cleanup_path)
 
-        for stack_type in ["inf", "vpc"]:
-            try:
-                stack_names.append(
-                    aws.get_cloudformation_stacks(
-                        pattern=f"{cluster_name}-{stack_type}"
-                    )[0]["StackName"]
-                )
-            except ClientError:
-                continue
+        stack_names += get_stack_names(aws, cluster_name, ["inf", "vpc"], inventory)
         try:
             aws.delete_cloudformation_stacks(stack_names)
         except StackStatusError:
             logger.error("Failed to fully destroy cluster %s", cluster_name)
-            if failed_deletions:
+            if failed_deletions is not None:
                 failed_deletions.append(cluster_name)
             raise
     else:
@@ -122,14 +164,14 @@ def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
             destroy_cluster(installer=oc_bin, cluster_path=cleanup_path)
         except CommandFailed:
             logger.error("Failed to fully destroy cluster %s", cluster_name)
-            if failed_deletions:
+            if failed_deletions is not None:
                 failed_deletions.append(cluster_name)
             raise
 
     delete_cluster_buckets(cluster_name)
 
 
-def get_clusters(time_to_delete, region_name, prefixes_hours_to_spare):
+def get_clusters(time_to_delete, region_name, prefixes_hours_to_spare, inventory=None):
     """
     Get all cluster names that their EC2 instances running time is greater
     than the specified time to delete
@@ -141,6 +183,8 @@ def get_clusters(time_to_delete, region_name, prefixes_hours_to_spare):
         prefixes_hours_to_spare (dict): Dictionaries of the cluster prefixes to spare
             along with the maximum time in hours that is allowed for spared
             clusters to continue running
+        inventory (AWSInventory): Snapshot of the resources of the region,
+            taken by default
 
     Returns:
         tuple: List of the cluster names (e.g ebenahar-cluster-gqtd4) to be provided to the
@@ -153,7 +197,7 @@ def get_clusters(time_to_delete, region_name, prefixes_hours_to_spare):
         for instance in ec2_instances:
             allowed_running_time = time_to_delete
             do_not_delete = False
-            if instance.state["Name"] == "running":
+            if instance["State"]["Name"] == "running":
                 for prefix, hours in prefixes_hours_to_spare.items():
                     # case insensitive 'startswith'
                     if bool(re.match(prefix, cluster_name, re.I)):
@@ -169,40 +213,35 @@ def get_clusters(time_to_delete, region_name, prefixes_hours_to_spare):
                     )
                     return False
                 else:
-                    launch_time = instance.launch_time
+                    launch_time = instance["LaunchTime"]
                     current_time = datetime.datetime.now(launch_time.tzinfo)
                     running_time = current_time - launch_time
                     logger.info(
-                        f"Instance {[tag['Value'] for tag in instance.tags if tag['Key'] == 'Name'][0]} "
-                        f"(id: {instance.id}) running time is {running_time} hours while the allowed"
+                        f"Instance {get_tag(instance, 'Name')} "
+                        f"(id: {instance['InstanceId']}) running time is {running_time} hours while the allowed"
                         f" running time for it is {allowed_running_time/3600} hours"
                     )
                     if running_time.total_seconds() > allowed_running_time:
                         return True
         return False
 
-    aws = AWS(region_name=region_name)
+    if inventory is None:
+        inventory = AWSInventory.snapshot(AWS(region_name=region_name))
     clusters_to_delete = list()
     remaining_clusters = list()
     cloudformation_vpc_names = list()
-    vpcs = aws.ec2_client.describe_vpcs()["Vpcs"]
-    vpc_ids = [vpc["VpcId"] for vpc in vpcs]
-    vpc_objs = [aws.ec2_resource.Vpc(vpc_id) for vpc_id in vpc_ids]
-    for vpc_obj in vpc_objs:
-        vpc_tags = vpc_obj.tags
-        if vpc_tags:
-            cloudformation_vpc_name = [
-                tag["Value"] for tag in vpc_tags if tag["Key"] == AWS_CLOUDFORMATION_TAG
-            ]
+    for vpc in inventory.vpcs:
+        if vpc.get("Tags"):
+            cloudformation_vpc_name = get_tag(vpc, AWS_CLOUDFORMATION_TAG)
             if cloudformation_vpc_name:
-                cloudformation_vpc_names.append(cloudformation_vpc_name[0])
+                cloudformation_vpc_names.append(cloudformation_vpc_name)
                 continue
-            vpc_name = [tag["Value"] for tag in vpc_tags if tag["Key"] == "Name"][0]
-            cluster_name = vpc_name.replace("-vpc", "")
-            vpc_instances = vpc_obj.instances.all()
-            if not vpc_instances:
-                clusters_to_delete.append(cluster_name)
+            vpc_name = get_tag(vpc, "Name")
+            if not vpc_name:
+                logger.info(f"No Name tag found for VPC {vpc['VpcId']}")
                 continue
+            cluster_name = vpc_name.replace("-vpc", "")
+            vpc_instances = inventory.instances_by_vpc[vpc["VpcId"]]
 
             # Append to clusters_to_delete if cluster should be deleted
             if determine_cluster_deletion(vpc_instances, cluster_name):
@@ -215,32 +254,19 @@ def get_clusters(time_to_delete, region_name, prefixes_hours_to_spare):
     # Get all cloudformation based clusters to delete
     cf_clusters_to_delete = list()
     for vpc_name in cloudformation_vpc_names:
-        instance_dicts = aws.get_instances_by_name_pattern(
+        ec2_instances = inventory.get_instances_by_name_pattern(
             f"{vpc_name.replace('-vpc', '')}*"
         )
-        ec2_instances = [
-            aws.get_ec2_instance(instance_dict["id"])
-            for instance_dict in instance_dicts
-        ]
         if not ec2_instances:
             continue
-        cluster_io_tag = None
-        for instance in ec2_instances:
-            cluster_io_tag = [
-                tag["Key"]
-                for tag in instance.tags
-                if "kubernetes.io/cluster" in tag["Key"]
-            ]
-            if cluster_io_tag:
-                break
-        if not cluster_io_tag:
+        cluster_name = inventory.get_cluster_name(ec2_instances)
+        if not cluster_name:
             logger.warning(
                 "Unable to find valid cluster IO tag from ec2 instance tags "
                 "for VPC %s. This is probably not an OCS cluster VPC!",
                 vpc_name,
             )
             continue
-        cluster_name = cluster_io_tag[0].replace("kubernetes.io/cluster/", "")
         if determine_cluster_deletion(ec2_instances, cluster_name):
             cf_clusters_to_delete.append(cluster_name)
         else:
@@ -249,6 +275,38 @@ def get_clusters(time_to_delete, region_name, prefixes_hours_to_spare):
     return clusters_to_delete, cf_clusters_to_delete, remaining_clusters
 
 
+def delete_clusters(clusters, upi=False, failed_deletions=None, inventory=None):
+    """
+    Delete the clusters in parallel
+
+    Args:
+        clusters (list): Cluster ids, e.g. ebenahar-cluster-gqtd4
+        upi (bool): True for UPI clusters, False otherwise
+        failed_deletions (list): list of clusters we failed to delete, used
+            for reporting purposes
+        inventory (AWSInventory): Snapshot of the resources of the region
+
+    """
+    if not clusters:
+        return
+    with ThreadPoolExecutor(
+        max_workers=defaults.MAX_PARALLEL_DELETIONS, thread_name_prefix="cleanup"
+    ) as executor:
+        futures = dict()
+        for cluster in clusters:
+            cluster_name = cluster.rsplit("-", 1)[0]
+            logger.info(f"Deleting {'UPI ' if upi else ''}cluster {cluster_name}")
+            future = executor.submit(
+                cleanup, cluster_name, cluster, upi, failed_deletions, inventory
+            )
+            futures[future] = cluster
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception:
+                logger.exception(f"Failed to delete cluster {futures[future]}")
+
+
 def cluster_cleanup():
     parser = argparse.ArgumentParser(description="Cleanup AWS Resource")
     parser.add_argument(
@@ -338,10 +396,12 @@ def aws_cleanup():
 
     time_to_delete = args.hours * 60 * 60
     region = defaults.AWS_REGION if not args.region else args.region
+    inventory = AWSInventory.snapshot(AWS(region_name=region))
     clusters_to_delete, cf_clusters_to_delete, remaining_clusters = get_clusters(
         time_to_delete=time_to_delete,
         region_name=region,
         prefixes_hours_to_spare=prefixes_hours_to_spare,
+        inventory=inventory,
     )
 
     if not clusters_to_delete:
@@ -349,28 +409,9 @@ def aws_cleanup():
     else:
         logger.info("Deleting clusters: %s", clusters_to_delete)
         get_openshift_installer()
-    procs = []
     failed_deletions = []
-    for cluster in clusters_to_delete:
-        cluster_name = cluster.rsplit("-", 1)[0]
-        logger.info(f"Deleting cluster {cluster_name}")
-        proc = threading.Thread(
-            target=cleanup, args=(cluster_name, cluster, False, failed_deletions)
-        )
-        proc.start()
-        procs.append(proc)
-    for p in procs:
-        p.join()
-    for cluster in cf_clusters_to_delete:
-        cluster_name = cluster.rsplit("-", 1)[0]
-        logger.info(f"Deleting UPI cluster {cluster_name}")
-        proc = threading.Thread(
-            target=cleanup, args=(cluster_name, cluster, True, failed_deletions)
-        )
-        proc.start()
-        procs.append(proc)
-    for p in procs:
-        p.join()
+    delete_clusters(clusters_to_delete, False, failed_deletions, inventory)
+    delete_clusters(cf_clusters_to_delete, True, failed_deletions, inventory)
     logger.info("Remaining clusters: %s", remaining_clusters)
     filename = "failed_cluster_deletions.txt"
     content = "None\n"
@@ -15,3 +15,4 @@ CLUSTER_PREFIXES_SPECIAL_RULES = {
 }
 MINIMUM_CLUSTER_RUNNING_TIME = 10
 CONFIRMATION_ANSWER = "yes-i-am-sure-i-want-to-proceed"
+MAX_PARALLEL_DELETIONS = 10
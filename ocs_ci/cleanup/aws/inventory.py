@@ -0,0 +1,195 @@
+"""
+Indexed snapshot of the AWS resources of the clusters in a region
+"""
+import fnmatch
+import logging
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+
+def get_tag(resource, key):
+    """
+    Get value of a tag of a resource
+
+    Args:
+        resource (dict): the resource as described by boto3, with 'Tags'
+        key (str): key of the tag
+
+    Returns:
+        str: value of the tag, None if the resource doesn't have it
+
+    """
+    for tag in resource.get("Tags") or []:
+        if tag["Key"] == key:
+            return tag["Value"]
+    return None
+
+
+def paginate(client, operation, key, **kwargs):
+    """
+    Iterate over the items of all pages of a boto3 operation
+
+    Args:
+        client (boto3.client): the client
+        operation (str): the operation, e.g. 'describe_instances'
+        key (str): key of the items in the pages, e.g. 'Reservations'
+        kwargs (dict): parameters of the operation
+
+    Yields:
+        dict: the items
+
+    """
+    for page in client.get_paginator(operation).paginate(**kwargs):
+        for item in page.get(key, []):
+            yield item
+
+
+class AWSInventory(object):
+    """
+    Snapshot of the AWS resources of a region, indexed by VPC and cluster
+    """
+
+    def __init__(self, instances=(), vpcs=(), volumes=(), stacks=(), hosted_zones=()):
+        """
+        Initializer function
+
+        Args:
+            instances (list): instances as described by describe_instances
+            vpcs (list): VPCs as described by describe_vpcs
+            volumes (list): volumes as described by describe_volumes
+            stacks (list): stacks as described by describe_stacks
+            hosted_zones (list): hosted zones as described by
+                list_hosted_zones
+
+        """
+        self.instances = list(instances)
+        self.vpcs = list(vpcs)
+        self.volumes = list(volumes)
+        self.stacks = {stack["StackName"]: stack for stack in stacks}
+        self.hosted_zones = list(hosted_zones)
+        self.instances_by_vpc = defaultdict(list)
+        for instance in self.instances:
+            self.instances_by_vpc[instance.get("VpcId")].append(instance)
+
+    @classmethod
+    def snapshot(cls, aws):
+        """
+        Take the snapshot of the resources
+
+        Args:
+            aws (AWS): AWS object of the region
+
+        Returns:
+            AWSInventory: the snapshot
+
+        """
+        ec2_client = aws.ec2_client
+        instances = [
+            instance
+            for reservation in paginate(
+                ec2_client, "describe_instances", "Reservations"
+            )
+            for instance in reservation["Instances"]
+        ]
+        inventory = cls(
+            instances=instances,
+            vpcs=paginate(ec2_client, "describe_vpcs", "Vpcs"),
+            volumes=paginate(ec2_client, "describe_volumes", "Volumes"),
+            stacks=paginate(aws.cf_client, "describe_stacks", "Stacks"),
+            hosted_zones=paginate(
+                aws.route53_client, "list_hosted_zones", "HostedZones"
+            ),
+        )
+        logger.info(
+            f"AWS inventory: {len(inventory.instances)} instances, "
+            f"{len(inventory.vpcs)} VPCs, {len(inventory.volumes)} volumes, "
+            f"{len(inventory.stacks)} stacks, "
+            f"{len(inventory.hosted_zones)} hosted zones"
+        )
+        return inventory
+
+    def get_instances_by_name_pattern(self, pattern):
+        """
+        Args:
+            pattern (str): pattern of the Name tag, e.g. 'cluster-55jx2*'
+
+        Returns:
+            list: the instances with matching Name tag
+        """
+        return [
+            instance
+            for instance in self.instances
+            if fnmatch.fnmatchcase(get_tag(instance, "Name") or "", pattern)
+        ]
+
+    def get_volumes_by_name_pattern(self, pattern):
+        """
+        Args:
+            pattern (str): pattern of the Name tag, e.g. 'cluster-55jx2*'
+
+        Returns:
+            list: id and attachments of the volumes with matching Name tag,
+                like AWS.get_volumes_by_name_pattern
+        """
+        return [
+            dict(id=volume["VolumeId"], attachments=volume["Attachments"])
+            for volume in self.volumes
+            if fnmatch.fnmatchcase(get_tag(volume, "Name") or "", pattern)
+        ]
+
+    def get_stack_names(self, cluster_name, stack_types):
+        """
+        Args:
+            cluster_name (str): name of the cluster
+            stack_types (list): suffixes of the stacks, e.g. ['ma', 'bs']
+
+        Returns:
+            list: names of the existing stacks of the cluster
+        """
+        return [
+            f"{cluster_name}-{stack_type}"
+            for stack_type in stack_types
+            if f"{cluster_name}-{stack_type}" in self.stacks
+        ]
+
+    def get_worker_stack_names(self, cluster_name):
+        """
+        Args:
+            cluster_name (str): name of the cluster
+
+        Returns:
+            list: names of the worker stacks of the cluster, cluster-no0,
+                cluster-no1, ... up to the first missing one
+        """
+        stack_names = []
+        while f"{cluster_name}-no{len(stack_names)}" in self.stacks:
+            stack_names.append(f"{cluster_name}-no{len(stack_names)}")
+        return stack_names
+
+    def get_cluster_name(self, instances):
+        """
+        Args:
+            instances (list): instances of a cluster
+
+        Returns:
+            str: name of the cluster from the kubernetes.io/cluster tag of the
+                instances, None if none of them has it
+        """
+        for instance in instances:
+            for tag in instance.get("Tags") or []:
+                if tag["Key"].startswith("kubernetes.io/cluster/"):
+                    return tag["Key"].replace("kubernetes.io/cluster/", "")
+        return None
+
+    def has_hosted_zone(self, cluster_name):
+        """
+        Args:
+            cluster_name (str): name of the cluster
+
+        Returns:
+            bool: True if there is a hosted zone of the cluster
+        """
+        return any(
+            zone["Name"].startswith(f"{cluster_name}.") for zone in self.hosted_zones
+        )
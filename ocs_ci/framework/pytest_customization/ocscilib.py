@@ -29,6 +29,12 @@ from ocs_ci.ocs.exceptions import (
     ChannelNotFound,
     ResourceInUnexpectedState,
 )
+from ocs_ci.ocs.fio_harvester import stop_fio_harvester
+from ocs_ci.ocs.log_collection import (
+    get_log_collection_service,
+    stop_log_collection_service,
+)
+from ocs_ci.ocs.log_follower import stop_log_follow_service
 from ocs_ci.ocs.resources.ocs import get_ocs_csv, get_version_info
 from ocs_ci.ocs.utils import collect_ocs_logs, collect_prometheus_metrics
 from ocs_ci.utility.utils import (
@@ -41,7 +47,9 @@ from ocs_ci.utility.utils import (
     get_ocs_build_number,
     get_testrun_name,
     load_config_file,
+    ocsci_log_path,
 )
+from ocs_ci.utility.workloads.provisioning import report_setup_times
 
 __all__ = [
     "pytest_addoption",
@@ -517,9 +525,15 @@ def pytest_runtest_makereport(item, call):
         )
         try:
             if not ocsci_config.RUN.get("is_ocp_deployment_failed"):
-                collect_ocs_logs(
-                    dir_name=test_case_name, ocp=ocp_logs_collection, mcg=mcg
-                )
+                if ocsci_config.REPORTING.get("log_collection_background"):
+                    # the gathers run while the next tests run
+                    get_log_collection_service().submit(
+                        dir_name=test_case_name, ocp=ocp_logs_collection, mcg=mcg
+                    )
+                else:
+                    collect_ocs_logs(
+                        dir_name=test_case_name, ocp=ocp_logs_collection, mcg=mcg
+                    )
         except Exception:
             log.exception("Failed to collect OCS logs")
 
@@ -552,6 +566,18 @@ def pytest_runtest_makereport(item, call):
             log.exception("Failed to collect performance stats")
 
 
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Wait for the log gathers of failed tests running in background, stop
+    harvesting results of detached fio and following the workload logs and
+    report the workload setup times
+    """
+    stop_log_collection_service()
+    stop_fio_harvester()
+    stop_log_follow_service()
+    report_setup_times(ocsci_log_path())
+
+
 def set_report_portal_config(config):
     """
     Add settings for report portal like description and tags for the launch.
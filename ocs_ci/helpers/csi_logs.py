@@ -0,0 +1,261 @@
+"""
+Index of the provisioning and deletion events from csi-provisioner logs
+
+The creation and deletion time measurements need the time of 'started' and
+'succeeded' log lines of many PVCs/PVs. Instead of searching all the log lines
+for every PVC, the logs are parsed once into an index of the events per name,
+and only the new lines are fetched (via --since-time) when the index is
+updated later.
+"""
+import datetime
+import logging
+import re
+import time
+from collections import defaultdict
+
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+from ocs_ci.ocs.resources import pod
+
+
+logger = logging.getLogger(__name__)
+
+PROVISION = "provision"
+DELETE = "delete"
+STARTED = "started"
+SUCCEEDED = "succeeded"
+
+TIME_FORMAT = "%H:%M:%S.%f"
+
+# optional RFC3339 timestamp added by --timestamps, then the klog header,
+# e.g. 'I0324 10:15:02.123456       1 controller.go:1332] '
+LINE_RE = re.compile(
+    r"^(?:(?P<timestamp>\d{4}-\d\d-\d\dT\S+) )?"
+    r"[IWEF]\d{4} (?P<time>\d\d:\d\d:\d\d\.\d+)\s"
+)
+# e.g. 'provision "namespace/pvc-name" class "sc-name": started'
+PROVISION_RE = re.compile(
+    r'provision "(?P<name>[^"]+)" class "[^"]*": (?P<status>started|succeeded)'
+)
+# e.g. 'delete "pvc-0b0c5c0f-...": succeeded'
+DELETE_RE = re.compile(r'delete "(?P<name>[^"]+)": (?P<status>started|succeeded)')
+
+
+def normalize_timestamp(timestamp):
+    """
+    Pad the fraction of RFC3339 timestamp to nanoseconds, so the timestamps
+    can be compared as strings (kubelet trims the trailing zeros)
+
+    Args:
+        timestamp (str): e.g. '2021-03-24T10:15:02.1234Z'
+
+    Returns:
+        str: e.g. '2021-03-24T10:15:02.123400000Z'
+
+    """
+    timestamp = timestamp.rstrip("Z")
+    seconds, _, fraction = timestamp.partition(".")
+    return f"{seconds}.{fraction:0<9}Z"
+
+
+class ProvisionerLogIndex(object):
+    """
+    Times of the provision and delete events found in csi-provisioner logs,
+    indexed by the PVC (provision) or PV (delete) name
+    """
+
+    def __init__(self, interface=None, container="csi-provisioner"):
+        """
+        Initializer function
+
+        Args:
+            interface (str): The interface of the provisioner pods, the logs
+                are only fed via feed method when not provided
+            container (str): The container of the provisioner pods
+
+        """
+        self.interface = interface
+        self.container = container
+        # (operation, status) -> name -> list of datetime objects
+        self.events = defaultdict(lambda: defaultdict(list))
+        self.lines_parsed = 0
+        # pod name -> (last timestamp, lines with that timestamp)
+        self._positions = {}
+
+    def feed(self, lines):
+        """
+        Parse the log lines and add their events to the index
+
+        Args:
+            lines (iterable): log lines, with or without RFC3339 timestamps
+
+        """
+        for line in lines:
+            self.lines_parsed += 1
+            # cheap checks first, most of the lines are not interesting
+            if PROVISION in line:
+                match = PROVISION_RE.search(line)
+                operation = PROVISION
+            elif DELETE in line:
+                match = DELETE_RE.search(line)
+                operation = DELETE
+            else:
+                continue
+            if not match:
+                continue
+            header = LINE_RE.match(line)
+            if not header:
+                continue
+            event_time = datetime.datetime.strptime(header.group("time"), TIME_FORMAT)
+            name = match.group("name")
+            events = self.events[(operation, match.group("status"))]
+            events[name].append(event_time)
+            if operation == PROVISION and "/" in name:
+                # PVCs are looked up by name without namespace as well
+                events[name.split("/", 1)[1]].append(event_time)
+
+    def _new_lines(self, pod_name, logs):
+        """
+        Lines of the logs fetched since the last position, without the lines
+        already parsed in the previous update
+        """
+        last_timestamp, seen = self._positions.get(pod_name, (None, set()))
+        new_lines = []
+        for line in logs.splitlines():
+            timestamp = normalize_timestamp(line.split(" ", 1)[0])
+            if last_timestamp and (
+                timestamp < last_timestamp
+                or (timestamp == last_timestamp and line in seen)
+            ):
+                continue
+            if timestamp != last_timestamp:
+                last_timestamp, seen = timestamp, set()
+            seen.add(line)
+            new_lines.append(line)
+        self._positions[pod_name] = (last_timestamp, seen)
+        return new_lines
+
+    def update(self):
+        """
+        Fetch the new log lines of the provisioner pods and add them to the
+        index
+        """
+        for pod_name in pod.get_csi_provisioner_pod(self.interface):
+            since_time = self._positions.get(pod_name, (None,))[0]
+            logs = pod.get_pod_logs(
+                pod_name, self.container, since_time=since_time, timestamps=True
+            )
+            new_lines = self._new_lines(pod_name, logs)
+            logger.debug(f"Parsing {len(new_lines)} new log lines of {pod_name}")
+            self.feed(new_lines)
+
+    def get_times(self, name, operation, status):
+        """
+        Get times of the event of the PVC or PV
+
+        Args:
+            name (str): PVC name (provision) or PV name (delete)
+            operation (str): PROVISION or DELETE
+            status (str): STARTED or SUCCEEDED
+
+        Returns:
+            list: datetime objects in the order as logged
+
+        """
+        return self.events[(operation, status)].get(name, [])
+
+    def get_time(self, name, operation, status, last=False):
+        """
+        Get time of the first (or last) event of the PVC or PV
+
+        Args:
+            name (str): PVC name (provision) or PV name (delete)
+            operation (str): PROVISION or DELETE
+            status (str): STARTED or SUCCEEDED
+            last (bool): True to get the time of the last event, the
+                'succeeded' line may be logged several times
+
+        Returns:
+            datetime: time of the event
+
+        Raises:
+            UnexpectedBehaviour: In case the event isn't in the logs
+
+        """
+        times = self.get_times(name, operation, status)
+        if not times:
+            raise UnexpectedBehaviour(
+                f"No '{operation} {status}' event of {name} found in "
+                f"{self.container} logs"
+            )
+        return times[-1] if last else times[0]
+
+    def missing(self, names, operation):
+        """
+        Get the names which don't have both started and succeeded events
+
+        Args:
+            names (list): PVC names (provision) or PV names (delete)
+            operation (str): PROVISION or DELETE
+
+        Returns:
+            list: names without complete data in the index
+
+        """
+        return [
+            name
+            for name in names
+            if not self.get_times(name, operation, STARTED)
+            or not self.get_times(name, operation, SUCCEEDED)
+        ]
+
+    def wait_for(self, names, operation, wait_time=60, attempts=3):
+        """
+        Update the index till all the names have complete data
+
+        Args:
+            names (list): PVC names (provision) or PV names (delete)
+            operation (str): PROVISION or DELETE
+            wait_time (int): Seconds to wait before every update, due to
+                some delay in CSI log generation
+            attempts (int): Number of the updates after the first one
+
+        Raises:
+            UnexpectedBehaviour: In case some names are still missing
+
+        """
+        time.sleep(wait_time)
+        self.update()
+        for _ in range(attempts):
+            missing = self.missing(names, operation)
+            if not missing:
+                return
+            logger.info(
+                f"Count of names without CSI {operation} log data {len(missing)}"
+            )
+            time.sleep(wait_time)
+            self.update()
+        missing = self.missing(names, operation)
+        if missing:
+            raise UnexpectedBehaviour(
+                f"There is no {operation} data in CSI logs for {missing}"
+            )
+
+    def measure(self, names, operation):
+        """
+        Get time between the first started and the first succeeded event
+
+        Args:
+            names (list): PVC names (provision) or PV names (delete)
+            operation (str): PROVISION or DELETE
+
+        Returns:
+            dict: name to the measured time in seconds
+
+        """
+        return {
+            name: (
+                self.get_time(name, operation, SUCCEEDED)
+                - self.get_time(name, operation, STARTED)
+            ).total_seconds()
+            for name in names
+        }
@@ -8,18 +8,16 @@ import json
 import logging
 import os
 import re
-import statistics
 import tempfile
-import threading
 import time
 import inspect
-from concurrent.futures import ThreadPoolExecutor
 from subprocess import PIPE, TimeoutExpired, run
 from uuid import uuid4
 
 import yaml
 
 from ocs_ci.framework import config
+from ocs_ci.helpers import csi_logs
 from ocs_ci.helpers.proxy import (
     get_cluster_proxies,
     update_container_with_proxy_env,
@@ -33,10 +31,12 @@ from ocs_ci.ocs.exceptions import (
     UnavailableBuildException,
     UnexpectedBehaviour,
 )
+from ocs_ci.ocs.node_metrics import get_node_metrics_collector
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources import pod, pvc
 from ocs_ci.ocs.resources.ocs import OCS
-from ocs_ci.utility import templating
+from ocs_ci.utility import node_metrics_analysis, templating
+from ocs_ci.utility.execution_pool import ExecutionPool
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import (
     TimeoutSampler,
@@ -267,6 +267,13 @@ def create_pod(
     if sa_name and dc_deployment:
         pod_data["spec"]["template"]["spec"]["serviceAccountName"] = sa_name
 
+    # app pods running an image with fio don't need to install it
+    io_pod_image = config.RUN.get("io_pod_image")
+    if io_pod_image and not dc_deployment:
+        container = pod_data["spec"]["containers"][0]
+        if container["image"] == constants.NGINX_IMAGE:
+            container["image"] = io_pod_image
+
     # overwrite used image (required for disconnected installation)
     update_container_with_mirrored_image(pod_data)
 
@@ -1244,7 +1251,7 @@ def measure_snapshot_creation_time(interface, snap_name, snap_con_name):
         return None
 
 
-def get_provision_time(interface, pvc_name, status="start"):
+def get_provision_time(interface, pvc_name, status="start", log_index=None):
     """
     Get the starting/ending creation time of a PVC based on provisioner logs
 
@@ -1253,95 +1260,75 @@ def get_provision_time(interface, pvc_name, status="start"):
         pvc_name (str / list): Name of the PVC(s) for creation time
                                the list will be list of pvc objects
         status (str): the status that we want to get - Start / End
+        log_index (ProvisionerLogIndex): Index of the provisioner logs,
+            fetched from the provisioner pods if not provided
 
     Returns:
         datetime object: Time of PVC(s) creation
 
     """
     # Define the status that need to retrieve
-    operation = "started"
+    operation = csi_logs.STARTED
     if status.lower() == "end":
-        operation = "succeeded"
-
-    format = "%H:%M:%S.%f"
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
+        operation = csi_logs.SUCCEEDED
 
-    logs = logs.split("\n")
+    if log_index is None:
+        log_index = csi_logs.ProvisionerLogIndex(interface)
+        log_index.update()
     # Extract the time for the one PVC provisioning
     if isinstance(pvc_name, str):
-        stat = [i for i in logs if re.search(f"provision.*{pvc_name}.*{operation}", i)]
-        stat = stat[0].split(" ")[1]
+        return log_index.get_time(pvc_name, csi_logs.PROVISION, operation)
     # Extract the time for the list of PVCs provisioning
-    if isinstance(pvc_name, list):
-        all_stats = []
-        for pv_name in pvc_name:
-            name = pv_name.name
-            stat = [i for i in logs if re.search(f"provision.*{name}.*{operation}", i)]
-            stat = stat[0].split(" ")[1]
-            all_stats.append(stat)
-        all_stats = sorted(all_stats)
-        if status.lower() == "end":
-            stat = all_stats[-1]  # return the highest time
-        elif status.lower() == "start":
-            stat = all_stats[0]  # return the lowest time
-    return datetime.datetime.strptime(stat, format)
+    all_stats = sorted(
+        log_index.get_time(pvc_obj.name, csi_logs.PROVISION, operation)
+        for pvc_obj in pvc_name
+    )
+    if status.lower() == "end":
+        return all_stats[-1]  # return the highest time
+    return all_stats[0]  # return the lowest time
 
 
-def get_start_creation_time(interface, pvc_name):
+def get_start_creation_time(interface, pvc_name, log_index=None):
     """
     Get the starting creation time of a PVC based on provisioner logs
 
     Args:
         interface (str): The interface backed the PVC
         pvc_name (str): Name of the PVC for creation time measurement
+        log_index (ProvisionerLogIndex): Index of the provisioner logs,
+            fetched from the provisioner pods if not provided
 
     Returns:
         datetime object: Start time of PVC creation
 
     """
-    format = "%H:%M:%S.%f"
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
-    # Extract the starting time for the PVC provisioning
-    start = [i for i in logs if re.search(f"provision.*{pvc_name}.*started", i)]
-    start = start[0].split(" ")[1]
-    return datetime.datetime.strptime(start, format)
+    if log_index is None:
+        log_index = csi_logs.ProvisionerLogIndex(interface)
+        log_index.update()
+    return log_index.get_time(pvc_name, csi_logs.PROVISION, csi_logs.STARTED)
 
 
-def get_end_creation_time(interface, pvc_name):
+def get_end_creation_time(interface, pvc_name, log_index=None):
     """
     Get the ending creation time of a PVC based on provisioner logs
 
     Args:
         interface (str): The interface backed the PVC
         pvc_name (str): Name of the PVC for creation time measurement
+        log_index (ProvisionerLogIndex): Index of the provisioner logs,
+            fetched from the provisioner pods if not provided
 
     Returns:
         datetime object: End time of PVC creation
 
     """
-    format = "%H:%M:%S.%f"
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
-    # Extract the starting time for the PVC provisioning
-    end = [i for i in logs if re.search(f"provision.*{pvc_name}.*succeeded", i)]
+    if log_index is None:
+        log_index = csi_logs.ProvisionerLogIndex(interface)
+        log_index.update()
     # End provisioning string may appear in logs several times, take here the latest one
-    end = end[-1].split(" ")[1]
-    return datetime.datetime.strptime(end, format)
+    return log_index.get_time(
+        pvc_name, csi_logs.PROVISION, csi_logs.SUCCEEDED, last=True
+    )
 
 
 def measure_pvc_creation_time(interface, pvc_name):
@@ -1356,8 +1343,10 @@ def measure_pvc_creation_time(interface, pvc_name):
         float: Creation time for the PVC
 
     """
-    start = get_start_creation_time(interface=interface, pvc_name=pvc_name)
-    end = get_end_creation_time(interface=interface, pvc_name=pvc_name)
+    log_index = csi_logs.ProvisionerLogIndex(interface)
+    log_index.update()
+    start = get_start_creation_time(interface, pvc_name, log_index)
+    end = get_end_creation_time(interface, pvc_name, log_index)
     total = end - start
     return total.total_seconds()
 
@@ -1375,58 +1364,9 @@ def measure_pvc_creation_time_bulk(interface, pvc_name_list, wait_time=60):
         pvc_dict (dict): Dictionary of pvc_name with creation time.
 
     """
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # due to some delay in CSI log generation added wait
-    time.sleep(wait_time)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-    logs = logs.split("\n")
-
-    loop_counter = 0
-    while True:
-        no_data_list = list()
-        for name in pvc_name_list:
-            # check if PV data present in CSI logs
-            start = [i for i in logs if re.search(f"provision.*{name}.*started", i)]
-            end = [i for i in logs if re.search(f"provision.*{name}.*succeeded", i)]
-            if not start or not end:
-                no_data_list.append(name)
-
-        if no_data_list:
-            # Clear and get CSI logs after 60secs
-            logging.info(f"PVC count without CSI create log data {len(no_data_list)}")
-            logs.clear()
-            time.sleep(wait_time)
-            logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-            logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-            logs = logs.split("\n")
-            loop_counter += 1
-            if loop_counter >= 3:
-                logging.info("Waited for more than 3mins still no data")
-                raise UnexpectedBehaviour(
-                    f"There is no pvc creation data in CSI logs for {no_data_list}"
-                )
-            continue
-        else:
-            break
-
-    pvc_dict = dict()
-    format = "%H:%M:%S.%f"
-    for pvc_name in pvc_name_list:
-        # Extract the starting time for the PVC provisioning
-        start = [i for i in logs if re.search(f"provision.*{pvc_name}.*started", i)]
-        start = start[0].split(" ")[1]
-        start_time = datetime.datetime.strptime(start, format)
-        # Extract the end time for the PVC provisioning
-        end = [i for i in logs if re.search(f"provision.*{pvc_name}.*succeeded", i)]
-        end = end[0].split(" ")[1]
-        end_time = datetime.datetime.strptime(end, format)
-        total = end_time - start_time
-        pvc_dict[pvc_name] = total.total_seconds()
-
-    return pvc_dict
+    log_index = csi_logs.ProvisionerLogIndex(interface)
+    log_index.wait_for(pvc_name_list, csi_logs.PROVISION, wait_time)
+    return log_index.measure(pvc_name_list, csi_logs.PROVISION)
 
 
 def measure_pv_deletion_time_bulk(interface, pv_name_list, wait_time=60):
@@ -1442,110 +1382,49 @@ def measure_pv_deletion_time_bulk(interface, pv_name_list, wait_time=60):
         pv_dict (dict): Dictionary of pv_name with deletion time.
 
     """
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # due to some delay in CSI log generation added wait
-    time.sleep(wait_time)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-    logs = logs.split("\n")
-
-    loop_counter = 0
-    while True:
-        no_data_list = list()
-        for pv in pv_name_list:
-            # check if PV data present in CSI logs
-            start = [i for i in logs if re.search(f'delete "{pv}": started', i)]
-            end = [i for i in logs if re.search(f'delete "{pv}": succeeded', i)]
-            if not start or not end:
-                no_data_list.append(pv)
-
-        if no_data_list:
-            # Clear and get CSI logs after 60secs
-            logging.info(f"PV count without CSI delete log data {len(no_data_list)}")
-            logs.clear()
-            time.sleep(wait_time)
-            logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-            logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-            logs = logs.split("\n")
-            loop_counter += 1
-            if loop_counter >= 3:
-                logging.info("Waited for more than 3mins still no data")
-                raise UnexpectedBehaviour(
-                    f"There is no pv deletion data in CSI logs for {no_data_list}"
-                )
-            continue
-        else:
-            break
-
-    pv_dict = dict()
-    format = "%H:%M:%S.%f"
-    for pv_name in pv_name_list:
-        # Extract the deletion start time for the PV
-        start = [i for i in logs if re.search(f'delete "{pv_name}": started', i)]
-        start = start[0].split(" ")[1]
-        start_time = datetime.datetime.strptime(start, format)
-        # Extract the deletion end time for the PV
-        end = [i for i in logs if re.search(f'delete "{pv_name}": succeeded', i)]
-        end = end[0].split(" ")[1]
-        end_time = datetime.datetime.strptime(end, format)
-        total = end_time - start_time
-        pv_dict[pv_name] = total.total_seconds()
-
-    return pv_dict
+    log_index = csi_logs.ProvisionerLogIndex(interface)
+    log_index.wait_for(pv_name_list, csi_logs.DELETE, wait_time)
+    return log_index.measure(pv_name_list, csi_logs.DELETE)
 
 
-def get_start_deletion_time(interface, pv_name):
+def get_start_deletion_time(interface, pv_name, log_index=None):
     """
     Get the starting deletion time of a PVC based on provisioner logs
 
     Args:
         interface (str): The interface backed the PVC
-        pvc_name (str): Name of the PVC for deletion time measurement
+        pv_name (str): Name of the PV for deletion time measurement
+        log_index (ProvisionerLogIndex): Index of the provisioner logs,
+            fetched from the provisioner pods if not provided
 
     Returns:
         datetime object: Start time of PVC deletion
 
     """
-    format = "%H:%M:%S.%f"
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
-    # Extract the starting time for the PVC deletion
-    start = [i for i in logs if re.search(f'delete "{pv_name}": started', i)]
-    start = start[0].split(" ")[1]
-    return datetime.datetime.strptime(start, format)
+    if log_index is None:
+        log_index = csi_logs.ProvisionerLogIndex(interface)
+        log_index.update()
+    return log_index.get_time(pv_name, csi_logs.DELETE, csi_logs.STARTED)
 
 
-def get_end_deletion_time(interface, pv_name):
+def get_end_deletion_time(interface, pv_name, log_index=None):
     """
     Get the ending deletion time of a PVC based on provisioner logs
 
     Args:
         interface (str): The interface backed the PVC
-        pv_name (str): Name of the PVC for deletion time measurement
+        pv_name (str): Name of the PV for deletion time measurement
+        log_index (ProvisionerLogIndex): Index of the provisioner logs,
+            fetched from the provisioner pods if not provided
 
     Returns:
         datetime object: End time of PVC deletion
 
     """
-    format = "%H:%M:%S.%f"
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
-    # Extract the starting time for the PV deletion
-    end = [i for i in logs if re.search(f'delete "{pv_name}": succeeded', i)]
-    end = end[0].split(" ")[1]
-    return datetime.datetime.strptime(end, format)
+    if log_index is None:
+        log_index = csi_logs.ProvisionerLogIndex(interface)
+        log_index.update()
+    return log_index.get_time(pv_name, csi_logs.DELETE, csi_logs.SUCCEEDED)
 
 
 def measure_pvc_deletion_time(interface, pv_name):
@@ -1560,8 +1439,10 @@ def measure_pvc_deletion_time(interface, pv_name):
         float: Deletion time for the PVC
 
     """
-    start = get_start_deletion_time(interface=interface, pv_name=pv_name)
-    end = get_end_deletion_time(interface=interface, pv_name=pv_name)
+    log_index = csi_logs.ProvisionerLogIndex(interface)
+    log_index.update()
+    start = get_start_deletion_time(interface, pv_name, log_index)
+    end = get_end_deletion_time(interface, pv_name, log_index)
     total = end - start
     return total.total_seconds()
 
@@ -2065,7 +1946,7 @@ def create_multiple_pvc_parallel(sc_obj, namespace, number_of_pvc, size, access_
         pvc_objs_list (list): List of pvc objs created in function
     """
     obj_status_list, result_lists = ([] for i in range(2))
-    with ThreadPoolExecutor() as executor:
+    with ExecutionPool("create-pvcs") as executor:
         for mode in access_modes:
             result_lists.append(
                 executor.submit(
@@ -2080,7 +1961,7 @@ def create_multiple_pvc_parallel(sc_obj, namespace, number_of_pvc, size, access_
     result_list = [result.result() for result in result_lists]
     pvc_objs_list = converge_lists(result_list)
     # Check for all the pvcs in Bound state
-    with ThreadPoolExecutor() as executor:
+    with ExecutionPool("wait-for-pvcs") as executor:
         for objs in pvc_objs_list:
             obj_status_list.append(
                 executor.submit(wait_for_resource_state, objs, "Bound", 90)
@@ -2123,7 +2004,7 @@ def create_pods_parallel(
     wait_time = 300
     if raw_block_pv and not pod_dict_path:
         pod_dict_path = constants.CSI_RBD_RAW_BLOCK_POD_YAML
-    with ThreadPoolExecutor() as executor:
+    with ExecutionPool("create-pods") as executor:
         for pvc_obj in pvc_list:
             future_pod_objs.append(
                 executor.submit(
@@ -2142,7 +2023,7 @@ def create_pods_parallel(
     pod_objs = [pvc_obj.result() for pvc_obj in future_pod_objs]
     # Check for all the pods are in Running state
     # In above pod creation not waiting for the pod to be created because of threads usage
-    with ThreadPoolExecutor() as executor:
+    with ExecutionPool("wait-for-pods") as executor:
         for obj in pod_objs:
             future_pod_objs.append(
                 executor.submit(
@@ -2162,34 +2043,58 @@ def delete_objs_parallel(obj_list):
         obj_list(list): List can be obj of pod, pvc, etc
 
     Returns:
-        bool: True if obj deleted else False
+        bool: True if all objs deleted else False
 
     """
-    threads = list()
-    for obj in obj_list:
-        process = threading.Thread(target=obj.delete)
-        process.start()
-        threads.append(process)
-    for process in threads:
-        process.join()
-    return True
+    with ExecutionPool("delete-objs") as executor:
+        futures = [executor.submit(obj.delete) for obj in obj_list]
+    deleted = True
+    for obj, future in zip(obj_list, futures):
+        if future.exception():
+            logger.error(f"Failed to delete {obj.name}: {future.exception()}")
+            deleted = False
+    return deleted
+
+
+def _get_osd_rss_series():
+    """
+    Get RSS of ceph-osd processes of the worker nodes collected by the node
+    metrics agents started by memory_leak_function fixture
+
+    Returns:
+        dict: worker name to list of (timestamp, RSS in KiB of all the
+            ceph-osd processes of the node) points
+
+    Raises:
+        UnexpectedBehaviour: In case the node metrics collection isn't running
+
+    """
+    collector = get_node_metrics_collector()
+    if collector is None:
+        raise UnexpectedBehaviour(
+            "Node metrics aren't collected, use memory_leak_function fixture"
+        )
+    return node_metrics_analysis.process_series(
+        collector.get_samples(), "ceph-osd", "rss", per_node=True
+    )
 
 
 def memory_leak_analysis(median_dict):
     """
     Function to analyse Memory leak after execution of test case Memory leak is
-    analyzed based on top output "RES" value of ceph-osd daemon, i.e.
-    ``list[7]`` in code.
+    analyzed based on RSS of ceph-osd daemons collected by the node metrics
+    agents.
 
     More Detail on Median value: For calculating memory leak require a constant
     value, which should not be start or end of test, so calculating it by
     getting memory for 180 sec before TC execution and take a median out of it.
     Memory value could be different for each nodes, so identify constant value
-    for each node and update in median_dict
+    for each node and update in median_dict. The end value is the median of the
+    last minute of the samples, so a single spike doesn't fail the test.
 
     Args:
          median_dict (dict): dict of worker nodes and respective median value
-         eg: median_dict = {'worker_node_1':102400, 'worker_node_2':204800, ...}
+         of RSS in KiB, eg: median_dict = {'worker_node_1':102400, ...}
 
     Usage::
 
@@ -2202,48 +2107,26 @@ def memory_leak_analysis(median_dict):
             helpers.memory_leak_analysis(median_dict)
             ....
     """
-    # dict to store memory leak difference for each worker
-    diff = {}
+    series = _get_osd_rss_series()
     for worker in node.get_worker_nodes():
-        memory_leak_data = []
-        if os.path.exists(f"/tmp/{worker}-top-output.txt"):
-            with open(f"/tmp/{worker}-top-output.txt", "r") as f:
-                data = f.readline()
-                list = data.split(" ")
-                list = [i for i in list if i]
-                memory_leak_data.append(list[7])
-        else:
-            logging.info(f"worker {worker} memory leak file not found")
+        if not series.get(worker):
+            logging.info(f"worker {worker} memory leak data not found")
             raise UnexpectedBehaviour
-        number_of_lines = len(memory_leak_data) - 1
-        # Get the start value form median_dict arg for respective worker
-        start_value = median_dict[f"{worker}"]
-        end_value = memory_leak_data[number_of_lines]
-        logging.info(f"Median value {start_value}")
-        logging.info(f"End value {end_value}")
-        # Convert the values to kb for calculations
-        if start_value.__contains__("g"):
-            start_value = float(1024 ** 2 * float(start_value[:-1]))
-        elif start_value.__contains__("m"):
-            start_value = float(1024 * float(start_value[:-1]))
-        else:
-            start_value = float(start_value)
-        if end_value.__contains__("g"):
-            end_value = float(1024 ** 2 * float(end_value[:-1]))
-        elif end_value.__contains__("m"):
-            end_value = float(1024 * float(end_value[:-1]))
-        else:
-            end_value = float(end_value)
-        # Calculate the percentage of diff between start and end value
-        # Based on value decide TC pass or fail
-        diff[worker] = ((end_value - start_value) / start_value) * 100
-        logging.info(f"Percentage diff in start and end value {diff[worker]}")
-        if diff[worker] <= 20:
+        verdict = node_metrics_analysis.leak_verdict(
+            series[worker], baseline=median_dict[worker], baseline_seconds=60
+        )
+        logging.info(f"Median value {verdict['baseline']}")
+        logging.info(f"End value {verdict['end']}")
+        logging.info(
+            f"Percentage diff in start and end value {verdict['growth']}, "
+            f"trend {verdict['slope']} KiB per hour"
+        )
+        if not verdict["leak"]:
             logging.info(f"No memory leak in worker {worker} passing the test")
         else:
             logging.info(f"There is a memory leak in worker {worker}")
-            logging.info(f"Memory median value start of the test {start_value}")
-            logging.info(f"Memory value end of the test {end_value}")
+            logging.info(f"Memory median value start of the test {verdict['baseline']}")
+            logging.info(f"Memory value end of the test {verdict['end']}")
             raise UnexpectedBehaviour
 
 
@@ -2251,7 +2134,7 @@ def get_memory_leak_median_value():
     """
     Function to calculate memory leak Median value by collecting the data for 180 sec
     and find the median value which will be considered as starting point
-    to evaluate memory leak using "RES" value of ceph-osd daemon i.e. list[7] in code
+    to evaluate memory leak using RSS of ceph-osd daemons
 
     Returns:
         median_dict (dict): dict of worker nodes and respective median value
@@ -2259,19 +2142,15 @@ def get_memory_leak_median_value():
     median_dict = {}
     timeout = 180  # wait for 180 sec to evaluate  memory leak median data.
     logger.info(f"waiting for {timeout} sec to evaluate the median value")
+    start = time.time()
     time.sleep(timeout)
+    series = _get_osd_rss_series()
     for worker in node.get_worker_nodes():
-        memory_leak_data = []
-        if os.path.exists(f"/tmp/{worker}-top-output.txt"):
-            with open(f"/tmp/{worker}-top-output.txt", "r") as f:
-                data = f.readline()
-                list = data.split(" ")
-                list = [i for i in list if i]
-                memory_leak_data.append(list[7])
-        else:
-            logging.info(f"worker {worker} memory leak file not found")
+        points = node_metrics_analysis.window(series.get(worker, []), start=start)
+        if not points:
+            logging.info(f"worker {worker} memory leak data not found")
             raise UnexpectedBehaviour
-        median_dict[f"{worker}"] = statistics.median(memory_leak_data)
+        median_dict[f"{worker}"] = node_metrics_analysis.median(points)
     return median_dict
 
 
@@ -11,6 +11,7 @@ from prettytable import PrettyTable
 from concurrent.futures import ThreadPoolExecutor
 
 from ocs_ci.ocs.exceptions import ResourceWrongStatusException, CommandFailed
+from ocs_ci.ocs.log_follower import get_log_follow_service
 from ocs_ci.ocs.ocp import OCP, switch_to_default_rook_cluster_project
 from ocs_ci.ocs.resources.pod import get_pod_obj
 from ocs_ci.ocs.resources.ocs import OCS
@@ -415,6 +416,9 @@ class AMQ(object):
         """
         Validate if messages are sent or received
 
+        The log of the pod is followed in background, see
+        :py:class:`ocs_ci.ocs.log_follower.LogFollowService`.
+
         Args:
             pod (str): Name of the pod
             namespace (str): Namespace of the pod
@@ -425,13 +429,71 @@ class AMQ(object):
             bool : True if all messages are sent/received
 
         """
-        cmd = f"oc logs -n {namespace} {pod} --since={since_time}s"
-        msg = run_cmd(cmd)
+        follower = self._follow_log(pod, namespace, since_time)
         substring = f"Hello world - {int(value) - 1}"
-        if msg.find(substring) is -1:
-            return False
-        else:
+        if follower.search(substring) is not None:
             return True
+        return follower.finished and self._fetch_log_has(
+            pod, namespace, since_time, substring
+        )
+
+    def wait_for_msg(
+        self,
+        pod,
+        namespace=constants.AMQ_NAMESPACE,
+        value="10000",
+        since_time=1800,
+        timeout=900,
+    ):
+        """
+        Wait until all messages are sent or received
+
+        Args:
+            pod (str): Name of the pod
+            namespace (str): Namespace of the pod
+            value (str): Number of messages are sent
+            since_time (int): Number of seconds to required to sent the msg
+            timeout (int): Time in seconds to wait
+
+        Returns:
+            bool : True if all messages are sent/received
+
+        """
+        follower = self._follow_log(pod, namespace, since_time)
+        substring = f"Hello world - {int(value) - 1}"
+        if follower.wait_for(substring, timeout=timeout) is not None:
+            return True
+        return follower.finished and self._fetch_log_has(
+            pod, namespace, since_time, substring
+        )
+
+    @staticmethod
+    def _follow_log(pod, namespace, since_time):
+        """
+        Returns:
+            LogFollower: follower of the pod log, a new one if the log of the
+                previous one ended, e.g. 'oc logs -f' failed or the container
+                restarted
+        """
+        return get_log_follow_service().follow(
+            pod, namespace, since=since_time, restart=True
+        )
+
+    @staticmethod
+    def _fetch_log_has(pod, namespace, since_time, substring):
+        """
+        Fetch the log of the pod when following it ended without the message
+
+        Returns:
+            bool: True if the log contains the substring
+        """
+        log.info(f"Following the log of {pod} ended, fetching the whole log")
+        try:
+            msg = run_cmd(f"oc logs -n {namespace} {pod} --since={since_time}s")
+        except CommandFailed as ex:
+            log.warning(f"Failed to fetch the log of {pod}: {ex}")
+            return False
+        return substring in msg
 
     def validate_messages_are_produced(
         self, namespace=constants.AMQ_NAMESPACE, value="10000", since_time=1800
@@ -448,17 +510,10 @@ class AMQ(object):
 
         """
         # ToDo: Support multiple topics and users
-        producer_pod_objs = [
-            get_pod_obj(pod)
-            for pod in get_pod_name_by_pattern("hello-world-produce", namespace)
-        ]
-        for pod in producer_pod_objs:
-            for msg in TimeoutSampler(
-                900, 30, self.validate_msg, pod.name, namespace, value, since_time
-            ):
-                if msg:
-                    break
-        assert msg, "Few messages are not sent by producer"
+        producer_pods = get_pod_name_by_pattern("hello-world-produce", namespace)
+        for pod in producer_pods:
+            msg = self.wait_for_msg(pod, namespace, value, since_time)
+            assert msg, "Few messages are not sent by producer"
         log.info("Producer sent all messages")
 
     def validate_messages_are_consumed(
@@ -476,17 +531,10 @@ class AMQ(object):
 
         """
         # ToDo: Support multiple topics and users
-        consumer_pod_objs = [
-            get_pod_obj(pod)
-            for pod in get_pod_name_by_pattern("hello-world-consumer", namespace)
-        ]
-        for pod in consumer_pod_objs:
-            for msg in TimeoutSampler(
-                900, 30, self.validate_msg, pod.name, namespace, value, since_time
-            ):
-                if msg:
-                    break
-        assert msg, "Consumer didn't receive all messages"
+        consumer_pods = get_pod_name_by_pattern("hello-world-consumer", namespace)
+        for pod in consumer_pods:
+            msg = self.wait_for_msg(pod, namespace, value, since_time)
+            assert msg, "Consumer didn't receive all messages"
         log.info("Consumer received all messages")
 
     def run_in_bg(
@@ -0,0 +1,842 @@
+"""
+Kubernetes API backend for OCP objects
+
+By default every OCP.get/create/patch/delete call forks the ``oc`` binary,
+which means a new process, a kubeconfig parsing and a TLS handshake per call.
+When ``ocp_backend`` in the RUN section of the config is set to ``api``, those
+calls are served by KubeAPIBackend over one pooled keep-alive connection to
+the API server using the kubernetes and openshift dynamic clients.
+
+Calls which the backend isn't able to serve (e.g. raw table output or
+resources addressed in a way only ``oc`` understands) raise
+UnsupportedAPIBackendCall and OCP falls back to the ``oc`` client.
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+import yaml
+from kubernetes import client as k8s_client
+from kubernetes import config as k8s_config
+from kubernetes.watch.watch import iter_resp_lines
+from openshift.dynamic import DynamicClient
+from openshift.dynamic.exceptions import DynamicApiError, ResourceNotFoundError
+from urllib3.exceptions import HTTPError
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import (
+    CommandFailed,
+    ResourceInUnexpectedState,
+    TimeoutExpiredError,
+    UnsupportedAPIBackendCall,
+)
+
+
+log = logging.getLogger(__name__)
+
+OC_BACKEND = "oc"
+API_BACKEND = "api"
+
+# oc patch --type values mapped to the content types of the API server
+PATCH_CONTENT_TYPES = {
+    "": "application/strategic-merge-patch+json",
+    "strategic": "application/strategic-merge-patch+json",
+    "merge": "application/merge-patch+json",
+    "json": "application/json-patch+json",
+}
+
+# Accept header asking the API server for the same columns as oc prints
+TABLE_ACCEPT = "application/json;as=Table;v=1;g=meta.k8s.io,application/json"
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_kubeconfig_path():
+    """
+    Get path to the kubeconfig the same way as OCP.exec_oc_cmd does
+
+    Returns:
+        str: path to the kubeconfig file, None when the default location of
+            the kubernetes client should be used
+
+    """
+    env_kubeconfig = os.getenv("KUBECONFIG")
+    if env_kubeconfig and os.path.exists(env_kubeconfig):
+        return env_kubeconfig
+    cluster_path = config.ENV_DATA.get("cluster_path")
+    if cluster_path:
+        cluster_dir_kubeconfig = os.path.join(
+            cluster_path, config.RUN.get("kubeconfig_location")
+        )
+        if os.path.exists(cluster_dir_kubeconfig):
+            return cluster_dir_kubeconfig
+    return None
+
+
+def get_api_backend():
+    """
+    Get the API backend selected in the config
+
+    The backend is created only once per kubeconfig and shared by all OCP
+    objects (and threads), so all of them reuse the same connection pool.
+
+    Returns:
+        KubeAPIBackend: the backend instance, None if OCP objects should use
+            the oc client
+
+    """
+    global _backend
+    if config.RUN.get("ocp_backend", OC_BACKEND) != API_BACKEND:
+        return None
+    kubeconfig = get_kubeconfig_path()
+    if _backend is not None and _backend.kubeconfig == kubeconfig:
+        return _backend
+    with _backend_lock:
+        if _backend is None or _backend.kubeconfig != kubeconfig:
+            _backend = KubeAPIBackend(
+                kubeconfig,
+                pool_maxsize=config.RUN.get("ocp_backend_pool_maxsize", 16),
+            )
+    return _backend
+
+
+def reset_api_backend():
+    """
+    Drop the shared API backend, e.g. after the kubeconfig was changed
+    """
+    global _backend
+    with _backend_lock:
+        _backend = None
+
+
+class KubeAPIBackend(object):
+    """
+    Serves OCP object calls over a pooled connection to the API server
+    """
+
+    def __init__(self, kubeconfig=None, pool_maxsize=16):
+        """
+        Initializer function
+
+        Args:
+            kubeconfig (str): path to the kubeconfig file
+            pool_maxsize (int): max number of keep-alive connections kept open
+                to the API server
+
+        """
+        self.kubeconfig = kubeconfig
+        client_config = k8s_client.Configuration()
+        k8s_config.load_kube_config(
+            config_file=kubeconfig, client_configuration=client_config
+        )
+        client_config.connection_pool_maxsize = pool_maxsize
+        self.api_client = k8s_client.ApiClient(client_config)
+        self.client = DynamicClient(self.api_client)
+        _, active_context = k8s_config.list_kube_config_contexts(kubeconfig)
+        self.default_namespace = active_context.get("context", {}).get(
+            "namespace", "default"
+        )
+        self._resources = {}
+        self._resources_lock = threading.Lock()
+        log.info(
+            f"Kubernetes API backend connected to {client_config.host} "
+            f"with connection pool of size {pool_maxsize}"
+        )
+
+    def resolve_resource(self, kind):
+        """
+        Find the API resource for the kind the same way as oc does, e.g.
+        'Pod', 'pod', 'pods' and 'po' all resolve to the Pod resource.
+
+        Args:
+            kind (str): kind, plural name or short name of the resource,
+                optionally suffixed by the api group (e.g. 'pods.metrics.k8s.io')
+
+        Returns:
+            Resource: the openshift dynamic client resource
+
+        Raises:
+            UnsupportedAPIBackendCall: if the kind can't be resolved
+
+        """
+        if not kind or "," in kind or "/" in kind or " " in kind:
+            raise UnsupportedAPIBackendCall(f"Can't resolve kind '{kind}'")
+        with self._resources_lock:
+            if kind in self._resources:
+                return self._resources[kind]
+            resource = self._search_resource(kind)
+            self._resources[kind] = resource
+            return resource
+
+    def _search_resource(self, kind):
+        """
+        Search the discovered API resources for the kind
+
+        Args:
+            kind (str): kind, plural name or short name of the resource
+
+        Returns:
+            Resource: the preferred resource version matching the kind
+
+        Raises:
+            UnsupportedAPIBackendCall: if there isn't any matching resource
+
+        """
+        name, _, group = kind.lower().partition(".")
+        candidates = []
+        try:
+            candidates = self.client.resources.search(kind=kind)
+            if not candidates:
+                candidates = self.client.resources.search()
+        except ResourceNotFoundError:
+            pass
+        matches = []
+        for resource in candidates:
+            names = [
+                (getattr(resource, "kind", "") or "").lower(),
+                (getattr(resource, "name", "") or "").lower(),
+                (getattr(resource, "singular_name", "") or "").lower(),
+            ]
+            short_names = getattr(resource, "short_names", None) or []
+            names += [short.lower() for short in short_names]
+            if name not in names or "/" in (getattr(resource, "name", "") or ""):
+                continue
+            if group and getattr(resource, "group", "") != group:
+                continue
+            matches.append(resource)
+        if not matches:
+            raise UnsupportedAPIBackendCall(f"No API resource found for '{kind}'")
+        # Core group wins over aggregated groups the same way as in oc
+        matches.sort(
+            key=lambda res: (
+                bool(getattr(res, "group", "")),
+                not getattr(res, "preferred", True),
+            )
+        )
+        return matches[0]
+
+    def _namespace_for(self, resource, namespace, all_namespaces=False):
+        """
+        Namespace used for the call as oc would use it
+        """
+        if not resource.namespaced:
+            return None
+        if namespace:
+            return namespace
+        if all_namespaces:
+            return None
+        return self.default_namespace
+
+    def _raise_command_failed(self, ex, verb, kind, name=""):
+        """
+        Translate API error to CommandFailed with oc like message so callers
+        checking e.g. for 'NotFound' in the error keep working.
+        """
+        reason = getattr(ex, "reason", "") or ""
+        message = str(ex)
+        body = getattr(ex, "body", None)
+        if body:
+            try:
+                status = json.loads(body)
+                reason = status.get("reason", reason)
+                message = status.get("message", message)
+            except (TypeError, ValueError):
+                pass
+        raise CommandFailed(
+            f"Error during execution of API call: {verb} {kind} {name}."
+            f"\nError is Error from server ({reason}): {message}"
+        )
+
+    def get(
+        self,
+        kind,
+        namespace=None,
+        resource_name="",
+        selector=None,
+        all_namespaces=False,
+    ):
+        """
+        Equivalent of 'oc get <kind> <resource_name> -o yaml'
+
+        Args:
+            kind (str): kind of the resource
+            namespace (str): namespace of the resource
+            resource_name (str): name of the resource, the whole list of
+                resources is returned if not specified
+            selector (str): label selector
+            all_namespaces (bool): list resources across all namespaces
+
+        Returns:
+            dict: the resource, or 'List' of the resources
+
+        """
+        if " " in (resource_name or ""):
+            raise UnsupportedAPIBackendCall("Multiple resource names requested")
+        resource = self.resolve_resource(kind)
+        namespace = self._namespace_for(resource, namespace, all_namespaces)
+        try:
+            if resource_name:
+                return resource.get(name=resource_name, namespace=namespace).to_dict()
+            data = resource.get(namespace=namespace, label_selector=selector)
+        except DynamicApiError as ex:
+            self._raise_command_failed(ex, "get", kind, resource_name)
+        except HTTPError as ex:
+            raise CommandFailed(f"API call get {kind} failed: {ex}")
+        data = data.to_dict()
+        # oc returns plain 'List' kind instead of e.g. PodList
+        return {
+            "apiVersion": "v1",
+            "kind": "List",
+            "items": data.get("items") or [],
+            "metadata": data.get("metadata") or {},
+        }
+
+    def create(self, namespace=None, yaml_file=None, resource_dict=None):
+        """
+        Equivalent of 'oc create -f <yaml_file> -o yaml'
+
+        Args:
+            namespace (str): namespace used for resources without namespace
+            yaml_file (str): path to the yaml file with resource(s)
+            resource_dict (dict): resource to create instead of the yaml file
+
+        Returns:
+            dict: created resource, or 'List' of them if the file contained
+                more resources
+
+        """
+        if resource_dict:
+            docs = [resource_dict]
+        elif yaml_file:
+            docs = self._load_docs(yaml_file)
+        else:
+            raise UnsupportedAPIBackendCall("Create without yaml file")
+        created = [self._create_one(namespace, doc) for doc in docs]
+        if len(created) == 1:
+            return created[0]
+        return {"apiVersion": "v1", "kind": "List", "items": created, "metadata": {}}
+
+    @staticmethod
+    def _load_docs(yaml_file):
+        """
+        Load the resources of the yaml file, the items of a single 'List'
+        document are loaded the same way as oc does
+
+        Args:
+            yaml_file (str): path to the yaml file with resource(s)
+
+        Returns:
+            list: resource dicts
+
+        """
+        with open(yaml_file) as file_stream:
+            docs = [doc for doc in yaml.safe_load_all(file_stream) if doc]
+        if len(docs) == 1 and docs[0].get("kind") == "List":
+            docs = docs[0].get("items", [])
+        return docs
+
+    def _create_one(self, namespace, body):
+        """
+        Create one resource from its dict
+        """
+        resource = self._resource_for_body(body)
+        metadata = body.get("metadata", {})
+        namespace = self._namespace_for(
+            resource, metadata.get("namespace") or namespace
+        )
+        try:
+            return resource.create(body=body, namespace=namespace).to_dict()
+        except DynamicApiError as ex:
+            self._raise_command_failed(ex, "create", body["kind"], metadata.get("name"))
+        except HTTPError as ex:
+            raise CommandFailed(f"API call create {body['kind']} failed: {ex}")
+
+    def _resource_for_body(self, body):
+        """
+        Get the API resource for apiVersion and kind of the resource dict
+        """
+        try:
+            return self.client.resources.get(
+                api_version=body["apiVersion"], kind=body["kind"]
+            )
+        except (KeyError, ResourceNotFoundError):
+            raise UnsupportedAPIBackendCall("Can't find API resource for the body")
+
+    def delete(
+        self,
+        kind,
+        namespace=None,
+        resource_name="",
+        yaml_file=None,
+        wait=True,
+        force=False,
+        timeout=600,
+    ):
+        """
+        Equivalent of 'oc delete <kind> <resource_name>' or
+        'oc delete -f <yaml_file>'
+
+        Args:
+            kind (str): kind of the resource
+            namespace (str): namespace of the resource
+            resource_name (str): name of the resource
+            yaml_file (str): path to the yaml file with the resource(s)
+            wait (bool): wait till the resource is really gone, as oc does
+            force (bool): delete immediately with zero grace period
+            timeout (int): how long to wait for the deletion
+
+        Returns:
+            str: oc like output, e.g. 'pod "my-pod" deleted'
+
+        """
+        if resource_name:
+            if " " in resource_name:
+                raise UnsupportedAPIBackendCall("Multiple resource names requested")
+            targets = [(self.resolve_resource(kind), namespace, resource_name)]
+        else:
+            docs = self._load_docs(yaml_file)
+            targets = [
+                (
+                    self._resource_for_body(doc),
+                    doc["metadata"].get("namespace") or namespace,
+                    doc["metadata"]["name"],
+                )
+                for doc in docs
+            ]
+        body = {"gracePeriodSeconds": 0} if force else None
+        output = []
+        for resource, res_namespace, name in targets:
+            res_namespace = self._namespace_for(resource, res_namespace)
+            try:
+                deleted = resource.delete(name=name, namespace=res_namespace, body=body)
+                if wait:
+                    self.wait_for_delete(resource, name, res_namespace, timeout)
+            except DynamicApiError as ex:
+                self._raise_command_failed(ex, "delete", resource.kind, name)
+            except HTTPError as ex:
+                raise CommandFailed(f"API call delete {resource.kind} failed: {ex}")
+            log.debug(f"Deleted {resource.kind} {name}: {deleted}")
+            singular = resource.singular_name or resource.kind.lower()
+            output.append(f'{singular} "{name}" deleted')
+        return "\n".join(output)
+
+    def wait_for_delete(self, resource, name, namespace, timeout=600):
+        """
+        Watch the resource till it's deleted
+
+        Args:
+            resource (Resource): the openshift dynamic client resource
+            name (str): name of the resource
+            namespace (str): namespace of the resource
+            timeout (int): timeout in seconds
+
+        Raises:
+            CommandFailed: if the resource isn't deleted within the timeout
+
+        """
+        try:
+            current = resource.get(name=name, namespace=namespace)
+        except DynamicApiError as ex:
+            if ex.status == 404:
+                return
+            raise
+        for event in self.client.watch(
+            resource,
+            namespace=namespace,
+            field_selector=f"metadata.name={name}",
+            resource_version=current.metadata.resourceVersion,
+            timeout=timeout,
+        ):
+            if event["type"] == "DELETED":
+                return
+        raise CommandFailed(
+            f"Timed out after {timeout}s waiting for {resource.kind} {name} "
+            "to be deleted"
+        )
+
+    def patch(
+        self, kind, namespace=None, resource_name="", params=None, format_type=""
+    ):
+        """
+        Equivalent of 'oc patch <kind> <resource_name> -p <params>'
+
+        Args:
+            kind (str): kind of the resource
+            namespace (str): namespace of the resource
+            resource_name (str): name of the resource
+            params (str): the patch in json or yaml format
+            format_type (str): type of the patch (strategic, merge or json)
+
+        Returns:
+            str: oc like output, e.g. 'pod/my-pod patched'
+
+        """
+        if format_type not in PATCH_CONTENT_TYPES:
+            raise UnsupportedAPIBackendCall(f"Unknown patch type: {format_type}")
+        resource = self.resolve_resource(kind)
+        try:
+            body = json.loads(params)
+        except ValueError:
+            body = yaml.safe_load(params)
+        try:
+            resource.patch(
+                body=body,
+                name=resource_name,
+                namespace=self._namespace_for(resource, namespace),
+                content_type=PATCH_CONTENT_TYPES[format_type],
+            )
+        except DynamicApiError as ex:
+            self._raise_command_failed(ex, "patch", kind, resource_name)
+        except HTTPError as ex:
+            raise CommandFailed(f"API call patch {kind} failed: {ex}")
+        singular = resource.singular_name or resource.kind.lower()
+        return f"{singular}/{resource_name} patched"
+
+    def _raw_request(
+        self, resource, namespace, query_params, timeout=None, accept=TABLE_ACCEPT
+    ):
+        """
+        Request the resources without loading the response
+
+        Args:
+            resource (Resource): the openshift dynamic client resource
+            namespace (str): namespace of the resources
+            query_params (list): list of (name, value) query parameters
+            timeout (int): read timeout of the request
+            accept (str): Accept header, Table format by default
+
+        Returns:
+            urllib3.HTTPResponse: not loaded response
+
+        """
+        return self.client.request(
+            "GET",
+            resource.path(namespace=namespace),
+            query_params=query_params,
+            header_params={"Accept": accept},
+            serialize=False,
+            _request_timeout=timeout,
+        )
+
+    def _watch_events(
+        self,
+        resource,
+        namespace,
+        selector=None,
+        field_selector=None,
+        resource_version=None,
+        timeout=60,
+        accept=TABLE_ACCEPT,
+    ):
+        """
+        Open one streaming watch request of the resources
+
+        Args:
+            resource (Resource): the openshift dynamic client resource
+            namespace (str): namespace of the resources
+            selector (str): label selector
+            field_selector (str): field selector
+            resource_version (str): resourceVersion to start the watch from
+            timeout (int): how long the watch should be kept open
+            accept (str): Accept header, Table format by default
+
+        Yields:
+            dict: raw watch events
+
+        """
+        query_params = [
+            ("watch", "true"),
+            ("timeoutSeconds", max(int(timeout), 1)),
+            ("allowWatchBookmarks", "true"),
+        ]
+        if resource_version:
+            query_params.append(("resourceVersion", resource_version))
+        if selector:
+            query_params.append(("labelSelector", selector))
+        if field_selector:
+            query_params.append(("fieldSelector", field_selector))
+        try:
+            response = self._raw_request(
+                resource, namespace, query_params, timeout=timeout + 10, accept=accept
+            )
+        except DynamicApiError as ex:
+            self._raise_command_failed(ex, "watch", resource.kind)
+        except HTTPError as ex:
+            raise CommandFailed(f"API call watch {resource.kind} failed: {ex}")
+        try:
+            for line in iter_resp_lines(response):
+                event = json.loads(line)
+                if event["type"] == "ERROR":
+                    log.info(
+                        f"Watch of {resource.kind} ended with: "
+                        f"{event['object'].get('message')}"
+                    )
+                yield event
+        except HTTPError as ex:
+            log.info(f"Watch of {resource.kind} was interrupted: {ex}")
+        finally:
+            response.release_conn()
+
+    @staticmethod
+    def _column_index(column_definitions, column):
+        """
+        Index of the oc column (e.g. STATUS) in the Table column definitions
+
+        Raises:
+            UnsupportedAPIBackendCall: if the Table doesn't have such column
+
+        """
+        names = [definition["name"].upper() for definition in column_definitions]
+        try:
+            return names.index(column.upper())
+        except ValueError:
+            raise UnsupportedAPIBackendCall(
+                f"Column {column} not found in table columns {names}"
+            )
+
+    def list_column(
+        self, kind, namespace=None, column="STATUS", selector=None, field_selector=None
+    ):
+        """
+        Get value of the column for all matching resources in one call, the
+        values are computed by the API server the same way as oc prints them.
+
+        Args:
+            kind (str): kind of the resources
+            namespace (str): namespace of the resources
+            column (str): name of the column as printed by oc (e.g. STATUS)
+            selector (str): label selector
+            field_selector (str): field selector
+
+        Returns:
+            tuple: dict of resource name to the column value and the
+                resourceVersion of the list, which can be used to start watch
+
+        """
+        resource = self.resolve_resource(kind)
+        namespace = self._namespace_for(resource, namespace)
+        query_params = []
+        if selector:
+            query_params.append(("labelSelector", selector))
+        if field_selector:
+            query_params.append(("fieldSelector", field_selector))
+        try:
+            response = self._raw_request(resource, namespace, query_params)
+            table = json.loads(response.data)
+        except DynamicApiError as ex:
+            self._raise_command_failed(ex, "get", kind)
+        except HTTPError as ex:
+            raise CommandFailed(f"API call get {kind} failed: {ex}")
+        if table.get("kind") != "Table":
+            raise UnsupportedAPIBackendCall("API server doesn't support Table format")
+        index = self._column_index(table["columnDefinitions"], column)
+        values = {
+            row["object"]["metadata"]["name"]: str(row["cells"][index])
+            for row in table.get("rows") or []
+        }
+        return values, table["metadata"].get("resourceVersion")
+
+    def watch_column(
+        self,
+        kind,
+        namespace=None,
+        column="STATUS",
+        selector=None,
+        field_selector=None,
+        resource_version=None,
+        timeout=60,
+    ):
+        """
+        Watch value of the column for all matching resources with one
+        streaming request.
+
+        Args:
+            kind (str): kind of the resources
+            namespace (str): namespace of the resources
+            column (str): name of the column as printed by oc (e.g. STATUS)
+            selector (str): label selector
+            field_selector (str): field selector
+            resource_version (str): resourceVersion to start the watch from,
+                usually taken from list_column
+            timeout (int): how long the watch should be kept open
+
+        Yields:
+            tuple: (event type, resource name, column value, resourceVersion),
+                event type is one of ADDED, MODIFIED, DELETED, BOOKMARK or
+                ERROR. After ERROR (e.g. too old resourceVersion) the watch
+                ends and the caller should list the resources again.
+
+        """
+        resource = self.resolve_resource(kind)
+        namespace = self._namespace_for(resource, namespace)
+        index = None
+        for event in self._watch_events(
+            resource, namespace, selector, field_selector, resource_version, timeout
+        ):
+            event_type = event["type"]
+            obj = event["object"]
+            if event_type == "ERROR":
+                yield event_type, None, None, None
+                return
+            if event_type == "BOOKMARK":
+                yield event_type, None, None, obj["metadata"]["resourceVersion"]
+                continue
+            if obj.get("columnDefinitions"):
+                index = self._column_index(obj["columnDefinitions"], column)
+            elif index is None:
+                index = self._column_index(
+                    self._column_definitions(resource, namespace), column
+                )
+            for row in obj.get("rows") or []:
+                metadata = row["object"]["metadata"]
+                yield (
+                    event_type,
+                    metadata["name"],
+                    str(row["cells"][index]),
+                    metadata.get("resourceVersion"),
+                )
+
+    def _column_definitions(self, resource, namespace):
+        """
+        Column definitions of the resource Table, used when the watch events
+        don't carry them.
+        """
+        response = self._raw_request(resource, namespace, [("limit", 1)])
+        return json.loads(response.data)["columnDefinitions"]
+
+    def wait_for_column(
+        self,
+        kind,
+        condition,
+        namespace=None,
+        resource_name="",
+        column="STATUS",
+        selector=None,
+        resource_count=0,
+        timeout=60,
+        dont_allow_other_resources=False,
+        error_condition=None,
+    ):
+        """
+        Wait for the resource(s) to reach the condition with one watch of the
+        resources instead of polling them. Column values of all watched
+        resources are cached locally and the condition is evaluated on every
+        change, so the wait ends as soon as the condition holds.
+
+        See OCP.wait_for_resource for description of the args, the semantic
+        of them is the same.
+
+        Returns:
+            bool: True when the resource(s) reached the condition
+
+        Raises:
+            TimeoutExpiredError: if the condition isn't reached in time
+            ResourceInUnexpectedState: if any resource reached error_condition
+
+        """
+        field_selector = f"metadata.name={resource_name}" if resource_name else None
+
+        def condition_reached(statuses):
+            for name, status in statuses.items():
+                if error_condition is not None and status == error_condition:
+                    raise ResourceInUnexpectedState(
+                        f"Status of '{name}' at column {column} is {status}."
+                    )
+            if resource_name:
+                return statuses.get(resource_name) == condition
+            in_condition = [name for name, st in statuses.items() if st == condition]
+            if resource_count:
+                if dont_allow_other_resources:
+                    return len(statuses) == len(in_condition) == resource_count
+                return len(in_condition) >= resource_count
+            return bool(statuses) and len(statuses) == len(in_condition)
+
+        deadline = time.time() + timeout
+        statuses = {}
+        resource_version = None
+        logged_statuses = None
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutExpiredError(
+                    timeout, f"last status of {kind} at column {column}: {statuses}"
+                )
+            if resource_version is None:
+                statuses, resource_version = self.list_column(
+                    kind, namespace, column, selector, field_selector
+                )
+            else:
+                for event_type, name, value, version in self.watch_column(
+                    kind,
+                    namespace,
+                    column,
+                    selector,
+                    field_selector,
+                    resource_version,
+                    remaining,
+                ):
+                    if event_type == "ERROR":
+                        resource_version = None
+                        break
+                    resource_version = version or resource_version
+                    if event_type == "DELETED":
+                        statuses.pop(name, None)
+                    elif event_type != "BOOKMARK":
+                        statuses[name] = value
+                    if condition_reached(statuses):
+                        break
+            if condition_reached(statuses):
+                log.info(
+                    f"{kind} resource(s) at column {column} reached condition "
+                    f"{condition}: {statuses}"
+                )
+                return True
+            if statuses != logged_statuses:
+                log.info(
+                    f"status of {kind} resource(s) at column {column} were "
+                    f"{statuses}, but we were waiting for {condition}"
+                )
+                logged_statuses = dict(statuses)
+
+    def watch_objects(
+        self,
+        kind,
+        namespace=None,
+        selector=None,
+        resource_version=None,
+        timeout=60,
+        all_namespaces=False,
+    ):
+        """
+        Watch the whole objects of the resources with one streaming request
+
+        Args:
+            kind (str): kind of the resources
+            namespace (str): namespace of the resources
+            selector (str): label selector
+            resource_version (str): resourceVersion to start the watch from,
+                usually taken from the list returned by get
+            timeout (int): how long the watch should be kept open
+            all_namespaces (bool): watch resources across all namespaces
+
+        Yields:
+            tuple: (event type, object dict), event type is one of ADDED,
+                MODIFIED, DELETED, BOOKMARK or ERROR. After ERROR (e.g. too
+                old resourceVersion) the watch ends and the caller should list
+                the resources again.
+
+        """
+        resource = self.resolve_resource(kind)
+        namespace = self._namespace_for(resource, namespace, all_namespaces)
+        for event in self._watch_events(
+            resource,
+            namespace,
+            selector,
+            resource_version=resource_version,
+            timeout=timeout,
+            accept="application/json",
+        ):
+            yield event["type"], event["object"]
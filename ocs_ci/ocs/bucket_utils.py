@@ -1,23 +1,31 @@
 """
 Helper functions file for working with object buckets
 """
+import json
 import logging
 import os
 import shlex
+import tempfile
+import threading
+from collections import defaultdict
 from uuid import uuid4
 
 import boto3
 from botocore.handlers import disable_signing
 
 from ocs_ci.framework import config
-from ocs_ci.ocs import constants
-from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.ocs import constants, s3_bulk
+from ocs_ci.ocs.exceptions import TimeoutExpiredError, UnexpectedBehaviour
+from ocs_ci.ocs.ocp import OCP
 from ocs_ci.utility import templating
 from ocs_ci.utility.utils import TimeoutSampler, run_cmd
 from ocs_ci.helpers.helpers import create_resource
 
 logger = logging.getLogger(__name__)
 
+_s3_bulk_engines = {}
+_s3_bulk_engines_lock = threading.Lock()
+
 
 def craft_s3_command(cmd, mcg_obj=None, api=False, signed_request_creds=None):
     """
@@ -100,6 +108,168 @@ def verify_s3_object_integrity(original_object_path, result_object_path, awscli_
         return False
 
 
+def verify_s3_objects_integrity(original_dir, result_dir, object_names, awscli_pod):
+    """
+    Verifies checksums of many original and result objects on an awscli pod
+    with one command
+
+    Args:
+        original_dir (str): Directory of the objects uploaded to the s3 bucket
+        result_dir (str): Directory of the objects downloaded from the bucket
+        object_names (list): Names of the objects in both directories
+        awscli_pod (pod): A pod running the AWSCLI tools
+
+    Returns:
+        bool: True if checksums of all the objects match, False otherwise
+
+    """
+    paths = []
+    for name in object_names:
+        paths += [os.path.join(original_dir, name), os.path.join(result_dir, name)]
+    output = awscli_pod.exec_cmd_on_pod(
+        command=f"md5sum {' '.join(shlex.quote(path) for path in paths)}",
+        out_yaml_format=False,
+    )
+    checksums = {}
+    for line in output.splitlines():
+        checksum, _, path = line.partition("  ")
+        checksums[path.strip()] = checksum
+    mismatched = [
+        name
+        for name in object_names
+        if checksums.get(os.path.join(original_dir, name)) is None
+        or checksums.get(os.path.join(original_dir, name))
+        != checksums.get(os.path.join(result_dir, name))
+    ]
+    if mismatched:
+        logger.error(f"Failed: MD5 comparison of objects {mismatched}")
+        return False
+    logger.info(f"Passed: MD5 comparison of {len(object_names)} objects")
+    return True
+
+
+def get_s3_external_endpoint(mcg_obj):
+    """
+    Get the S3 endpoint reachable from the runner
+
+    Args:
+        mcg_obj (obj): An MCG or OBC object containing the S3 connection
+            credentials
+
+    Returns:
+        str: s3_endpoint of MCG, s3_external_endpoint of OBC, None if the
+            object has none (e.g. rook OBC)
+
+    """
+    return getattr(mcg_obj, "s3_endpoint", None) or getattr(
+        mcg_obj, "s3_external_endpoint", None
+    )
+
+
+def get_s3_bulk_mode(mcg_obj):
+    """
+    Get the mode of the bulk S3 operations usable with the object
+
+    Args:
+        mcg_obj (obj): An MCG or OBC object containing the S3 connection
+            credentials
+
+    Returns:
+        str: RUN['s3_bulk'], None (the awscli commands in the pod) when it's
+            'runner' and the object has no endpoint reachable from the runner
+
+    """
+    mode = config.RUN.get("s3_bulk")
+    if mode == "runner" and not get_s3_external_endpoint(mcg_obj):
+        logger.warning(
+            "No S3 endpoint reachable from the runner, using the awscli commands"
+        )
+        return None
+    return mode
+
+
+def get_s3_bulk_engine(mcg_obj):
+    """
+    Get the bulk S3 engine connected to the external S3 endpoint of the MCG
+    (or OBC) object, shared by all the helpers using the same credentials
+
+    Args:
+        mcg_obj (obj): An MCG or OBC object containing the S3 connection
+            credentials, with an external endpoint (see get_s3_bulk_mode)
+
+    Returns:
+        S3BulkEngine: the engine
+
+    """
+    endpoint = get_s3_external_endpoint(mcg_obj)
+    key = (endpoint, mcg_obj.access_key_id)
+    with _s3_bulk_engines_lock:
+        if key not in _s3_bulk_engines:
+            _s3_bulk_engines[key] = s3_bulk.S3BulkEngine(
+                endpoint_url=endpoint,
+                access_key_id=mcg_obj.access_key_id,
+                secret_access_key=mcg_obj.access_key,
+                region=mcg_obj.region,
+                verify=retrieve_verification_mode(),
+                max_workers=config.RUN.get("s3_bulk_max_workers", 16),
+            )
+        return _s3_bulk_engines[key]
+
+
+def run_s3_bulk_job_in_pod(podobj, mcg_obj, operations):
+    """
+    Run the bulk S3 operations with one exec in the pod, against the
+    internal S3 endpoint. The pod needs python3 with boto3.
+
+    Args:
+        podobj (Pod): The pod to run the operations in
+        mcg_obj (obj): An MCG object containing the MCG S3 connection credentials
+        operations (list): operations, see S3BulkEngine.run_job
+
+    Returns:
+        dict: results of the job, see S3BulkEngine.run_job
+
+    """
+    job = {
+        "client": {
+            "endpoint_url": mcg_obj.s3_internal_endpoint,
+            "access_key_id": mcg_obj.access_key_id,
+            "secret_access_key": mcg_obj.access_key,
+            "region": mcg_obj.region,
+            "verify": constants.SERVICE_CA_CRT_AWSCLI_PATH,
+            "max_workers": config.RUN.get("s3_bulk_max_workers", 16),
+        },
+        "operations": operations,
+    }
+    with open(s3_bulk.__file__) as source_file:
+        source = source_file.read()
+    # the program is sent via stdin, so the credentials are not in the logs
+    program = f"{source}\nmain({json.dumps(job)!r})\n"
+    output = podobj.exec_cmd_on_pod(
+        command="python3 -",
+        out_yaml_format=False,
+        input=program.encode(),
+    )
+    results = json.loads(output.strip().splitlines()[-1])
+    logger.info(f"S3 bulk job latencies in {podobj.name}: {results['stats']}")
+    return results
+
+
+def copy_dir_from_pod(podobj, src_dir, dst_dir):
+    """
+    Copy directory from the pod to the local host with one 'oc cp'
+
+    Args:
+        podobj (Pod): The pod to copy from
+        src_dir (str): The directory in the pod
+        dst_dir (str): Local path of the copy, must not exist
+
+    """
+    OCP(namespace=podobj.namespace).exec_oc_cmd(
+        f"cp {podobj.name}:{src_dir} {dst_dir}", out_yaml_format=False
+    )
+
+
 def retrieve_test_objects_to_pod(podobj, target_dir):
     """
     Downloads all the test objects to a given directory in a given pod.
@@ -230,6 +400,29 @@ def write_individual_s3_objects(
     """
     bucketname = bucket_name or bucket_factory(1)[0].name
     logger.info("Writing objects to bucket")
+    mode = get_s3_bulk_mode(mcg_obj)
+    if mode == "pod":
+        operations = [
+            {
+                "op": "upload",
+                "bucket": bucketname,
+                "key": obj_name,
+                "path": f"{target_dir}{obj_name}",
+            }
+            for obj_name in downloaded_files
+        ]
+        run_s3_bulk_job_in_pod(awscli_pod, mcg_obj, operations)
+        return
+    if mode == "runner":
+        with tempfile.TemporaryDirectory() as local_dir:
+            local_dir = os.path.join(local_dir, "objects")
+            copy_dir_from_pod(awscli_pod, target_dir, local_dir)
+            engine = get_s3_bulk_engine(mcg_obj)
+            engine.upload_files(
+                bucketname, s3_bulk.list_files(local_dir, downloaded_files)
+            )
+        logger.info(f"S3 bulk engine latencies: {engine.stats()}")
+        return
     for obj_name in downloaded_files:
         full_object_path = f"s3://{bucketname}/{obj_name}"
         copycommand = f"cp {target_dir}{obj_name} {full_object_path}"
@@ -263,6 +456,33 @@ def upload_parts(
         list: List containing the ETag of the parts
 
     """
+    mode = get_s3_bulk_mode(mcg_obj)
+    if mode == "pod":
+        operations = [
+            {
+                "op": "upload_part",
+                "bucket": bucketname,
+                "key": object_key,
+                "upload_id": upload_id,
+                "path": f"{body_path}/{part}",
+            }
+            for part in uploaded_parts
+        ]
+        results = run_s3_bulk_job_in_pod(awscli_pod, mcg_obj, operations)
+        return results["parts"][f"{bucketname}/{object_key}"]
+    if mode == "runner":
+        with tempfile.TemporaryDirectory() as local_dir:
+            local_dir = os.path.join(local_dir, "parts")
+            copy_dir_from_pod(awscli_pod, body_path, local_dir)
+            engine = get_s3_bulk_engine(mcg_obj)
+            parts = engine.upload_parts(
+                bucketname,
+                object_key,
+                upload_id,
+                [os.path.join(local_dir, part) for part in uploaded_parts],
+            )
+        logger.info(f"S3 bulk engine latencies: {engine.stats()}")
+        return parts
     parts = []
     secrets = [mcg_obj.access_key_id, mcg_obj.access_key, mcg_obj.s3_internal_endpoint]
     for count, part in enumerate(uploaded_parts, 1):
@@ -938,10 +1158,35 @@ def del_objects(uploaded_objects_paths, awscli_pod, mcg_obj):
         mcg_obj (obj): An MCG object containing the MCG S3 connection credentials
 
     """
+    mode = get_s3_bulk_mode(mcg_obj)
+    if mode:
+        keys = defaultdict(list)
+        for uploaded_filename in uploaded_objects_paths:
+            bucket, _, key = uploaded_filename[len("s3://") :].partition("/")
+            keys[bucket].append(key)
+        logger.info(f"Deleting {len(uploaded_objects_paths)} objects")
+        if mode == "pod":
+            operations = [
+                {"op": "delete", "bucket": bucket, "key": key}
+                for bucket, bucket_keys in keys.items()
+                for key in bucket_keys
+            ]
+            errors = run_s3_bulk_job_in_pod(awscli_pod, mcg_obj, operations)[
+                "delete_errors"
+            ]
+        else:
+            engine = get_s3_bulk_engine(mcg_obj)
+            errors = []
+            for bucket, bucket_keys in keys.items():
+                errors += engine.delete_objects(bucket, bucket_keys)
+            logger.info(f"S3 bulk engine latencies: {engine.stats()}")
+        if errors:
+            raise UnexpectedBehaviour(f"Failed to delete objects: {errors}")
+        return
     for uploaded_filename in uploaded_objects_paths:
         logger.info(f"Deleting object {uploaded_filename}")
         awscli_pod.exec_cmd_on_pod(
-            command=craft_s3_command(mcg_obj, "rm " + uploaded_filename),
+            command=craft_s3_command("rm " + uploaded_filename, mcg_obj),
             secrets=[
                 mcg_obj.access_key_id,
                 mcg_obj.access_key,
@@ -1050,13 +1295,12 @@ def compare_directory(awscli_pod, original_dir, result_dir, amount=2):
         amount (int): Number of test objects to create
 
     """
-    for i in range(amount):
-        file_name = f"ObjKey-{i}"
-        assert verify_s3_object_integrity(
-            original_object_path=f"{original_dir}/{file_name}",
-            result_object_path=f"{result_dir}/{file_name}",
-            awscli_pod=awscli_pod,
-        ), "Checksum comparision between original and result object failed"
+    assert verify_s3_objects_integrity(
+        original_dir=original_dir,
+        result_dir=result_dir,
+        object_names=[f"ObjKey-{i}" for i in range(amount)],
+        awscli_pod=awscli_pod,
+    ), "Checksum comparision between original and result object failed"
 
 
 def s3_copy_object(s3_obj, bucketname, source, object_key):
@@ -0,0 +1,251 @@
+"""
+Persistent channel for Ceph commands executed on the toolbox pod
+
+Pod.exec_ceph_cmd runs every command as a separate 'oc rsh' process, which
+means new process, API server connection and exec session per command plus
+the start of the ceph CLI in the pod. When ``ceph_command_channel`` is
+enabled in the RUN section, a small server (see ceph_channel_shim) is started
+in the toolbox pod once via 'oc exec -i' and the commands are sent to it over
+the open stream. More commands can be in flight at the same time, their
+responses are matched by request id.
+"""
+import itertools
+import json
+import logging
+import os
+import shlex
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CephChannelClosed, CommandFailed
+from ocs_ci.ocs.ocp import OCP
+
+
+log = logging.getLogger(__name__)
+
+SHIM_PATH = os.path.join(os.path.dirname(__file__), "ceph_channel_shim.py")
+START_TIMEOUT = 60
+
+_channels = {}
+_channels_lock = threading.Lock()
+
+
+class CephCommandChannel(object):
+    """
+    Client of the ceph command server running in the toolbox pod
+    """
+
+    def __init__(self, command):
+        """
+        Initializer function
+
+        Args:
+            command (list): command starting the server, e.g.
+                ['oc', '-n', 'openshift-storage', 'exec', '-i', 'tools-pod',
+                '--', 'python3', '-u', '-c', '<shim source>']
+
+        """
+        self.command = command
+        self.process = None
+        self.rados = False
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._reader = None
+        self._stderr_reader = None
+        # the last lines of stderr of the server, drained continuously
+        self._stderr = deque(maxlen=50)
+        # set by the reader when the server exited, no new requests then
+        self._closed = False
+
+    @classmethod
+    def for_pod(cls, pod_name, namespace):
+        """
+        Channel to the server started in the pod via 'oc exec -i'
+
+        Args:
+            pod_name (str): name of the toolbox pod
+            namespace (str): namespace of the pod
+
+        Returns:
+            CephCommandChannel: the channel, not started yet
+
+        """
+        with open(SHIM_PATH) as shim_file:
+            shim = shim_file.read()
+        oc_cmd = OCP(namespace=namespace).oc_cmd(f"exec -i {pod_name} --")
+        return cls(shlex.split(oc_cmd) + ["python3", "-u", "-c", shim])
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """
+        Start the server and wait till it's ready
+
+        Raises:
+            CephChannelClosed: In case the server didn't start
+
+        """
+        log.info("Starting ceph command channel")
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            bufsize=1,
+        )
+        ready = Future()
+        self._pending[0] = ready
+        self._reader = threading.Thread(
+            target=self._read_responses, name="ceph-channel-reader", daemon=True
+        )
+        self._reader.start()
+        self._stderr_reader = threading.Thread(
+            target=self._read_stderr, name="ceph-channel-stderr", daemon=True
+        )
+        self._stderr_reader.start()
+        try:
+            hello = ready.result(START_TIMEOUT)
+        except (TimeoutError, CephChannelClosed) as ex:
+            self.close()
+            raise CephChannelClosed(f"Ceph command channel failed to start: {ex}")
+        self.rados = hello.get("rados", False)
+        log.info(f"Ceph command channel started, librados used: {self.rados}")
+        return self
+
+    def _read_stderr(self):
+        # a full stderr pipe would block the server
+        for line in self.process.stderr:
+            self._stderr.append(line)
+
+    def _read_responses(self):
+        for line in self.process.stdout:
+            try:
+                response = json.loads(line)
+            except ValueError:
+                log.debug(f"Unexpected output of ceph command channel: {line}")
+                continue
+            request_id = 0 if response.get("ready") else response.get("id")
+            with self._lock:
+                future = self._pending.pop(request_id, None)
+            if future is not None:
+                future.set_result(response)
+        # the process exited, fail all the requests waiting for response
+        if self._stderr_reader is not None:
+            self._stderr_reader.join(5)
+        stderr = "".join(self._stderr)
+        with self._lock:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(
+                CephChannelClosed(f"Ceph command channel closed: {stderr.strip()}")
+            )
+
+    def run(self, args, format="json", timeout=600):
+        """
+        Run the ceph command via the channel
+
+        Args:
+            args (list): arguments of the ceph command, e.g. ['osd', 'df']
+            format (str): output format of the command
+            timeout (int): timeout of the command in seconds
+
+        Returns:
+            str: output of the command
+
+        Raises:
+            CommandFailed: In case the command failed
+            CephChannelClosed: In case the channel isn't running
+
+        """
+        request_id = next(self._ids)
+        future = Future()
+        with self._lock:
+            # the reader fails only the futures registered before it exited
+            if self._closed or not self.alive:
+                raise CephChannelClosed("Ceph command channel isn't running")
+            self._pending[request_id] = future
+        request = {"id": request_id, "args": args, "format": format, "timeout": timeout}
+        log.info(f"Executing ceph command via channel: ceph {' '.join(args)}")
+        try:
+            with self._write_lock:
+                self.process.stdin.write(json.dumps(request) + "\n")
+                self.process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as ex:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise CephChannelClosed(f"Ceph command channel closed: {ex}")
+        try:
+            # some time for the transfer on top of the command timeout
+            response = future.result(timeout + 30)
+        except TimeoutError:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise CommandFailed(f"Ceph command {args} timed out via channel")
+        if response["rc"] != 0:
+            raise CommandFailed(
+                f"Error during execution of command: ceph {' '.join(args)}."
+                f"\nError is {response['err']}"
+            )
+        return response["out"]
+
+    def close(self):
+        """
+        Stop the server
+        """
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(10)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+        if self._reader is not None:
+            self._reader.join(10)
+        if self._stderr_reader is not None:
+            self._stderr_reader.join(10)
+
+
+def get_ceph_command_channel(pod_name, namespace):
+    """
+    Get running channel to the toolbox pod, started on the first use
+
+    Args:
+        pod_name (str): name of the toolbox pod
+        namespace (str): namespace of the pod
+
+    Returns:
+        CephCommandChannel: the channel, None if it's disabled in the config
+
+    """
+    if not config.RUN.get("ceph_command_channel"):
+        return None
+    key = (pod_name, namespace)
+    with _channels_lock:
+        channel = _channels.get(key)
+        if channel is None or not channel.alive:
+            channel = CephCommandChannel.for_pod(pod_name, namespace).start()
+            _channels[key] = channel
+        return channel
+
+
+def close_ceph_command_channels(pod_name=None):
+    """
+    Close the channels, e.g. when the toolbox pod was recreated
+
+    Args:
+        pod_name (str): close only channels to this pod, all if not provided
+
+    """
+    with _channels_lock:
+        for key in list(_channels):
+            if pod_name is None or key[0] == pod_name:
+                _channels.pop(key).close()
@@ -0,0 +1,138 @@
+"""
+Ceph command server running inside the rook-ceph-tools pod
+
+It's started by CephCommandChannel via 'oc exec -i' and serves requests
+received as json lines on stdin:
+
+    {"id": 1, "args": ["osd", "df"], "format": "json", "timeout": 60}
+
+with responses written as json lines on stdout in the order of completion:
+
+    {"id": 1, "rc": 0, "out": "...", "err": ""}
+
+Requests are processed concurrently. The commands are sent to the monitors
+(or managers) via one librados connection kept open for the whole session,
+so the ceph CLI isn't started for every command. Commands which can't be
+sent this way fall back to the ceph CLI.
+
+The code runs with the python of the toolbox image, keep it compatible with
+python 3.6 and without other dependencies than the ceph python bindings.
+"""
+import json
+import subprocess
+import sys
+import threading
+
+try:
+    import rados
+    import ceph_argparse
+except ImportError:
+    rados = None
+    ceph_argparse = None
+
+EINVAL = 22
+
+write_lock = threading.Lock()
+
+
+def connect():
+    """
+    Connect to the cluster and get the command descriptions of the monitors
+
+    Returns:
+        tuple: rados.Rados connection and signatures of the commands, both
+            None when librados isn't usable
+
+    """
+    if rados is None:
+        return None, None
+    try:
+        cluster = rados.Rados(conffile="")
+        cluster.conf_read_file()
+        cluster.connect(timeout=30)
+        ret, outbuf, _ = cluster.mon_command(
+            json.dumps({"prefix": "get_command_descriptions"}), b""
+        )
+        if ret != 0:
+            return cluster, None
+        sigdict = ceph_argparse.parse_json_funcsigs(outbuf.decode("utf-8"), "cli")
+        return cluster, sigdict
+    except Exception:
+        return None, None
+
+
+def run_rados(cluster, sigdict, request):
+    """
+    Send the command via librados, returns None when it's not possible
+    """
+    if cluster is None or sigdict is None:
+        return None
+    try:
+        argdict = ceph_argparse.validate_command(sigdict, request["args"], False)
+    except Exception:
+        return None
+    if not argdict:
+        return None
+    if request.get("format"):
+        argdict["format"] = request["format"]
+    cmd = json.dumps(argdict)
+    timeout = request.get("timeout") or 0
+    ret, outbuf, outs = cluster.mon_command(cmd, b"", timeout=timeout)
+    if ret == -EINVAL:
+        # commands implemented by the manager modules
+        ret, outbuf, outs = cluster.mgr_command(cmd, b"", timeout=timeout)
+    return -ret, outbuf.decode("utf-8"), outs
+
+
+def run_cli(request):
+    """
+    Run the command with the ceph CLI
+    """
+    args = ["ceph"] + list(request["args"])
+    if request.get("format"):
+        args += ["--format", request["format"]]
+    try:
+        process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, err = process.communicate(timeout=request.get("timeout"))
+        return process.returncode, out.decode("utf-8"), err.decode("utf-8")
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        return 124, "", "Command timed out"
+    except Exception as ex:
+        return 1, "", str(ex)
+
+
+def handle(cluster, sigdict, request):
+    try:
+        result = run_rados(cluster, sigdict, request)
+    except Exception:
+        result = None
+    if result is None:
+        result = run_cli(request)
+    rc, out, err = result
+    response = json.dumps({"id": request["id"], "rc": rc, "out": out, "err": err})
+    with write_lock:
+        sys.stdout.write(response + "\n")
+        sys.stdout.flush()
+
+
+def main():
+    cluster, sigdict = connect()
+    with write_lock:
+        sys.stdout.write(json.dumps({"ready": True, "rados": sigdict is not None}))
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        thread = threading.Thread(target=handle, args=(cluster, sigdict, request))
+        thread.daemon = True
+        thread.start()
+    if cluster is not None:
+        cluster.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+"""
+Background sampler of the Ceph cluster status into a ring buffer of snapshots
+
+Snapshot example::
+
+    {
+        "time": 1616580902.1,
+        "health": "HEALTH_WARN",
+        "checks": {"OSD_DOWN": "1 osds down"},
+        "num_pgs": 96,
+        "pgs_by_state": {"active+clean": 90, "active+undersized": 6},
+        "read_bytes_sec": 1048576,
+        "write_bytes_sec": 4194304,
+        "read_op_per_sec": 120,
+        "write_op_per_sec": 340,
+        "total_bytes": 322122547200,
+        "total_used_raw_bytes": 3221225472,
+        "osd_utilization": {"0": 1.02, "1": 0.98, "2": 1.0},
+    }
+
+"""
+import collections
+import gzip
+import json
+import logging
+import threading
+import time
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.ocs.resources import pod
+from ocs_ci.utility.utils import get_trim_mean
+
+
+log = logging.getLogger(__name__)
+
+STATUS_CMD = "ceph status"
+DF_CMD = "ceph df"
+OSD_DF_CMD = "ceph osd df"
+COMMANDS = (STATUS_CMD, DF_CMD, OSD_DF_CMD)
+PGMAP_RATES = (
+    "read_bytes_sec",
+    "write_bytes_sec",
+    "read_op_per_sec",
+    "write_op_per_sec",
+)
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def parse_snapshot(outputs, sample_time=None):
+    """
+    Extract the values used by the helpers from the command outputs
+
+    Args:
+        outputs (dict): command to its parsed json output, commands which
+            failed are missing
+        sample_time (float): time of the sample, now by default
+
+    Returns:
+        dict: the snapshot, see the module docstring
+
+    """
+    snapshot = {"time": sample_time or time.time()}
+    status = outputs.get(STATUS_CMD)
+    if status:
+        health = status.get("health", {})
+        snapshot["health"] = health.get("status")
+        snapshot["checks"] = {
+            name: check.get("summary", {}).get("message", "")
+            for name, check in health.get("checks", {}).items()
+        }
+        pgmap = status.get("pgmap", {})
+        snapshot["num_pgs"] = pgmap.get("num_pgs", 0)
+        snapshot["pgs_by_state"] = {
+            state["state_name"]: state["count"]
+            for state in pgmap.get("pgs_by_state", [])
+        }
+        # ceph omits the rates when there is no client IO
+        for key in PGMAP_RATES:
+            snapshot[key] = pgmap.get(key, 0)
+    df = outputs.get(DF_CMD)
+    if df:
+        snapshot["total_bytes"] = df["stats"]["total_bytes"]
+        snapshot["total_used_raw_bytes"] = df["stats"]["total_used_raw_bytes"]
+    osd_df = outputs.get(OSD_DF_CMD)
+    if osd_df:
+        snapshot["osd_utilization"] = {
+            str(node["id"]): round(node["utilization"], 3)
+            for node in osd_df.get("nodes", [])
+        }
+    return snapshot
+
+
+def throughput(snapshot):
+    """
+    Client throughput of the snapshot
+
+    Returns:
+        float: read + write throughput in MiB/s
+
+    """
+    return (snapshot["read_bytes_sec"] + snapshot["write_bytes_sec"]) / 2 ** 20
+
+
+def iops(snapshot):
+    """
+    Client IOPS of the snapshot
+
+    Returns:
+        int: read + write operations per second
+
+    """
+    return snapshot["read_op_per_sec"] + snapshot["write_op_per_sec"]
+
+
+def is_rebalanced(snapshot):
+    """
+    Check whether all the PGs of the snapshot are active+clean
+
+    Returns:
+        bool: True if rebalance is completed, False otherwise
+
+    """
+    return snapshot["pgs_by_state"] == {"active+clean": snapshot["num_pgs"]}
+
+
+class CephStatusSampler(threading.Thread):
+    """
+    Thread fetching the Ceph status into a ring buffer of snapshots
+    """
+
+    def __init__(self, interval=10, size=4320, commands=COMMANDS, fetch=None):
+        """
+        Initializer function
+
+        Args:
+            interval (float): seconds between the samples
+            size (int): max number of snapshots kept, the oldest are dropped
+            commands (tuple): ceph commands run for every sample
+            fetch (function): function running the ceph command and returning
+                its parsed output, exec_ceph_cmd of the toolbox pod by default
+
+        """
+        super(CephStatusSampler, self).__init__(name="ceph-sampler", daemon=True)
+        self.interval = interval
+        self.commands = commands
+        self.fetch = fetch or self._exec_ceph_cmd
+        self.samples = collections.deque(maxlen=size)
+        self.errors = 0
+        self._stop_event = threading.Event()
+        self._new_sample = threading.Condition()
+
+    @staticmethod
+    def _exec_ceph_cmd(ceph_cmd):
+        return pod.get_ceph_tools_pod().exec_ceph_cmd(ceph_cmd=ceph_cmd)
+
+    def sample(self):
+        """
+        Run the commands and add the snapshot to the buffer
+
+        Returns:
+            dict: the snapshot
+
+        """
+        sample_time = time.time()
+        outputs = {}
+        for command in self.commands:
+            try:
+                outputs[command] = self.fetch(command)
+            except Exception as ex:
+                # keep sampling, the cluster may be disrupted on purpose
+                self.errors += 1
+                log.warning(f"Ceph sampler failed to run '{command}': {ex}")
+        snapshot = parse_snapshot(outputs, sample_time)
+        with self._new_sample:
+            self.samples.append(snapshot)
+            self._new_sample.notify_all()
+        return snapshot
+
+    def run(self):
+        log.info(f"Ceph sampler started, interval {self.interval}s")
+        while not self._stop_event.is_set():
+            start = time.monotonic()
+            self.sample()
+            self._stop_event.wait(max(0, self.interval - (time.monotonic() - start)))
+
+    def stop(self):
+        """
+        Stop the sampling and wait for the thread
+        """
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(self.interval + 60)
+        log.info(
+            f"Ceph sampler stopped with {len(self.samples)} snapshots and "
+            f"{self.errors} errors"
+        )
+
+    def window(self, seconds=None, key=None):
+        """
+        Get the snapshots of the last seconds
+
+        Args:
+            seconds (float): length of the window, whole buffer by default
+            key (str): only snapshots having the key, e.g. 'health' isn't
+                in snapshots where 'ceph status' failed
+
+        Returns:
+            list: snapshots from the oldest
+
+        """
+        with self._new_sample:
+            samples = list(self.samples)
+        if seconds is not None:
+            since = time.time() - seconds
+            samples = [sample for sample in samples if sample["time"] >= since]
+        if key is not None:
+            samples = [sample for sample in samples if key in sample]
+        return samples
+
+    def latest(self, key="health", max_age=None):
+        """
+        Get the newest snapshot
+
+        Args:
+            key (str): the snapshot has to have the key
+            max_age (float): max age of the snapshot in seconds, twice the
+                interval by default
+
+        Returns:
+            dict: the snapshot, None if there is no recent one
+
+        """
+        if max_age is None:
+            max_age = 2 * self.interval
+        samples = self.window(max_age, key)
+        return samples[-1] if samples else None
+
+    def last(self, count, key="health", timeout=None, since=None):
+        """
+        Get the newest snapshots, waits till there are enough of them
+
+        Args:
+            count (int): number of snapshots
+            key (str): the snapshots have to have the key
+            timeout (float): max time to wait, (count + 2) * interval by
+                default
+            since (float): ignore the snapshots older than this time, e.g.
+                the time of the call to wait for fresh snapshots only
+
+        Returns:
+            list: snapshots from the oldest
+
+        Raises:
+            TimeoutExpiredError: In case there are not enough snapshots
+
+        """
+        if timeout is None:
+            timeout = (count + 2) * self.interval
+        deadline = time.monotonic() + timeout
+        with self._new_sample:
+            while True:
+                samples = [
+                    sample
+                    for sample in self.samples
+                    if key in sample and (since is None or sample["time"] >= since)
+                ]
+                if len(samples) >= count:
+                    return samples[-count:]
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutExpiredError(
+                        f"Ceph sampler has {len(samples)} of {count} snapshots"
+                    )
+                self._new_sample.wait(remaining)
+
+    def trimmed_mean(self, func, seconds=None, count=None, percentage=20, since=None):
+        """
+        Trimmed mean of a value over a window of snapshots
+
+        Args:
+            func (function): function getting the value from the snapshot,
+                e.g. throughput
+            seconds (float): length of the window
+            count (int): number of the newest snapshots, used instead of
+                seconds, waits for them if needed
+            percentage (int): the percentage to be trimmed
+            since (float): with count, ignore the snapshots older than this
+                time
+
+        Returns:
+            float: the trimmed mean, None if the window is empty
+
+        """
+        if count:
+            samples = self.last(count, since=since)
+        else:
+            samples = self.window(seconds, key="health")
+        if not samples:
+            return None
+        return get_trim_mean([func(sample) for sample in samples], percentage)
+
+    def first_time(self, predicate, since=None):
+        """
+        Find the first snapshot where the condition held
+
+        Args:
+            predicate (function): condition taking the snapshot
+            since (float): ignore the snapshots older than this time
+
+        Returns:
+            dict: the snapshot, None if the condition never held
+
+        """
+        for sample in self.window(key="health"):
+            if since is not None and sample["time"] < since:
+                continue
+            if predicate(sample):
+                return sample
+        return None
+
+    def wait_for(self, predicate, timeout, since=None):
+        """
+        Wait for a snapshot satisfying the condition
+
+        Args:
+            predicate (function): condition taking the snapshot
+            timeout (float): max time to wait in seconds
+            since (float): ignore the snapshots older than this time, now
+                by default so the condition is checked on fresh data
+
+        Returns:
+            dict: the first snapshot satisfying the condition
+
+        Raises:
+            TimeoutExpiredError: In case no snapshot satisfied the condition
+
+        """
+        if since is None:
+            since = time.time()
+        deadline = time.monotonic() + timeout
+        with self._new_sample:
+            while True:
+                sample = self.first_time(predicate, since)
+                if sample is not None:
+                    return sample
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.is_alive():
+                    raise TimeoutExpiredError(
+                        timeout, "No Ceph sampler snapshot satisfied the condition"
+                    )
+                self._new_sample.wait(remaining)
+
+    def dump(self, path):
+        """
+        Write the snapshots to gzip compressed file, one json per line
+
+        Args:
+            path (str): path of the file
+
+        """
+        samples = self.window()
+        with gzip.open(path, "wt") as dump_file:
+            for sample in samples:
+                dump_file.write(json.dumps(sample, separators=(",", ":")) + "\n")
+        log.info(f"Dumped {len(samples)} Ceph sampler snapshots to {path}")
+
+
+def load_samples(path):
+    """
+    Read the snapshots dumped by CephStatusSampler.dump
+
+    Args:
+        path (str): path of the file
+
+    Returns:
+        list: snapshots from the oldest
+
+    """
+    with gzip.open(path, "rt") as dump_file:
+        return [json.loads(line) for line in dump_file if line.strip()]
+
+
+def get_ceph_sampler():
+    """
+    Get the session wide sampler, started on the first use
+
+    Returns:
+        CephStatusSampler: the sampler, None if it's disabled in the config
+
+    """
+    global _sampler
+    if not config.RUN.get("ceph_sampler"):
+        return None
+    with _sampler_lock:
+        if _sampler is None or not _sampler.is_alive():
+            _sampler = CephStatusSampler(
+                interval=config.RUN.get("ceph_sampler_interval", 10),
+                size=config.RUN.get("ceph_sampler_size", 4320),
+            )
+            _sampler.start()
+        return _sampler
+
+
+def stop_ceph_sampler(dump_path=None):
+    """
+    Stop the session wide sampler if it's running
+
+    Args:
+        dump_path (str): dump the snapshots to this file when provided
+
+    Returns:
+        CephStatusSampler: the stopped sampler, None if it wasn't running
+
+    """
+    global _sampler
+    with _sampler_lock:
+        sampler, _sampler = _sampler, None
+    if sampler is None:
+        return None
+    sampler.stop()
+    if dump_path and sampler.samples:
+        sampler.dump(dump_path)
+    return sampler
@@ -15,6 +15,7 @@ import yaml
 import time
 
 import ocs_ci.ocs.resources.pod as pod
+from ocs_ci.ocs import ceph_sampler
 from ocs_ci.ocs.exceptions import UnexpectedBehaviour
 from ocs_ci.ocs.resources import ocs, storage_cluster
 import ocs_ci.ocs.constants as constant
@@ -549,6 +550,10 @@ class CephCluster(object):
 
         """
 
+        sampler = ceph_sampler.get_ceph_sampler()
+        snapshot = sampler.latest() if sampler else None
+        if snapshot:
+            return ceph_sampler.iops(snapshot)
         ceph_pod = pod.get_ceph_tools_pod()
         ceph_status = ceph_pod.exec_ceph_cmd(ceph_cmd="ceph status")
         read_ops = ceph_status["pgmap"]["read_op_per_sec"]
@@ -585,6 +590,10 @@ class CephCluster(object):
             float: The write throughput of the cluster in MiB/s
 
         """
+        sampler = ceph_sampler.get_ceph_sampler()
+        snapshot = sampler.latest() if sampler else None
+        if snapshot:
+            return ceph_sampler.throughput(snapshot)
         ceph_status = self.get_ceph_status()
         for item in ceph_status.split("\n"):
             if "client" in item:
@@ -632,6 +641,15 @@ class CephCluster(object):
             float: The average cluster throughput
 
         """
+        sampler = ceph_sampler.get_ceph_sampler()
+        if sampler:
+            # only the snapshots taken after the call, not the buffered ones
+            return round(
+                sampler.trimmed_mean(
+                    ceph_sampler.throughput, count=samples, since=time.time()
+                ),
+                3,
+            )
         throughput_vals = [self.get_cluster_throughput() for _ in range(samples)]
         return round(get_trim_mean(throughput_vals), 3)
 
@@ -643,7 +661,12 @@ class CephCluster(object):
             bool: True if rebalance is completed, False otherwise
 
         """
-
+        sampler = ceph_sampler.get_ceph_sampler()
+        snapshot = sampler.latest() if sampler else None
+        if snapshot:
+            logger.info(f"{snapshot['health']} {snapshot['checks']}")
+            logger.info(snapshot["pgs_by_state"])
+            return ceph_sampler.is_rebalanced(snapshot)
         ceph_pod = pod.get_ceph_tools_pod()
         ceph_status = ceph_pod.exec_ceph_cmd(ceph_cmd="ceph status")
         ceph_health = ceph_pod.exec_ceph_cmd(ceph_cmd="ceph health")
@@ -668,7 +691,15 @@ class CephCluster(object):
             bool: True if rebalance completed, False otherwise
 
         """
+        sampler = ceph_sampler.get_ceph_sampler()
         try:
+            if sampler:
+                snapshot = sampler.wait_for(ceph_sampler.is_rebalanced, timeout)
+                logging.info(
+                    f"Re-balance is completed, {snapshot['num_pgs']} PGs are "
+                    f"active+clean"
+                )
+                return True
             for rebalance in TimeoutSampler(
                 timeout=timeout, sleep=10, func=self.get_rebalance_status
             ):
@@ -729,9 +760,19 @@ class CephHealthMonitor(threading.Thread):
 
     def run(self):
         self.health_monitor_enabled = True
+        sampler = ceph_sampler.get_ceph_sampler()
         while self.health_monitor_enabled and (not self.health_error_status):
             time.sleep(self.sleep)
-            self.latest_health_status = self.ceph_cluster.get_ceph_health(detail=True)
+            snapshot = sampler.latest() if sampler else None
+            if snapshot:
+                checks = "; ".join(
+                    f"{name}: {message}" for name, message in snapshot["checks"].items()
+                )
+                self.latest_health_status = f"{snapshot['health']} {checks}"
+            else:
+                self.latest_health_status = self.ceph_cluster.get_ceph_health(
+                    detail=True
+                )
             if "HEALTH_ERROR" in self.latest_health_status:
                 self.health_error_status = self.ceph_cluster.get_ceph_status()
                 self.log_error_status()
@@ -2,8 +2,11 @@
 A module for cluster load related functionalities
 
 """
+import json
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from uuid import uuid4
 import math
@@ -13,10 +16,12 @@ from yaml.scanner import ScannerError
 
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.prometheus import PrometheusAPI
-from ocs_ci.utility.utils import get_trim_mean
+from ocs_ci.utility.utils import get_trim_mean, ocsci_log_path
 from ocs_ci.utility import templating
 from ocs_ci.ocs import constants, defaults
 from ocs_ci.ocs.cluster import get_osd_pods_memory_sum, get_percent_used_capacity
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resources.pod import Pod
 from ocs_ci.framework import config
 
 
@@ -39,6 +44,214 @@ def wrap_msg(msg):
     return f"\n{marks}\n{msg}\n{marks}"
 
 
+# file in the FIO pod with the current value of FIO 'rate' param, 0 pauses IO
+RATE_FILE = "/tmp/fio-rate"
+# seconds of one FIO run of the loop, the max delay of a rate change
+FIO_SEGMENT_RUNTIME = 60
+# seconds of the window of the rates in IOPS_QUERY and LATENCY_QUERY
+QUERY_WINDOW = 60
+# seconds since a rate change till the metrics reflect only the new rate
+RATE_SETTLE_TIME = FIO_SEGMENT_RUNTIME + QUERY_WINDOW
+RATE_UNITS = {"": 1, "k": 2 ** 10, "m": 2 ** 20, "g": 2 ** 30}
+
+
+def parse_rate(rate):
+    """
+    Convert FIO 'rate' value to bytes per second
+
+    Args:
+        rate (str): FIO 'rate' value (e.g. '20M')
+
+    Returns:
+        int: bytes per second
+
+    """
+    rate = str(rate).strip().lower()
+    unit = rate[-1] if rate[-1] in RATE_UNITS else ""
+    return int(float(rate[: len(rate) - len(unit)]) * RATE_UNITS[unit])
+
+
+def format_rate(rate):
+    """
+    Convert bytes per second to FIO 'rate' value
+
+    Args:
+        rate (float): bytes per second
+
+    Returns:
+        str: FIO 'rate' value in KiB (e.g. '20480k'), '0' for no rate
+
+    """
+    if rate <= 0:
+        return "0"
+    return f"{max(int(rate // 2 ** 10), 1)}k"
+
+
+def find_cluster_limit(
+    measure,
+    start_rate,
+    max_rate,
+    bisect_steps=3,
+    min_gain=0.1,
+    max_latency=250,
+    should_stop=None,
+):
+    """
+    Find the cluster IOPS limit by doubling the FIO rate till the IOPS stop
+    growing or the latency gets too high, then bisect the last interval to
+    find the knee of the IOPS/latency curve
+
+    Args:
+        measure (function): sets the rate (bytes per second, every pod) and
+            returns the measured (iops, latency in ms)
+        start_rate (float): the first rate in bytes per second
+        max_rate (float): the max rate in bytes per second
+        bisect_steps (int): number of the bisection steps
+        min_gain (float): min relative IOPS gain of a rate doubling, lower
+            gain means the cluster is saturated
+        max_latency (float): latency in ms which means saturation
+        should_stop (function): returns reason to stop the search (e.g.
+            timeout, cluster is full), None to continue
+
+    Returns:
+        tuple: the cluster limit in IOPS and the measured curve, list of
+            dicts with 'rate', 'iops' and 'latency' keys
+
+    """
+    curve = []
+
+    def point(rate):
+        iops, latency = measure(rate)
+        curve.append({"rate": rate, "iops": iops, "latency": latency})
+        logger.info(
+            f"FIO rate {format_rate(rate)}: IOPS {iops:.2f}, latency {latency:.2f} ms"
+        )
+        return curve[-1]
+
+    def stop():
+        reason = should_stop() if should_stop else None
+        if reason:
+            logger.warning(wrap_msg(f"Stopping the search of the limit: {reason}"))
+        return reason
+
+    low = point(start_rate)
+    high = None
+    while low["rate"] < max_rate and not stop():
+        current = point(min(low["rate"] * 2, max_rate))
+        if current["latency"] > max_latency or current["iops"] < low["iops"] * (
+            1 + min_gain
+        ):
+            high = current
+            break
+        low = current
+    if high:
+        for _ in range(bisect_steps):
+            if stop():
+                break
+            current = point(math.sqrt(low["rate"] * high["rate"]))
+            # half of the rate ratio, so a half of the expected gain
+            if current["latency"] > max_latency or current["iops"] < low["iops"] * (
+                1 + min_gain / 2
+            ):
+                high = current
+            else:
+                low = current
+    healthy = [p["iops"] for p in curve if p["latency"] <= max_latency]
+    return max(healthy or [p["iops"] for p in curve]), curve
+
+
+def rate_for_iops(curve, target_iops):
+    """
+    Estimate the rate which gives the target IOPS from the measured curve
+
+    Args:
+        curve (list): points measured by find_cluster_limit
+        target_iops (float): the target IOPS
+
+    Returns:
+        float: the rate in bytes per second
+
+    """
+    points = sorted(curve, key=lambda p: p["rate"])
+    previous = None
+    for current in points:
+        if current["iops"] >= target_iops:
+            if previous is None or current["iops"] == previous["iops"]:
+                return current["rate"] * target_iops / max(current["iops"], 1)
+            ratio = (target_iops - previous["iops"]) / (
+                current["iops"] - previous["iops"]
+            )
+            return previous["rate"] + ratio * (current["rate"] - previous["rate"])
+        previous = current
+    return points[-1]["rate"]
+
+
+class RateController(object):
+    """
+    Feedback controller of the FIO rate holding the target IOPS
+    """
+
+    def __init__(
+        self,
+        target_iops,
+        rate,
+        min_rate=2 ** 20,
+        max_rate=2 ** 30,
+        gain=0.7,
+        deadband=0.05,
+        max_step=2.0,
+        max_latency=250,
+    ):
+        """
+        Initializer function
+
+        Args:
+            target_iops (float): the IOPS to hold
+            rate (float): the current rate in bytes per second
+            min_rate (float): min rate in bytes per second
+            max_rate (float): max rate in bytes per second
+            gain (float): exponent of the correction, lower is smoother
+            deadband (float): relative IOPS error which isn't corrected
+            max_step (float): max change of the rate by one update
+            max_latency (float): latency in ms above which the rate is halved
+
+        """
+        self.target_iops = target_iops
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.gain = gain
+        self.deadband = deadband
+        self.max_step = max_step
+        self.max_latency = max_latency
+
+    def update(self, iops, latency):
+        """
+        Compute the new rate from the measured values
+
+        Args:
+            iops (float): the measured IOPS
+            latency (float): the measured latency in ms
+
+        Returns:
+            float: the new rate in bytes per second, None if the rate
+                doesn't need to be changed
+
+        """
+        if latency > self.max_latency:
+            factor = 0.5
+        elif abs(self.target_iops - iops) <= self.target_iops * self.deadband:
+            return None
+        else:
+            factor = (self.target_iops / max(iops, 1)) ** self.gain
+        factor = min(max(factor, 1 / self.max_step), self.max_step)
+        rate = min(max(self.rate * factor, self.min_rate), self.max_rate)
+        if rate == self.rate:
+            return None
+        self.rate = rate
+        return rate
+
+
 class ClusterLoad:
     """
     A class for cluster load functionalities
@@ -83,31 +296,27 @@ class ClusterLoad:
             self.pvc_size = 10
         self.sleep_time = 45
         self.target_pods_number = None
+        # FIO pods with the rate adjustable in place and the feedback controller
+        self.adjustable_rate = config.RUN.get("io_load_controller", False)
+        self.controller = None
+        self.rate_set_time = None
+        self.curve = list()
         if project_factory:
             project_name = f"{defaults.BG_LOAD_NAMESPACE}-{uuid4().hex[:5]}"
             self.project = project_factory(project_name=project_name)
 
-    def increase_load(self, rate, wait=True):
+    def fio_args(self, rate):
         """
-        Create a PVC, a service account and a DeploymentConfig of FIO pod
+        Get FIO arguments of the FIO DeploymentConfig template with the
+        updated file size and rate
 
         Args:
             rate (str): FIO 'rate' value (e.g. '20M')
-            wait (bool): True for waiting for IO to kick in on the
-                newly created pod, False otherwise
 
-        """
-        pvc_obj = self.pvc_factory(
-            interface=constants.CEPHBLOCKPOOL,
-            project=self.project,
-            size=self.pvc_size,
-            volume_mode=constants.VOLUME_MODE_BLOCK,
-        )
-        self.pvc_objs.append(pvc_obj)
-        service_account = self.sa_factory(pvc_obj.project)
+        Returns:
+            list: the FIO arguments
 
-        # Set new arguments with the updated file size to be used for
-        # DeploymentConfig of FIO pod creation
+        """
         fio_dc_data = templating.load_yaml(constants.FIO_DC_YAML)
         args = (
             fio_dc_data.get("spec")
@@ -124,13 +333,70 @@ class ClusterLoad:
         io_file_size = f"{self.pvc_size * 1000 - 200}M"
         new_args.append(f"--filesize={io_file_size}")
         new_args.append(f"--rate={rate}")
+        return new_args
+
+    def fio_loop_script(self, rate):
+        """
+        Get shell script running FIO in a loop, every run with the rate read
+        from RATE_FILE, so the rate can be changed without restarting the pod
+
+        Args:
+            rate (str): the initial FIO 'rate' value (e.g. '20M')
+
+        Returns:
+            str: the script
+
+        """
+        args = [
+            x
+            for x in self.fio_args(rate)
+            if not x.startswith(("--rate=", "--runtime=", "--time_based="))
+        ]
+        return (
+            f"echo {rate} > {RATE_FILE}; "
+            "while true; do "
+            f"rate=$(cat {RATE_FILE}); "
+            'if [ "$rate" = 0 ]; then sleep 5; continue; fi; '
+            f"/usr/bin/fio {' '.join(args)} --rate=$rate "
+            f"--time_based=1 --runtime={FIO_SEGMENT_RUNTIME} > /dev/null; "
+            "done"
+        )
+
+    def increase_load(self, rate, wait=True):
+        """
+        Create a PVC, a service account and a DeploymentConfig of FIO pod
+
+        Args:
+            rate (str): FIO 'rate' value (e.g. '20M')
+            wait (bool): True for waiting for IO to kick in on the
+                newly created pod, False otherwise
+
+        """
+        pvc_obj = self.pvc_factory(
+            interface=constants.CEPHBLOCKPOOL,
+            project=self.project,
+            size=self.pvc_size,
+            volume_mode=constants.VOLUME_MODE_BLOCK,
+        )
+        self.pvc_objs.append(pvc_obj)
+        service_account = self.sa_factory(pvc_obj.project)
+
+        # Set new arguments with the updated file size to be used for
+        # DeploymentConfig of FIO pod creation
+        if self.adjustable_rate:
+            command = ["/bin/sh", "-c"]
+            command_args = [self.fio_loop_script(rate)]
+        else:
+            command = None
+            command_args = self.fio_args(rate)
         dc_obj = self.pod_factory(
             pvc=pvc_obj,
             pod_dict_path=constants.FIO_DC_YAML,
             raw_block_pv=True,
             deployment_config=True,
             service_account=service_account,
-            command_args=new_args,
+            command=command,
+            command_args=command_args,
         )
         self.dc_objs.append(dc_obj)
         if wait:
@@ -140,6 +406,34 @@ class ClusterLoad:
             )
             time.sleep(self.sleep_time)
 
+    def set_rate(self, rate):
+        """
+        Change FIO 'rate' of all the running FIO pods in place, the FIO run
+        is restarted with the new rate
+
+        Args:
+            rate (str): FIO 'rate' value (e.g. '20M'), '0' pauses the IO
+
+        """
+        pod_ocp = OCP(kind=constants.POD, namespace=self.project.namespace)
+        pods = [
+            Pod(**pod_data)
+            for dc_obj in self.dc_objs
+            for pod_data in pod_ocp.get(selector=f"name={dc_obj.name}")["items"]
+        ]
+        command = f"sh -c 'echo {rate} > {RATE_FILE}; pkill fio; true'"
+        with ThreadPoolExecutor(max_workers=max(len(pods), 1)) as executor:
+            list(
+                executor.map(
+                    lambda pod_obj: pod_obj.exec_cmd_on_pod(
+                        command, out_yaml_format=False
+                    ),
+                    pods,
+                )
+            )
+        self.rate_set_time = time.time()
+        logger.info(f"FIO rate of {len(pods)} FIO pods set to {rate}")
+
     def decrease_load(self, wait=True):
         """
         Delete DeploymentConfig with its pods and the PVC. Then, wait for the
@@ -203,6 +497,9 @@ class ClusterLoad:
                 "not within the accepted range. Therefore, IO will not be started"
             )
             return
+        if self.adjustable_rate:
+            self.reach_cluster_load_percentage_with_controller()
+            return
         low_diff_counter = 0
         cluster_limit = None
         latency_vals = list()
@@ -336,6 +633,135 @@ class ClusterLoad:
         logger.info(wrap_msg(msg))
         self.target_pods_number = len(self.dc_objs)
 
+    def measure(self, settle_time=None):
+        """
+        Wait for the load to settle and measure the cluster IOPS and latency
+
+        Args:
+            settle_time (int): seconds to wait before the measurement, by
+                default till the last rate change settles with adjustable
+                rate (see rate_settle_remaining), self.sleep_time otherwise
+
+        Returns:
+            tuple: the IOPS and the latency in ms
+
+        """
+        if settle_time is None:
+            settle_time = (
+                self.rate_settle_remaining()
+                if self.adjustable_rate
+                else self.sleep_time
+            )
+        time.sleep(settle_time)
+        iops = self.calc_trim_metric_mean(metric=constants.IOPS_QUERY, mute_logs=True)
+        latency = (
+            self.calc_trim_metric_mean(metric=constants.LATENCY_QUERY, mute_logs=True)
+            * 1000
+        )
+        self.previous_iops, self.current_iops = self.current_iops, iops
+        return iops, latency
+
+    def rate_settle_remaining(self):
+        """
+        Returns:
+            float: seconds till the metrics reflect only the rate set by the
+                last set_rate, 0 if they do already
+        """
+        if not self.rate_set_time:
+            return 0
+        return max(0, self.rate_set_time + RATE_SETTLE_TIME - time.time())
+
+    def save_curve(self):
+        """
+        Save the IOPS/latency curve measured by the search of the cluster
+        limit to cluster_load_curve.json in the log directory
+        """
+        curve_path = os.path.join(ocsci_log_path(), "cluster_load_curve.json")
+        os.makedirs(os.path.dirname(curve_path), exist_ok=True)
+        with open(curve_path, "w") as curve_file:
+            json.dump(
+                {
+                    "pods": len(self.dc_objs),
+                    "cluster_limit": self.cluster_limit,
+                    "points": self.curve,
+                },
+                curve_file,
+                indent=2,
+            )
+        logger.info(f"IOPS/latency curve saved to {curve_path}")
+
+    def reach_cluster_load_percentage_with_controller(self):
+        """
+        Reach the target percentage with a fixed number of FIO pods which
+        have the rate adjustable in place.
+
+        The cluster limit is found by doubling the rate of all the pods
+        till the IOPS stop growing or the latency is higher than 250 ms,
+        followed by bisection of the last interval. Then the rate estimated
+        from the measured curve for the target IOPS is set and corrected by
+        the feedback controller till the IOPS are within 5% of the target.
+
+        """
+        time_to_wait = 60 * 30
+        time_before = time.time()
+        pods_number = config.RUN.get("io_load_controller_pods", 6)
+        logger.info(f"Creating {pods_number} FIO pods with adjustable rate")
+        for _ in range(pods_number):
+            self.increase_load(rate="1M", wait=False)
+
+        def measure_at_rate(rate):
+            self.set_rate(format_rate(rate))
+            iops, latency = self.measure()
+            self.curve.append(
+                {
+                    "time": time.time(),
+                    "rate": format_rate(rate),
+                    "requested_iops": rate * pods_number / parse_rate("128K"),
+                    "iops": iops,
+                    "latency": latency,
+                }
+            )
+            return iops, latency
+
+        def should_stop():
+            if time.time() > time_before + time_to_wait:
+                return f"the {time_to_wait} seconds timeout was reached"
+            cluster_used_space = get_percent_used_capacity()
+            if cluster_used_space > 60:
+                return f"cluster used space is {cluster_used_space}%"
+            return None
+
+        self.cluster_limit, curve = find_cluster_limit(
+            measure_at_rate,
+            start_rate=parse_rate("4M"),
+            max_rate=parse_rate("512M"),
+            should_stop=should_stop,
+        )
+        logger.info(wrap_msg(f"The cluster IOPS limit is {self.cluster_limit:.2f}"))
+        self.save_curve()
+
+        target_iops = self.cluster_limit * self.target_percentage
+        rate = rate_for_iops(curve, target_iops)
+        self.controller = RateController(target_iops, rate)
+        msg = (
+            f"The target load, in IOPS, is: {target_iops}, which is "
+            f"{self.target_percentage*100}% of the {self.cluster_limit} cluster limit"
+        )
+        logger.info(wrap_msg(msg))
+        for _ in range(10):
+            self.rate = format_rate(self.controller.rate)
+            self.set_rate(self.rate)
+            iops, latency = self.measure()
+            if self.controller.update(iops, latency) is None:
+                break
+            if time.time() > time_before + time_to_wait:
+                logger.warning("Timeout reached while adjusting the load")
+                break
+        self.print_metrics()
+        msg = f"The target load, of {self.target_percentage * 100}%, has been reached"
+        logger.info(wrap_msg(msg))
+        self.target_pods_number = len(self.dc_objs)
+
     @retry((IndexError, ScannerError), tries=15, delay=5, backoff=1)
     def get_query(self, query, mute_logs=False):
         """
@@ -429,6 +855,20 @@ class ClusterLoad:
         to make sure that cluster load is around the target percentage
 
         """
+        if self.controller:
+            # the metrics don't reflect the last rate change yet
+            if self.rate_settle_remaining():
+                return
+            iops, latency = self.measure(settle_time=0)
+            rate = self.controller.update(iops, latency)
+            if rate is not None:
+                logger.info(
+                    f"IOPS {iops:.2f} and latency {latency:.2f} ms, adjusting the "
+                    f"FIO rate to hold {self.controller.target_iops:.2f} IOPS"
+                )
+                self.rate = format_rate(rate)
+                self.set_rate(self.rate)
+            return
         latency = self.calc_trim_metric_mean(constants.LATENCY_QUERY, mute_logs=True)
         if latency > 0.25 and len(self.dc_objs) > 0:
             msg = (
@@ -451,6 +891,11 @@ class ClusterLoad:
         Pause the cluster load
 
         """
+        if self.controller:
+            logger.info(wrap_msg(f"{'Pausing' if pause else 'Reducing'} the load"))
+            rate = "0" if pause else format_rate(self.controller.rate / 2)
+            self.set_rate(rate)
+            return
         pods_to_keep = 0 if pause else int(len(self.dc_objs) / 2)
         logger.info(
             wrap_msg(
@@ -466,5 +911,8 @@ class ClusterLoad:
 
         """
         logger.info(wrap_msg("Resuming the cluster load"))
+        if self.controller:
+            self.set_rate(self.rate)
+            return
         while len(self.dc_objs) < self.target_pods_number:
             self.increase_load(rate=self.rate, wait=False)
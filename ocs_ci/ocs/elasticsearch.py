@@ -6,11 +6,11 @@ Interface for the Performance ElasticSearch server
 import logging
 import base64
 import time
-import json
 
-from elasticsearch import Elasticsearch, helpers, exceptions as esexp
+from elasticsearch import Elasticsearch, exceptions as esexp
 
 from ocs_ci.ocs import constants
+from ocs_ci.ocs.es_transfer import copy_index, get_connection, load_file
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.utils import get_pod_name_by_pattern
 from ocs_ci.utility.utils import TimeoutSampler
@@ -27,6 +27,9 @@ def elasticsearch_load(connection, target_path):
     """
     Load all data from target_path/results into an elasticsearch (es) server.
 
+    The dump files are streamed into the server in chunks, see
+    :py:func:`ocs_ci.ocs.es_transfer.load_file`.
+
     Args:
         connection (obj): an elasticsearch connection object
         target_path (str): the path where data was dumped into
@@ -35,39 +38,6 @@ def elasticsearch_load(connection, target_path):
         bool: True if loading data succeed, False otherwise
 
     """
-
-    # define a function that will load a text file
-    def get_data_from_text_file(json_file):
-        """
-        This function will return a list of docs stored in a text file
-
-        Args:
-            json_file (str): the file name to look for docs in
-
-        Returns:
-             list : list of documents as json dicts
-
-        """
-
-        docs = [
-            l.strip() for l in open(str(json_file), encoding="utf8", errors="ignore")
-        ]
-        log.info(f"String docs length: {len(docs)}")
-        doc_list = []
-
-        for num, doc in enumerate(docs):
-            try:
-                dict_doc = json.loads(doc)
-                doc_list += [dict_doc]
-            except json.decoder.JSONDecodeError as err:
-                # print the errors
-                log.error(
-                    f"ERROR for num: {num} -- JSONDecodeError: {err} for doc: {doc}"
-                )
-
-        log.info(f"Dict docs length: {len(doc_list)}")
-        return doc_list
-
     all_files = run_command(f"ls {target_path}/results/", out_format="list")
     if "Error in command" in all_files:
         log.error("There is No data to load into ES server")
@@ -77,21 +47,16 @@ def elasticsearch_load(connection, target_path):
             log.warning("There is no elasticsearch server to load data into")
             return False
         log.info(f"The ES connection is {connection}")
+        connection = get_connection(connection)
         for ind in all_files:
             if ".data." in ind:  # load only data files and not mapping info
                 file_name = f"{target_path}/results/{ind}"
                 ind_name = ind.split(".")[0]
                 log.info(f"Loading the {ind} data into the ES server")
-                docs_list = get_data_from_text_file(file_name)
-
                 try:
-                    log.info(
-                        "Attempting to index the list of docs using helpers.bulk()"
-                    )
-                    resp = helpers.bulk(connection, docs_list, index=ind_name)
-                    log.info(f"helpers.bulk() RESPONSE: {resp}")
+                    load_file(connection, file_name, ind_name)
                 except Exception as err:
-                    log.error(f"Elasticsearch helpers.bulk() ERROR:{err}")
+                    log.error(f"Elasticsearch bulk load ERROR:{err}")
         return True
 
 
@@ -308,27 +273,24 @@ class ElasticSearch(object):
         """
         Copy All data from the internal ES server to the main ES.
 
-        **This is deprecated function** , use the dump function, and load
-        the data from the files for the main ES server
+        All documents of every index are read with scroll and written in
+        bulk, see :py:func:`ocs_ci.ocs.es_transfer.copy_index`.
 
         Args:
             es (obj): elasticsearch object which connected to the main ES
-        """
 
-        query = {"size": 1000, "query": {"match_all": {}}}
+        Returns:
+            dict: index name to its copy stats
+
+        """
+        all_stats = {}
         for ind in self.get_indices():
-            log.info(f"Reading {ind} from internal ES server")
+            log.info(f"Copying {ind} from internal ES server into main ES server")
             try:
-                result = self.con.search(index=ind, body=query)
+                all_stats[ind] = copy_index(self.con, es, ind)
             except esexp.NotFoundError:
                 log.warning(f"{ind} Not found in the Internal ES.")
-                continue
-
-            log.debug(f"The results from internal ES for {ind} are :{result}")
-            log.info(f"Writing {ind} into main ES server")
-            for doc in result["hits"]["hits"]:
-                log.debug(f"Going to write : {doc}")
-                es.index(index=ind, doc_type="_doc", body=doc["_source"])
+        return all_stats
 
     def dumping_all_data(self, target_path):
         """
@@ -0,0 +1,170 @@
+"""
+Streaming transfer of documents into and between Elasticsearch servers
+"""
+import json
+import logging
+import time
+
+from elasticsearch import Elasticsearch, helpers
+
+from ocs_ci.framework import config
+
+
+log = logging.getLogger(__name__)
+
+
+def read_docs(file_name, errors=None):
+    """
+    Read the documents of a dump file, one json document per line
+
+    Args:
+        file_name (str): path of the file
+        errors (list): the line numbers of the documents which are not valid
+            json are appended to it
+
+    Yields:
+        dict: the documents
+
+    """
+    with open(str(file_name), encoding="utf8", errors="ignore") as docs_file:
+        for num, line in enumerate(docs_file):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.decoder.JSONDecodeError as err:
+                log.error(f"ERROR for num: {num} -- JSONDecodeError: {err}")
+                if errors is not None:
+                    errors.append(num)
+
+
+def get_connection(connection):
+    """
+    Returns:
+        Elasticsearch: the connection, created if connection is a dict with
+            host and port
+    """
+    if isinstance(connection, dict):
+        return Elasticsearch([connection])
+    return connection
+
+
+def bulk_load(connection, actions, index=None, chunk_size=None, threads=None):
+    """
+    Write the documents in chunks, by parallel threads
+
+    Args:
+        connection (Elasticsearch): the target server
+        actions (iterable): documents or bulk actions, e.g. {'_index': ...,
+            '_id': ..., '_source': {...}}
+        index (str): index of the actions which don't have '_index'
+        chunk_size (int): number of documents in one bulk request,
+            RUN['es_bulk_chunk_size'] by default
+        threads (int): number of parallel bulk requests, RUN['es_bulk_threads']
+            by default, streaming_bulk is used with 1
+
+    Returns:
+        dict: {'docs': number of the written documents, 'errors': number of
+            the failed ones, 'seconds': ..., 'docs_per_sec': ...}
+
+    """
+    connection = get_connection(connection)
+    chunk_size = chunk_size or config.RUN.get("es_bulk_chunk_size", 500)
+    threads = threads or config.RUN.get("es_bulk_threads", 4)
+    kwargs = {"chunk_size": chunk_size, "raise_on_error": False}
+    if index:
+        kwargs["index"] = index
+    if threads > 1:
+        results = helpers.parallel_bulk(
+            connection, actions, thread_count=threads, **kwargs
+        )
+    else:
+        results = helpers.streaming_bulk(connection, actions, **kwargs)
+    start = time.time()
+    stats = {"docs": 0, "errors": 0}
+    for ok, item in results:
+        if ok:
+            stats["docs"] += 1
+        else:
+            stats["errors"] += 1
+            if stats["errors"] <= 10:
+                log.error(f"Failed to write a document: {item}")
+    stats["seconds"] = time.time() - start
+    stats["docs_per_sec"] = stats["docs"] / stats["seconds"] if stats["seconds"] else 0
+    return stats
+
+
+def load_file(connection, file_name, index, chunk_size=None, threads=None):
+    """
+    Load the documents of a dump file into an index
+
+    Args:
+        connection (Elasticsearch): the target server
+        file_name (str): path of the file, one json document per line
+        index (str): the index
+        chunk_size (int): number of documents in one bulk request
+        threads (int): number of parallel bulk requests
+
+    Returns:
+        dict: the stats, see bulk_load, with 'invalid' number of the lines
+            which are not valid json
+
+    """
+    invalid = []
+    stats = bulk_load(
+        connection,
+        read_docs(file_name, invalid),
+        index=index,
+        chunk_size=chunk_size,
+        threads=threads,
+    )
+    stats["invalid"] = len(invalid)
+    log.info(
+        f"Loaded {stats['docs']} documents of {file_name} into {index} "
+        f"({stats['docs_per_sec']:.0f} docs/sec), {stats['errors']} failed, "
+        f"{stats['invalid']} not valid"
+    )
+    return stats
+
+
+def copy_index(
+    source,
+    target,
+    index,
+    target_index=None,
+    page_size=1000,
+    chunk_size=None,
+    threads=None,
+):
+    """
+    Copy all documents of an index, keeping their ids
+
+    Args:
+        source (Elasticsearch): the server to copy from
+        target (Elasticsearch): the server to copy to
+        index (str): the index
+        target_index (str): name of the index in the target server, the same
+            by default
+        page_size (int): number of documents read by one scroll request
+        chunk_size (int): number of documents in one bulk request
+        threads (int): number of parallel bulk requests
+
+    Returns:
+        dict: the stats, see bulk_load
+
+    """
+    target_index = target_index or index
+    hits = helpers.scan(
+        source, query={"query": {"match_all": {}}}, index=index, size=page_size
+    )
+    actions = (
+        {"_index": target_index, "_id": hit["_id"], "_source": hit["_source"]}
+        for hit in hits
+    )
+    stats = bulk_load(target, actions, chunk_size=chunk_size, threads=threads)
+    log.info(
+        f"Copied {stats['docs']} documents of {index} "
+        f"({stats['docs_per_sec']:.0f} docs/sec), {stats['errors']} failed"
+    )
+    return stats
@@ -287,3 +287,19 @@ class UnhealthyBucket(Exception):
 
 class NotFoundError(Exception):
     pass
+
+
+class UnsupportedAPIBackendCall(Exception):
+    pass
+
+
+class SamplingCancelled(Exception):
+    pass
+
+
+class CephChannelClosed(CommandFailed):
+    pass
+
+
+class NoobaaRpcError(Exception):
+    pass
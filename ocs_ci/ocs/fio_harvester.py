@@ -0,0 +1,219 @@
+"""
+Harvesting of the results of fio running detached in the pods
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
+
+
+log = logging.getLogger(__name__)
+
+# printed by the poll command when fio is still running
+RUNNING = "fio-running"
+
+_harvester = None
+_harvester_lock = threading.Lock()
+
+
+class DetachedFio(object):
+    """
+    fio started in background in a pod
+    """
+
+    def __init__(self, pod, output_file, rc_file, deadline, not_before=0):
+        """
+        Initializer function
+
+        Args:
+            pod (Pod): the pod running fio
+            output_file (str): path of the json output of fio in the pod
+            rc_file (str): path of the file with the return code of fio in
+                the pod, created when fio finishes
+            deadline (float): time when the fio has to be finished
+            not_before (float): time before which fio can't finish, e.g. the
+                end of time based run
+
+        """
+        self.pod = pod
+        self.output_file = output_file
+        self.rc_file = rc_file
+        self.deadline = deadline
+        self.not_before = not_before
+        self.future = Future()
+        self.failed_polls = 0
+
+    def poll_command(self):
+        """
+        Returns:
+            str: command printing the return code and the output of fio, or
+                RUNNING
+        """
+        return (
+            f"sh -c 'if [ -f {self.rc_file} ]; then "
+            f"cat {self.rc_file} {self.output_file}; else echo {RUNNING}; fi'"
+        )
+
+
+class FioHarvester(object):
+    """
+    Polls the pods with detached fio and collects the results
+    """
+
+    def __init__(self, interval=30, batch_size=20, max_workers=8):
+        """
+        Initializer function
+
+        Args:
+            interval (int): seconds between the polls
+            batch_size (int): number of pods polled at once
+            max_workers (int): number of threads polling the pods of a batch
+
+        """
+        self.interval = interval
+        self.batch_size = batch_size
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fio-harvester"
+        )
+        self._pending = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add(self, detached):
+        """
+        Start harvesting the results of detached fio
+
+        Args:
+            detached (DetachedFio): the fio
+
+        Returns:
+            Future: resolved with the fio output, or failed with CommandFailed
+                or TimeoutExpiredError
+
+        """
+        with self._lock:
+            self._pending.append(detached)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="fio-harvester", daemon=True
+                )
+                self._thread.start()
+        return detached.future
+
+    def _poll(self, detached):
+        """
+        Poll one pod, resolves its future when fio finished
+
+        Returns:
+            bool: True if the future is resolved
+        """
+        now = time.time()
+        try:
+            out = detached.pod.exec_cmd_on_pod(
+                detached.poll_command(), out_yaml_format=False, timeout=120
+            )
+        except Exception as ex:
+            detached.failed_polls += 1
+            log.warning(f"Failed to poll fio on pod {detached.pod.name}: {ex}")
+            if now < detached.deadline:
+                return False
+            detached.future.set_exception(
+                CommandFailed(f"Failed to get fio results of {detached.pod.name}: {ex}")
+            )
+            return True
+        if out.strip() == RUNNING:
+            if now < detached.deadline:
+                return False
+            detached.future.set_exception(
+                TimeoutExpiredError(f"fio on pod {detached.pod.name} didn't finish")
+            )
+            return True
+        rc, _, output = out.partition("\n")
+        if rc.strip() != "0":
+            detached.future.set_exception(
+                CommandFailed(
+                    f"fio on pod {detached.pod.name} failed with {rc.strip()}: "
+                    f"{output}"
+                )
+            )
+        else:
+            detached.future.set_result(output)
+        return True
+
+    def poll(self):
+        """
+        Poll the pods whose fio could have finished, batch by batch
+
+        Returns:
+            int: number of the resolved futures
+
+        """
+        now = time.time()
+        with self._lock:
+            due = [detached for detached in self._pending if detached.not_before <= now]
+        resolved = []
+        for index in range(0, len(due), self.batch_size):
+            batch = due[index : index + self.batch_size]
+            for detached, done in zip(batch, self.executor.map(self._poll, batch)):
+                if done:
+                    resolved.append(detached)
+        if resolved:
+            with self._lock:
+                self._pending = [
+                    detached for detached in self._pending if detached not in resolved
+                ]
+            log.info(
+                f"Harvested fio results of {len(resolved)} pods, "
+                f"{len(self._pending)} pending"
+            )
+        return len(resolved)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                log.exception("Failed to poll the pods with detached fio")
+
+    def stop(self):
+        """
+        Stop polling, the pending futures are cancelled
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for detached in pending:
+            detached.future.cancel()
+        self.executor.shutdown()
+
+
+def get_fio_harvester():
+    """
+    Returns:
+        FioHarvester: the shared harvester, created on the first call
+    """
+    global _harvester
+    with _harvester_lock:
+        if _harvester is None:
+            _harvester = FioHarvester(
+                interval=config.RUN.get("fio_harvest_interval", 30),
+                batch_size=config.RUN.get("fio_harvest_batch", 20),
+            )
+        return _harvester
+
+
+def stop_fio_harvester():
+    """
+    Stop the shared harvester, if it's running
+    """
+    global _harvester
+    with _harvester_lock:
+        harvester, _harvester = _harvester, None
+    if harvester is not None:
+        harvester.stop()
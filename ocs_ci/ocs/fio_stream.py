@@ -0,0 +1,342 @@
+"""
+Streaming ingestion of fio json output, as a whole or followed from the pod log
+
+Examples::
+
+    ingester = FioResultIngester()
+    stream_pod_log(namespace, pod_name, ingester)
+    ingester.last_report, ingester.records
+
+"""
+import json
+import logging
+import shlex
+import subprocess
+import threading
+import time
+from collections import deque
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.ocp import OCP
+
+
+log = logging.getLogger(__name__)
+
+# metrics of one direction of a fio job kept in the compact record
+DIRECTIONS = ("read", "write", "trim")
+DISK_UTIL_KEYS = ("name", "util", "read_ios", "write_ios", "in_queue")
+# max number of the lines which are not part of a report kept
+MAX_MESSAGES = 100
+
+
+def _compact_direction(stats):
+    """
+    Returns:
+        dict: bw (KiB/s), iops, io_kbytes, runtime (ms) and clat percentiles
+            (ns) of one direction of a fio job
+    """
+    if "clat_ns" in stats:
+        percentiles = stats["clat_ns"].get("percentile", {})
+    else:
+        # fio < 3.0 reports clat in usec
+        percentiles = {
+            key: value * 1000
+            for key, value in stats.get("clat", {}).get("percentile", {}).items()
+        }
+    return {
+        "bw": stats.get("bw", 0),
+        "iops": stats.get("iops", 0),
+        "io_kbytes": stats.get("io_kbytes", 0),
+        "runtime": stats.get("runtime", 0),
+        "clat_percentiles": {
+            f"{float(key):g}": value for key, value in percentiles.items()
+        },
+    }
+
+
+def compact_record(report):
+    """
+    Extract the metrics the tests use from a fio json report
+
+    Args:
+        report (dict): fio json report
+
+    Returns:
+        dict: the compact record, e.g. {'timestamp': 1584531581,
+            'jobs': [{'jobname': 'simple-write', 'error': 0, 'elapsed': 296,
+            'write': {'bw': 184531, 'iops': 46132.8, 'io_kbytes': ...,
+            'runtime': ..., 'clat_percentiles': {'99': 5472, ...}}}],
+            'disk_util': [{'name': 'rbd1', 'util': 7.9, ...}]}
+
+    """
+    jobs = []
+    for job in report.get("jobs", []):
+        compact_job = {
+            "jobname": job.get("jobname"),
+            "error": job.get("error", 0),
+            "elapsed": job.get("elapsed"),
+        }
+        for direction in DIRECTIONS:
+            stats = job.get(direction)
+            if stats and stats.get("io_kbytes"):
+                compact_job[direction] = _compact_direction(stats)
+        jobs.append(compact_job)
+    return {
+        "timestamp": report.get("timestamp"),
+        "jobs": jobs,
+        "disk_util": [
+            {key: disk[key] for key in DISK_UTIL_KEYS if key in disk}
+            for disk in report.get("disk_util", [])
+        ],
+    }
+
+
+def format_record(record):
+    """
+    Returns:
+        str: one line summary of the compact record for logging
+    """
+    parts = []
+    for job in record["jobs"]:
+        for direction in DIRECTIONS:
+            if direction not in job:
+                continue
+            stats = job[direction]
+            p99 = stats["clat_percentiles"].get("99")
+            summary = (
+                f"{job['jobname']} {direction} {stats['bw'] / 2**10:.1f} MiB/s "
+                f"{stats['iops']:.0f} iops"
+            )
+            if p99 is not None:
+                summary += f" p99 clat {p99 / 10**6:.2f} ms"
+            parts.append(summary)
+    for disk in record["disk_util"]:
+        parts.append(f"{disk.get('name')} util {disk.get('util', 0):.1f}%")
+    return ", ".join(parts) or "no io yet"
+
+
+class FioResultIngester(object):
+    """
+    Incremental parser of fio json output
+    """
+
+    def __init__(self, on_record=None, max_records=None, log_messages=True):
+        """
+        Initializer function
+
+        Args:
+            on_record (function): called with every compact record as soon
+                as its report is parsed, e.g. to log the progress
+            max_records (int): max number of the compact records kept, the
+                oldest are dropped, no limit by default
+            log_messages (bool): log the lines which are not part of a
+                report, e.g. fio errors and warnings
+
+        """
+        self.on_record = on_record
+        self.log_messages = log_messages
+        self.records = deque(maxlen=max_records)
+        self.last_report = None
+        self.reports = 0
+        # lines printed by fio outside of the reports, e.g. io_u errors
+        self.messages = deque(maxlen=MAX_MESSAGES)
+        self._partial = ""
+        self._report_lines = None
+
+    def _line(self, line):
+        line = line.rstrip("\r")
+        if self._report_lines is None:
+            # fio starts every report with '{' on a separate line
+            if line.rstrip() == "{":
+                self._report_lines = [line]
+            elif line.strip():
+                self.messages.append(line)
+                if self.log_messages:
+                    log.info(line)
+            return None
+        self._report_lines.append(line)
+        # ... and ends it with '}' on a separate line, the nested objects
+        # are indented
+        if line.rstrip() != "}":
+            return None
+        try:
+            report = json.loads("\n".join(self._report_lines))
+        except ValueError:
+            return None
+        self._report_lines = None
+        self.last_report = report
+        self.reports += 1
+        record = compact_record(report)
+        self.records.append(record)
+        if self.on_record:
+            self.on_record(record)
+        return record
+
+    def feed(self, data):
+        """
+        Parse next chunk of fio output
+
+        Args:
+            data (str): the chunk, doesn't have to end with a whole line
+
+        Returns:
+            list: compact records of the reports completed by the chunk
+
+        """
+        lines = (self._partial + data).split("\n")
+        self._partial = lines.pop()
+        records = []
+        for line in lines:
+            record = self._line(line)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def close(self):
+        """
+        Parse the rest of the output after its last chunk
+
+        Returns:
+            str: text of the report which is not complete, None if there
+                is no such report
+
+        """
+        if self._partial:
+            self.feed("\n")
+        lines, self._report_lines = self._report_lines, None
+        if lines is None:
+            return None
+        return "\n".join(lines)
+
+    @property
+    def last_record(self):
+        """
+        Returns:
+            dict: the last compact record, None if no report was parsed
+        """
+        return self.records[-1] if self.records else None
+
+
+def parse_fio_output(fio_output, ingester=None):
+    """
+    Parse fio output, with any text around the json reports
+
+    Args:
+        fio_output (str): the output of fio run with --output-format=json
+        ingester (FioResultIngester): the ingester to use, a new one by
+            default
+
+    Returns:
+        dict: the last complete fio report, None if there is none
+
+    Raises:
+        ValueError: if the output ends with a report which is not complete
+
+    """
+    ingester = ingester or FioResultIngester()
+    ingester.feed(fio_output)
+    incomplete = ingester.close()
+    if incomplete is not None:
+        raise ValueError(f"fio report is not complete: {incomplete[:200]}")
+    return ingester.last_report
+
+
+def stream_pod_log(namespace, pod_name, ingester, follow=False):
+    """
+    Feed the log of the pod to the ingester as it's read from 'oc logs'
+
+    Args:
+        namespace (str): namespace of the pod
+        pod_name (str): name of the pod
+        ingester (FioResultIngester): the ingester
+        follow (bool): follow the log until the container finishes
+
+    Returns:
+        int: return code of 'oc logs'
+
+    """
+    command = OCP(namespace=namespace).oc_cmd(
+        f"logs {'-f ' if follow else ''}{pod_name}"
+    )
+    process = subprocess.Popen(
+        shlex.split(command),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        universal_newlines=True,
+    )
+    with process.stdout:
+        for line in process.stdout:
+            ingester.feed(line)
+    return process.wait()
+
+
+class FioLogFollower(object):
+    """
+    Follows the log of the only fio pod of a Job in background
+    """
+
+    def __init__(self, namespace, ingester, pod_timeout=600):
+        """
+        Initializer function
+
+        Args:
+            namespace (str): namespace of the fio Job
+            ingester (FioResultIngester): the ingester fed with the log
+            pod_timeout (int): max seconds to wait for the pod to start
+
+        """
+        self.namespace = namespace
+        self.ingester = ingester
+        self.pod_timeout = pod_timeout
+        self.pod_name = None
+        self.returncode = None
+        self._thread = threading.Thread(
+            target=self._follow, name=f"fio-log-{namespace}", daemon=True
+        )
+
+    def _started_pod(self):
+        ocp_pod = OCP(kind=constants.POD, namespace=self.namespace)
+        deadline = time.time() + self.pod_timeout
+        while time.time() < deadline:
+            for item in ocp_pod.get().get("items", []):
+                if item.get("status", {}).get("phase") != constants.STATUS_PENDING:
+                    return item["metadata"]["name"]
+            time.sleep(5)
+        return None
+
+    def _follow(self):
+        try:
+            self.pod_name = self._started_pod()
+            if self.pod_name is None:
+                log.warning(f"No fio pod started in {self.namespace}")
+                return
+            self.returncode = stream_pod_log(
+                self.namespace, self.pod_name, self.ingester, follow=True
+            )
+        except Exception:
+            log.exception(f"Failed to follow the log of fio in {self.namespace}")
+
+    def start(self):
+        """
+        Start following the log
+
+        Returns:
+            FioLogFollower: self
+
+        """
+        self._thread.start()
+        return self
+
+    def join(self, timeout=None):
+        """
+        Wait for the end of the log
+
+        Args:
+            timeout (float): max seconds to wait
+
+        Returns:
+            bool: True if the whole log was read successfully
+
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive() and self.returncode == 0
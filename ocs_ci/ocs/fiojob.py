@@ -24,6 +24,12 @@ from ocs_ci.framework import config
 from ocs_ci.ocs import constants, ocp
 from ocs_ci.ocs.exceptions import TimeoutExpiredError
 from ocs_ci.ocs.exceptions import UnexpectedVolumeType
+from ocs_ci.ocs.fio_stream import (
+    FioLogFollower,
+    FioResultIngester,
+    format_record,
+    stream_pod_log,
+)
 from ocs_ci.ocs.resources import pod
 from ocs_ci.ocs.resources.objectconfigfile import ObjectConfFile
 from ocs_ci.utility.utils import TimeoutSampler
@@ -104,19 +110,21 @@ def get_storageutilization_size(target_percentage, ceph_pool_name):
 
 
 def fio_to_dict(fio_output):
-    """ "
+    """
     Parse fio output and provide parsed dict it as a result.
+
+    The json reports are parsed one by one as they end, lines of the output
+    outside of them (e.g. fio errors) are logged. When fio was running with
+    ``--status-interval``, the last (final) report is returned.
     """
-    fio_output_lines = fio_output.splitlines()
-    line_num = 0
-    for line_num, line in enumerate(fio_output_lines):
-        if line == "{":
-            break
-        else:
-            logger.info(line)
-    fio_parseable_output = "\n".join(fio_output_lines[line_num:])
+    ingester = FioResultIngester()
+    ingester.feed(fio_output)
+    incomplete = ingester.close()
+    if incomplete is None:
+        return ingester.last_report
+    # not a complete json report, yaml reports the problem in detail
     try:
-        fio_report = yaml.safe_load(fio_parseable_output)
+        fio_report = yaml.safe_load(incomplete)
     except yaml.parser.ParserError as ex:
         logger.error("json output from fio can't be parsed: %s", ex)
         raise ex
@@ -230,20 +238,29 @@ def write_data_via_fio(fio_job_file, write_timeout, pvc_size, target_percentage)
         " severe product performance regression"
         " or by a misconfiguration of the clusterr, ping infra team."
     )
-    pod_name = wait_for_job_completion(
-        fio_job_file.project.namespace, write_timeout, error_msg
+    namespace = fio_job_file.project.namespace
+    # the reports are parsed as the log is read, with --status-interval the
+    # periodic reports are logged as a progress of the job while it runs
+    ingester = FioResultIngester(
+        on_record=lambda record: logger.info(f"fio progress: {format_record(record)}")
     )
-
-    ocp_pod = ocp.OCP(kind="Pod", namespace=fio_job_file.project.namespace)
-    fio_output = ocp_pod.get_logs(pod_name)
-
-    # parse fio output
-    fio_report = fio_to_dict(fio_output)
+    follower = None
+    if config.RUN.get("fio_status_interval"):
+        follower = FioLogFollower(namespace, ingester).start()
+    pod_name = wait_for_job_completion(namespace, write_timeout, error_msg)
+
+    if follower is None or not follower.join(timeout=60):
+        # read the whole log again, with a new ingester
+        ingester = FioResultIngester()
+        stream_pod_log(namespace, pod_name, ingester)
+    incomplete = ingester.close()
+    if incomplete is not None:
+        logger.error("json output from fio is not complete: %s", incomplete)
+    fio_report = ingester.last_report
 
     logger.debug(fio_report)
     if fio_report is not None:
-        disk_util = fio_report.get("disk_util")
-        logger.info("fio disk_util stats: %s", disk_util)
+        logger.info("fio disk_util stats: %s", ingester.last_record["disk_util"])
     else:
         logger.warning("fio report is empty")
 
@@ -252,6 +269,7 @@ def write_data_via_fio(fio_job_file, write_timeout, pvc_size, target_percentage)
     result = {
         "fio_job_start": fio_job_start_ts,
         "fio": fio_report,
+        "fio_records": list(ingester.records),
         "pvc_size": pvc_size,
         "target_p": target_percentage,
         "namespace": fio_job_file.project.namespace,
@@ -460,6 +478,13 @@ def workload_fio_storageutilization(
     else:
         fio_conf += f"size={pvc_size}G\n"
 
+    # fio prints a report every status interval, the reports are logged as
+    # a progress of the Job (see write_data_via_fio)
+    status_interval = config.RUN.get("fio_status_interval")
+    if status_interval:
+        container = fio_job_dict["spec"]["template"]["spec"]["containers"][0]
+        container["command"].insert(-1, f"--status-interval={status_interval}")
+
     # When we ask for checksum to be generated for all files written in the
     # /mnt/target directory, we change the command of the container to run
     # both fio and sha1 checksum tool in the target directory. To do that,
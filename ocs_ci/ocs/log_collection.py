@@ -0,0 +1,321 @@
+"""
+Background collection of the logs of failed tests, with deduplication of the
+gathers of the same cluster state and a content addressed store of the files
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.utils import (
+    gather_noobaa_db_dump,
+    gather_ocp_must_gather,
+    gather_ocs_must_gather,
+    get_ocs_logs_dir_path,
+    kubeconfig_exists,
+)
+
+
+log = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+STORE_DIR = ".artifacts"
+# files already compressed are stored as they are
+COMPRESSED_SUFFIXES = (".gz", ".tgz", ".xz", ".bz2", ".zip")
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def file_sha256(path):
+    """
+    Returns:
+        str: hex sha256 digest of the file content
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as data:
+        for chunk in iter(lambda: data.read(2 ** 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def has_files(directory):
+    """
+    Returns:
+        bool: True if there is a file in the directory or its subdirectories
+    """
+    for _, _, files in os.walk(directory):
+        if files:
+            return True
+    return False
+
+
+def _store_object(path, object_path, compress):
+    """
+    Write the file to the store, atomically so concurrent gathers storing
+    the same content don't see partial objects
+    """
+    os.makedirs(os.path.dirname(object_path), exist_ok=True)
+    tmp_path = f"{object_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(path, "rb") as source:
+        if compress:
+            with gzip.open(tmp_path, "wb", compresslevel=6) as target:
+                shutil.copyfileobj(source, target)
+        else:
+            with open(tmp_path, "wb") as target:
+                shutil.copyfileobj(source, target)
+    os.replace(tmp_path, object_path)
+
+
+def store_artifacts(directory, store_dir):
+    """
+    Replace the files of the directory with links to the content addressed
+    store, compressed files keep their name, others get .gz suffix
+
+    Args:
+        directory (str): directory with the collected files
+        store_dir (str): directory of the store, on the same filesystem
+
+    Returns:
+        dict: the manifest, e.g. {'files': {'path/in/dir': '<sha256>'},
+            'stored': 10, 'reused': 90}
+
+    """
+    manifest = {"files": {}, "stored": 0, "reused": 0}
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            relpath = os.path.relpath(path, directory)
+            if os.path.islink(path) or relpath == MANIFEST:
+                continue
+            compressed = name.endswith(COMPRESSED_SUFFIXES)
+            digest = file_sha256(path)
+            object_path = os.path.join(
+                store_dir, digest[:2], digest if compressed else f"{digest}.gz"
+            )
+            if os.path.exists(object_path):
+                manifest["reused"] += 1
+            else:
+                _store_object(path, object_path, not compressed)
+                manifest["stored"] += 1
+            os.remove(path)
+            link_path = path if compressed else f"{path}.gz"
+            try:
+                os.link(object_path, link_path)
+            except OSError:
+                # e.g. max number of links of the object reached
+                shutil.copyfile(object_path, link_path)
+            manifest["files"][relpath] = digest
+    with open(os.path.join(directory, MANIFEST), "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    return manifest
+
+
+def cluster_state_fingerprint(namespace=None):
+    """
+    Get fingerprint of the cluster state, which changes when any pod in the
+    cluster namespace is created, deleted, restarted or changes its status
+
+    Args:
+        namespace (str): the namespace, the cluster namespace by default
+
+    Returns:
+        str: the fingerprint, None if it couldn't be read
+
+    """
+    namespace = namespace or config.ENV_DATA["cluster_namespace"]
+    try:
+        out = OCP(namespace=namespace).exec_oc_cmd(
+            "get pods --no-headers -o "
+            "custom-columns=NAME:.metadata.name,VERSION:.metadata.resourceVersion",
+            out_yaml_format=False,
+        )
+    except CommandFailed as ex:
+        log.warning(f"Failed to get the cluster state fingerprint: {ex}")
+        return None
+    lines = sorted(line.strip() for line in out.splitlines() if line.strip())
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+
+class LogCollectionService(object):
+    """
+    Runs the log gathers of the failed tests in background
+    """
+
+    # name of the gather: subdirectory of its logs, function gathering them
+    GATHERS = {
+        "ocs": ("ocs_must_gather", gather_ocs_must_gather),
+        "ocp": ("ocp_must_gather", gather_ocp_must_gather),
+        "mcg": ("noobaa_db_dump", gather_noobaa_db_dump),
+    }
+
+    def __init__(self, max_workers=3, dedup_window=1800, store=True):
+        """
+        Initializer function
+
+        Args:
+            max_workers (int): max number of concurrent gathers
+            dedup_window (int): seconds since the previous gather of the same
+                cluster state, during which the gather is skipped, 0 to
+                disable the deduplication
+            store (bool): store the collected files in the content addressed
+                store
+
+        """
+        self.dedup_window = dedup_window
+        self.store = store
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="log-collection"
+        )
+        # name of the gather to (time, fingerprint, directory) of the last
+        # successful one
+        self._last = {}
+        self._futures = []
+        self._lock = threading.Lock()
+
+    def _previous(self, name, fingerprint):
+        """
+        Returns:
+            str: directory of the previous gather of the same cluster state,
+                None if the gather has to be done
+        """
+        if not fingerprint or not self.dedup_window or name not in self._last:
+            return None
+        started, last_fingerprint, directory = self._last[name]
+        if last_fingerprint == fingerprint and (
+            time.time() - started < self.dedup_window
+        ):
+            return directory
+        return None
+
+    def _gather(self, name, gather, log_dir_path, directory, fingerprint):
+        start = time.time()
+        try:
+            gather(log_dir_path, raise_on_error=True)
+            if not has_files(directory):
+                raise CommandFailed(f"No {name} logs were collected to {directory}")
+            if self.store:
+                store_dir = os.path.join(os.path.dirname(log_dir_path), STORE_DIR)
+                manifest = store_artifacts(directory, store_dir)
+                log.info(
+                    f"Stored {manifest['stored']} new files of {directory}, "
+                    f"{manifest['reused']} files were stored already"
+                )
+        except Exception:
+            log.exception(f"Failed to collect {name} logs to {directory}")
+            raise
+        log.info(f"Collected {name} logs to {directory} in {time.time() - start:.0f}s")
+        # only the finished gathers are linked by the next failures
+        with self._lock:
+            self._last[name] = (start, fingerprint, directory)
+
+    def submit(self, dir_name, ocp=True, ocs=True, mcg=False, status_failure=True):
+        """
+        Start the gathers in background, arguments are the same as of
+        collect_ocs_logs
+
+        Returns:
+            list: futures of the started gathers
+
+        """
+        if not kubeconfig_exists():
+            return []
+        log_dir_path = get_ocs_logs_dir_path(dir_name, status_failure)
+        fingerprint = cluster_state_fingerprint()
+        requested = {"ocs": ocs, "ocp": ocp, "mcg": mcg}
+        futures = []
+        with self._lock:
+            for name, (subdir, gather) in self.GATHERS.items():
+                if not requested[name]:
+                    continue
+                directory = os.path.join(log_dir_path, subdir)
+                previous = self._previous(name, fingerprint)
+                if previous:
+                    log.info(
+                        f"Cluster state didn't change since {name} logs were "
+                        f"collected to {previous}, linking them to {directory}"
+                    )
+                    os.makedirs(log_dir_path, exist_ok=True)
+                    os.symlink(os.path.relpath(previous, log_dir_path), directory)
+                    continue
+                futures.append(
+                    self.executor.submit(
+                        self._gather,
+                        name,
+                        gather,
+                        log_dir_path,
+                        directory,
+                        fingerprint,
+                    )
+                )
+            self._futures += futures
+        return futures
+
+    def wait(self, timeout=None):
+        """
+        Wait for the started gathers
+
+        Args:
+            timeout (float): max seconds to wait, no limit by default
+
+        Returns:
+            int: number of gathers not finished within the timeout
+
+        """
+        with self._lock:
+            futures = list(self._futures)
+        if futures:
+            log.info(f"Waiting for {len(futures)} log gathers")
+        done, not_done = wait(futures, timeout=timeout)
+        failed = [future for future in done if future.exception()]
+        if failed:
+            log.error(f"{len(failed)} of {len(futures)} log gathers failed")
+        return len(not_done)
+
+    def shutdown(self, timeout=None):
+        """
+        Wait for the started gathers and stop the workers
+        """
+        not_done = self.wait(timeout)
+        if not_done:
+            log.warning(f"{not_done} log gathers are still running")
+        self.executor.shutdown(wait=not not_done)
+
+
+def get_log_collection_service():
+    """
+    Returns:
+        LogCollectionService: the shared service, created on the first call
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = LogCollectionService(
+                max_workers=config.REPORTING.get("log_collection_workers", 3),
+                dedup_window=config.REPORTING.get("log_collection_dedup_window", 1800),
+                store=config.REPORTING.get("log_collection_store", True),
+            )
+        return _service
+
+
+def stop_log_collection_service(timeout=None):
+    """
+    Wait for the gathers of the shared service and stop it, if it's running
+
+    Args:
+        timeout (float): max seconds to wait, no limit by default
+
+    """
+    global _service
+    with _service_lock:
+        service, _service = _service, None
+    if service is not None:
+        service.shutdown(timeout)
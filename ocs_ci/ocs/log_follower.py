@@ -0,0 +1,367 @@
+"""
+Following the logs of the workload pods with line parsers registered per pod
+"""
+import logging
+import re
+import shlex
+import subprocess
+import threading
+import time
+from collections import deque
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.ocp import OCP
+
+
+log = logging.getLogger(__name__)
+
+_service = None
+_service_lock = threading.Lock()
+
+
+class LogMatcher(object):
+    """
+    Finds the first line of a log matching a pattern
+    """
+
+    def __init__(self, pattern):
+        """
+        Initializer function
+
+        Args:
+            pattern (str or re.Pattern): substring or compiled regular
+                expression to search in the lines
+
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(re.escape(pattern))
+        self.pattern = pattern
+        self.line = None
+
+    def feed(self, line):
+        """
+        Args:
+            line (str): line of the log
+        """
+        if self.line is None and self.pattern.search(line):
+            self.line = line
+
+    @property
+    def matched(self):
+        """
+        Returns:
+            bool: True if a matching line was found
+        """
+        return self.line is not None
+
+
+class LogFileWriter(object):
+    """
+    Writes the lines of a log to a file
+    """
+
+    def __init__(self, path):
+        """
+        Initializer function
+
+        Args:
+            path (str): path of the file
+
+        """
+        self.path = path
+        self._file = open(path, "w")
+
+    def feed(self, line):
+        """
+        Args:
+            line (str): line of the log
+        """
+        if not self._file.closed:
+            self._file.write(line.replace("\x00", "") + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class LogFollower(object):
+    """
+    Follows the log of one pod and feeds the lines to the parsers
+    """
+
+    def __init__(
+        self, pod_name, namespace, since=None, buffer_size=10000, start_timeout=300
+    ):
+        """
+        Initializer function
+
+        Args:
+            pod_name (str): name of the pod
+            namespace (str): namespace of the pod
+            since (int): follow only the lines of the last seconds, the whole
+                log by default
+            buffer_size (int): number of the last lines replayed to the
+                parsers added later
+            start_timeout (int): max seconds to retry following the log of a
+                container which didn't start yet
+
+        """
+        self.pod_name = pod_name
+        self.namespace = namespace
+        self.since = since
+        self.start_timeout = start_timeout
+        self.lines = 0
+        self.returncode = None
+        self.finished = False
+        self._buffer = deque(maxlen=buffer_size)
+        self._parsers = []
+        self._cond = threading.Condition()
+        self._process = None
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._follow, name=f"log-{namespace}-{pod_name}", daemon=True
+        )
+
+    def start(self):
+        """
+        Start following the log
+
+        Returns:
+            LogFollower: self
+
+        """
+        self._thread.start()
+        return self
+
+    def _command(self):
+        command = f"logs -f {self.pod_name}"
+        if self.since:
+            command += f" --since={self.since}s"
+        return shlex.split(OCP(namespace=self.namespace).oc_cmd(command))
+
+    def _follow(self):
+        deadline = time.time() + self.start_timeout
+        try:
+            while True:
+                process = subprocess.Popen(
+                    self._command(),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    universal_newlines=True,
+                    errors="replace",
+                )
+                with self._cond:
+                    self._process = process
+                    if self._stopped:
+                        process.terminate()
+                with process.stdout:
+                    for line in process.stdout:
+                        self._feed(line.rstrip("\n"))
+                returncode = process.wait()
+                # the container isn't running yet, 'oc logs' fails right away
+                if (
+                    returncode
+                    and not self.lines
+                    and not self._stopped
+                    and time.time() < deadline
+                ):
+                    time.sleep(5)
+                    continue
+                break
+            self.returncode = returncode
+            log.info(
+                f"Log of pod {self.pod_name} finished after {self.lines} lines, "
+                f"return code {returncode}"
+            )
+        except Exception:
+            log.exception(f"Failed to follow the log of pod {self.pod_name}")
+        finally:
+            with self._cond:
+                self.finished = True
+                self._cond.notify_all()
+
+    def _feed(self, line):
+        with self._cond:
+            self.lines += 1
+            self._buffer.append(line)
+            for parser in self._parsers:
+                try:
+                    parser.feed(line)
+                except Exception:
+                    log.exception(f"Failed to parse the log of pod {self.pod_name}")
+            self._cond.notify_all()
+
+    def add_parser(self, parser, replay=True):
+        """
+        Feed the lines of the log to a parser
+
+        Args:
+            parser (object): object with feed(line) method
+            replay (bool): feed the buffered lines first
+
+        Returns:
+            object: the parser
+
+        """
+        with self._cond:
+            if replay:
+                for line in self._buffer:
+                    parser.feed(line)
+            self._parsers.append(parser)
+        return parser
+
+    def remove_parser(self, parser):
+        """
+        Args:
+            parser (object): parser added by add_parser
+        """
+        with self._cond:
+            if parser in self._parsers:
+                self._parsers.remove(parser)
+
+    def search(self, pattern):
+        """
+        Search the buffered lines, without waiting
+
+        Args:
+            pattern (str or re.Pattern): substring or compiled regular
+                expression
+
+        Returns:
+            str: the first matching line, None if there is none
+
+        """
+        matcher = LogMatcher(pattern)
+        with self._cond:
+            for line in self._buffer:
+                matcher.feed(line)
+                if matcher.matched:
+                    break
+        return matcher.line
+
+    def wait_for(self, pattern, timeout=None):
+        """
+        Wait for a line matching the pattern
+
+        Args:
+            pattern (str or re.Pattern): substring or compiled regular
+                expression
+            timeout (float): max seconds to wait, no limit by default
+
+        Returns:
+            str: the matching line, None when the log ended or the timeout
+                expired without it
+
+        """
+        matcher = LogMatcher(pattern)
+        self.add_parser(matcher)
+        try:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: matcher.matched or self.finished, timeout=timeout
+                )
+        finally:
+            self.remove_parser(matcher)
+        return matcher.line
+
+    def join(self, timeout=None):
+        """
+        Wait for the end of the log
+
+        Args:
+            timeout (float): max seconds to wait, no limit by default
+
+        Returns:
+            bool: True if the whole log was read successfully
+
+        """
+        self._thread.join(timeout)
+        return self.finished and self.returncode == 0
+
+    def stop(self):
+        """
+        Stop following the log
+        """
+        with self._cond:
+            self._stopped = True
+            process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+        self._thread.join(10)
+
+
+class LogFollowService(object):
+    """
+    Keeps one follower per pod
+    """
+
+    def __init__(self, buffer_size=10000):
+        """
+        Initializer function
+
+        Args:
+            buffer_size (int): number of the last lines of every log replayed
+                to the parsers added later
+
+        """
+        self.buffer_size = buffer_size
+        self._followers = {}
+        self._lock = threading.Lock()
+
+    def follow(self, pod_name, namespace, since=None, restart=False):
+        """
+        Get the follower of the pod, started on the first call
+
+        Args:
+            pod_name (str): name of the pod
+            namespace (str): namespace of the pod
+            since (int): follow only the lines of the last seconds, used when
+                the follower is started
+            restart (bool): start a new follower if the log of the previous
+                one ended
+
+        Returns:
+            LogFollower: the follower
+
+        """
+        with self._lock:
+            follower = self._followers.get((namespace, pod_name))
+            if follower is None or (restart and follower.finished):
+                follower = LogFollower(
+                    pod_name, namespace, since=since, buffer_size=self.buffer_size
+                ).start()
+                self._followers[(namespace, pod_name)] = follower
+        return follower
+
+    def stop(self):
+        """
+        Stop all followers
+        """
+        with self._lock:
+            followers, self._followers = list(self._followers.values()), {}
+        for follower in followers:
+            follower.stop()
+
+
+def get_log_follow_service():
+    """
+    Returns:
+        LogFollowService: the shared service, created on the first call
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = LogFollowService(
+                buffer_size=config.RUN.get("log_follow_buffer", 10000)
+            )
+        return _service
+
+
+def stop_log_follow_service():
+    """
+    Stop the followers of the shared service, if it's running
+    """
+    global _service
+    with _service_lock:
+        service, _service = _service, None
+    if service is not None:
+        service.stop()
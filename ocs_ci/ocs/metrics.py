@@ -6,6 +6,9 @@ Code in this module Supports monitoring test cases dealing with OCS metrics.
 """
 
 import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from ocs_ci.ocs import constants
 
@@ -285,7 +288,68 @@ ceph_rgw_metrics = tuple(
 ceph_metrics_all = tuple(ceph_metrics + ceph_rbd_metrics)
 
 
-def get_missing_metrics(prometheus, metrics, current_platform=None):
+METRIC_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+
+
+def get_available_metrics(prometheus, metrics, batch_size=50, workers=4):
+    """
+    Check which of the given metrics have some values in Prometheus.
+
+    Plain metric names are checked in batches, each batch with a single
+    ``count by (__name__) ({__name__=~"name1|name2|..."})`` query, the other
+    queries (e.g. with label matchers) one by one. The queries are run
+    concurrently by a bounded pool of workers.
+
+    Args:
+        prometheus (ocs_ci.utility.prometheus.PrometheusAPI): prometheus instance
+        metrics (list): list or tuple with metrics to be checked
+        batch_size (int): max number of metric names checked by one query
+        workers (int): max number of queries running at the same time
+
+    Returns:
+        tuple: set of metrics with some values and dict with latency in
+            seconds of every query
+
+    """
+    names = [metric for metric in metrics if METRIC_NAME_RE.match(metric)]
+    others = [metric for metric in metrics if not METRIC_NAME_RE.match(metric)]
+    batches = [names[i : i + batch_size] for i in range(0, len(names), batch_size)]
+
+    def check_batch(batch):
+        query = f'count by (__name__) ({{__name__=~"{"|".join(batch)}"}})'
+        start = time.perf_counter()
+        result = prometheus.query(query, mute_logs=True)
+        latency = time.perf_counter() - start
+        found = {item["metric"]["__name__"] for item in result}
+        return f"{batch[0]}..{batch[-1]} ({len(batch)} metrics)", latency, found
+
+    def check_query(metric):
+        start = time.perf_counter()
+        result = prometheus.query(metric, mute_logs=True)
+        latency = time.perf_counter() - start
+        return metric, latency, {metric} if result else set()
+
+    logger.info(
+        f"Checking {len(metrics)} metrics with {len(batches) + len(others)} "
+        f"queries, {workers} at a time"
+    )
+    available = set()
+    latencies = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(check_batch, batch) for batch in batches]
+        futures += [executor.submit(check_query, metric) for metric in others]
+        for future in futures:
+            query, latency, found = future.result()
+            latencies[query] = latency
+            available |= found
+    for query, latency in sorted(latencies.items(), key=lambda item: -item[1]):
+        logger.info(f"Query of {query} took {latency:.3f}s")
+    return available, latencies
+
+
+def get_missing_metrics(
+    prometheus, metrics, current_platform=None, batch_size=50, workers=4
+):
     """
     Using given prometheus instance, check that all given metrics which are
     expected to be available on current platform are there.
@@ -294,16 +358,18 @@ def get_missing_metrics(prometheus, metrics, current_platform=None):
         prometheus (ocs_ci.utility.prometheus.PrometheusAPI): prometheus instance
         metrics (list): list or tuple with metrics to be checked
         current_platform (str): name of current platform (optional)
+        batch_size (int): max number of metrics checked by one query
+        workers (int): max number of queries running at the same time
 
     Returns:
         list: metrics which were not available but should be
 
     """
+    available, _ = get_available_metrics(prometheus, metrics, batch_size, workers)
     metrics_without_results = []
     for metric in metrics:
-        result = prometheus.query(metric)
         # check that we actually received some values
-        if len(result) == 0:
+        if metric not in available:
             # Ceph Object Gateway https://docs.ceph.com/docs/master/radosgw/ is
             # deployed on on-prem platforms only, so we are going to ignore
             # missing metrics from these components on such platforms.
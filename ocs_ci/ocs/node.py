@@ -474,11 +474,15 @@ def get_node_resource_utilization_from_oc_describe(
     )
     obj = ocp.OCP()
     utilization_dict = {}
-    for node in node_names:
-        output = obj.exec_oc_cmd(
-            command=f"describe node {node}", out_yaml_format=False
-        ).split("\n")
-        for line in output:
+    # one describe for all the nodes, the sections start with 'Name:' line
+    output = obj.exec_oc_cmd(
+        command=f"describe node {' '.join(node_names)}", out_yaml_format=False
+    )
+    sections = re.split(r"^Name:\s+", output, flags=re.MULTILINE)[1:]
+    for section in sections:
+        node, _, section = section.partition("\n")
+        node = node.strip()
+        for line in section.split("\n"):
             if "cpu  " in line:
                 cpu_data = line.split(" ")
                 cpu = re.findall(r"\d+", [i for i in cpu_data if i][2])
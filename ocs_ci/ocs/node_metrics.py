@@ -0,0 +1,297 @@
+"""
+Collector of per node metrics streamed by a DaemonSet of agents
+
+Examples::
+
+    with NodeMetricsCollector(interval=5) as collector:
+        run_the_test()
+        series = process_series(collector.get_samples(), "ceph-osd", "rss")
+
+"""
+import json
+import logging
+import os
+import shlex
+import subprocess
+import threading
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resources import pod
+from ocs_ci.utility import templating
+from ocs_ci.utility.utils import TimeoutSampler, ocsci_log_path
+
+
+log = logging.getLogger(__name__)
+
+AGENT_PATH = os.path.join(os.path.dirname(__file__), "node_metrics_agent.py")
+NAME = "ocs-ci-node-metrics"
+SELECTOR = f"app={NAME}"
+
+_collector = None
+_collector_lock = threading.Lock()
+
+
+class NodeMetricsCollector(object):
+    """
+    Deploys the node metrics agents and collects their samples
+    """
+
+    def __init__(
+        self,
+        namespace=None,
+        interval=5,
+        processes=("ceph-osd", "ceph-mon", "ceph-mgr"),
+        image=None,
+        output_path=None,
+    ):
+        """
+        Initializer function
+
+        Args:
+            namespace (str): namespace of the DaemonSet, the cluster
+                namespace by default
+            interval (float): seconds between the samples
+            processes (tuple): names of the sampled processes
+            image (str): image with python3 used by the agents, image of the
+                toolbox pod by default, so nothing is pulled from outside
+            output_path (str): NDJSON file with all the samples, in the log
+                directory by default
+
+        """
+        self.namespace = namespace or config.ENV_DATA["cluster_namespace"]
+        self.interval = interval
+        self.processes = processes
+        self.image = image
+        self.output_path = output_path or os.path.join(
+            ocsci_log_path(), "node-metrics.ndjson"
+        )
+        self.samples = []
+        self.parse_errors = 0
+        self._lock = threading.Lock()
+        self._output = None
+        self._followers = []
+
+    def _daemonset_dict(self):
+        with open(AGENT_PATH) as agent_file:
+            agent = agent_file.read()
+        if not self.image:
+            tools_pod = pod.get_ceph_tools_pod()
+            self.image = tools_pod.data["spec"]["containers"][0]["image"]
+        daemonset = templating.load_yaml(constants.NODE_METRICS_DAEMONSET_YAML)
+        daemonset["metadata"]["namespace"] = self.namespace
+        container = daemonset["spec"]["template"]["spec"]["containers"][0]
+        container["image"] = self.image
+        container["args"] = [agent]
+        env = {item["name"]: item for item in container["env"]}
+        env["INTERVAL"]["value"] = str(self.interval)
+        env["PROCESSES"]["value"] = ",".join(self.processes)
+        return daemonset
+
+    def deploy(self, timeout=300):
+        """
+        Create the service account and the DaemonSet and wait for the agents
+
+        Args:
+            timeout (int): max time to wait for the agents in seconds
+
+        Returns:
+            list: names of the agent pods
+
+        """
+        ocp = OCP(namespace=self.namespace)
+        service_account = templating.load_yaml(constants.SERVICE_ACCOUNT_YAML)
+        service_account["metadata"]["name"] = NAME
+        service_account["metadata"]["namespace"] = self.namespace
+        OCP(kind="ServiceAccount", namespace=self.namespace).create(
+            resource_dict=service_account
+        )
+        # hostPID and /proc of the host need privileged SCC
+        ocp.exec_oc_cmd(
+            f"adm policy add-scc-to-user privileged -z {NAME}",
+            out_yaml_format=False,
+        )
+        daemonset_ocp = OCP(kind="DaemonSet", namespace=self.namespace)
+        daemonset_ocp.create(resource_dict=self._daemonset_dict())
+        log.info(f"Waiting for the node metrics agents in {self.namespace}")
+        for status in TimeoutSampler(
+            timeout, 5, lambda: daemonset_ocp.get(resource_name=NAME).get("status", {})
+        ):
+            desired = status.get("desiredNumberScheduled", 0)
+            if desired and status.get("numberReady") == desired:
+                break
+        pods = OCP(kind=constants.POD, namespace=self.namespace).get(selector=SELECTOR)[
+            "items"
+        ]
+        return [agent_pod["metadata"]["name"] for agent_pod in pods]
+
+    def _follow(self, pod_name):
+        command = OCP(namespace=self.namespace).oc_cmd(f"logs -f {pod_name}")
+        process = subprocess.Popen(
+            shlex.split(command),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        )
+        thread = threading.Thread(
+            target=self._read_stream,
+            args=(pod_name, process),
+            name=f"node-metrics-{pod_name}",
+            daemon=True,
+        )
+        thread.start()
+        self._followers.append((process, thread))
+
+    def _read_stream(self, pod_name, process):
+        for line in process.stdout:
+            try:
+                sample = json.loads(line)
+            except ValueError:
+                with self._lock:
+                    self.parse_errors += 1
+                continue
+            with self._lock:
+                self.samples.append(sample)
+                if self._output:
+                    self._output.write(line)
+        log.info(f"Stream of node metrics agent {pod_name} finished")
+
+    def start(self):
+        """
+        Deploy the agents and start following their streams
+
+        Returns:
+            NodeMetricsCollector: self
+
+        """
+        try:
+            pod_names = self.deploy()
+            os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
+            self._output = open(self.output_path, "a")
+            for pod_name in pod_names:
+                self._follow(pod_name)
+        except Exception:
+            log.error("Failed to start the node metrics agents, deleting them")
+            self.stop()
+            raise
+        log.info(
+            f"Collecting node metrics of {len(pod_names)} nodes every "
+            f"{self.interval}s to {self.output_path}"
+        )
+        return self
+
+    def get_samples(self, start=None, node=None):
+        """
+        Get the collected samples
+
+        Args:
+            start (float): only samples taken since this timestamp
+            node (str): only samples of this node
+
+        Returns:
+            list: samples in the order of arrival
+
+        """
+        with self._lock:
+            samples = list(self.samples)
+        return [
+            sample
+            for sample in samples
+            if (start is None or sample["t"] >= start)
+            and (node is None or sample["node"] == node)
+        ]
+
+    def stop(self):
+        """
+        Stop the streams and delete the agents
+        """
+        for process, _ in self._followers:
+            process.terminate()
+        for process, thread in self._followers:
+            try:
+                process.wait(10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+            thread.join(10)
+        self._followers = []
+        with self._lock:
+            if self._output:
+                self._output.close()
+                self._output = None
+        log.info(
+            f"Collected {len(self.samples)} node metrics samples, "
+            f"{self.parse_errors} unparsable lines"
+        )
+        # every resource is deleted even if the previous one failed or
+        # wasn't created by a failed deploy
+        cleanup = [
+            (
+                "DaemonSet",
+                lambda: OCP(kind="DaemonSet", namespace=self.namespace).delete(
+                    resource_name=NAME
+                ),
+            ),
+            (
+                "privileged SCC",
+                lambda: OCP(namespace=self.namespace).exec_oc_cmd(
+                    f"adm policy remove-scc-from-user privileged -z {NAME}",
+                    out_yaml_format=False,
+                ),
+            ),
+            (
+                "ServiceAccount",
+                lambda: OCP(kind="ServiceAccount", namespace=self.namespace).delete(
+                    resource_name=NAME
+                ),
+            ),
+        ]
+        for resource, delete in cleanup:
+            try:
+                delete()
+            except Exception as err:
+                log.warning(f"Failed to delete {resource} of node metrics: {err}")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def get_node_metrics_collector():
+    """
+    Returns:
+        NodeMetricsCollector: the running collector started by
+            start_node_metrics_collector, None if there is none
+    """
+    return _collector
+
+
+def start_node_metrics_collector(**kwargs):
+    """
+    Start the shared collector, used by the memory leak helpers
+
+    Args:
+        kwargs: arguments of NodeMetricsCollector
+
+    Returns:
+        NodeMetricsCollector: the running collector
+
+    """
+    global _collector
+    with _collector_lock:
+        if _collector is None:
+            _collector = NodeMetricsCollector(**kwargs).start()
+        return _collector
+
+
+def stop_node_metrics_collector():
+    """
+    Stop the shared collector if it's running
+    """
+    global _collector
+    with _collector_lock:
+        collector, _collector = _collector, None
+    if collector is not None:
+        collector.stop()
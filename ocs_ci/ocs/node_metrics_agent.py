@@ -0,0 +1,131 @@
+"""
+Node metrics agent running in the pods of the node metrics DaemonSet
+
+It's started by NodeMetricsCollector with the host PID namespace, reads /proc
+every INTERVAL seconds and writes one json line per sample to stdout:
+
+    {"t": 1616580902.1, "node": "worker-0", "cpu": 12.5, "mem": 40.2,
+     "procs": [{"name": "ceph-osd", "pid": 4242, "id": "0", "rss": 1048576,
+                "cpu": 3.1}]}
+
+cpu values are percentages of all the node CPUs since the previous sample,
+mem is the percentage of used memory of the node and rss is the resident
+memory of the process in KiB.
+
+The code runs with the python of the image used by the DaemonSet, keep it
+compatible with python 3.6 and without other dependencies.
+"""
+import json
+import os
+import sys
+import time
+
+INTERVAL = float(os.environ.get("INTERVAL", "5"))
+NODE_NAME = os.environ.get("NODE_NAME", "")
+PROCESSES = os.environ.get("PROCESSES", "ceph-osd,ceph-mon,ceph-mgr").split(",")
+
+
+def read_cpu_times():
+    """
+    Returns:
+        tuple: busy and total jiffies of all the node CPUs
+    """
+    with open("/proc/stat") as stat_file:
+        values = [int(value) for value in stat_file.readline().split()[1:]]
+    # idle and iowait
+    idle = values[3] + values[4]
+    return sum(values) - idle, sum(values)
+
+
+def read_memory_percent():
+    meminfo = {}
+    with open("/proc/meminfo") as meminfo_file:
+        for line in meminfo_file:
+            key, value = line.split(":", 1)
+            meminfo[key] = int(value.split()[0])
+    total = meminfo["MemTotal"]
+    return round(100.0 * (total - meminfo["MemAvailable"]) / total, 2)
+
+
+def daemon_id(pid):
+    """
+    Get the value of --id argument of the ceph daemon, e.g. OSD number
+    """
+    try:
+        with open("/proc/%s/cmdline" % pid) as cmdline_file:
+            args = cmdline_file.read().split("\0")
+    except OSError:
+        return None
+    for index, arg in enumerate(args[:-1]):
+        if arg in ("--id", "-i"):
+            return args[index + 1]
+    return None
+
+
+def read_processes():
+    """
+    Returns:
+        dict: pid to process info with cpu time in jiffies
+    """
+    processes = {}
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open("/proc/%s/stat" % pid) as stat_file:
+                stat = stat_file.read()
+            # the name is in parentheses and may contain spaces
+            name = stat[stat.index("(") + 1 : stat.rindex(")")]
+            if name not in PROCESSES:
+                continue
+            fields = stat[stat.rindex(")") + 2 :].split()
+            rss = 0
+            with open("/proc/%s/status" % pid) as status_file:
+                for line in status_file:
+                    if line.startswith("VmRSS:"):
+                        rss = int(line.split()[1])
+                        break
+        except (OSError, ValueError):
+            # the process exited meanwhile
+            continue
+        processes[pid] = {
+            "name": name,
+            "pid": int(pid),
+            "id": daemon_id(pid),
+            "rss": rss,
+            # utime + stime
+            "jiffies": int(fields[11]) + int(fields[12]),
+        }
+    return processes
+
+
+def main():
+    previous_cpu = read_cpu_times()
+    previous_processes = read_processes()
+    while True:
+        time.sleep(INTERVAL)
+        cpu = read_cpu_times()
+        processes = read_processes()
+        total = float(cpu[1] - previous_cpu[1]) or 1.0
+        procs = []
+        for pid, process in sorted(processes.items()):
+            proc = dict((k, v) for k, v in process.items() if k != "jiffies")
+            previous = previous_processes.get(pid)
+            if previous is not None:
+                used = process["jiffies"] - previous["jiffies"]
+                proc["cpu"] = round(100.0 * used / total, 2)
+            procs.append(proc)
+        sample = {
+            "t": round(time.time(), 3),
+            "node": NODE_NAME,
+            "cpu": round(100.0 * (cpu[0] - previous_cpu[0]) / total, 2),
+            "mem": read_memory_percent(),
+            "procs": procs,
+        }
+        sys.stdout.write(json.dumps(sample, separators=(",", ":")) + "\n")
+        sys.stdout.flush()
+        previous_cpu, previous_processes = cpu, processes
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Pooled client of the NooBaa RPC API and incremental checks of bucket mirroring
+"""
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.ocs.exceptions import NoobaaRpcError
+from ocs_ci.utility.prometheus import create_session
+
+
+log = logging.getLogger(__name__)
+
+
+class NoobaaRpcClient(object):
+    """
+    NooBaa RPC client with pooled connections
+    """
+
+    def __init__(self, endpoint, verify=True, max_workers=8, auth_token=None):
+        """
+        Initializer function
+
+        Args:
+            endpoint (str): URL of the RPC endpoint, e.g. https://<mgmt>/rpc
+            verify (str or bool): CA bundle path or whether to verify the
+                certificate of the endpoint
+            max_workers (int): max number of concurrent calls of call_many
+            auth_token (str): token sent with the calls
+
+        """
+        self.endpoint = endpoint
+        self.verify = verify
+        self.max_workers = max_workers
+        self.auth_token = auth_token
+        # POST isn't retried on error responses, only failed connections are
+        self.session = create_session(pool_maxsize=max_workers, gzip=False)
+
+    def call(self, api, method, params=None, auth_token=None):
+        """
+        Send the RPC call
+
+        Args:
+            api (str): The name of the API to use
+            method (str): The method to use inside the API
+            params (dict): The command payload
+            auth_token (str): token of the call, the client token by default
+
+        Returns:
+            requests.Response: The server's response
+
+        """
+        payload = {
+            "api": api,
+            "method": method,
+            "params": params,
+            "auth_token": auth_token or self.auth_token,
+        }
+        return self.session.post(
+            url=self.endpoint, data=json.dumps(payload), verify=self.verify
+        )
+
+    def reply(self, api, method, params=None):
+        """
+        Send the RPC call and get its reply
+
+        Returns:
+            dict: The reply of the call
+
+        Raises:
+            NoobaaRpcError: In case the server responded with error
+
+        """
+        response = self.call(api, method, params).json()
+        if response.get("error"):
+            raise NoobaaRpcError(f"RPC {api}.{method} failed: {response['error']}")
+        return response.get("reply")
+
+    def call_many(self, api, method, params_list):
+        """
+        Send calls of the method with all the params concurrently
+
+        Args:
+            api (str): The name of the API to use
+            method (str): The method to use inside the API
+            params_list (list): payloads of the calls
+
+        Returns:
+            list: replies in the order of the params
+
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda params: self.reply(api, method, params), params_list
+                )
+            )
+
+    def list_objects(self, bucket_name, page_size=1000):
+        """
+        List all the objects of the bucket, page by page, the next page
+        starts after the last key of the previous one, so the objects added
+        or deleted while listing don't shift the pages
+
+        Args:
+            bucket_name (str): The bucket name
+            page_size (int): Number of objects requested by one call
+
+        Yields:
+            dict: The objects as returned by object_api.list_objects
+
+        """
+        params = {"bucket": bucket_name, "limit": page_size}
+        while True:
+            reply = self.reply("object_api", "list_objects", params)
+            objects = reply.get("objects", [])
+            yield from objects
+            if not reply.get("is_truncated") or not objects:
+                return
+            params = dict(
+                params, key_marker=reply.get("next_marker") or objects[-1]["key"]
+            )
+
+
+def is_object_mirrored(object_mapping):
+    """
+    Check whether all the chunks of the object are mirrored
+
+    Args:
+        object_mapping (dict): reply of object_api.read_object_mapping
+
+    Returns:
+        bool: True if all the chunks have blocks on at least two different
+            nodes, False otherwise
+
+    """
+    for chunk in object_mapping.get("chunks"):
+        blocks = chunk.get("frags")[0].get("blocks")
+        nodes = [block.get("block_md").get("node") for block in blocks]
+        if not 2 <= len(blocks) == len(set(nodes)):
+            return False
+    return True
+
+
+class MirroringCheck(object):
+    """
+    Incremental check of the mirroring of the objects of a bucket
+    """
+
+    def __init__(self, client, bucket_name):
+        """
+        Initializer function
+
+        Args:
+            client (NoobaaRpcClient): The RPC client
+            bucket_name (str): The name of the bucket that should be checked
+
+        """
+        self.client = client
+        self.bucket_name = bucket_name
+        # (key, obj_id) of the objects confirmed mirrored
+        self.confirmed = set()
+
+    def check(self):
+        """
+        Read mapping of the objects not confirmed mirrored yet
+
+        Returns:
+            bool: True if all the objects of the bucket are mirrored
+
+        """
+        pending = [
+            obj
+            for obj in self.client.list_objects(self.bucket_name)
+            if (obj.get("key"), obj.get("obj_id")) not in self.confirmed
+        ]
+        mappings = self.client.call_many(
+            "object_api",
+            "read_object_mapping",
+            [
+                {
+                    "bucket": self.bucket_name,
+                    "key": obj.get("key"),
+                    "obj_id": obj.get("obj_id"),
+                }
+                for obj in pending
+            ],
+        )
+        not_mirrored = 0
+        for obj, mapping in zip(pending, mappings):
+            if is_object_mirrored(mapping):
+                self.confirmed.add((obj.get("key"), obj.get("obj_id")))
+            else:
+                not_mirrored += 1
+        log.info(
+            f"Bucket {self.bucket_name}: {len(self.confirmed)} objects mirrored, "
+            f"{not_mirrored} not mirrored yet"
+        )
+        return not_mirrored == 0
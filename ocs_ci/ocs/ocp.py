@@ -4,7 +4,6 @@ General OCP object
 import logging
 import os
 import re
-import shlex
 import tempfile
 import time
 import yaml
@@ -18,11 +17,17 @@ from ocs_ci.ocs.exceptions import (
     ResourceInUnexpectedState,
     ResourceNameNotSpecifiedException,
     TimeoutExpiredError,
+    UnsupportedAPIBackendCall,
 )
+from ocs_ci.ocs.api_backend import get_api_backend
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import TimeoutSampler
 from ocs_ci.utility.utils import exec_cmd, run_cmd, update_container_with_mirrored_image
-from ocs_ci.utility.templating import dump_data_to_temp_yaml, load_yaml
+from ocs_ci.utility.templating import (
+    dump_data_to_temp_yaml,
+    dump_data_to_yaml,
+    load_yaml,
+)
 from ocs_ci.ocs import defaults, constants
 from ocs_ci.framework import config
 
@@ -94,6 +99,32 @@ class OCP(object):
         """
         self._data = self.get()
 
+    def oc_cmd(self, command):
+        """
+        Get full 'oc' command line with kubeconfig and namespace options
+
+        Args:
+            command (str): The command (e.g. get pods) without the initial
+                'oc' at the beginning
+
+        Returns:
+            str: The 'oc' command line
+
+        """
+        oc_cmd = "oc "
+        env_kubeconfig = os.getenv("KUBECONFIG")
+        if not env_kubeconfig or not os.path.exists(env_kubeconfig):
+            cluster_dir_kubeconfig = os.path.join(
+                config.ENV_DATA["cluster_path"], config.RUN.get("kubeconfig_location")
+            )
+            if os.path.exists(cluster_dir_kubeconfig):
+                oc_cmd += f"--kubeconfig {cluster_dir_kubeconfig} "
+
+        if self.namespace:
+            oc_cmd += f"-n {self.namespace} "
+
+        return oc_cmd + command
+
     def exec_oc_cmd(
         self,
         command,
@@ -123,19 +154,7 @@ class OCP(object):
             str: If out_yaml_format is False.
 
         """
-        oc_cmd = "oc "
-        env_kubeconfig = os.getenv("KUBECONFIG")
-        if not env_kubeconfig or not os.path.exists(env_kubeconfig):
-            cluster_dir_kubeconfig = os.path.join(
-                config.ENV_DATA["cluster_path"], config.RUN.get("kubeconfig_location")
-            )
-            if os.path.exists(cluster_dir_kubeconfig):
-                oc_cmd += f"--kubeconfig {cluster_dir_kubeconfig} "
-
-        if self.namespace:
-            oc_cmd += f"-n {self.namespace} "
-
-        oc_cmd += command
+        oc_cmd = self.oc_cmd(command)
         out = run_cmd(
             cmd=oc_cmd,
             secrets=secrets,
@@ -154,6 +173,31 @@ class OCP(object):
             return yaml.safe_load(out)
         return out
 
+    def call_api_backend(self, method, *args, **kwargs):
+        """
+        Serve the call by the API backend if it's enabled in the config (see
+        ocs_ci.ocs.api_backend) and it's able to serve the call.
+
+        Args:
+            method (str): name of the KubeAPIBackend method (get, create,
+                delete or patch)
+            *args: arguments of the backend method
+            **kwargs: keyword arguments of the backend method
+
+        Returns:
+            tuple: (True, result) when the call was served by the backend,
+                (False, None) when the caller should fall back to oc client
+
+        """
+        backend = get_api_backend()
+        if backend is None:
+            return False, None
+        try:
+            return True, getattr(backend, method)(*args, **kwargs)
+        except UnsupportedAPIBackendCall as ex:
+            log.debug(f"API backend can't serve {method} call: {ex}, using oc")
+            return False, None
+
     def exec_oc_debug_cmd(self, node, cmd_list, timeout=300):
         """
         Function to execute "oc debug" command on OCP node
@@ -229,6 +273,17 @@ class OCP(object):
         retry += 1
         while retry:
             try:
+                if out_yaml_format:
+                    served, out = self.call_api_backend(
+                        "get",
+                        self.kind,
+                        namespace=self.namespace,
+                        resource_name=resource_name,
+                        selector=selector,
+                        all_namespaces=all_namespaces,
+                    )
+                    if served:
+                        return out
                 return self.exec_oc_cmd(command)
             except CommandFailed as ex:
                 log.warning(
@@ -272,7 +327,9 @@ class OCP(object):
             command += f" --selector={selector}"
         return self.exec_oc_cmd(command, out_yaml_format=False)
 
-    def create(self, yaml_file=None, resource_name="", out_yaml_format=True):
+    def create(
+        self, yaml_file=None, resource_name="", out_yaml_format=True, resource_dict=None
+    ):
         """
         Creates a new resource
 
@@ -282,23 +339,39 @@ class OCP(object):
             resource_name (str): Name of the resource you want to create
             out_yaml_format (bool): Determines if the output should be
                 formatted to a yaml like string
+            resource_dict (dict): Resource to create, passed to
+                'oc create -f -' via stdin without any file
 
         Returns:
             dict: Dictionary represents a returned yaml file
         """
-        if not (yaml_file or resource_name):
+        if not (yaml_file or resource_name or resource_dict):
             raise CommandFailed(
-                "At least one of resource_name or yaml_file have to " "be provided"
+                "At least one of resource_name, yaml_file or resource_dict have "
+                "to be provided"
             )
         command = "create "
-        if yaml_file:
+        kwargs = {}
+        if resource_dict:
+            command += "-f -"
+            kwargs["input"] = dump_data_to_yaml(resource_dict).encode()
+        elif yaml_file:
             command += f"-f {yaml_file}"
         elif resource_name:
             # e.g "oc namespace my-project"
             command += f"{self.kind} {resource_name}"
         if out_yaml_format:
             command += " -o yaml"
-        output = self.exec_oc_cmd(command)
+            served, output = self.call_api_backend(
+                "create",
+                namespace=self.namespace,
+                yaml_file=yaml_file,
+                resource_dict=resource_dict,
+            )
+            if served:
+                log.debug(f"{yaml.dump(output)}")
+                return output
+        output = self.exec_oc_cmd(command, **kwargs)
         log.debug(f"{yaml.dump(output)}")
         return output
 
@@ -326,6 +399,18 @@ class OCP(object):
                 "At least one of resource_name or yaml_file have to " "be provided"
             )
 
+        served, output = self.call_api_backend(
+            "delete",
+            self.kind,
+            namespace=self.namespace,
+            resource_name=resource_name,
+            yaml_file=yaml_file,
+            wait=wait,
+            force=force,
+        )
+        if served:
+            return output
+
         command = "delete "
         if resource_name:
             command += f"{self.kind} {resource_name}"
@@ -338,17 +423,23 @@ class OCP(object):
             command += " --wait=false"
         return self.exec_oc_cmd(command)
 
-    def apply(self, yaml_file):
+    def apply(self, yaml_file=None, resource_dict=None):
         """
         Applies configuration changes to a resource
 
         Args:
             yaml_file (str): Path to a yaml file to use in 'oc apply -f
                 file.yaml
+            resource_dict (dict): Resource to apply, passed to
+                'oc apply -f -' via stdin without any file
 
         Returns:
             dict: Dictionary represents a returned yaml file
         """
+        if resource_dict:
+            return self.exec_oc_cmd(
+                "apply -f -", input=dump_data_to_yaml(resource_dict).encode()
+            )
         command = f"apply -f {yaml_file}"
         return self.exec_oc_cmd(command)
 
@@ -366,6 +457,17 @@ class OCP(object):
 
         """
         resource_name = resource_name or self.resource_name
+        served, result = self.call_api_backend(
+            "patch",
+            self.kind,
+            namespace=self.namespace,
+            resource_name=resource_name,
+            params=params,
+            format_type=format_type,
+        )
+        if served:
+            log.info(f"Patched {self.kind} {resource_name} with: {params}")
+            return "patched" in result
         params = "'" + f"{params}" + "'"
         command = f"patch {self.kind} {resource_name} -n {self.namespace} -p {params}"
         if format_type:
@@ -481,6 +583,10 @@ class OCP(object):
         """
         Wait for a resource to reach to a desired condition
 
+        When the API backend is enabled (see ocs_ci.ocs.api_backend), the
+        resources are watched with one streaming request and the wait ends as
+        soon as the condition holds, instead of polling every sleep seconds.
+
         Args:
             condition (str): The desired state the resource that is sampled
                 from 'oc get <kind> <resource_name>' command
@@ -535,6 +641,21 @@ class OCP(object):
         actual_status = None
 
         try:
+            served, result = self.call_api_backend(
+                "wait_for_column",
+                self.kind,
+                condition,
+                namespace=self.namespace,
+                resource_name=resource_name,
+                column=column,
+                selector=selector,
+                resource_count=resource_count,
+                timeout=timeout,
+                dont_allow_other_resources=dont_allow_other_resources,
+                error_condition=error_condition,
+            )
+            if served:
+                return result
             for sample in TimeoutSampler(
                 timeout, sleep, self.get, resource_name, True, selector
             ):
@@ -573,10 +694,21 @@ class OCP(object):
                     actual_status = []
                     sample = sample["items"]
                     sample_len = len(sample)
+                    try:
+                        # one call for all the listed resources
+                        statuses = self.get_column_values(column, selector=selector)
+                    except CommandFailed as ex:
+                        log.info(
+                            f"Failed to get status of resources at column {column}, "
+                            f"Error: {ex}"
+                        )
+                        statuses = {}
                     for item in sample:
                         try:
                             item_name = item.get("metadata").get("name")
-                            status = self.get_resource(item_name, column)
+                            if item_name not in statuses:
+                                raise CommandFailed(f"{item_name} not listed")
+                            status = statuses[item_name]
                             actual_status.append(status)
                             if status == condition:
                                 in_condition.append(item)
@@ -718,43 +850,80 @@ class OCP(object):
         Returns:
             str: The output returned by 'oc get' command not in the 'yaml'
                 format
+
+        Raises:
+            CommandFailed: In case no resource was found
+
         """
         resource_name = resource_name if resource_name else self.resource_name
         selector = selector if selector else self.selector
-        # Get the resource in str format
-        resource = self.get(
+        values = self.get_column_values(
+            column, resource_name, selector=selector, retry=retry, wait=wait
+        )
+        if resource_name in values:
+            return values[resource_name]
+        if not values:
+            raise CommandFailed(
+                f"No {self.kind} resource {resource_name} found, selector: {selector}"
+            )
+        # with selector oc ignores the name and lists all selected resources
+        return next(iter(values.values()))
+
+    def get_column_values(
+        self, column, resource_name="", selector=None, retry=0, wait=3
+    ):
+        """
+        Get a column value for every listed resource with one call
+
+        When the API backend is enabled, the values are taken from the Table
+        format computed by the API server (built-in printers and CRD
+        additionalPrinterColumns). Otherwise they are extracted from one
+        'oc get' table output using the position of the column title in the
+        header, as oc aligns all cells of the column with its title.
+
+        Args:
+            column (str): The name of the column as printed by oc (e.g. STATUS)
+            resource_name (str): The name of the resource, all resources
+                are listed if not specified
+            selector (str): The resource selector to search with
+            retry (int): Number of attempts to retry to get resource
+            wait (int): Number of seconds to wait between attempts for retry
+
+        Returns:
+            dict: resource name to the column value, in the order as listed
+
+        Raises:
+            ValueError: In case the column doesn't exist
+
+        """
+        field_selector = (
+            f"metadata.name={resource_name}" if resource_name and not selector else None
+        )
+        served, result = self.call_api_backend(
+            "list_column",
+            self.kind,
+            namespace=self.namespace,
+            column=column,
+            selector=selector,
+            field_selector=field_selector,
+        )
+        if served:
+            values, _ = result
+            return values
+        output = self.get(
             resource_name=resource_name,
             out_yaml_format=False,
             retry=retry,
             wait=wait,
             selector=selector,
         )
-        # get the list of titles
-        titles = re.sub(r"\s{2,}", ",", resource)  # noqa: W605
-        titles = titles.split(",")
-        # Get the index of column
-        column_index = titles.index(column)
-        resource = shlex.split(resource)
-        # Get the values from the output including access modes in capital
-        # letters
-        resource_info = [
-            i for i in resource if (not i.isupper() or i in ("RWO", "RWX", "ROX"))
-        ]
-        # WA, Failed to parse "oc get build" command
-        # https://github.com/red-hat-storage/ocs-ci/issues/2312
-        try:
-            if self.data["items"][0]["kind"].lower() == "build" and (
-                self.data["items"][0]
-                .get("metadata")
-                .get("annotations")
-                .get("openshift.io/build-config.name")
-                == "jax-rs-build"
-            ):
-                return resource_info[column_index - 1]
-        except Exception:
-            pass
-
-        return resource_info[column_index]
+        rows = parse_table_output(output)
+        if rows and column not in rows[0]:
+            raise ValueError(
+                f"Column {column} not found in columns {list(rows[0])} of "
+                f"{self.kind}"
+            )
+        return {row.get("NAME", ""): row[column] for row in rows}
 
     def get_resource_status(self, resource_name):
         """
@@ -940,6 +1109,40 @@ class OCP(object):
         return output
 
 
+def parse_table_output(output):
+    """
+    Parse the human readable table printed by 'oc get' command
+
+    Boundaries of the columns are taken from the positions of the titles in
+    the header line, because oc aligns all cells of a column with its title.
+    So values containing spaces and empty values are parsed properly.
+
+    Args:
+        output (str): output of 'oc get' command without '-o' option
+
+    Returns:
+        list: dict of column title to the value for every row
+
+    """
+    lines = [line for line in output.splitlines() if line.strip()]
+    if not lines:
+        return []
+    # titles are separated by at least 2 spaces, but may contain single
+    # space, e.g. 'ACCESS MODES'
+    titles = [
+        (match.group(), match.start())
+        for match in re.finditer(r"\S+(?: \S+)*", lines[0])
+    ]
+    rows = []
+    for line in lines[1:]:
+        row = {}
+        for index, (title, start) in enumerate(titles):
+            end = titles[index + 1][1] if index + 1 < len(titles) else None
+            row[title] = line[start:end].strip()
+        rows.append(row)
+    return rows
+
+
 def get_clustername():
     """
     Return the name (DNS short name) of the cluster
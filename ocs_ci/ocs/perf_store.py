@@ -0,0 +1,460 @@
+"""
+Local store of the performance results with comparison against baselines
+
+The performance tests push their results to Elasticsearch (PerfResult) or to
+the codespeed dashboard (ocs_ci.utility.performance_dashboard), so there is
+no history of the results without these services. PerfResultsStore keeps
+the results in a SQLite file, in the log dir of the run by default or in a
+file shared by many runs (RUN.perf_results_store), one row per value of a
+metric:
+
+    run_id, test, params, metric, value, recorded
+
+params are the parameters of the test which have to match for the results to
+be comparable, e.g. {"io_pattern": "random", "interface": "CephBlockPool"}.
+Many values of the same metric in one run are samples of it.
+
+compare_run compares every metric of a run with the same metric of the
+previous runs (the baseline): delta of the means and p-value of Welch's
+t-test of the samples (one sample t-test of the baseline when the run has
+one sample). A significant change in the worse direction is a regression,
+so the results can be gated offline:
+
+    perf-compare --store perf_results.sqlite --run-id 1612345678 \\
+        --fail-on-regression
+
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from statistics import mean
+
+from scipy import stats
+
+from ocs_ci.framework import config
+from ocs_ci.utility.utils import ocsci_log_path
+
+
+log = logging.getLogger(__name__)
+
+STORE_FILE = "perf_results.sqlite"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started REAL,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT,
+    test TEXT,
+    params TEXT,
+    metric TEXT,
+    value REAL,
+    recorded REAL
+);
+CREATE INDEX IF NOT EXISTS results_key ON results (test, metric, params);
+CREATE INDEX IF NOT EXISTS results_run ON results (run_id);
+"""
+# metrics whose lower values are better, the higher ones are better otherwise
+LOWER_IS_BETTER = re.compile(r"time|duration|lat|std_dev|deviation", re.IGNORECASE)
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def flatten_metrics(results, prefix=""):
+    """
+    Flatten nested results into metric names and their numeric values
+
+    Args:
+        results (dict): e.g. {'4KiB': {'randread': {'IOPS': 1000.0}}}
+        prefix (str): prefix of the metric names
+
+    Returns:
+        dict: e.g. {'4KiB.randread.IOPS': 1000.0}, lists of numbers are
+            kept as samples
+
+    """
+    metrics = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics.update(flatten_metrics(value, f"{name}."))
+        elif isinstance(value, bool):
+            continue
+        elif isinstance(value, (int, float)):
+            metrics[name] = value
+        elif isinstance(value, (list, tuple)) and all(
+            isinstance(item, (int, float)) and not isinstance(item, bool)
+            for item in value
+        ):
+            metrics[name] = list(value)
+    return metrics
+
+
+def _params_key(params):
+    return json.dumps(params or {}, sort_keys=True, default=str)
+
+
+class PerfResultsStore(object):
+    """
+    SQLite file with the performance results of the runs
+    """
+
+    def __init__(self, path):
+        """
+        Initializer function
+
+        Args:
+            path (str): path of the SQLite file, created if it doesn't exist
+
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.executescript(SCHEMA)
+
+    def _connect(self):
+        # the file may be shared by parallel runs
+        return sqlite3.connect(self.path, timeout=60)
+
+    def record(self, test, metrics, params=None, run_id=None, metadata=None):
+        """
+        Record the metrics of a test
+
+        Args:
+            test (str): name of the test, e.g. 'ripsaw-fio-fullres'
+            metrics (dict): metric name to its value or list of samples
+            params (dict): parameters of the test which have to match for the
+                results to be comparable
+            run_id (str): id of the run, RUN['run_id'] by default
+            metadata (dict): information about the run, e.g. OCS build, kept
+                from the first record of the run
+
+        Returns:
+            int: number of the recorded values
+
+        """
+        run_id = str(run_id or config.RUN.get("run_id"))
+        params_key = _params_key(params)
+        now = time.time()
+        rows = []
+        for metric, values in metrics.items():
+            if not isinstance(values, (list, tuple)):
+                values = [values]
+            rows += [
+                (run_id, test, params_key, metric, float(value), now)
+                for value in values
+            ]
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO runs VALUES (?, ?, ?)",
+                (run_id, now, json.dumps(metadata or {}, default=str)),
+            )
+            connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        log.info(f"Recorded {len(rows)} values of {test} to {self.path}")
+        return len(rows)
+
+    def runs(self):
+        """
+        Returns:
+            list: ids of the runs, from the oldest
+        """
+        with closing(self._connect()) as connection:
+            return [
+                row[0]
+                for row in connection.execute(
+                    "SELECT run_id FROM runs ORDER BY started, rowid"
+                )
+            ]
+
+    def samples(self, run_id):
+        """
+        Get all values recorded in a run
+
+        Args:
+            run_id (str): id of the run
+
+        Returns:
+            dict: (test, params, metric) to the list of values, params as
+                json string
+
+        """
+        samples = {}
+        with closing(self._connect()) as connection:
+            for test, params, metric, value in connection.execute(
+                "SELECT test, params, metric, value FROM results "
+                "WHERE run_id = ? ORDER BY rowid",
+                (str(run_id),),
+            ):
+                samples.setdefault((test, params, metric), []).append(value)
+        return samples
+
+    def history(self, test, metric, params, before_run=None, limit=None):
+        """
+        Get values of the metric in the previous runs
+
+        Args:
+            test (str): name of the test
+            metric (str): name of the metric
+            params (str): params of the test as json string
+            before_run (str): only the runs started before this one
+            limit (int): max number of the runs, the latest ones
+
+        Returns:
+            dict: run id to its values, from the oldest run
+
+        """
+        query = (
+            "SELECT runs.run_id, value FROM results JOIN runs "
+            "ON results.run_id = runs.run_id "
+            "WHERE test = ? AND metric = ? AND params = ?"
+        )
+        args = [test, metric, params]
+        if before_run is not None:
+            query += (
+                " AND runs.run_id != ? AND runs.started <= "
+                "(SELECT started FROM runs WHERE run_id = ?)"
+            )
+            args += [str(before_run), str(before_run)]
+        query += " ORDER BY runs.started, runs.rowid, results.rowid"
+        values = {}
+        with closing(self._connect()) as connection:
+            for run_id, value in connection.execute(query, args):
+                values.setdefault(run_id, []).append(value)
+        run_ids = list(values)
+        if limit:
+            run_ids = run_ids[-limit:]
+        return {run_id: values[run_id] for run_id in run_ids}
+
+
+def _p_value(current, baseline):
+    """
+    Returns:
+        float: p-value of the difference of the samples, None if there are
+            not enough samples
+    """
+    if len(baseline) < 2:
+        return None
+    if len(current) >= 2:
+        result = stats.ttest_ind(current, baseline, equal_var=False)
+    else:
+        result = stats.ttest_1samp(baseline, current[0])
+    if math.isnan(result.pvalue):
+        # no variance at all, any change is significant
+        return 1.0 if mean(current) == mean(baseline) else 0.0
+    return float(result.pvalue)
+
+
+def compare_values(metric, current, baseline, alpha=0.05, threshold=0.05):
+    """
+    Compare the samples of a metric with the baseline samples
+
+    Args:
+        metric (str): name of the metric, decides the better direction (see
+            LOWER_IS_BETTER)
+        current (list): values of the compared run
+        baseline (list): values of the baseline runs
+        alpha (float): max p-value of a significant change
+        threshold (float): min relative change of the mean which matters
+
+    Returns:
+        dict: {'current': mean, 'baseline': mean, 'delta': relative change,
+            'p_value': ..., 'significant': bool, 'regression': bool}
+
+    """
+    current_mean = mean(current)
+    baseline_mean = mean(baseline) if baseline else None
+    comparison = {
+        "current": current_mean,
+        "baseline": baseline_mean,
+        "delta": None,
+        "p_value": None,
+        "significant": False,
+        "regression": False,
+    }
+    if not baseline:
+        return comparison
+    if baseline_mean:
+        comparison["delta"] = (current_mean - baseline_mean) / abs(baseline_mean)
+    p_value = _p_value(current, baseline)
+    comparison["p_value"] = p_value
+    comparison["significant"] = bool(
+        p_value is not None
+        and p_value < alpha
+        and comparison["delta"] is not None
+        and abs(comparison["delta"]) >= threshold
+    )
+    worse = (
+        current_mean > baseline_mean
+        if LOWER_IS_BETTER.search(metric)
+        else current_mean < baseline_mean
+    )
+    comparison["regression"] = comparison["significant"] and worse
+    return comparison
+
+
+def compare_run(store, run_id, baseline_runs=5, alpha=0.05, threshold=0.05):
+    """
+    Compare all metrics of a run with the previous runs
+
+    Args:
+        store (PerfResultsStore): the store
+        run_id (str): id of the compared run
+        baseline_runs (int): max number of the previous runs in the baseline
+        alpha (float): max p-value of a significant change
+        threshold (float): min relative change of the mean which matters
+
+    Returns:
+        list: comparison of every metric (see compare_values) with 'test',
+            'params', 'metric' and 'baseline_runs' keys
+
+    """
+    comparisons = []
+    for (test, params, metric), current in sorted(store.samples(run_id).items()):
+        history = store.history(
+            test, metric, params, before_run=run_id, limit=baseline_runs
+        )
+        baseline = [value for values in history.values() for value in values]
+        comparison = compare_values(metric, current, baseline, alpha, threshold)
+        comparison.update(
+            {
+                "test": test,
+                "params": json.loads(params),
+                "metric": metric,
+                "baseline_runs": len(history),
+            }
+        )
+        comparisons.append(comparison)
+    return comparisons
+
+
+def format_comparison(comparison):
+    """
+    Returns:
+        str: one line summary of the comparison of a metric
+    """
+    params = ",".join(f"{key}={value}" for key, value in comparison["params"].items())
+    line = f"{comparison['test']}[{params}] {comparison['metric']}: "
+    line += f"{comparison['current']:.6g}"
+    if comparison["baseline"] is None:
+        return line + " (no baseline)"
+    line += f" vs {comparison['baseline']:.6g}"
+    if comparison["delta"] is not None:
+        line += f" ({comparison['delta']:+.1%}"
+        if comparison["p_value"] is not None:
+            line += f", p={comparison['p_value']:.3f}"
+        line += ")"
+    if comparison["regression"]:
+        line += " REGRESSION"
+    elif comparison["significant"]:
+        line += " improvement"
+    return line
+
+
+def get_store(path=None):
+    """
+    Get the store of the run, RUN.perf_results_store or perf_results.sqlite
+    in the ocs-ci log dir of the run by default
+
+    Args:
+        path (str): path of the store file
+
+    Returns:
+        PerfResultsStore: the store
+
+    """
+    path = path or config.RUN.get("perf_results_store")
+    if not path:
+        path = os.path.join(ocsci_log_path(), STORE_FILE)
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = PerfResultsStore(path)
+        return _stores[path]
+
+
+def record_results(test, results, params=None, metadata=None, path=None):
+    """
+    Record the results of a performance test to the store of the run, the
+    one API for all performance tests, failures are only logged so they
+    don't fail the test
+
+    Args:
+        test (str): name of the test
+        results (dict): nested results, every numeric value is a metric (see
+            flatten_metrics)
+        params (dict): parameters of the test which have to match for the
+            results to be comparable
+        metadata (dict): information about the run
+        path (str): path of the store file, see get_store
+
+    Returns:
+        int: number of the recorded values, 0 on failure
+
+    """
+    try:
+        return get_store(path).record(
+            test, flatten_metrics(results), params=params, metadata=metadata
+        )
+    except Exception as ex:
+        log.warning(f"Failed to record results of {test} locally: {ex}")
+        return 0
+
+
+def main():
+    """
+    Compare a run in the store with its baseline, exits with 1 on
+    a regression when --fail-on-regression is given
+    """
+    parser = argparse.ArgumentParser(
+        description="Compare performance results of a run with previous runs"
+    )
+    parser.add_argument("--store", required=True, help="path of the store file")
+    parser.add_argument("--run-id", help="id of the compared run, the last one")
+    parser.add_argument(
+        "--baseline-runs",
+        type=int,
+        default=5,
+        help="number of previous runs in the baseline",
+    )
+    parser.add_argument("--alpha", type=float, default=0.05, help="max p-value")
+    parser.add_argument(
+        "--threshold", type=float, default=0.05, help="min relative change"
+    )
+    parser.add_argument(
+        "--fail-on-regression", action="store_true", help="exit with 1 on regression"
+    )
+    parser.add_argument("--json", action="store_true", help="print json")
+    args = parser.parse_args()
+
+    store = PerfResultsStore(args.store)
+    runs = store.runs()
+    if not runs:
+        parser.error(f"no runs in {args.store}")
+    run_id = args.run_id or runs[-1]
+    comparisons = compare_run(
+        store, run_id, args.baseline_runs, args.alpha, args.threshold
+    )
+    if args.json:
+        print(json.dumps(comparisons, indent=2))
+    else:
+        for comparison in comparisons:
+            print(format_comparison(comparison))
+    regressions = [comparison for comparison in comparisons if comparison["regression"]]
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
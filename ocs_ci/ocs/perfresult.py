@@ -7,6 +7,8 @@ import logging
 
 from elasticsearch import Elasticsearch, exceptions as ESExp
 
+from ocs_ci.ocs.perf_store import record_results
+
 log = logging.getLogger(__name__)
 
 
@@ -16,6 +18,20 @@ class PerfResult:
 
     """
 
+    # keys of the results which are parameters of the test, see store_write
+    PARAMS = (
+        "io_pattern",
+        "storageclass",
+        "dataset",
+        "file_size",
+        "files",
+        "threads",
+        "samples",
+        "servers",
+        "vol_size",
+        "platform",
+    )
+
     def __init__(self, uuid, crd):
         """
         Initialize the object by reading some of the data from the CRD file and
@@ -108,6 +124,38 @@ class PerfResult:
             return False
         return True
 
+    def store_write(self, results=None, params=None):
+        """
+        Writing the results to the local results store of the run (see
+        ocs_ci.ocs.perf_store), which works without the elastic-search server
+
+        Args:
+            results (dict): the results to write, all_results by default
+            params (list): keys of the results which are parameters of the
+                test, the results are compared only with the results of the
+                same parameters, PARAMS by default
+
+        Returns:
+            int: number of the recorded values
+
+        """
+        params = {
+            key: self.results[key]
+            for key in (params or self.PARAMS)
+            if isinstance(self.results.get(key), (str, int, float))
+        }
+        metadata = {
+            key: value
+            for key, value in self.results.items()
+            if isinstance(value, (str, int, float)) and key not in params
+        }
+        return record_results(
+            self.new_index or self.index,
+            self.all_results if results is None else results,
+            params,
+            metadata,
+        )
+
     def add_key(self, key, value):
         """
         Adding (key and value) to this object results dictionary as a new
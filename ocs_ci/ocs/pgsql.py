@@ -31,12 +31,61 @@ from ocs_ci.helpers.helpers import (
     storagecluster_independent_check,
 )
 from ocs_ci.ocs.constants import RIPSAW_NAMESPACE, RIPSAW_CRD
+from ocs_ci.ocs.log_follower import get_log_follow_service
 from ocs_ci.utility.spreadsheet.spreadsheet_api import GoogleSpreadSheetAPI
 
 
 log = logging.getLogger(__name__)
 
 
+class PgbenchLogParser(object):
+    """
+    Incremental parser of the log of a pgbench pod, see
+    :py:func:`ocs_ci.utility.utils.parse_pgsql_logs`
+    """
+
+    MARKER = "PGBench Results"
+
+    def __init__(self):
+        # the results of the finished runs, the text of the current one
+        self._results = []
+        self._blocks = 0
+        self._current = []
+
+    def _next_block(self, text):
+        # like parse_pgsql_logs, the first two blocks are not results
+        if self._blocks >= 2:
+            self._results.append(
+                {self._blocks - 1: utils.parse_pgsql_result("".join(self._current))}
+            )
+        self._blocks += 1
+        self._current = [text]
+
+    def feed(self, line):
+        """
+        Args:
+            line (str): line of the log
+        """
+        parts = line.split(self.MARKER)
+        self._current.append(parts[0])
+        for part in parts[1:]:
+            self._next_block(part)
+
+    @property
+    def results(self):
+        """
+        Returns:
+            list: the results of the runs parsed so far, in the format of
+                parse_pgsql_logs
+        """
+        results = list(self._results)
+        if self._blocks >= 2:
+            results.append(
+                {self._blocks - 1: utils.parse_pgsql_result("".join(self._current))}
+            )
+        return results
+
+
 class Postgresql(RipSaw):
     """
     Postgresql workload operation
@@ -49,6 +98,7 @@ class Postgresql(RipSaw):
         """
         super().__init__(**kwargs)
         self._apply_crd(crd=RIPSAW_CRD)
+        self.pgbench_parsers = {}
 
     def _apply_crd(self, crd):
         """
@@ -278,6 +328,31 @@ class Postgresql(RipSaw):
                 resource=postgres_pod_obj, state=status, timeout=timeout
             )
 
+    def follow_pgbench_logs(self, pgbench_pods):
+        """
+        Start following the logs of the pgbench pods, the results are parsed
+        while pgbench runs
+
+        Args:
+            pgbench_pods (list): List of pgbench pods
+
+        Returns:
+            dict: pod name to the (LogFollower, PgbenchLogParser) of the pod
+
+        """
+        service = get_log_follow_service()
+        for pgbench_pod in pgbench_pods:
+            if pgbench_pod.name not in self.pgbench_parsers:
+                follower = service.follow(pgbench_pod.name, RIPSAW_NAMESPACE)
+                self.pgbench_parsers[pgbench_pod.name] = (
+                    follower,
+                    follower.add_parser(PgbenchLogParser()),
+                )
+        return {
+            pgbench_pod.name: self.pgbench_parsers[pgbench_pod.name]
+            for pgbench_pod in pgbench_pods
+        }
+
     def wait_for_pgbench_status(self, status, timeout=None):
         """
         Wait for pgbench benchmark pods status to reach running/completed
@@ -298,6 +373,7 @@ class Postgresql(RipSaw):
         # Wait for pg_bench pods to initialized and running
         log.info(f"Waiting for pgbench pods to be reach {status} state")
         pgbench_pod_objs = self.get_pgbench_pods()
+        self.follow_pgbench_logs(pgbench_pod_objs)
         for pgbench_pod_obj in pgbench_pod_objs:
             try:
                 wait_for_resource_state(
@@ -321,10 +397,18 @@ class Postgresql(RipSaw):
 
         """
         all_pgbench_pods_output = []
+        pgbench_parsers = self.follow_pgbench_logs(pgbench_pods)
         for pgbench_pod in pgbench_pods:
             log.info(f"pgbench_client_pod===={pgbench_pod.name}====")
-            output = run_cmd(f"oc logs {pgbench_pod.name} -n {RIPSAW_NAMESPACE}")
-            pg_output = utils.parse_pgsql_logs(output)
+            follower, parser = pgbench_parsers[pgbench_pod.name]
+            if follower.join(timeout=600):
+                pg_output = parser.results
+            else:
+                log.warning(
+                    f"Failed to follow the log of {pgbench_pod.name}, fetching it"
+                )
+                output = run_cmd(f"oc logs {pgbench_pod.name} -n {RIPSAW_NAMESPACE}")
+                pg_output = utils.parse_pgsql_logs(output)
             log.info("*******PGBench output log*********\n" f"{pg_output}")
             # for data in all_pgbench_pods_output:
             for data in pg_output:
@@ -9,6 +9,7 @@ from os.path import isfile, join
 from shutil import rmtree
 from ocs_ci.utility.spreadsheet.spreadsheet_api import GoogleSpreadSheetAPI
 
+from ocs_ci.ocs.log_follower import LogFileWriter, get_log_follow_service
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.ocs import constants
@@ -19,6 +20,49 @@ from ocs_ci.utility import utils, templating
 log = logging.getLogger(__name__)
 
 
+class PillowfightLogParser(object):
+    """
+    Incremental parser of the log of a pillowfight pod, see
+    :py:meth:`PillowFight.parse_pillowfight_log`
+    """
+
+    def __init__(self):
+        self.ops_per_sec = []
+        self.resp_hist = {}
+
+    def feed(self, dline):
+        """
+        Args:
+            dline (str): line of the log
+        """
+        dline = dline.replace("\x00", "")
+        try:
+            if dline.startswith("OPS/SEC"):
+                dfields = dline.split(" ")
+                dnumb = int(dfields[-1].strip())
+                self.ops_per_sec.append(dnumb)
+            if re.match("^\\[\\d+ +- \\d+ *\\][um]s \\|#* - \\d+", dline):
+                for element in ["[", "]", "|", "-", "#"]:
+                    dline = dline.replace(element, " ")
+                parts = dline.split()
+                i1 = int(parts[0])
+                i2 = int(parts[1])
+                if parts[2] == "ms":
+                    i1 *= 1000
+                    i2 *= 1000
+                self.resp_hist[i2] = {"minindx": i1, "number": int(parts[3])}
+        except ValueError:
+            log.info(f"{dline} -- contains invalid data")
+
+    @property
+    def stats(self):
+        """
+        Returns:
+            dict: ops per sec and response time information
+        """
+        return {"opspersec": self.ops_per_sec, "resptimes": self.resp_hist}
+
+
 class PillowFight(object):
     """
     Workload operation using PillowFight
@@ -26,6 +70,8 @@ class PillowFight(object):
     """
 
     WAIT_FOR_TIME = 1800
+    # seconds to read the rest of the log of a completed pod
+    WAIT_FOR_LOG_TIME = 300
     MIN_ACCEPTABLE_OPS_PER_SEC = 2000
     MAX_ACCEPTABLE_RESPONSE_TIME = 2000
 
@@ -57,6 +103,7 @@ class PillowFight(object):
         self.ocp = OCP()
         self.up_check = OCP(namespace=constants.COUCHBASE_OPERATOR)
         self.logs = tempfile.mkdtemp(prefix="pf_logs_")
+        self.pf_stats = {}
 
     def run_pillowfights(self, replicas=1, num_items=None, num_threads=None):
         """
@@ -70,7 +117,6 @@ class PillowFight(object):
             num_threads (int): Number of threads
 
         """
-        ocp_local = OCP(namespace=self.namespace)
         pf_files = listdir(constants.TEMPLATE_PILLOWFIGHT_DIR)
         self.replicas = replicas
         for i in range(self.replicas):
@@ -95,6 +141,8 @@ class PillowFight(object):
                 lpillowfight = OCS(**pfight)
                 lpillowfight.create()
         self.pods_info = {}
+        followers = {}
+        service = get_log_follow_service()
 
         for pillowfight_pods in TimeoutSampler(
             self.WAIT_FOR_TIME,
@@ -108,6 +156,8 @@ class PillowFight(object):
                 for pf_pod in pillowfight_pods:
                     pod_info = self.up_check.exec_oc_cmd(f"get pods {pf_pod} -o json")
                     pf_status = pod_info["status"]["containerStatuses"][0]["state"]
+                    if pf_pod not in followers and "waiting" not in pf_status:
+                        followers[pf_pod] = self._follow_log(service, pf_pod)
                     if "terminated" in pf_status:
                         pf_completion_info = pf_status["terminated"]["reason"]
                         if pf_completion_info == constants.STATUS_COMPLETED:
@@ -124,23 +174,71 @@ class PillowFight(object):
         pf_yaml = pf_files[0]  # for  basic-fillowfight.yaml
         for pod, pf_completion_info in self.pods_info.items():
             if pf_completion_info == "Completed":
-                pf_endlog = f"{pod}.log"
-                pf_log = join(self.logs, pf_endlog)
-                data_from_log = ocp_local.exec_oc_cmd(
-                    f"logs -f {pod} --ignore-errors", out_yaml_format=False
-                )
-                data_from_log = data_from_log.replace("\x00", "")
-                with open(pf_log, "w") as fd:
-                    fd.write(data_from_log)
+                if pod not in followers:
+                    followers[pod] = self._follow_log(service, pod)
+                follower, writer, parser = followers[pod]
+                completed = follower.join(self.WAIT_FOR_LOG_TIME)
+                writer.close()
+                if not completed:
+                    follower.stop()
+                    parser = self._fetch_log(pod)
+                self.pf_stats[pod] = parser.stats
 
             elif pf_completion_info == "Error":
                 raise Exception(f"Pillowfight {pf_yaml} failed to complete")
 
+    def _follow_log(self, service, pod):
+        """
+        Start following the log of a pillowfight pod, the log is written to
+        the self.logs directory and parsed while pillowfight runs
+
+        Args:
+            service (LogFollowService): the log follow service
+            pod (str): name of the pod
+
+        Returns:
+            tuple: LogFollower, LogFileWriter and PillowfightLogParser of the pod
+
+        """
+        follower = service.follow(pod, self.namespace)
+        writer = follower.add_parser(LogFileWriter(join(self.logs, f"{pod}.log")))
+        parser = follower.add_parser(PillowfightLogParser())
+        return follower, writer, parser
+
+    def _fetch_log(self, pod):
+        """
+        Fetch the whole log of a pillowfight pod when following it failed,
+        the log is written to the self.logs directory
+
+        Args:
+            pod (str): name of the pod
+
+        Returns:
+            PillowfightLogParser: parser of the log
+
+        """
+        log.warning(f"Following the log of {pod} failed, fetching the whole log")
+        data_from_log = OCP(namespace=self.namespace).exec_oc_cmd(
+            f"logs {pod} --ignore-errors", out_yaml_format=False
+        )
+        data_from_log = data_from_log.replace("\x00", "")
+        with open(join(self.logs, f"{pod}.log"), "w") as fd:
+            fd.write(data_from_log)
+        parser = PillowfightLogParser()
+        for dline in data_from_log.split("\n"):
+            parser.feed(dline)
+        return parser
+
     def analyze_all(self):
         """
         Analyze the data extracted into self.logs files
 
         """
+        if self.pf_stats:
+            for pod, log_data in self.pf_stats.items():
+                logging.info(f"Analyzing {pod}")
+                self.sanity_check(log_data)
+            return
         for path in listdir(self.logs):
             full_path = join(self.logs, path)
             logging.info(f"Analyzing {full_path}")
@@ -191,30 +289,11 @@ class PillowFight(object):
         # So what's left is a list of OPS/SEC values and a histogram of
         # response times.  This routine organizes that data.
 
-        ops_per_sec = []
-        resp_hist = {}
         log.info("*******Couchbase raw output log*********\n" f"{data_from_log}")
-        lines = data_from_log.split("\n")
-        for dline in lines:
-            try:
-                if dline.startswith("OPS/SEC"):
-                    dfields = dline.split(" ")
-                    dnumb = int(dfields[-1].strip())
-                    ops_per_sec.append(dnumb)
-                if re.match("^\\[\\d+ +- \\d+ *\\][um]s \\|#* - \\d+", dline):
-                    for element in ["[", "]", "|", "-", "#"]:
-                        dline = dline.replace(element, " ")
-                    parts = dline.split()
-                    i1 = int(parts[0])
-                    i2 = int(parts[1])
-                    if parts[2] == "ms":
-                        i1 *= 1000
-                        i2 *= 1000
-                    resp_hist[i2] = {"minindx": i1, "number": int(parts[3])}
-            except ValueError:
-                log.info(f"{dline} -- contains invalid data")
-        ret_data = {"opspersec": ops_per_sec, "resptimes": resp_hist}
-        return ret_data
+        parser = PillowfightLogParser()
+        for dline in data_from_log.split("\n"):
+            parser.feed(dline)
+        return parser.stats
 
     def export_pfoutput_to_googlesheet(self, sheet_name, sheet_index):
         """
@@ -0,0 +1,368 @@
+"""
+Session wide cache of read-only resource lookups
+
+Helpers like pod.get_all_pods or pod.get_osd_pods list the same resources
+many times within one test. When ``resource_cache`` is enabled in the RUN
+section of the config (it requires the API backend, see
+ocs_ci.ocs.api_backend), the first lookup of a kind in a namespace starts an
+Informer: one list followed by a watch kept open in a background thread, which
+keeps a local copy of the objects up to date. Following lookups are served
+from the local copy.
+
+Lookups which need to see the latest state (e.g. right after the resource was
+changed) can pass ``consistent=True`` to read through to the API server, or
+``min_resource_version`` to wait till the cache caught up with a known change.
+"""
+import copy
+import logging
+import threading
+from collections import defaultdict
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.api_backend import get_api_backend
+from ocs_ci.ocs.ocp import OCP
+
+
+log = logging.getLogger(__name__)
+
+# How long to wait for the initial list of the informer
+SYNC_TIMEOUT = 30
+# How long is one watch request kept open before it's renewed
+WATCH_TIMEOUT = 300
+# Delay before the failed informer lists the resources again
+RETRY_DELAY = 5
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def match_label_selector(labels, selector):
+    """
+    Check if the labels match the label selector, supported are equality
+    (=, ==, !=), set based (in, notin) and existence (key, !key) requirements.
+
+    Args:
+        labels (dict): labels of the resource
+        selector (str): label selector, e.g. 'app=rook-ceph-osd,osd!=0'
+
+    Returns:
+        bool: True if all the requirements of the selector are met
+
+    """
+    labels = labels or {}
+    requirements = []
+    depth = 0
+    current = ""
+    # split by commas which are not part of the (a,b) value sets
+    for char in selector or "":
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "," and depth == 0:
+            requirements.append(current.strip())
+            current = ""
+        else:
+            current += char
+    requirements.append(current.strip())
+    for requirement in filter(None, requirements):
+        if " notin " in requirement or " in " in requirement:
+            operator = " notin " if " notin " in requirement else " in "
+            key, values = requirement.split(operator, 1)
+            values = {value.strip() for value in values.strip(" ()").split(",")}
+            present = labels.get(key.strip()) in values
+            if present != (operator == " in "):
+                return False
+        elif "!=" in requirement:
+            key, value = requirement.split("!=", 1)
+            if labels.get(key.strip()) == value.strip():
+                return False
+        elif "=" in requirement:
+            key, value = requirement.replace("==", "=").split("=", 1)
+            if labels.get(key.strip()) != value.strip():
+                return False
+        elif requirement.startswith("!"):
+            if requirement[1:].strip() in labels:
+                return False
+        elif requirement not in labels:
+            return False
+    return True
+
+
+def resource_version_reached(current, expected):
+    """
+    Check if the current resourceVersion is the same or newer than expected
+
+    resourceVersions are opaque strings by the API contract, but they are
+    numbers (etcd revisions) in practice, so they are compared as numbers
+    when possible.
+    """
+    if current is None:
+        return False
+    try:
+        return int(current) >= int(expected)
+    except ValueError:
+        return current == expected
+
+
+class Informer(object):
+    """
+    Keeps a local copy of all objects of one kind in one namespace up to date
+    via watch running in a background thread
+    """
+
+    def __init__(self, backend, kind, namespace=None):
+        """
+        Initializer function
+
+        Args:
+            backend (KubeAPIBackend): the API backend
+            kind (str): kind of the resources
+            namespace (str): namespace of the resources
+
+        """
+        self.backend = backend
+        self.kind = kind
+        self.namespace = namespace
+        self.objects = {}
+        self.resource_version = None
+        self.synced = threading.Event()
+        self._changed = threading.Condition()
+        self._stop_event = threading.Event()
+        self.thread = threading.Thread(
+            target=self._run, name=f"informer-{kind}-{namespace}", daemon=True
+        )
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                if self.resource_version is None:
+                    self._list()
+                self._watch()
+            except Exception as ex:
+                log.warning(
+                    f"Informer of {self.kind} in {self.namespace} failed, "
+                    f"listing again in {RETRY_DELAY}s: {ex}"
+                )
+                self.synced.clear()
+                self.resource_version = None
+                self._stop_event.wait(RETRY_DELAY)
+
+    def _list(self):
+        data = self.backend.get(self.kind, namespace=self.namespace)
+        with self._changed:
+            self.objects = {
+                item["metadata"]["name"]: item for item in data.get("items", [])
+            }
+            self.resource_version = data["metadata"].get("resourceVersion")
+            self._changed.notify_all()
+        self.synced.set()
+        log.debug(
+            f"Informer of {self.kind} in {self.namespace} synced "
+            f"{len(self.objects)} objects at version {self.resource_version}"
+        )
+
+    def _watch(self):
+        for event_type, obj in self.backend.watch_objects(
+            self.kind,
+            self.namespace,
+            resource_version=self.resource_version,
+            timeout=WATCH_TIMEOUT,
+        ):
+            if self._stop_event.is_set():
+                return
+            if event_type == "ERROR":
+                # e.g. resourceVersion too old, we need to list again
+                self.synced.clear()
+                self.resource_version = None
+                return
+            with self._changed:
+                self.resource_version = obj["metadata"]["resourceVersion"]
+                if event_type == "DELETED":
+                    self.objects.pop(obj["metadata"]["name"], None)
+                elif event_type in ("ADDED", "MODIFIED"):
+                    self.objects[obj["metadata"]["name"]] = obj
+                self._changed.notify_all()
+
+    def wait_for_resource_version(self, resource_version, timeout=SYNC_TIMEOUT):
+        """
+        Wait till the local copy includes all changes up to resource_version
+
+        Returns:
+            bool: True if the cache caught up in time
+
+        """
+        with self._changed:
+            return self._changed.wait_for(
+                lambda: resource_version_reached(
+                    self.resource_version, resource_version
+                ),
+                timeout,
+            )
+
+    def items(self, selector=None):
+        """
+        Get copies of the cached objects
+
+        Args:
+            selector (str): label selector
+
+        Returns:
+            list: resource dicts sorted by name as oc lists them
+
+        """
+        with self._changed:
+            objects = [
+                obj
+                for obj in self.objects.values()
+                if match_label_selector(obj["metadata"].get("labels"), selector)
+            ]
+            objects.sort(key=lambda obj: obj["metadata"]["name"])
+            return copy.deepcopy(objects)
+
+
+class ResourceCache(object):
+    """
+    Informers of all kinds and namespaces looked up during the test session
+    together with their hit/miss counters
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.informers = {}
+        self.counters = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+
+    def _informer(self, kind, namespace):
+        key = (kind, namespace)
+        with self._lock:
+            if key not in self.informers:
+                log.info(f"Starting informer of {kind} in namespace {namespace}")
+                self.informers[key] = Informer(self.backend, kind, namespace).start()
+            return self.informers[key]
+
+    def count(self, kind, namespace, counter):
+        with self._lock:
+            self.counters[f"{kind}/{namespace}"][counter] += 1
+
+    def list(self, kind, namespace=None, selector=None, min_resource_version=None):
+        """
+        Get the resources from the cache
+
+        Args:
+            kind (str): kind of the resources
+            namespace (str): namespace of the resources
+            selector (str): label selector
+            min_resource_version (str): serve only when the cache already
+                includes changes up to this resourceVersion
+
+        Returns:
+            list: resource dicts, None when the cache isn't able to serve
+                the lookup (caller should read from the API)
+
+        """
+        informer = self._informer(kind, namespace)
+        if informer.synced.is_set() and (
+            min_resource_version is None
+            or resource_version_reached(informer.resource_version, min_resource_version)
+        ):
+            self.count(kind, namespace, "hits")
+            return informer.items(selector)
+        self.count(kind, namespace, "misses")
+        if not informer.synced.wait(SYNC_TIMEOUT):
+            log.warning(f"Informer of {kind} in {namespace} isn't synced")
+            return None
+        if min_resource_version is not None:
+            if not informer.wait_for_resource_version(min_resource_version):
+                return None
+        return informer.items(selector)
+
+    def stats(self):
+        """
+        Returns:
+            dict: hit/miss counters per kind/namespace, e.g.
+                {'Pod/openshift-storage': {'hits': 10, 'misses': 1}}
+
+        """
+        with self._lock:
+            return {key: dict(value) for key, value in self.counters.items()}
+
+    def stop(self):
+        for informer in self.informers.values():
+            informer.stop()
+
+
+def get_resource_cache():
+    """
+    Get the session resource cache if it's enabled in the config
+
+    Returns:
+        ResourceCache: the cache, None if it's disabled
+
+    """
+    global _cache
+    if not config.RUN.get("resource_cache"):
+        return None
+    backend = get_api_backend()
+    if backend is None:
+        return None
+    with _cache_lock:
+        if _cache is None or _cache.backend is not backend:
+            if _cache is not None:
+                _cache.stop()
+            _cache = ResourceCache(backend)
+        return _cache
+
+
+def stop_resource_cache():
+    """
+    Stop all informers of the session cache
+
+    Returns:
+        dict: final hit/miss counters of the cache, see ResourceCache.stats
+
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            return {}
+        _cache.stop()
+        stats = _cache.stats()
+        _cache = None
+        return stats
+
+
+def get_resource_items(
+    kind, namespace=None, selector=None, consistent=False, min_resource_version=None
+):
+    """
+    Get list of resources, served from the session cache when it's enabled
+
+    Args:
+        kind (str): kind of the resources
+        namespace (str): namespace of the resources
+        selector (str): label selector
+        consistent (bool): read through to the API server instead of the cache
+        min_resource_version (str): serve from the cache only when it already
+            includes changes up to this resourceVersion
+
+    Returns:
+        list: resource dicts
+
+    """
+    cache = get_resource_cache()
+    if cache is not None:
+        if consistent:
+            cache.count(kind, namespace, "consistent_reads")
+        else:
+            items = cache.list(kind, namespace, selector, min_resource_version)
+            if items is not None:
+                return items
+    return OCP(kind=kind, namespace=namespace).get(selector=selector)["items"]
@@ -5,7 +5,6 @@ import os
 from time import sleep
 
 import boto3
-import requests
 from botocore.client import ClientError
 
 from ocs_ci.framework import config
@@ -23,6 +22,7 @@ from ocs_ci.ocs.exceptions import (
     TimeoutExpiredError,
     UnsupportedPlatformError,
 )
+from ocs_ci.ocs.noobaa_rpc import MirroringCheck, NoobaaRpcClient
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources import pod
 from ocs_ci.ocs.resources.pod import cal_md5sum
@@ -63,6 +63,7 @@ class MCG:
         noobaa_password,
         noobaa_token,
     ) = (None,) * 12
+    _rpc_client = None
 
     def __init__(self, *args, **kwargs):
         """
@@ -346,6 +347,21 @@ class MCG:
         """
         return bucketname in self.cli_get_all_bucket_names()
 
+    @property
+    def rpc_client(self):
+        """
+        Returns:
+            NoobaaRpcClient: client of the mgmt endpoint with pooled connections
+        """
+        if self._rpc_client is None:
+            self._rpc_client = NoobaaRpcClient(
+                self.mgmt_endpoint,
+                verify=retrieve_verification_mode(),
+                max_workers=config.RUN.get("noobaa_rpc_max_workers", 8),
+            )
+        self._rpc_client.auth_token = self.noobaa_token
+        return self._rpc_client
+
     def send_rpc_query(self, api, method, params=None):
         """
         Templates and sends an RPC query to the MCG mgmt endpoint
@@ -359,17 +375,7 @@ class MCG:
             The server's response
 
         """
-        payload = {
-            "api": api,
-            "method": method,
-            "params": params,
-            "auth_token": self.noobaa_token,
-        }
-        return requests.post(
-            url=self.mgmt_endpoint,
-            data=json.dumps(payload),
-            verify=retrieve_verification_mode(),
-        )
+        return self.rpc_client.call(api, method, params)
 
     def check_data_reduction(self, bucketname, expected_reduction_in_bytes):
         """
@@ -789,48 +795,13 @@ class MCG:
 
         """
 
-        def _check_mirroring():
-            results = []
-            obj_list = (
-                self.send_rpc_query(
-                    "object_api", "list_objects", params={"bucket": bucket_name}
-                )
-                .json()
-                .get("reply")
-                .get("objects")
-            )
-
-            for written_object in obj_list:
-                object_chunks = (
-                    self.send_rpc_query(
-                        "object_api",
-                        "read_object_mapping",
-                        params={
-                            "bucket": bucket_name,
-                            "key": written_object.get("key"),
-                            "obj_id": written_object.get("obj_id"),
-                        },
-                    )
-                    .json()
-                    .get("reply")
-                    .get("chunks")
-                )
-
-                for object_chunk in object_chunks:
-                    mirror_blocks = object_chunk.get("frags")[0].get("blocks")
-                    mirror_nodes = [
-                        mirror_blocks[i].get("block_md").get("node")
-                        for i in range(len(mirror_blocks))
-                    ]
-                    if 2 <= len(mirror_blocks) == len(set(mirror_nodes)):
-                        results.append(True)
-                    else:
-                        results.append(False)
-
-            return all(results)
+        # objects confirmed mirrored are not checked again on the next polls
+        mirroring_check = MirroringCheck(self.rpc_client, bucket_name)
 
         try:
-            for mirroring_is_complete in TimeoutSampler(timeout, 5, _check_mirroring):
+            for mirroring_is_complete in TimeoutSampler(
+                timeout, 5, mirroring_check.check
+            ):
                 if mirroring_is_complete:
                     logger.info("All objects mirrored successfully.")
                     return True
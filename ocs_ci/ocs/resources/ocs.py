@@ -4,8 +4,6 @@ General OCS object
 import logging
 import tempfile
 
-import yaml
-
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants, defaults
 from ocs_ci.ocs.ocp import get_images, OCP
@@ -15,7 +13,7 @@ from ocs_ci.ocs.resources.packagemanifest import (
     PackageManifest,
 )
 from ocs_ci.ocs.exceptions import CSVNotFound
-from ocs_ci.utility import templating, utils
+from ocs_ci.utility import utils
 
 log = logging.getLogger(__name__)
 
@@ -51,10 +49,9 @@ class OCS(object):
         self.ocp = OCP(
             api_version=self._api_version, kind=self.kind, namespace=self._namespace
         )
-        with tempfile.NamedTemporaryFile(
-            mode="w+", prefix=self._kind, delete=False
-        ) as temp_file_info:
-            self.temp_yaml = temp_file_info.name
+        # The resource is passed to oc via stdin, the temporary file is
+        # created only when some caller asks for it, see temp_yaml
+        self._temp_yaml = None
         # This _is_delete flag is set to True if the delete method was called
         # on object of this class and was successfull.
         self._is_deleted = False
@@ -79,6 +76,18 @@ class OCS(object):
     def is_deleted(self):
         return self._is_deleted
 
+    @property
+    def temp_yaml(self):
+        """
+        Path to temporary yaml file for the resource, created on first access
+        """
+        if self._temp_yaml is None:
+            with tempfile.NamedTemporaryFile(
+                mode="w+", prefix=self._kind, delete=False
+            ) as temp_file_info:
+                self._temp_yaml = temp_file_info.name
+        return self._temp_yaml
+
     def reload(self):
         """
         Reloading the OCS instance with the new information from its actual
@@ -100,8 +109,7 @@ class OCS(object):
 
     def create(self, do_reload=True):
         log.info(f"Adding {self.kind} with name {self.name}")
-        templating.dump_data_to_temp_yaml(self.data, self.temp_yaml)
-        status = self.ocp.create(yaml_file=self.temp_yaml)
+        status = self.ocp.create(resource_dict=self.data)
         if do_reload:
             self.reload()
         return status
@@ -139,11 +147,7 @@ class OCS(object):
         return result
 
     def apply(self, **data):
-        with open(self.temp_yaml, "w") as yaml_file:
-            yaml.dump(data, yaml_file)
-        assert self.ocp.apply(
-            yaml_file=self.temp_yaml
-        ), f"Failed to apply changes {data}"
+        assert self.ocp.apply(resource_dict=data), f"Failed to apply changes {data}"
         self.reload()
 
     def add_label(self, label):
@@ -159,22 +163,24 @@ class OCS(object):
         return status
 
     def delete_temp_yaml_file(self):
-        utils.delete_file(self.temp_yaml)
+        if self._temp_yaml:
+            utils.delete_file(self._temp_yaml)
+            self._temp_yaml = None
 
     def __getstate__(self):
         """
         unset attributes for serializing the object
         """
-        self_dict = self.__dict__
-        del self.temp_yaml
+        self_dict = self.__dict__.copy()
+        self_dict["_temp_yaml"] = None
         return self_dict
 
     def __setstate__(self, d):
         """
         reset attributes for serializing the object
         """
-        self.temp_yaml = None
         self.__dict__.update(d)
+        self._temp_yaml = None
 
 
 def get_version_info(namespace=None):
@@ -3,11 +3,12 @@ Pod related functionalities and context info
 
 Each pod in the openshift cluster will have a corresponding pod object
 """
+import json
 import logging
 import os
 import re
+import shlex
 import yaml
-import tempfile
 import time
 import calendar
 from threading import Thread
@@ -20,6 +21,7 @@ from ocs_ci.helpers.proxy import update_container_with_proxy_env
 from ocs_ci.ocs import constants, defaults, node, workload, ocp
 from ocs_ci.framework import config
 from ocs_ci.ocs.exceptions import (
+    CephChannelClosed,
     CommandFailed,
     NonUpgradedImagesFoundError,
     ResourceWrongStatusException,
@@ -27,6 +29,12 @@ from ocs_ci.ocs.exceptions import (
     UnavailableResourceException,
 )
 from ocs_ci.ocs.utils import setup_ceph_toolbox, get_pod_name_by_pattern
+from ocs_ci.ocs.ceph_channel import (
+    close_ceph_command_channels,
+    get_ceph_command_channel,
+)
+from ocs_ci.ocs.resource_cache import get_resource_cache, get_resource_items
+from ocs_ci.ocs.fio_stream import parse_fio_output
 from ocs_ci.ocs.resources.ocs import OCS, get_job_obj
 from ocs_ci.utility import templating
 from ocs_ci.utility.utils import (
@@ -39,6 +47,9 @@ from ocs_ci.utility.utils import check_if_executable_in_path
 from ocs_ci.utility.retry import retry
 
 logger = logging.getLogger(__name__)
+
+# Ceph tools pod per namespace, see get_ceph_tools_pod
+_ceph_tools_pod_cache = {}
 FIO_TIMEOUT = 600
 
 TEXT_CONTENT = (
@@ -72,10 +83,6 @@ class Pod(OCS):
         update_container_with_proxy_env(self.pod_data)
         super(Pod, self).__init__(**kwargs)
 
-        with tempfile.NamedTemporaryFile(
-            mode="w+", prefix="POD_", delete=False
-        ) as temp_info:
-            self.temp_yaml = temp_info.name
         self._name = self.pod_data.get("metadata").get("name")
         self._labels = self.get_labels()
         self._roles = []
@@ -136,7 +143,14 @@ class Pod(OCS):
         try:
             result = self.fio_thread.result(timeout)
             if result:
-                return yaml.safe_load(result)
+                try:
+                    fio_report = parse_fio_output(result)
+                except ValueError:
+                    fio_report = None
+                if fio_report is None:
+                    # not the json output format
+                    fio_report = yaml.safe_load(result)
+                return fio_report
             raise CommandFailed(f"FIO execution results: {result}.")
 
         except CommandFailed as ex:
@@ -232,16 +246,56 @@ class Pod(OCS):
         """
         if "rook-ceph-tools" not in self.labels.values():
             raise CommandFailed("Ceph commands can be executed only on toolbox pod")
-        ceph_cmd = ceph_cmd
-        if format:
-            ceph_cmd += f" --format {format}"
-        out = self.exec_cmd_on_pod(ceph_cmd)
+        served, out = self._exec_ceph_cmd_via_channel(ceph_cmd, format)
+        if not served:
+            rsh_cmd = f"{ceph_cmd} --format {format}" if format else ceph_cmd
+            try:
+                out = self.exec_cmd_on_pod(rsh_cmd)
+            except CommandFailed as ex:
+                if "NotFound" not in str(ex):
+                    raise
+                # the cached toolbox pod was recreated meanwhile
+                invalidate_ceph_tools_pod()
+                ct_pod = get_ceph_tools_pod()
+                if ct_pod.name == self.name:
+                    raise
+                return ct_pod.exec_ceph_cmd(ceph_cmd, format=format)
 
         # For some commands, like "ceph fs ls", the returned output is a list
         if isinstance(out, list):
             return [item for item in out if item]
         return out
 
+    def _exec_ceph_cmd_via_channel(self, ceph_cmd, format):
+        """
+        Execute the Ceph command via the persistent command channel
+
+        Returns:
+            tuple: True and the Ceph command output, or False and None if the
+                channel isn't enabled or available
+
+        """
+        try:
+            channel = get_ceph_command_channel(self.name, self.namespace)
+        except CephChannelClosed as ex:
+            logger.warning(f"Ceph command channel not available: {ex}")
+            invalidate_ceph_tools_pod()
+            return False, None
+        if channel is None:
+            return False, None
+        args = shlex.split(ceph_cmd)
+        if args and args[0] == "ceph":
+            args = args[1:]
+        try:
+            out = channel.run(args, format=format)
+        except CephChannelClosed as ex:
+            logger.warning(f"Ceph command channel closed, falling back to rsh: {ex}")
+            invalidate_ceph_tools_pod()
+            return False, None
+        if format and "json" in format and out.strip():
+            return True, json.loads(out)
+        return True, yaml.safe_load(out)
+
     def get_storage_path(self, storage_type="fs"):
         """
         Get the pod volume mount path or device path
@@ -298,6 +352,7 @@ class Pod(OCS):
         fio_filename=None,
         bs="4K",
         end_fsync=0,
+        detached=None,
     ):
         """
         Execute FIO on a pod
@@ -326,6 +381,9 @@ class Pod(OCS):
             bs (str): Block size, e.g. 4K
             end_fsync (int): If 1, fio will sync file contents when a write
                 stage has completed. Fio default is 0
+            detached (bool): run FIO in background in the pod, the results
+                are collected by the fio harvester instead of a thread
+                waiting for the 'oc rsh', RUN['fio_detached'] by default
         """
         if not self.wl_setup_done:
             self.workload_setup(storage_type=storage_type, jobs=jobs)
@@ -346,7 +404,12 @@ class Pod(OCS):
         self.io_params["bs"] = bs
         if end_fsync:
             self.io_params["end_fsync"] = end_fsync
-        self.fio_thread = self.wl_obj.run(**self.io_params)
+        if detached is None:
+            detached = config.RUN.get("fio_detached")
+        if detached:
+            self.fio_thread = self.wl_obj.run_detached(**self.io_params)
+        else:
+            self.fio_thread = self.wl_obj.run(**self.io_params)
 
     def fillup_fs(self, size, fio_filename=None):
         """
@@ -481,6 +544,7 @@ def get_all_pods(
     selector_label="app",
     exclude_selector=False,
     wait=False,
+    consistent=False,
 ):
     """
     Get all pods in a namespace.
@@ -492,12 +556,13 @@ def get_all_pods(
             Example: ['alertmanager','prometheus']
         selector_label (str): Label of selector (default: app).
         exclude_selector (bool): If list of the resource selector not to search with
+        consistent (bool): True to always read the pods from the API server,
+            even when the session resource cache is enabled
 
     Returns:
         list: List of Pod objects
 
     """
-    ocp_pod_obj = OCP(kind=constants.POD, namespace=namespace)
     # In case of >4 worker nodes node failures automatic failover of pods to
     # other nodes will happen.
     # So, we are waiting for the pods to come up on new node
@@ -505,7 +570,7 @@ def get_all_pods(
         wait_time = 180
         logger.info(f"Waiting for {wait_time}s for the pods to stabilize")
         time.sleep(wait_time)
-    pods = ocp_pod_obj.get()["items"]
+    pods = get_resource_items(constants.POD, namespace, consistent=consistent)
     if selector:
         if exclude_selector:
             pods_new = [
@@ -528,33 +593,91 @@ def get_ceph_tools_pod():
     """
     Get the Ceph tools pod
 
+    The found pod is cached. The cached pod is used only while it's still
+    running and not being deleted, which is checked by listing the pods
+    when the session resource cache is enabled (served from the cache), or
+    by getting the pod by name otherwise. The cache is dropped as well when
+    the command channel to the pod breaks.
+
     Returns:
         Pod object: The Ceph tools pod object
     """
-    ocp_pod_obj = OCP(
-        kind=constants.POD, namespace=config.ENV_DATA["cluster_namespace"]
-    )
-    ct_pod_items = ocp_pod_obj.get(selector="app=rook-ceph-tools")["items"]
-    if not ct_pod_items:
+    namespace = config.ENV_DATA["cluster_namespace"]
+    cached = _ceph_tools_pod_cache.get(namespace)
+    if cached is not None:
+        uid = cached.pod_data["metadata"].get("uid")
+        if get_resource_cache() is None:
+            # e.g. after a node failure the old pod stays Terminating/Unknown
+            item = OCP(kind=constants.POD, namespace=namespace).get(
+                resource_name=cached.name, dont_raise=True
+            )
+            valid = (
+                item is not None
+                and item["metadata"].get("uid") == uid
+                and _is_running_pod(item)
+            )
+        else:
+            # listing is served by the session cache, so checking is cheap
+            valid = any(
+                item["metadata"].get("uid") == uid
+                for item in _get_running_ceph_tools_pods(namespace)
+            )
+        if valid:
+            return cached
+        invalidate_ceph_tools_pod()
+
+    running_ct_pods = _get_running_ceph_tools_pods(namespace)
+    if not running_ct_pods:
         # setup ceph_toolbox pod if the cluster has been setup by some other CI
         setup_ceph_toolbox()
-        ct_pod_items = ocp_pod_obj.get(selector="app=rook-ceph-tools")["items"]
+        running_ct_pods = _get_running_ceph_tools_pods(namespace, consistent=True)
+
+    assert running_ct_pods, "No running Ceph tools pod found"
+    ceph_pod = Pod(**running_ct_pods[0])
+    _ceph_tools_pod_cache[namespace] = ceph_pod
+    return ceph_pod
 
-    assert ct_pod_items, "No Ceph tools pod found"
 
+def _get_running_ceph_tools_pods(namespace, consistent=False):
+    """
+    Get the Ceph tools pods which are running and not being deleted
+
+    Args:
+        namespace (str): Namespace of the tools pod
+        consistent (bool): Read through to the API server instead of the
+            session resource cache
+
+    Returns:
+        list: Dicts of the running Ceph tools pods
+
+    """
+    ct_pod_items = get_pods_having_label("app=rook-ceph-tools", namespace, consistent)
     # In the case of node failure, the CT pod will be recreated with the old
     # one in status Terminated. Therefore, need to filter out the Terminated pod
-    running_ct_pods = list()
-    for pod in ct_pod_items:
-        if (
-            ocp_pod_obj.get_resource_status(pod.get("metadata").get("name"))
-            == constants.STATUS_RUNNING
-        ):
-            running_ct_pods.append(pod)
+    return [pod for pod in ct_pod_items if _is_running_pod(pod)]
 
-    assert running_ct_pods, "No running Ceph tools pod found"
-    ceph_pod = Pod(**running_ct_pods[0])
-    return ceph_pod
+
+def _is_running_pod(pod):
+    """
+    Args:
+        pod (dict): the pod
+
+    Returns:
+        bool: True if the pod is running and not being deleted
+
+    """
+    phase = pod.get("status", {}).get("phase")
+    deleted = pod["metadata"].get("deletionTimestamp")
+    return phase == constants.STATUS_RUNNING and not deleted
+
+
+def invalidate_ceph_tools_pod():
+    """
+    Forget the cached Ceph tools pod and close the command channels to it
+    """
+    pod = _ceph_tools_pod_cache.pop(config.ENV_DATA["cluster_namespace"], None)
+    if pod is not None:
+        close_ceph_command_channels(pod.name)
 
 
 def get_csi_provisioner_pod(interface):
@@ -868,21 +991,23 @@ def run_io_and_verify_mount_point(pod_obj, bs="10M", count="950"):
     return used_percentage
 
 
-def get_pods_having_label(label, namespace):
+def get_pods_having_label(label, namespace, consistent=False):
     """
     Fetches pod resources with given label in given namespace
 
     Args:
         label (str): label which pods might have
         namespace (str): Namespace in which to be looked up
+        consistent (bool): True to always read the pods from the API server,
+            even when the session resource cache is enabled
 
     Return:
         list: of pods info
 
     """
-    ocp_pod = OCP(kind=constants.POD, namespace=namespace)
-    pods = ocp_pod.get(selector=label).get("items")
-    return pods
+    return get_resource_items(
+        constants.POD, namespace, selector=label, consistent=consistent
+    )
 
 
 def get_deployments_having_label(label, namespace):
@@ -1087,7 +1212,12 @@ def get_pod_obj(name, namespace=None):
 
 
 def get_pod_logs(
-    pod_name, container=None, namespace=defaults.ROOK_CLUSTER_NAMESPACE, previous=False
+    pod_name,
+    container=None,
+    namespace=defaults.ROOK_CLUSTER_NAMESPACE,
+    previous=False,
+    since_time=None,
+    timestamps=False,
 ):
     """
     Get logs from a given pod
@@ -1096,6 +1226,8 @@ def get_pod_logs(
     container (str): Name of the container
     namespace (str): Namespace of the pod
     previous (bool): True, if pod previous log required. False otherwise.
+    since_time (str): Only return logs after this RFC3339 timestamp
+    timestamps (bool): True to prefix every line with its RFC3339 timestamp
 
     Returns:
         str: Output from 'oc get logs <pod_name> command
@@ -1106,6 +1238,10 @@ def get_pod_logs(
         cmd += f" -c {container}"
     if previous:
         cmd += " --previous"
+    if since_time:
+        cmd += f" --since-time={since_time}"
+    if timestamps:
+        cmd += " --timestamps"
     return pod.exec_oc_cmd(cmd, out_yaml_format=False)
 
 
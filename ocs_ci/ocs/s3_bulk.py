@@ -0,0 +1,395 @@
+"""
+Bulk S3 data plane operations for MCG/RGW tests
+
+The module is also run in the pods (see bucket_utils.run_s3_bulk_job_in_pod),
+keep it without other dependencies than boto3.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+
+log = logging.getLogger(__name__)
+
+MiB = 2 ** 20
+# max number of keys of one DeleteObjects request
+DELETE_BATCH = 1000
+
+
+def file_md5(path):
+    """
+    Returns:
+        str: hex md5 digest of the file content
+    """
+    md5 = hashlib.md5()
+    with open(path, "rb") as data:
+        for chunk in iter(lambda: data.read(MiB), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+class LatencyHistogram(object):
+    """
+    Histogram of latencies with fixed buckets
+    """
+
+    # upper bounds of the buckets in seconds, the last bucket is unbounded
+    BOUNDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self):
+        self.buckets = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        index = 0
+        while index < len(self.BOUNDS) and seconds > self.BOUNDS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent):
+        """
+        Get the upper bound of the bucket containing the percentile
+
+        Args:
+            percent (float): e.g. 95
+
+        Returns:
+            float: the bound in seconds, max latency for the last bucket
+
+        """
+        if not self.count:
+            return None
+        rank = percent / 100.0 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return self.BOUNDS[index] if index < len(self.BOUNDS) else self.max
+        return self.max
+
+    def as_dict(self):
+        """
+        Returns:
+            dict: e.g. {'count': 100, 'mean': 0.02, 'max': 0.3, 'p50': 0.025,
+                'p95': 0.1, 'p99': 0.25, 'buckets': {'0.025': 60, ...}}
+        """
+        if not self.count:
+            return {"count": 0}
+        labels = [str(bound) for bound in self.BOUNDS] + ["inf"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4),
+            "max": round(self.max, 4),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": {
+                label: count for label, count in zip(labels, self.buckets) if count
+            },
+        }
+
+
+class S3BulkEngine(object):
+    """
+    Runs S3 operations on many objects concurrently from one client
+    """
+
+    def __init__(
+        self,
+        endpoint_url,
+        access_key_id,
+        secret_access_key,
+        region=None,
+        verify=None,
+        max_workers=16,
+        multipart_threshold=8 * MiB,
+        multipart_chunksize=8 * MiB,
+    ):
+        """
+        Initializer function
+
+        Args:
+            endpoint_url (str): S3 endpoint
+            access_key_id (str): access key ID
+            secret_access_key (str): secret access key
+            region (str): region of the endpoint
+            verify (str or bool): CA bundle path or False to skip the
+                verification of the certificate
+            max_workers (int): number of concurrent operations
+            multipart_threshold (int): files larger than this are uploaded
+                in parts
+            multipart_chunksize (int): size of the parts
+
+        """
+        self.max_workers = max_workers
+        self.client = boto3.session.Session().client(
+            "s3",
+            endpoint_url=endpoint_url,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+            region_name=region,
+            verify=verify,
+            config=Config(
+                # every worker and its multipart threads need a connection
+                max_pool_connections=max_workers * 4,
+                retries={"max_attempts": 5, "mode": "standard"},
+            ),
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=4,
+        )
+        self.histograms = defaultdict(LatencyHistogram)
+        self._lock = threading.Lock()
+
+    def _timed(self, operation, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.histograms[operation].record(time.perf_counter() - start)
+
+    def _run(self, operation, func, items):
+        """
+        Run the function for all the items concurrently
+
+        Returns:
+            list: results in the order of the items
+
+        Raises:
+            Exception: the first failure, after all the items were processed
+
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._timed, operation, func, *item) for item in items
+            ]
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            log.error(f"{len(errors)} of {len(futures)} {operation} operations failed")
+            raise errors[0]
+        return [future.result() for future in futures]
+
+    def upload_files(self, bucket, files):
+        """
+        Upload the files, the large ones in parts
+
+        Args:
+            bucket (str): bucket name
+            files (dict): object key to local file path
+
+        """
+        self._run(
+            "upload",
+            lambda key, path: self.client.upload_file(
+                path, bucket, key, Config=self.transfer_config
+            ),
+            list(files.items()),
+        )
+
+    def put_objects(self, bucket, objects):
+        """
+        Write the objects from memory
+
+        Args:
+            bucket (str): bucket name
+            objects (dict): object key to its content (bytes)
+
+        """
+        self._run(
+            "put",
+            lambda key, body: self.client.put_object(Bucket=bucket, Key=key, Body=body),
+            list(objects.items()),
+        )
+
+    def upload_parts(self, bucket, key, upload_id, part_paths):
+        """
+        Upload the parts of the multipart upload concurrently
+
+        Args:
+            bucket (str): bucket name
+            key (str): object key
+            upload_id (str): ID of the multipart upload
+            part_paths (list): local paths of the parts, in the order
+
+        Returns:
+            list: parts for complete_multipart_upload, e.g.
+                [{'PartNumber': 1, 'ETag': '"etag"'}]
+
+        """
+
+        def upload_part(number, path):
+            with open(path, "rb") as body:
+                response = self.client.upload_part(
+                    Bucket=bucket,
+                    Key=key,
+                    PartNumber=number,
+                    UploadId=upload_id,
+                    Body=body,
+                )
+            return {"PartNumber": number, "ETag": response["ETag"]}
+
+        return self._run("upload_part", upload_part, list(enumerate(part_paths, 1)))
+
+    def delete_objects(self, bucket, keys):
+        """
+        Delete the objects with batched DeleteObjects requests
+
+        Args:
+            bucket (str): bucket name
+            keys (list): object keys
+
+        Returns:
+            list: errors of the objects which were not deleted, e.g.
+                [{'Key': 'obj', 'Code': 'AccessDenied', 'Message': '...'}]
+
+        """
+        keys = list(keys)
+        batches = [
+            (keys[index : index + DELETE_BATCH],)
+            for index in range(0, len(keys), DELETE_BATCH)
+        ]
+        responses = self._run(
+            "delete",
+            lambda batch: self.client.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            ),
+            batches,
+        )
+        return [error for response in responses for error in response.get("Errors", [])]
+
+    def object_md5(self, bucket, key):
+        """
+        Returns:
+            str: hex md5 digest of the object content, streamed in chunks
+        """
+        md5 = hashlib.md5()
+        body = self.client.get_object(Bucket=bucket, Key=key)["Body"]
+        for chunk in iter(lambda: body.read(MiB), b""):
+            md5.update(chunk)
+        return md5.hexdigest()
+
+    def verify_objects(self, bucket, files):
+        """
+        Compare md5 checksums of the objects with the local files
+
+        Args:
+            bucket (str): bucket name
+            files (dict): object key to local file path
+
+        Returns:
+            dict: object key to True if the checksums match, False otherwise
+
+        """
+        items = list(files.items())
+        matches = self._run(
+            "verify",
+            lambda key, path: self.object_md5(bucket, key) == file_md5(path),
+            items,
+        )
+        for (key, _), match in zip(items, matches):
+            if not match:
+                log.error(f"MD5 of object {key} differs from the original")
+        return {key: match for (key, _), match in zip(items, matches)}
+
+    def stats(self):
+        """
+        Returns:
+            dict: operation to its latency histogram as dict
+        """
+        with self._lock:
+            return {op: hist.as_dict() for op, hist in self.histograms.items()}
+
+    def run_job(self, operations):
+        """
+        Run the operations of a batch job, grouped by type and target
+
+        Args:
+            operations (list): dicts with 'op' key, one of:
+                {'op': 'upload', 'bucket': 'b', 'key': 'k', 'path': 'p'}
+                {'op': 'upload_part', 'bucket': 'b', 'key': 'k',
+                 'upload_id': 'id', 'path': 'p'} (parts in the order)
+                {'op': 'delete', 'bucket': 'b', 'key': 'k'}
+                {'op': 'verify', 'bucket': 'b', 'key': 'k', 'path': 'p'}
+
+        Returns:
+            dict: results per type, e.g. {'upload': 10, 'parts': {...},
+                'delete_errors': [], 'verify': {'b/k': True}, 'stats': {...}}
+
+        """
+        groups = defaultdict(list)
+        for operation in operations:
+            target = (operation["bucket"], operation.get("upload_id"))
+            groups[(operation["op"], target)].append(operation)
+        results = {"upload": 0, "parts": {}, "delete_errors": [], "verify": {}}
+        for (op, (bucket, upload_id)), items in groups.items():
+            if op == "upload":
+                self.upload_files(bucket, {item["key"]: item["path"] for item in items})
+                results["upload"] += len(items)
+            elif op == "upload_part":
+                key = items[0]["key"]
+                results["parts"][f"{bucket}/{key}"] = self.upload_parts(
+                    bucket, key, upload_id, [item["path"] for item in items]
+                )
+            elif op == "delete":
+                results["delete_errors"] += self.delete_objects(
+                    bucket, [item["key"] for item in items]
+                )
+            elif op == "verify":
+                verified = self.verify_objects(
+                    bucket, {item["key"]: item["path"] for item in items}
+                )
+                for key, match in verified.items():
+                    results["verify"][f"{bucket}/{key}"] = match
+            else:
+                raise ValueError(f"Unknown S3 bulk operation {op}")
+        results["stats"] = self.stats()
+        return results
+
+
+def main(job_json):
+    """
+    Run the batch job and print its results as json, used in the pod
+
+    Args:
+        job_json (str): json with 'client' (arguments of S3BulkEngine) and
+            'operations' (see S3BulkEngine.run_job)
+
+    """
+    job = json.loads(job_json)
+    engine = S3BulkEngine(**job["client"])
+    results = engine.run_job(job["operations"])
+    print(json.dumps(results))
+
+
+def list_files(directory, names=None):
+    """
+    Get paths of the files in the directory
+
+    Args:
+        directory (str): the directory
+        names (list): only these file names, all files by default
+
+    Returns:
+        dict: file name to its path
+
+    """
+    names = names if names is not None else sorted(os.listdir(directory))
+    return {name: os.path.join(directory, name) for name in names}
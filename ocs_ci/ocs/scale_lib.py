@@ -7,6 +7,7 @@ from ocs_ci.helpers import helpers
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.framework import config
 from ocs_ci.utility import templating, utils
+from ocs_ci.utility.execution_pool import ExecutionPool
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.ocs.resources import pod, pvc
 from ocs_ci.ocs import constants, cluster, machine, node
@@ -340,20 +341,16 @@ def delete_objs_parallel(obj_list, namespace, kind):
 
     """
     ocp = OCP(kind=kind, namespace=namespace)
-    threads = list()
-    for obj in obj_list:
-        process1 = threading.Thread(
-            target=ocp.delete, kwargs={"resource_name": f"{obj.name}"}
-        )
-        process2 = threading.Thread(
-            target=ocp.wait_for_delete, kwargs={"resource_name": f"{obj.name}"}
-        )
-        process1.start()
-        process2.start()
-        threads.append(process1)
-        threads.append(process2)
-    for process in threads:
-        process.join()
+
+    def delete_and_wait(name):
+        ocp.delete(resource_name=name)
+        ocp.wait_for_delete(resource_name=name)
+
+    with ExecutionPool(f"delete-{kind.lower()}") as executor:
+        futures = [executor.submit(delete_and_wait, obj.name) for obj in obj_list]
+    for obj, future in zip(obj_list, futures):
+        if future.exception():
+            logger.error(f"Failed to delete {kind} {obj.name}: {future.exception()}")
 
 
 def check_enough_resource_available_in_workers(ms_name=None, pod_dict_path=None):
@@ -0,0 +1,253 @@
+"""
+Bulk teardown of the resources created by the test factories, kind by kind in
+dependency order
+
+Examples::
+
+    engine = TeardownEngine()
+    engine.add_resources(pvc_objs)
+    engine.run()
+
+"""
+import logging
+import time
+from collections import OrderedDict, defaultdict
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.api_backend import get_api_backend
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.utils import TimeoutSampler
+
+
+log = logging.getLogger(__name__)
+
+# kinds deleted in this order, the others after them from the last added,
+# namespaces last
+KIND_ORDER = (
+    "deploymentconfig",
+    "deployment",
+    "statefulset",
+    "job",
+    "pod",
+    "volumesnapshot",
+    "persistentvolumeclaim",
+    "persistentvolume",
+    "volumesnapshotcontent",
+)
+LAST_KINDS = ("project", "namespace")
+# max number of names in one oc delete command
+DELETE_BATCH = 100
+POLL_INTERVAL = 3
+
+
+def _kind_rank(kind):
+    if kind in LAST_KINDS:
+        return len(KIND_ORDER) + 1
+    if kind in KIND_ORDER:
+        return KIND_ORDER.index(kind)
+    return len(KIND_ORDER)
+
+
+class TeardownEngine(object):
+    """
+    Deletes the collected resources in bulk and waits for them together
+    """
+
+    def __init__(self, timeout=300, pv_timeout=None):
+        """
+        Initializer function
+
+        Args:
+            timeout (int): max seconds to wait for the deletion of one kind
+            pv_timeout (int): max seconds to wait for the deletion of the PVs,
+                720 on Azure (bug 1915706) and 180 elsewhere by default
+
+        """
+        self.timeout = timeout
+        if pv_timeout is None:
+            pv_timeout = (
+                720
+                if config.ENV_DATA["platform"].lower() == constants.AZURE_PLATFORM
+                else 180
+            )
+        self.pv_timeout = pv_timeout
+        # kind to {(namespace, name): delete}, delete is False for the
+        # resources which are only waited for (e.g. PVs of deleted PVCs)
+        self.resources = defaultdict(OrderedDict)
+        self._objects = []
+        self.durations = OrderedDict()
+
+    def add(self, kind, name, namespace=None, delete=True):
+        """
+        Add the resource to tear down
+
+        Args:
+            kind (str): kind of the resource
+            name (str): name of the resource
+            namespace (str): namespace of the resource, None for cluster
+                scoped resources
+            delete (bool): False if the resource gets deleted by itself and
+                should be only waited for
+
+        """
+        key = (namespace or "", name)
+        resources = self.resources[kind.lower()]
+        resources[key] = resources.get(key, False) or delete
+
+    def add_resources(self, resources):
+        """
+        Add the OCS objects to tear down, the already deleted ones are skipped
+
+        Args:
+            resources (list): OCS objects, e.g. PVC or Pod instances
+
+        """
+        for resource in resources:
+            if resource.is_deleted:
+                continue
+            self.add(resource.kind, resource.name, resource.namespace)
+            self._objects.append(resource)
+
+    def _add_pvs_of_pvcs(self):
+        """
+        Add the PVs bound to the PVCs: the ones with Retain reclaim policy to
+        delete, the others to wait for
+        """
+        pvcs = self.resources.get("persistentvolumeclaim")
+        if not pvcs:
+            return
+        volume_names = []
+        for namespace in {namespace for namespace, _ in pvcs}:
+            items = OCP(kind=constants.PVC, namespace=namespace).get()["items"]
+            volume_names += [
+                item["spec"].get("volumeName")
+                for item in items
+                if (namespace, item["metadata"]["name"]) in pvcs
+                and item["spec"].get("volumeName")
+            ]
+        if not volume_names:
+            return
+        policies = {
+            item["metadata"]["name"]: item["spec"].get("persistentVolumeReclaimPolicy")
+            for item in OCP(kind=constants.PV).get()["items"]
+        }
+        for name in volume_names:
+            if name in policies:
+                retain = policies[name] == constants.RECLAIM_POLICY_RETAIN
+                self.add(constants.PV, name, delete=retain)
+
+    def _delete(self, kind, keys):
+        by_namespace = defaultdict(list)
+        for namespace, name in keys:
+            by_namespace[namespace].append(name)
+        for namespace, names in by_namespace.items():
+            ocp = OCP(kind=kind, namespace=namespace or None)
+            for index in range(0, len(names), DELETE_BATCH):
+                batch = " ".join(names[index : index + DELETE_BATCH])
+                ocp.exec_oc_cmd(
+                    f"delete {kind} {batch} --wait=false --ignore-not-found",
+                    out_yaml_format=False,
+                )
+
+    def _existing(self, kind):
+        """
+        Returns:
+            set: (namespace, name) of the resources of the kind which exist
+        """
+        out = OCP(kind=kind).exec_oc_cmd(
+            f"get {kind} --all-namespaces --no-headers -o custom-columns="
+            "NAMESPACE:.metadata.namespace,NAME:.metadata.name",
+            out_yaml_format=False,
+        )
+        existing = set()
+        for line in out.splitlines():
+            if line.strip():
+                namespace, name = line.split()
+                existing.add(("" if namespace == "<none>" else namespace, name))
+        return existing
+
+    def _wait_polling(self, kind, pending, timeout):
+        for existing in TimeoutSampler(timeout, POLL_INTERVAL, self._existing, kind):
+            pending &= existing
+            if not pending:
+                return
+
+    def _wait_watching(self, backend, kind, pending, timeout):
+        deadline = time.time() + timeout
+        while pending:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutExpiredError(
+                    f"{len(pending)} {kind} resources weren't deleted in "
+                    f"{timeout}s: {sorted(pending)[:10]}"
+                )
+            listing = OCP(kind=kind).get(all_namespaces=True)
+            pending &= {
+                (item["metadata"].get("namespace") or "", item["metadata"]["name"])
+                for item in listing["items"]
+            }
+            for event_type, obj in backend.watch_objects(
+                kind,
+                resource_version=listing["metadata"].get("resourceVersion"),
+                timeout=remaining,
+                all_namespaces=True,
+            ):
+                if event_type == "ERROR":
+                    # e.g. too old resourceVersion, list again
+                    break
+                if event_type == "DELETED":
+                    metadata = obj["metadata"]
+                    pending.discard((metadata.get("namespace") or "", metadata["name"]))
+                    if not pending:
+                        return
+
+    def _wait(self, kind, keys):
+        timeout = self.pv_timeout if kind == "persistentvolume" else self.timeout
+        pending = set(keys)
+        backend = get_api_backend()
+        if backend is not None:
+            self._wait_watching(backend, kind, pending, timeout)
+        else:
+            self._wait_polling(kind, pending, timeout)
+
+    def run(self):
+        """
+        Delete the resources kind by kind and wait for their deletion
+
+        Returns:
+            OrderedDict: kind to seconds spent on its teardown
+
+        Raises:
+            TimeoutExpiredError: if resources of a kind aren't deleted in
+                time, the following kinds are not torn down then
+
+        """
+        self._add_pvs_of_pvcs()
+        # the kinds of the same rank, e.g. the ones not in KIND_ORDER, are
+        # deleted from the last added, like the factories deleted newest first
+        added = {kind: index for index, kind in enumerate(self.resources)}
+        for kind in sorted(added, key=lambda kind: (_kind_rank(kind), -added[kind])):
+            resources = self.resources[kind]
+            start = time.time()
+            to_delete = [key for key, delete in resources.items() if delete]
+            log.info(
+                f"Tearing down {len(resources)} {kind} resources, "
+                f"{len(to_delete)} to delete"
+            )
+            if to_delete:
+                self._delete(kind, to_delete)
+            self._wait(kind, resources)
+            self.durations[kind] = time.time() - start
+        for resource in self._objects:
+            resource._is_deleted = True
+        self.resources.clear()
+        if self.durations:
+            log.info(
+                "Teardown time per kind: "
+                + ", ".join(
+                    f"{kind} {seconds:.1f}s" for kind, seconds in self.durations.items()
+                )
+            )
+        return self.durations
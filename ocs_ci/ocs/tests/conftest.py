@@ -0,0 +1,30 @@
+# -*- coding: utf8 -*-
+
+import os
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import api_backend
+from ocs_ci.utility.benchmarks import ocp_backend
+from ocs_ci.utility.benchmarks.stub_server import StubServer
+
+
+@pytest.fixture
+def fake_api_server(tmpdir, monkeypatch):
+    """
+    Fake API server with 3 pods and kubeconfig pointing to it, OCP objects are
+    switched to the API backend.
+    """
+    ocp_backend.FakeAPIServerHandler.pods = {
+        f"pod-{i}": ocp_backend.pod_dict(f"pod-{i}") for i in range(3)
+    }
+    ocp_backend.FakeAPIServerHandler.watch_events = []
+    with StubServer(ocp_backend.FakeAPIServerHandler) as server:
+        kubeconfig = os.path.join(str(tmpdir), "kubeconfig")
+        ocp_backend.write_kubeconfig(server.url, kubeconfig)
+        monkeypatch.setenv("KUBECONFIG", kubeconfig)
+        monkeypatch.setitem(config.RUN, "ocp_backend", api_backend.API_BACKEND)
+        api_backend.reset_api_backend()
+        yield server
+        api_backend.reset_api_backend()
@@ -0,0 +1,99 @@
+# -*- coding: utf8 -*-
+
+import pytest
+import yaml
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import api_backend
+from ocs_ci.ocs.exceptions import (
+    CommandFailed,
+    ResourceInUnexpectedState,
+    UnsupportedAPIBackendCall,
+)
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.benchmarks import ocp_backend
+
+
+def test_backend_disabled_by_default():
+    assert config.RUN["ocp_backend"] == api_backend.OC_BACKEND
+    assert api_backend.get_api_backend() is None
+
+
+def test_resolve_resource(fake_api_server):
+    backend = api_backend.get_api_backend()
+    for kind in ("Pod", "pod", "pods", "po"):
+        assert backend.resolve_resource(kind).kind == "Pod"
+    with pytest.raises(UnsupportedAPIBackendCall):
+        backend.resolve_resource("pod,pvc")
+
+
+def test_ocp_get_via_backend(fake_api_server):
+    ocp_pod = OCP(kind="pod", namespace=ocp_backend.NAMESPACE)
+    pod = ocp_pod.get("pod-1")
+    assert pod["metadata"]["name"] == "pod-1"
+    pods = ocp_pod.get()
+    assert pods["kind"] == "List"
+    assert len(pods["items"]) == 3
+
+
+def test_ocp_get_not_found(fake_api_server):
+    ocp_pod = OCP(kind="Pod", namespace=ocp_backend.NAMESPACE)
+    with pytest.raises(CommandFailed, match="NotFound"):
+        ocp_pod.get("missing-pod")
+    assert ocp_pod.get("missing-pod", dont_raise=True) is None
+
+
+def test_backend_shared_across_calls(fake_api_server):
+    assert api_backend.get_api_backend() is api_backend.get_api_backend()
+
+
+def test_wait_for_resource_via_watch(fake_api_server):
+    pending = ocp_backend.pod_dict("pod-0")
+    pending["status"]["phase"] = "Pending"
+    ocp_backend.FakeAPIServerHandler.pods["pod-0"] = pending
+    ocp_backend.FakeAPIServerHandler.watch_events = [
+        ("MODIFIED", ocp_backend.pod_dict("pod-0"))
+    ]
+    ocp_pod = OCP(kind="Pod", namespace=ocp_backend.NAMESPACE)
+    assert ocp_pod.wait_for_resource(
+        condition="Running", selector="app=benchmark", resource_count=3, timeout=10
+    )
+    assert ocp_pod.wait_for_resource(
+        condition="Running", resource_name="pod-1", timeout=10
+    )
+
+
+def test_wait_for_resource_via_watch_error_condition(fake_api_server, monkeypatch):
+    failed = ocp_backend.pod_dict("pod-2")
+    failed["status"]["phase"] = "Failed"
+    ocp_backend.FakeAPIServerHandler.watch_events = [("MODIFIED", failed)]
+    ocp_pod = OCP(kind="Pod", namespace=ocp_backend.NAMESPACE)
+    # describe of the failed resources isn't served by the API backend
+    monkeypatch.setattr(ocp_pod, "describe", lambda *args, **kwargs: "")
+    with pytest.raises(ResourceInUnexpectedState):
+        ocp_pod.wait_for_resource(
+            condition="Pending", error_condition="Failed", timeout=10
+        )
+
+
+def test_get_resource_column_via_table(fake_api_server):
+    pending = ocp_backend.pod_dict("pod-1")
+    pending["status"]["phase"] = "Pending"
+    ocp_backend.FakeAPIServerHandler.pods["pod-1"] = pending
+    ocp_pod = OCP(kind="Pod", namespace=ocp_backend.NAMESPACE)
+    assert ocp_pod.get_resource("pod-1", "STATUS") == "Pending"
+    assert ocp_pod.get_column_values("STATUS", selector="app=benchmark") == {
+        "pod-0": "Running",
+        "pod-1": "Pending",
+        "pod-2": "Running",
+    }
+
+
+def test_delete_list_yaml_via_backend(fake_api_server, tmpdir):
+    pods = [ocp_backend.pod_dict(f"pod-{i}") for i in range(2)]
+    yaml_file = tmpdir.join("pods.yaml")
+    yaml_file.write(yaml.safe_dump({"apiVersion": "v1", "kind": "List", "items": pods}))
+    backend = api_backend.get_api_backend()
+    output = backend.delete(kind=None, yaml_file=str(yaml_file))
+    assert output == 'pod "pod-0" deleted\npod "pod-1" deleted'
+    assert list(ocp_backend.FakeAPIServerHandler.pods) == ["pod-2"]
@@ -0,0 +1,108 @@
+# -*- coding: utf8 -*-
+
+import json
+import os
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import ceph_channel
+from ocs_ci.ocs.exceptions import CephChannelClosed, CommandFailed
+from ocs_ci.ocs.resources import pod
+from ocs_ci.utility.benchmarks.ocp_backend import pod_dict
+
+FAKE_CEPH = """#!/bin/sh
+if [ "$1" = "fail" ]; then
+    echo "Error EINVAL: invalid command" >&2
+    exit 22
+fi
+sleep 0.2
+printf '{"args": "%s"}' "$*"
+"""
+
+
+@pytest.fixture
+def channel(tmp_path, monkeypatch):
+    """
+    Channel to the shim running locally with fake ceph CLI in PATH
+    """
+    ceph = tmp_path / "ceph"
+    ceph.write_text(FAKE_CEPH)
+    ceph.chmod(ceph.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    channel = ceph_channel.CephCommandChannel(
+        [sys.executable, "-u", ceph_channel.SHIM_PATH]
+    ).start()
+    yield channel
+    channel.close()
+
+
+def test_channel_runs_commands_concurrently(channel):
+    commands = [["osd", "df"], ["status"], ["df", "detail"], ["health"]]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        outputs = list(executor.map(channel.run, commands))
+    for args, out in zip(commands, outputs):
+        assert json.loads(out) == {"args": " ".join(args + ["--format", "json"])}
+
+
+def test_channel_command_failure(channel):
+    with pytest.raises(CommandFailed, match="invalid command"):
+        channel.run(["fail"])
+    # the channel is still usable after the failed command
+    assert json.loads(channel.run(["status"], format=None)) == {"args": "status"}
+    channel.close()
+    with pytest.raises(CephChannelClosed):
+        channel.run(["status"])
+
+
+def test_channel_died(channel, monkeypatch):
+    channel.process.kill()
+    channel._reader.join(10)
+    # the reader exited, no request can wait for it anymore
+    monkeypatch.setattr(ceph_channel.CephCommandChannel, "alive", True)
+    with pytest.raises(CephChannelClosed):
+        channel.run(["status"], timeout=1)
+
+
+def test_ceph_tools_pod_cached(monkeypatch):
+    tools_pod = pod_dict("rook-ceph-tools-1", config.ENV_DATA["cluster_namespace"])
+    tools_pod["metadata"]["labels"] = {"app": "rook-ceph-tools"}
+    terminating = pod_dict("rook-ceph-tools-0", config.ENV_DATA["cluster_namespace"])
+    terminating["metadata"]["deletionTimestamp"] = "2021-03-24T10:15:02Z"
+    lookups = []
+    current = {"rook-ceph-tools-1": tools_pod}
+
+    def get_pods_having_label(label, namespace, consistent=False):
+        lookups.append(label)
+        return [terminating] + list(current.values())
+
+    def get(self, resource_name="", dont_raise=False, **kwargs):
+        return current.get(resource_name)
+
+    monkeypatch.setattr(pod, "get_pods_having_label", get_pods_having_label)
+    monkeypatch.setattr(pod.OCP, "get", get)
+    config.ENV_DATA["http_proxy"] = ""
+    try:
+        pod.invalidate_ceph_tools_pod()
+        assert pod.get_ceph_tools_pod().name == "rook-ceph-tools-1"
+        assert pod.get_ceph_tools_pod().name == "rook-ceph-tools-1"
+        assert len(lookups) == 1
+        pod.invalidate_ceph_tools_pod()
+        pod.get_ceph_tools_pod()
+        assert len(lookups) == 2
+
+        # the node of the cached pod failed, the pod is being deleted
+        stale = pod_dict("rook-ceph-tools-1", config.ENV_DATA["cluster_namespace"])
+        stale["metadata"]["deletionTimestamp"] = "2021-03-24T10:15:02Z"
+        new_pod = pod_dict("rook-ceph-tools-2", config.ENV_DATA["cluster_namespace"])
+        new_pod["metadata"]["labels"] = {"app": "rook-ceph-tools"}
+        current["rook-ceph-tools-1"] = stale
+        current["rook-ceph-tools-2"] = new_pod
+        assert pod.get_ceph_tools_pod().name == "rook-ceph-tools-2"
+        assert len(lookups) == 3
+    finally:
+        pod.invalidate_ceph_tools_pod()
+        config.ENV_DATA.pop("http_proxy")
@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from ocs_ci.ocs import ceph_sampler
+from ocs_ci.ocs.ceph_sampler import CephStatusSampler, load_samples
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+
+
+class FakeCeph(object):
+    """
+    Returns canned outputs of the sampled commands
+    """
+
+    def __init__(self):
+        self.write_bytes_sec = 0
+        self.degraded = 8
+        self.calls = 0
+
+    def __call__(self, command):
+        self.calls += 1
+        if command == ceph_sampler.STATUS_CMD:
+            pgs = [{"state_name": "active+clean", "count": 32 - self.degraded}]
+            if self.degraded:
+                pgs.append({"state_name": "active+degraded", "count": self.degraded})
+            return {
+                "health": {"status": "HEALTH_OK", "checks": {}},
+                "pgmap": {
+                    "num_pgs": 32,
+                    "pgs_by_state": pgs,
+                    "write_bytes_sec": self.write_bytes_sec,
+                    "write_op_per_sec": 10,
+                },
+            }
+        if command == ceph_sampler.DF_CMD:
+            return {"stats": {"total_bytes": 300, "total_used_raw_bytes": 30}}
+        return {"nodes": [{"id": 0, "utilization": 10.0}]}
+
+
+@pytest.fixture
+def fake_ceph():
+    return FakeCeph()
+
+
+def test_parse_snapshot(fake_ceph):
+    outputs = {command: fake_ceph(command) for command in ceph_sampler.COMMANDS}
+    snapshot = ceph_sampler.parse_snapshot(outputs, sample_time=1.0)
+    assert snapshot["health"] == "HEALTH_OK"
+    assert snapshot["pgs_by_state"] == {"active+clean": 24, "active+degraded": 8}
+    assert snapshot["read_bytes_sec"] == 0
+    assert snapshot["total_used_raw_bytes"] == 30
+    assert snapshot["osd_utilization"] == {"0": 10.0}
+    assert ceph_sampler.iops(snapshot) == 10
+    assert not ceph_sampler.is_rebalanced(snapshot)
+
+
+def test_ring_buffer_and_windows(fake_ceph):
+    sampler = CephStatusSampler(interval=1, size=5, fetch=fake_ceph)
+    for write_rate in (1, 2, 3, 4, 100, 5, 6):
+        fake_ceph.write_bytes_sec = write_rate * 2 ** 20
+        sampler.sample()
+    assert len(sampler.samples) == 5
+    assert ceph_sampler.throughput(sampler.latest()) == 6
+    assert [ceph_sampler.throughput(s) for s in sampler.last(3)] == [100, 5, 6]
+    # the outlier is trimmed
+    assert sampler.trimmed_mean(ceph_sampler.throughput, count=5) == 5
+    assert sampler.first_time(lambda s: ceph_sampler.throughput(s) > 50)
+    assert sampler.latest(max_age=-1) is None
+    # only the snapshots taken after the call
+    with pytest.raises(TimeoutExpiredError):
+        sampler.last(1, timeout=0.1, since=time.time())
+    since = time.time()
+    fake_ceph.write_bytes_sec = 7 * 2 ** 20
+    sampler.sample()
+    assert [ceph_sampler.throughput(s) for s in sampler.last(1, since=since)] == [7]
+
+
+def test_failed_command_is_counted(fake_ceph):
+    def fetch(command):
+        if command == ceph_sampler.STATUS_CMD:
+            raise Exception("ceph status timed out")
+        return fake_ceph(command)
+
+    sampler = CephStatusSampler(interval=1, fetch=fetch)
+    sampler.sample()
+    assert sampler.errors == 1
+    assert sampler.latest() is None
+    assert sampler.window(key="total_bytes")
+
+
+def test_wait_for_condition_in_background(fake_ceph):
+    sampler = CephStatusSampler(interval=0.05, fetch=fake_ceph)
+    sampler.start()
+    try:
+        with pytest.raises(TimeoutExpiredError):
+            sampler.wait_for(ceph_sampler.is_rebalanced, timeout=0.3)
+        fake_ceph.degraded = 0
+        snapshot = sampler.wait_for(ceph_sampler.is_rebalanced, timeout=5)
+        assert snapshot["pgs_by_state"] == {"active+clean": 32}
+    finally:
+        sampler.stop()
+    calls = fake_ceph.calls
+    time.sleep(0.2)
+    assert fake_ceph.calls == calls
+
+
+def test_dump_and_load(fake_ceph, tmp_path):
+    sampler = CephStatusSampler(interval=1, fetch=fake_ceph)
+    for _ in range(3):
+        sampler.sample()
+    path = str(tmp_path / "samples.json.gz")
+    sampler.dump(path)
+    assert load_samples(path) == list(sampler.samples)
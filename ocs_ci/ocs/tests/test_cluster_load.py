@@ -0,0 +1,98 @@
+import time
+
+from ocs_ci.ocs import cluster_load
+from ocs_ci.ocs.cluster_load import (
+    ClusterLoad,
+    RateController,
+    find_cluster_limit,
+    format_rate,
+    parse_rate,
+    rate_for_iops,
+)
+
+MiB = 2 ** 20
+LIMIT = 5000.0
+
+
+def cluster_model(rate):
+    """
+    IOPS grow with the rate of 6 pods doing 128K IO till the limit, the
+    latency grows fast near the limit
+    """
+    requested = 6 * rate / (128 * 1024)
+    iops = min(requested, LIMIT)
+    latency = 5 / max(1 - requested / (LIMIT * 1.2), 0.01)
+    return iops, latency
+
+
+def test_rate_conversion():
+    assert parse_rate("20M") == 20 * MiB
+    assert parse_rate("512k") == 512 * 1024
+    assert parse_rate(1000) == 1000
+    assert format_rate(20 * MiB) == "20480k"
+    assert format_rate(0) == "0"
+
+
+def test_find_cluster_limit():
+    limit, curve = find_cluster_limit(cluster_model, 4 * MiB, 512 * MiB)
+    assert 0.8 * LIMIT < limit <= LIMIT
+    # doubling till saturation and 3 bisection steps
+    assert len(curve) < 12
+    rate = rate_for_iops(curve, limit * 0.5)
+    assert abs(cluster_model(rate)[0] - limit * 0.5) < limit * 0.05
+
+
+def test_find_cluster_limit_stops():
+    calls = []
+
+    def should_stop():
+        calls.append(1)
+        return "timeout" if len(calls) > 2 else None
+
+    _, curve = find_cluster_limit(
+        cluster_model, 4 * MiB, 512 * MiB, should_stop=should_stop
+    )
+    assert len(curve) == 3
+
+
+def test_rate_controller_converges():
+    target = LIMIT * 0.6
+    controller = RateController(target, rate=1 * MiB)
+    for _ in range(20):
+        iops, latency = cluster_model(controller.rate)
+        if controller.update(iops, latency) is None:
+            break
+    assert abs(cluster_model(controller.rate)[0] - target) <= target * 0.05
+    # high latency halves the rate
+    rate = controller.rate
+    assert controller.update(target, 300) == rate / 2
+
+
+def test_controller_waits_for_rate_change(monkeypatch):
+    load = ClusterLoad.__new__(ClusterLoad)
+    load.controller = RateController(LIMIT * 0.6, rate=1 * MiB)
+    rates = []
+    monkeypatch.setattr(load, "set_rate", rates.append)
+    monkeypatch.setattr(load, "measure", lambda settle_time=None: (LIMIT * 0.3, 5))
+    load.rate_set_time = time.time()
+    load.adjust_load_if_needed()
+    assert not rates
+    load.rate_set_time -= cluster_load.RATE_SETTLE_TIME
+    load.adjust_load_if_needed()
+    assert rates == [load.rate]
+
+
+def test_measure_waits_for_rate_change(monkeypatch):
+    load = ClusterLoad.__new__(ClusterLoad)
+    load.adjustable_rate = True
+    load.current_iops = None
+    sleeps = []
+    monkeypatch.setattr(cluster_load.time, "sleep", sleeps.append)
+    monkeypatch.setattr(load, "calc_trim_metric_mean", lambda metric, **kw: 1.0)
+    load.rate_set_time = time.time()
+    load.measure()
+    # the queries cover only the time after the rate change
+    assert sleeps[0] > cluster_load.QUERY_WINDOW
+    load.rate_set_time -= cluster_load.RATE_SETTLE_TIME
+    load.measure()
+    assert sleeps[1] == 0
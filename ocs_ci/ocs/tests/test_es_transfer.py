@@ -0,0 +1,122 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from elasticsearch.serializer import JSONSerializer
+
+from ocs_ci.ocs import es_transfer
+
+SHARDS = {"successful": 1, "total": 1, "skipped": 0}
+
+
+class FakeElasticsearch(object):
+    """
+    Serves bulk writes and scroll searches of in-memory indices, the
+    documents with "fail" are rejected
+    """
+
+    def __init__(self):
+        self.transport = SimpleNamespace(serializer=JSONSerializer())
+        self.indices = {}
+        self.bulk_sizes = []
+        self.scrolls = {}
+        # number of documents read from the source when a bulk was received
+        self.read_at_bulk = []
+        self.read = None
+
+    def bulk(self, body, index=None, **kwargs):
+        lines = [json.loads(line) for line in body.strip().split("\n")]
+        if self.read is not None:
+            self.read_at_bulk.append(self.read())
+        items = []
+        for action, doc in zip(lines[::2], lines[1::2]):
+            meta = action["index"]
+            if doc.get("fail"):
+                error = {"type": "mapper_parsing_exception"}
+                items.append({"index": {"status": 400, "error": error}})
+                continue
+            docs = self.indices.setdefault(meta.get("_index", index), {})
+            docs[meta.get("_id", f"auto-{len(docs)}")] = doc
+            items.append({"index": {"status": 201}})
+        self.bulk_sizes.append(len(items))
+        return {
+            "errors": any("error" in item["index"] for item in items),
+            "items": items,
+        }
+
+    def _page(self, scroll_id):
+        hits = self.scrolls[scroll_id]
+        page, self.scrolls[scroll_id] = hits[: self.page_size], hits[self.page_size :]
+        return {"_scroll_id": scroll_id, "hits": {"hits": page}, "_shards": SHARDS}
+
+    def search(self, body=None, index=None, scroll=None, size=None, **kwargs):
+        self.page_size = size
+        self.scrolls[index] = [
+            {"_index": index, "_id": doc_id, "_source": doc}
+            for doc_id, doc in self.indices.get(index, {}).items()
+        ]
+        return self._page(index)
+
+    def scroll(self, body=None, scroll_id=None, **kwargs):
+        return self._page(scroll_id or body["scroll_id"])
+
+    def clear_scroll(self, **kwargs):
+        pass
+
+
+@pytest.fixture
+def dump(tmp_path):
+    path = tmp_path / "dump.data.json"
+    with open(path, "w") as dump_file:
+        for num in range(2500):
+            dump_file.write(json.dumps({"num": num}) + "\n")
+            if num % 1000 == 0:
+                dump_file.write("not json\n\n")
+    return str(path)
+
+
+def test_load_file_skips_invalid_lines(dump):
+    target = FakeElasticsearch()
+    stats = es_transfer.load_file(target, dump, "main", chunk_size=100, threads=4)
+    assert (stats["docs"], stats["errors"], stats["invalid"]) == (2500, 0, 3)
+    assert len(target.indices["main"]) == 2500
+    assert max(target.bulk_sizes) == 100
+
+
+def test_load_file_streams(dump, monkeypatch):
+    read_docs = es_transfer.read_docs
+    read = []
+
+    def counting_read_docs(file_name, errors=None):
+        for doc in read_docs(file_name, errors):
+            read.append(doc)
+            yield doc
+
+    monkeypatch.setattr(es_transfer, "read_docs", counting_read_docs)
+    target = FakeElasticsearch()
+    target.read = lambda: len(read)
+    es_transfer.load_file(target, dump, "main", chunk_size=100, threads=1)
+    assert len(target.bulk_sizes) == 25
+    # the documents are read one chunk ahead of the writes at most
+    for written, read_count in enumerate(target.read_at_bulk, start=1):
+        assert read_count <= written * 100 + 1
+
+
+def test_bulk_errors_are_counted():
+    target = FakeElasticsearch()
+    docs = ({"num": num, "fail": num % 10 == 0} for num in range(50))
+    stats = es_transfer.bulk_load(target, docs, index="main", chunk_size=20, threads=2)
+    assert (stats["docs"], stats["errors"]) == (45, 5)
+    assert len(target.indices["main"]) == 45
+
+
+def test_copy_index():
+    source, target = FakeElasticsearch(), FakeElasticsearch()
+    source.indices["main"] = {f"id-{num}": {"num": num} for num in range(2500)}
+    source.indices["other"] = {"id-0": {"num": 0}}
+    stats = es_transfer.copy_index(
+        source, target, "main", "copy", page_size=1000, chunk_size=500, threads=1
+    )
+    assert (stats["docs"], stats["errors"]) == (2500, 0)
+    # all documents with their ids, not only the first 1000
+    assert target.indices == {"copy": source.indices["main"]}
@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
+from ocs_ci.ocs.fio_harvester import RUNNING, DetachedFio, FioHarvester
+from ocs_ci.utility.workloads import fio
+
+
+class FakePod(object):
+    def __init__(self, name, outputs):
+        self.name = name
+        self.outputs = list(outputs)
+        self.polls = 0
+
+    def exec_cmd_on_pod(self, command, out_yaml_format=True, timeout=600):
+        self.polls += 1
+        output = self.outputs.pop(0)
+        if isinstance(output, Exception):
+            raise output
+        return output
+
+
+@pytest.fixture
+def harvester():
+    # polled explicitly by the tests
+    harvester = FioHarvester(interval=3600, batch_size=2)
+    yield harvester
+    harvester.stop()
+
+
+def add(harvester, pod, deadline=60, not_before=0):
+    now = time.time()
+    return harvester.add(
+        DetachedFio(pod, "out.json", "out.rc", now + deadline, now + not_before)
+    )
+
+
+def test_harvest_in_batches(harvester):
+    done = FakePod("done", ['0\n{"jobs": []}'])
+    flaky = FakePod("flaky", [CommandFailed("api hiccup"), RUNNING, '0\n{"a": 1}'])
+    failed = FakePod("failed", ["1\nfio: error"])
+    later = FakePod("later", ['0\n{"b": 2}'])
+    futures = [add(harvester, pod) for pod in (done, flaky, failed)]
+    futures.append(add(harvester, later, not_before=3600))
+    assert harvester.poll() == 2
+    assert futures[0].result(0) == '{"jobs": []}'
+    with pytest.raises(CommandFailed):
+        futures[2].result(0)
+    # the failed poll and the running fio are retried
+    assert harvester.poll() == 0
+    assert harvester.poll() == 1
+    assert futures[1].result(0) == '{"a": 1}'
+    # fio of the last pod can't be finished yet
+    assert later.polls == 0
+    assert not futures[3].done()
+
+
+def test_deadline(harvester):
+    future = add(harvester, FakePod("slow", [RUNNING]), deadline=-1)
+    assert harvester.poll() == 1
+    with pytest.raises(TimeoutExpiredError):
+        future.result(0)
+
+
+def test_detached_deadline_after_runtime(harvester, monkeypatch):
+    monkeypatch.setattr(fio, "get_fio_harvester", lambda: harvester)
+    pod = FakePod("pod", ["started"])
+    fio.run_detached(
+        pod=pod, type="fs", path="/mnt", time_based=1, runtime=1200, name="test"
+    )
+    detached = harvester._pending[0]
+    # polls after the earliest time fio can finish
+    grace = fio.DETACHED_MARGIN + fio.DETACHED_HARVEST_POLLS * harvester.interval
+    assert detached.deadline - detached.not_before == pytest.approx(grace, abs=1)
@@ -0,0 +1,47 @@
+import json
+import os
+
+import pytest
+
+from ocs_ci.ocs.fio_stream import FioResultIngester, parse_fio_output
+
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+
+@pytest.fixture
+def fio_report():
+    with open(os.path.join(HERE, "fio.output")) as fio_output:
+        return json.load(fio_output)
+
+
+def test_status_interval_reports(fio_report):
+    reports = []
+    for elapsed in (10, 20, 30):
+        fio_report["jobs"][0]["elapsed"] = elapsed
+        reports.append(json.dumps(fio_report, indent=2))
+    output = "fio: warning\n" + "\n".join(reports) + "\n"
+    progress = []
+    ingester = FioResultIngester(on_record=progress.append, max_records=2)
+    # chunks not aligned with the lines
+    for index in range(0, len(output), 1000):
+        ingester.feed(output[index : index + 1000])
+    assert ingester.close() is None
+    assert [record["jobs"][0]["elapsed"] for record in progress] == [10, 20, 30]
+    assert len(ingester.records) == 2
+    assert ingester.last_report == fio_report
+    assert list(ingester.messages) == ["fio: warning"]
+    record = ingester.last_record
+    assert record["disk_util"][0]["name"] == "rbd1"
+    # the job doesn't read
+    assert set(record["jobs"][0]) == {"jobname", "error", "elapsed", "write"}
+    write = record["jobs"][0]["write"]
+    assert write["bw"] == fio_report["jobs"][0]["write"]["bw"]
+    assert "99.99" in write["clat_percentiles"]
+
+
+def test_incomplete_report(fio_report):
+    output = json.dumps(fio_report, indent=2)
+    with pytest.raises(ValueError):
+        parse_fio_output(output[:-10])
+    assert parse_fio_output(output) == fio_report
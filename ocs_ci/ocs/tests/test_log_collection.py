@@ -0,0 +1,115 @@
+import gzip
+import json
+import logging
+import os
+
+import pytest
+
+from ocs_ci.ocs import log_collection, utils
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.log_collection import LogCollectionService, store_artifacts
+
+
+def write_gather(directory, content):
+    os.makedirs(os.path.join(directory, "namespaces"))
+    with open(os.path.join(directory, "namespaces", "pods.yaml"), "w") as data:
+        data.write(content)
+    with open(os.path.join(directory, "version"), "w") as data:
+        data.write("4.7")
+
+
+def test_store_artifacts(tmp_path):
+    store_dir = str(tmp_path / ".artifacts")
+    first, second = str(tmp_path / "first"), str(tmp_path / "second")
+    write_gather(first, "pods: 1")
+    write_gather(second, "pods: 2")
+    assert store_artifacts(first, store_dir)["stored"] == 2
+    manifest = store_artifacts(second, store_dir)
+    # the version file is stored once
+    assert (manifest["stored"], manifest["reused"]) == (1, 1)
+    with gzip.open(os.path.join(second, "namespaces", "pods.yaml.gz"), "rt") as data:
+        assert data.read() == "pods: 2"
+    assert not os.path.exists(os.path.join(second, "version"))
+    assert os.path.samefile(
+        os.path.join(first, "version.gz"), os.path.join(second, "version.gz")
+    )
+    with open(os.path.join(second, "manifest.json")) as manifest_file:
+        assert json.load(manifest_file)["files"].keys() == {
+            "version",
+            os.path.join("namespaces", "pods.yaml"),
+        }
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    gathered = []
+
+    def gather(log_dir_path, raise_on_error=False):
+        gathered.append(log_dir_path)
+        if "failing" in log_dir_path and raise_on_error:
+            raise CommandFailed("must-gather timed out")
+        if "empty" in log_dir_path:
+            # the must-gather logs its error and returns
+            logging.error("Failed during must gather logs!")
+            os.makedirs(os.path.join(log_dir_path, "ocs_must_gather"))
+            return
+        write_gather(os.path.join(log_dir_path, "ocs_must_gather"), "pods: 1")
+
+    fingerprint = {"value": "state-1"}
+    monkeypatch.setattr(log_collection, "kubeconfig_exists", lambda: True)
+    monkeypatch.setattr(
+        log_collection,
+        "get_ocs_logs_dir_path",
+        lambda dir_name, status_failure: str(tmp_path / f"{dir_name}_ocs_logs"),
+    )
+    monkeypatch.setattr(
+        log_collection, "cluster_state_fingerprint", lambda: fingerprint["value"]
+    )
+    monkeypatch.setattr(
+        LogCollectionService, "GATHERS", {"ocs": ("ocs_must_gather", gather)}
+    )
+    service = LogCollectionService(max_workers=2)
+    service.gathered = gathered
+    service.fingerprint = fingerprint
+    yield service
+    service.shutdown()
+
+
+def test_service_deduplicates(service, tmp_path):
+    assert len(service.submit("test_a", ocp=False)) == 1
+    assert service.wait(timeout=10) == 0
+    # cluster state didn't change, the logs of test_a are linked
+    assert service.submit("test_b", ocp=False) == []
+    service.fingerprint["value"] = "state-2"
+    assert len(service.submit("test_c", ocp=False)) == 1
+    assert service.wait(timeout=10) == 0
+    assert len(service.gathered) == 2
+    linked = tmp_path / "test_b_ocs_logs" / "ocs_must_gather"
+    assert os.path.islink(linked)
+    assert os.path.exists(linked / "namespaces" / "pods.yaml.gz")
+
+
+def test_failed_gather_isnt_linked(service):
+    assert len(service.submit("test_failing", ocp=False)) == 1
+    assert service.wait(timeout=10) == 0
+    assert len(service.submit("test_b", ocp=False)) == 1
+
+
+def test_empty_gather_isnt_linked(service):
+    assert len(service.submit("test_empty", ocp=False)) == 1
+    assert service.wait(timeout=10) == 0
+    assert len(service.submit("test_b", ocp=False)) == 1
+
+
+class FailingOCP(object):
+    def exec_oc_cmd(self, command, out_yaml_format=True, timeout=600):
+        raise CommandFailed("must-gather failed")
+
+
+def test_run_must_gather_raise_on_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "OCP", FailingOCP)
+    monkeypatch.setitem(utils.ocsci_config.ENV_DATA, "ocs_version", "4.7")
+    # the error is only logged by default
+    utils.run_must_gather(str(tmp_path / "logs"), "image")
+    with pytest.raises(CommandFailed):
+        utils.run_must_gather(str(tmp_path / "logs"), "image", raise_on_error=True)
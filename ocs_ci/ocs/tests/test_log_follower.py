@@ -0,0 +1,76 @@
+import re
+
+import pytest
+
+from ocs_ci.ocs.log_follower import LogFollower, LogFollowService, LogMatcher
+
+
+class ScriptFollower(LogFollower):
+    """
+    Follows the output of a shell script instead of 'oc logs -f'
+    """
+
+    script = ""
+
+    def _command(self):
+        return ["sh", "-c", self.script]
+
+
+@pytest.fixture
+def follower_factory():
+    followers = []
+
+    def factory(script, **kwargs):
+        follower = ScriptFollower("pod", "namespace", start_timeout=0, **kwargs)
+        follower.script = script
+        followers.append(follower)
+        return follower
+
+    yield factory
+    for follower in followers:
+        follower.stop()
+
+
+def test_wait_for_resolves_on_match(follower_factory):
+    follower = follower_factory(
+        "for i in 1 2 3; do echo Hello world - $i; done; exec sleep 30"
+    ).start()
+    assert follower.wait_for("Hello world - 3", timeout=10) == "Hello world - 3"
+    assert follower.search(re.compile(r"world - \d")) == "Hello world - 1"
+    assert not follower.finished
+
+
+def test_wait_for_ends_with_log(follower_factory):
+    follower = follower_factory("echo one; echo two").start()
+    assert follower.wait_for("three", timeout=10) is None
+    assert follower.join(10)
+    assert follower.lines == 2
+
+
+def test_parsers_get_buffered_lines(follower_factory):
+    follower = follower_factory("seq 1 5", buffer_size=3).start()
+    assert follower.join(10)
+    early = LogMatcher("1")
+    follower.add_parser(early)
+    assert not early.matched
+    late = follower.add_parser(LogMatcher("4"))
+    assert late.line == "4"
+    assert follower.search("2") is None
+
+
+def test_failed_log():
+    follower = ScriptFollower("pod", "namespace", start_timeout=0)
+    follower.script = "exit 1"
+    assert not follower.start().join(10)
+    assert follower.returncode == 1
+
+
+def test_service_keeps_one_follower_per_pod(monkeypatch):
+    monkeypatch.setattr(LogFollower, "start", lambda follower: follower)
+    service = LogFollowService()
+    follower = service.follow("pod", "namespace", since=60)
+    assert service.follow("pod", "namespace") is follower
+    assert follower.since == 60
+    assert service.follow("other", "namespace") is not follower
+    follower.finished = True
+    assert service.follow("pod", "namespace", restart=True) is not follower
@@ -0,0 +1,50 @@
+# -*- coding: utf8 -*-
+
+import re
+
+from ocs_ci.ocs import metrics
+
+
+class FakePrometheus(object):
+    """
+    Answers the queries from the set of available metrics
+    """
+
+    def __init__(self, available):
+        self.available = available
+        self.queries = []
+
+    def query(self, query, mute_logs=False):
+        self.queries.append(query)
+        match = re.match(r'^count by \(__name__\) \(\{__name__=~"(.*)"\}\)$', query)
+        if match:
+            names = match.group(1).split("|")
+        else:
+            names = [query]
+        return [
+            {"metric": {"__name__": name}, "value": [0, "1"]}
+            for name in names
+            if name in self.available
+        ]
+
+
+def test_get_missing_metrics_batched():
+    available = {"ceph_osd_up", "ceph_mon_quorum_status", "ceph_pool_stored"}
+    expected = ["ceph_osd_up", "ceph_osd_in", "ceph_mon_quorum_status", "ceph_rgw_req"]
+    expected += ['ceph_pool_stored{pool_id="1"}']
+    prometheus = FakePrometheus(available)
+    missing = metrics.get_missing_metrics(
+        prometheus, expected, current_platform="aws", batch_size=2
+    )
+    assert missing == ["ceph_osd_in", 'ceph_pool_stored{pool_id="1"}']
+    # 4 plain names in 2 batches, the query with labels on its own
+    assert len(prometheus.queries) == 3
+
+
+def test_get_available_metrics_latencies():
+    prometheus = FakePrometheus({"ceph_osd_up"})
+    available, latencies = metrics.get_available_metrics(
+        prometheus, ["ceph_osd_up", "ceph_osd_in"]
+    )
+    assert available == {"ceph_osd_up"}
+    assert list(latencies) == ["ceph_osd_up..ceph_osd_in (2 metrics)"]
@@ -0,0 +1,45 @@
+import pytest
+
+# node_metrics can't be imported before pod module because of import cycle
+from ocs_ci.ocs.resources import pod  # noqa: F401
+from ocs_ci.ocs import node_metrics
+from ocs_ci.ocs.exceptions import CommandFailed
+
+
+class FakeOCP(object):
+    """
+    Records the deletes, failing the one of the DaemonSet
+    """
+
+    calls = []
+
+    def __init__(self, kind=None, namespace=None):
+        self.kind = kind
+
+    def delete(self, resource_name):
+        self.calls.append(("delete", self.kind))
+        if self.kind == "DaemonSet":
+            raise CommandFailed("daemonsets.apps not found")
+
+    def exec_oc_cmd(self, command, out_yaml_format=True):
+        self.calls.append(("exec", command.split()[2]))
+
+
+def test_failed_start_tears_down(monkeypatch, tmp_path):
+    FakeOCP.calls = []
+    monkeypatch.setattr(node_metrics, "OCP", FakeOCP)
+
+    def deploy(timeout=300):
+        raise TimeoutError("agents not ready")
+
+    collector = node_metrics.NodeMetricsCollector(
+        namespace="ns", output_path=str(tmp_path / "metrics.ndjson")
+    )
+    monkeypatch.setattr(collector, "deploy", deploy)
+    with pytest.raises(TimeoutError):
+        collector.start()
+    assert FakeOCP.calls == [
+        ("delete", "DaemonSet"),
+        ("exec", "remove-scc-from-user"),
+        ("delete", "ServiceAccount"),
+    ]
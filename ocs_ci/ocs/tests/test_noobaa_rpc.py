@@ -0,0 +1,58 @@
+import pytest
+
+from ocs_ci.ocs.exceptions import NoobaaRpcError
+from ocs_ci.ocs.noobaa_rpc import MirroringCheck, NoobaaRpcClient
+from ocs_ci.utility.benchmarks.noobaa_rpc import FakeNoobaaHandler, run_benchmark
+from ocs_ci.utility.benchmarks.stub_server import StubServer
+
+
+@pytest.fixture
+def client():
+    with StubServer(FakeNoobaaHandler) as server:
+        yield NoobaaRpcClient(f"{server.url}/rpc", max_workers=4)
+
+
+def test_list_objects_pages(client):
+    FakeNoobaaHandler.reset(25)
+    keys = [obj["key"] for obj in client.list_objects("bucket", page_size=10)]
+    assert keys == sorted(FakeNoobaaHandler.mirrored_at)
+    assert FakeNoobaaHandler.calls == 3
+
+
+def test_list_objects_pages_while_adding(client):
+    FakeNoobaaHandler.reset(25)
+    listing = client.list_objects("bucket", page_size=10)
+    keys = [next(listing)["key"] for _ in range(10)]
+    # objects added before the listed ones don't shift the next pages
+    for index in range(5):
+        FakeNoobaaHandler.mirrored_at[f"new-{index}"] = 0
+    keys += [obj["key"] for obj in listing]
+    assert keys == [f"obj-{index:06}" for index in range(25)]
+    assert FakeNoobaaHandler.calls == 3
+
+
+def test_rpc_error(client):
+    FakeNoobaaHandler.reset(1)
+    with pytest.raises(NoobaaRpcError):
+        client.reply("object_api", "unknown_method")
+
+
+def test_mirroring_check_is_incremental(client):
+    FakeNoobaaHandler.reset(10, mirror_spread=60)
+    check = MirroringCheck(client, "bucket")
+    # only the first object is mirrored already
+    assert not check.check()
+    assert len(check.confirmed) == 1
+    FakeNoobaaHandler.mirrored_at = dict.fromkeys(FakeNoobaaHandler.mirrored_at, 0)
+    FakeNoobaaHandler.calls = 0
+    assert check.check()
+    # one listing and mapping of the 9 unconfirmed objects
+    assert FakeNoobaaHandler.calls == 10
+    assert len(check.confirmed) == 10
+
+
+def test_benchmark():
+    results = run_benchmark(objects=20, mirror_spread=0.3, interval=0.05)
+    assert set(results) == {"legacy", "pooled"}
+    # listing and mapping of every object at least once
+    assert all(result["calls"] >= 21 for result in results.values())
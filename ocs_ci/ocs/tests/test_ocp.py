@@ -0,0 +1,39 @@
+# -*- coding: utf8 -*-
+
+import textwrap
+
+from ocs_ci.ocs.ocp import parse_table_output
+
+
+def test_parse_table_output_pvc():
+    output = textwrap.dedent(
+        """\
+        NAME         STATUS    VOLUME            CAPACITY   ACCESS MODES   STORAGECLASS                  AGE
+        pvc-rbd      Bound     pvc-0b0c5c0f-1    10Gi       RWO            ocs-storagecluster-ceph-rbd   5m
+        pvc-cephfs   Pending                                               ocs-storagecluster-cephfs     1m
+        """  # noqa: E501
+    )
+    rows = parse_table_output(output)
+    assert rows[0]["ACCESS MODES"] == "RWO"
+    assert rows[0]["CAPACITY"] == "10Gi"
+    assert rows[1]["NAME"] == "pvc-cephfs"
+    assert rows[1]["STATUS"] == "Pending"
+    assert rows[1]["VOLUME"] == ""
+    assert rows[1]["STORAGECLASS"] == "ocs-storagecluster-cephfs"
+
+
+def test_parse_table_output_pod():
+    output = textwrap.dedent(
+        """\
+        NAME                               READY   STATUS              RESTARTS   AGE
+        rook-ceph-tools-6b8fb5c8d6-xkfxm   1/1     Running             0          2d
+        pod-test-rbd-1                     0/1     ContainerCreating   0          3s
+        """
+    )
+    rows = parse_table_output(output)
+    assert [row["STATUS"] for row in rows] == ["Running", "ContainerCreating"]
+    assert rows[0]["READY"] == "1/1"
+
+
+def test_parse_table_output_empty():
+    assert parse_table_output("") == []
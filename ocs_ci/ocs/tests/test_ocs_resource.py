@@ -0,0 +1,27 @@
+# -*- coding: utf8 -*-
+
+import os
+import pickle
+
+from ocs_ci.ocs.resources.ocs import OCS
+from ocs_ci.utility.benchmarks import resources
+from ocs_ci.utility.utils import exec_cmd
+
+
+def test_ocs_temp_yaml_created_lazily():
+    obj = OCS(kind="ConfigMap", metadata={"name": "cm", "namespace": "ns"})
+    assert obj._temp_yaml is None
+    path = obj.temp_yaml
+    assert os.path.exists(path)
+    restored = pickle.loads(pickle.dumps(obj))
+    assert restored._temp_yaml is None
+    obj.delete_temp_yaml_file()
+    assert not os.path.exists(path)
+
+
+def test_pod_list_construction_without_temp_files():
+    assert resources.run_benchmark(pods=50)["temp_files"] == 0
+
+
+def test_exec_cmd_input():
+    assert exec_cmd("cat", input=b"kind: Pod\n").stdout == b"kind: Pod\n"
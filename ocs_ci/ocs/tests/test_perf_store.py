@@ -0,0 +1,43 @@
+import pytest
+
+from ocs_ci.ocs.perf_store import PerfResultsStore, compare_run, flatten_metrics
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PerfResultsStore(str(tmp_path / "perf_results.sqlite"))
+    params = {"io_pattern": "random"}
+    for run_id, iops in enumerate([1000, 1010, 990, 1005, 995]):
+        store.record(
+            "fio",
+            {"4KiB.randread.IOPS": [iops, iops + 4], "create.time": 10 + run_id % 2},
+            params=params,
+            run_id=f"run-{run_id}",
+        )
+    # results of other parameters are not part of the baseline
+    store.record("fio", {"4KiB.randread.IOPS": 10}, {"io_pattern": "seq"}, "run-5")
+    return store
+
+
+def test_flatten_metrics():
+    results = {"4KiB": {"randread": {"IOPS": 1.0, "ok": True}}, "name": "x"}
+    assert flatten_metrics(results) == {"4KiB.randread.IOPS": 1.0}
+
+
+def test_compare_run(store):
+    store.record(
+        "fio",
+        {"4KiB.randread.IOPS": [800, 805], "create.time": 10},
+        {"io_pattern": "random"},
+        "current",
+    )
+    comparisons = {
+        comparison["metric"]: comparison for comparison in compare_run(store, "current")
+    }
+    iops = comparisons["4KiB.randread.IOPS"]
+    assert iops["baseline_runs"] == 5
+    assert iops["delta"] == pytest.approx(802.5 / 1002 - 1)
+    assert iops["significant"] and iops["regression"]
+    # one sample within the baseline spread
+    assert not comparisons["create.time"]["significant"]
+    assert not comparisons["create.time"]["regression"]
@@ -0,0 +1,59 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import resource_cache
+from ocs_ci.ocs.resource_cache import match_label_selector, resource_version_reached
+from ocs_ci.utility.benchmarks import ocp_backend
+
+
+@pytest.mark.parametrize(
+    "selector,expected",
+    [
+        ("app=rook-ceph-osd", True),
+        ("app==rook-ceph-osd", True),
+        ("app=rook-ceph-mon", False),
+        ("app!=rook-ceph-mon", True),
+        ("app=rook-ceph-osd,ceph-osd-id=1", True),
+        ("app=rook-ceph-osd,ceph-osd-id=2", False),
+        ("app in (rook-ceph-mon,rook-ceph-osd)", True),
+        ("app notin (rook-ceph-mon,rook-ceph-osd)", False),
+        ("ceph-osd-id", True),
+        ("!ceph-osd-id", False),
+        ("!failure-domain", True),
+        ("", True),
+    ],
+)
+def test_match_label_selector(selector, expected):
+    labels = {"app": "rook-ceph-osd", "ceph-osd-id": "1"}
+    assert match_label_selector(labels, selector) == expected
+
+
+def test_resource_version_reached():
+    assert resource_version_reached("100", "99")
+    assert resource_version_reached("100", "100")
+    assert not resource_version_reached("99", "100")
+    assert not resource_version_reached(None, "1")
+
+
+def test_resource_cache_hits(fake_api_server, monkeypatch):
+    monkeypatch.setitem(config.RUN, "resource_cache", True)
+    try:
+        for _ in range(3):
+            pods = resource_cache.get_resource_items(
+                "Pod", ocp_backend.NAMESPACE, selector="app=benchmark"
+            )
+            assert len(pods) == 3
+        resource_cache.get_resource_items("Pod", ocp_backend.NAMESPACE, consistent=True)
+    finally:
+        stats = resource_cache.stop_resource_cache()
+    assert stats[f"Pod/{ocp_backend.NAMESPACE}"] == {
+        "misses": 1,
+        "hits": 2,
+        "consistent_reads": 1,
+    }
+
+
+def test_resource_cache_disabled_by_default(fake_api_server):
+    assert resource_cache.get_resource_cache() is None
@@ -0,0 +1,188 @@
+import hashlib
+import shlex
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+# bucket_utils can't be imported before pod module because of import cycle
+from ocs_ci.ocs.resources import pod  # noqa: F401
+from ocs_ci.ocs import bucket_utils
+from ocs_ci.ocs.s3_bulk import LatencyHistogram, S3BulkEngine, list_files
+
+moto = pytest.importorskip("moto")
+
+BUCKET = "bulk-bucket"
+
+
+@pytest.fixture
+def engine():
+    with moto.mock_aws():
+        engine = S3BulkEngine(
+            endpoint_url=None,
+            access_key_id="key",
+            secret_access_key="secret",
+            region="us-east-1",
+            max_workers=8,
+            multipart_threshold=5 * 2 ** 20,
+            multipart_chunksize=5 * 2 ** 20,
+        )
+        engine.client.create_bucket(Bucket=BUCKET)
+        yield engine
+
+
+@pytest.fixture
+def objects_dir(tmp_path):
+    for index in range(20):
+        (tmp_path / f"obj-{index}").write_bytes(bytes([index]) * 1024 * (index + 1))
+    # uploaded in parts
+    (tmp_path / "large").write_bytes(b"x" * 11 * 2 ** 20)
+    return tmp_path
+
+
+def test_histogram():
+    histogram = LatencyHistogram()
+    for latency in [0.001] * 90 + [0.3] * 9 + [100]:
+        histogram.record(latency)
+    stats = histogram.as_dict()
+    assert stats["count"] == 100
+    assert stats["p50"] == 0.005
+    assert stats["p95"] == 0.5
+    assert stats["p99"] == 0.5
+    assert stats["max"] == 100
+    assert stats["buckets"] == {"0.005": 90, "0.5": 9, "inf": 1}
+    assert LatencyHistogram().as_dict() == {"count": 0}
+
+
+def test_upload_verify_delete(engine, objects_dir):
+    files = list_files(str(objects_dir))
+    engine.upload_files(BUCKET, files)
+    listed = engine.client.list_objects_v2(Bucket=BUCKET)["Contents"]
+    assert sorted(obj["Key"] for obj in listed) == sorted(files)
+    assert all(engine.verify_objects(BUCKET, files).values())
+
+    engine.put_objects(BUCKET, {"obj-0": b"changed"})
+    assert not engine.verify_objects(BUCKET, files)["obj-0"]
+
+    assert engine.delete_objects(BUCKET, list(files)) == []
+    assert "Contents" not in engine.client.list_objects_v2(Bucket=BUCKET)
+    stats = engine.stats()
+    assert stats["upload"]["count"] == 21
+    assert stats["verify"]["count"] == 42
+    assert stats["delete"]["count"] == 1
+
+
+def test_upload_parts(engine, tmp_path):
+    paths = []
+    for number in range(3):
+        path = tmp_path / f"part-{number}"
+        path.write_bytes(bytes([number]) * 5 * 2 ** 20)
+        paths.append(str(path))
+    upload_id = engine.client.create_multipart_upload(Bucket=BUCKET, Key="mp")[
+        "UploadId"
+    ]
+    parts = engine.upload_parts(BUCKET, "mp", upload_id, paths)
+    assert [part["PartNumber"] for part in parts] == [1, 2, 3]
+    engine.client.complete_multipart_upload(
+        Bucket=BUCKET, Key="mp", UploadId=upload_id, MultipartUpload={"Parts": parts}
+    )
+    expected = hashlib.md5(b"".join(open(path, "rb").read() for path in paths))
+    assert engine.object_md5(BUCKET, "mp") == expected.hexdigest()
+
+
+def test_run_job(engine, objects_dir):
+    operations = [
+        {"op": "upload", "bucket": BUCKET, "key": "a", "path": f"{objects_dir}/obj-1"},
+        {"op": "upload", "bucket": BUCKET, "key": "b", "path": f"{objects_dir}/obj-2"},
+    ]
+    results = engine.run_job(operations)
+    assert results["upload"] == 2
+    results = engine.run_job(
+        [
+            {
+                "op": "verify",
+                "bucket": BUCKET,
+                "key": "a",
+                "path": f"{objects_dir}/obj-1",
+            },
+            {"op": "delete", "bucket": BUCKET, "key": "a"},
+            {"op": "delete", "bucket": BUCKET, "key": "b"},
+        ]
+    )
+    assert results["verify"] == {f"{BUCKET}/a": True}
+    assert results["delete_errors"] == []
+    assert "upload" in results["stats"]
+
+
+def test_failures_are_raised(engine, objects_dir):
+    with pytest.raises(Exception):
+        engine.upload_files("missing-bucket", list_files(str(objects_dir)))
+
+
+class LocalPod(object):
+    """
+    Runs the commands of exec_cmd_on_pod locally
+    """
+
+    name = "local"
+
+    def exec_cmd_on_pod(self, command, out_yaml_format=True, **kwargs):
+        return subprocess.run(
+            shlex.split(command), stdout=subprocess.PIPE, check=True
+        ).stdout.decode()
+
+
+def test_verify_s3_objects_integrity(tmp_path):
+    original, result = tmp_path / "original", tmp_path / "result"
+    original.mkdir()
+    result.mkdir()
+    for name in ("a", "b c"):
+        (original / name).write_text(name)
+        (result / name).write_text(name)
+    names = ["a", "b c"]
+    assert bucket_utils.verify_s3_objects_integrity(
+        str(original), str(result), names, LocalPod()
+    )
+    (result / "b c").write_text("corrupted")
+    assert not bucket_utils.verify_s3_objects_integrity(
+        str(original), str(result), names, LocalPod()
+    )
+
+
+class RecordingPod(object):
+    """
+    Records the commands of exec_cmd_on_pod
+    """
+
+    name = "recording"
+
+    def __init__(self):
+        self.commands = []
+
+    def exec_cmd_on_pod(self, command, **kwargs):
+        self.commands.append(command)
+
+
+def test_bulk_mode_per_endpoint(monkeypatch):
+    monkeypatch.setitem(bucket_utils.config.RUN, "s3_bulk", "runner")
+    mcg = SimpleNamespace(s3_endpoint="https://s3.mcg", s3_internal_endpoint="x")
+    noobaa_obc = SimpleNamespace(
+        s3_internal_endpoint="x", s3_external_endpoint="https://s3.obc"
+    )
+    rook_obc = SimpleNamespace(s3_internal_endpoint="http://rgw:80")
+    assert bucket_utils.get_s3_external_endpoint(mcg) == "https://s3.mcg"
+    assert bucket_utils.get_s3_external_endpoint(noobaa_obc) == "https://s3.obc"
+    assert bucket_utils.get_s3_external_endpoint(rook_obc) is None
+    assert bucket_utils.get_s3_bulk_mode(noobaa_obc) == "runner"
+    assert bucket_utils.get_s3_bulk_mode(rook_obc) is None
+
+    # rook OBC falls back to the awscli commands in the pod
+    monkeypatch.setattr(
+        bucket_utils,
+        "craft_s3_command",
+        lambda cmd, mcg_obj=None, **kwargs: f"aws s3 {cmd}",
+    )
+    rook_obc.access_key_id, rook_obc.access_key = "key", "secret"
+    awscli_pod = RecordingPod()
+    bucket_utils.del_objects([f"s3://{BUCKET}/a"], awscli_pod, rook_obc)
+    assert awscli_pod.commands == [f"aws s3 rm s3://{BUCKET}/a"]
@@ -0,0 +1,131 @@
+import pytest
+
+from ocs_ci.ocs import teardown
+from ocs_ci.ocs.teardown import TeardownEngine
+
+
+class Resource(object):
+    def __init__(self, kind, name, namespace, is_deleted):
+        self.kind = kind
+        self.name = name
+        self.namespace = namespace
+        self._is_deleted = is_deleted
+
+    @property
+    def is_deleted(self):
+        return self._is_deleted
+
+
+class FakeCluster(object):
+    """
+    Resources of the fake cluster, deleted right after the delete command
+    """
+
+    def __init__(self):
+        self.existing = set()
+        self.pvcs = {}
+        self.pvs = {}
+        self.commands = []
+
+    def ocp(self, kind=None, namespace=None):
+        cluster = self
+
+        class FakeOCP(object):
+            def exec_oc_cmd(self, command, out_yaml_format=True):
+                cluster.commands.append((kind.lower(), namespace, command))
+                if command.startswith("delete"):
+                    names = command.split()[2:-2]
+                    for name in names:
+                        cluster.existing.discard((kind.lower(), namespace or "", name))
+                    return ""
+                return "\n".join(
+                    f"{ns or '<none>'} {name}"
+                    for existing_kind, ns, name in cluster.existing
+                    if existing_kind == kind.lower()
+                )
+
+            def get(self):
+                if kind == "PersistentVolumeClaim":
+                    return {"items": cluster.pvcs[namespace]}
+                return {"items": cluster.pvs}
+
+        return FakeOCP()
+
+
+@pytest.fixture
+def cluster(monkeypatch):
+    cluster = FakeCluster()
+    monkeypatch.setattr(teardown, "OCP", cluster.ocp)
+    monkeypatch.setattr(teardown, "get_api_backend", lambda: None)
+    return cluster
+
+
+def test_teardown_order_and_batches(cluster, monkeypatch):
+    monkeypatch.setattr(teardown, "DELETE_BATCH", 2)
+    resources = [Resource("Pod", f"pod-{i}", "ns", False) for i in range(3)]
+    resources += [
+        Resource("PersistentVolumeClaim", f"pvc-{i}", "ns", False) for i in range(3)
+    ]
+    resources.append(Resource("Pod", "deleted", "ns", True))
+    for resource in resources[:-1]:
+        cluster.existing.add((resource.kind.lower(), "ns", resource.name))
+    cluster.pvcs["ns"] = [
+        {"metadata": {"name": f"pvc-{i}"}, "spec": {"volumeName": f"pv-{i}"}}
+        for i in range(3)
+    ]
+    cluster.pvs = [
+        {
+            "metadata": {"name": f"pv-{i}"},
+            "spec": {"persistentVolumeReclaimPolicy": policy},
+        }
+        for i, policy in enumerate(["Delete", "Retain", "Delete"])
+    ]
+    # only the PV with Retain policy is deleted by the engine
+    cluster.existing.add(("persistentvolume", "", "pv-1"))
+
+    engine = TeardownEngine(pv_timeout=5)
+    engine.add_resources(resources)
+    durations = engine.run()
+
+    assert list(durations) == ["pod", "persistentvolumeclaim", "persistentvolume"]
+    assert not cluster.existing
+    assert all(resource.is_deleted for resource in resources)
+    deletes = [command for command in cluster.commands if "delete" in command[2]]
+    assert deletes == [
+        ("pod", "ns", "delete pod pod-0 pod-1 --wait=false --ignore-not-found"),
+        ("pod", "ns", "delete pod pod-2 --wait=false --ignore-not-found"),
+        (
+            "persistentvolumeclaim",
+            "ns",
+            "delete persistentvolumeclaim pvc-0 pvc-1 --wait=false --ignore-not-found",
+        ),
+        (
+            "persistentvolumeclaim",
+            "ns",
+            "delete persistentvolumeclaim pvc-2 --wait=false --ignore-not-found",
+        ),
+        (
+            "persistentvolume",
+            None,
+            "delete persistentvolume pv-1 --wait=false --ignore-not-found",
+        ),
+    ]
+
+
+def test_unlisted_kinds_newest_first(cluster):
+    resources = [
+        Resource("Secret", "secret", "ns", False),
+        Resource("CephBlockPool", "pool", "ns", False),
+        Resource("StorageClass", "sc", None, False),
+        Resource("Pod", "pod", "ns", False),
+        Resource("Namespace", "ns", None, False),
+    ]
+    engine = TeardownEngine()
+    engine.add_resources(resources)
+    assert list(engine.run()) == [
+        "pod",
+        "storageclass",
+        "cephblockpool",
+        "secret",
+        "namespace",
+    ]
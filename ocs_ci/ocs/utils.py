@@ -814,7 +814,7 @@ def apply_oc_resource(
     occli.apply(cfg_file)
 
 
-def run_must_gather(log_dir_path, image, command=None):
+def run_must_gather(log_dir_path, image, command=None, raise_on_error=False):
     """
     Runs the must-gather tool against the cluster
 
@@ -822,6 +822,13 @@ def run_must_gather(log_dir_path, image, command=None):
         log_dir_path (str): directory for dumped must-gather logs
         image (str): must-gather image registry path
         command (str): optional command to execute within the must-gather image
+        raise_on_error (bool): raise the error of the must-gather after
+            logging it
+
+    Raises:
+        CommandFailed: In case the must-gather failed and raise_on_error
+        TimeoutExpired: In case the must-gather timed out and raise_on_error
+
     """
     # Must-gather has many changes on 4.6 which add more time to the collection.
     # https://github.com/red-hat-storage/ocs-ci/issues/3240
@@ -841,11 +848,15 @@ def run_must_gather(log_dir_path, image, command=None):
         occli.exec_oc_cmd(cmd, out_yaml_format=False, timeout=must_gather_timeout)
     except CommandFailed as ex:
         log.error(f"Failed during must gather logs! Error: {ex}")
+        if raise_on_error:
+            raise
     except TimeoutExpired as ex:
         log.error(
             f"Timeout {must_gather_timeout}s for must-gather reached, command"
             f" exited with error: {ex}"
         )
+        if raise_on_error:
+            raise
 
 
 def collect_noobaa_db_dump(log_dir_path):
@@ -889,6 +900,126 @@ def collect_noobaa_db_dump(log_dir_path):
     )
 
 
+def get_ocs_logs_dir_path(dir_name, status_failure=True):
+    """
+    Get directory of the logs collected by collect_ocs_logs
+
+    Args:
+        dir_name (str): directory name to store OCS logs
+        status_failure (bool): Whether the collection is after success or failure
+
+    Returns:
+        str: path of the directory
+
+    """
+    if status_failure:
+        return os.path.join(
+            os.path.expanduser(ocsci_config.RUN["log_dir"]),
+            f"failed_testcase_ocs_logs_{ocsci_config.RUN['run_id']}",
+            f"{dir_name}_ocs_logs",
+        )
+    return os.path.join(
+        os.path.expanduser(ocsci_config.RUN["log_dir"]),
+        f"{dir_name}_{ocsci_config.RUN['run_id']}",
+    )
+
+
+def gather_ocs_must_gather(log_dir_path, raise_on_error=False):
+    """
+    Run the OCS must-gather, the logs are placed in ocs_must_gather
+    subdirectory
+
+    Args:
+        log_dir_path (str): directory of the collected logs
+        raise_on_error (bool): raise the error of the must-gather
+
+    """
+    latest_tag = ocsci_config.REPORTING.get(
+        "ocs_must_gather_latest_tag",
+        ocsci_config.REPORTING.get(
+            "default_ocs_must_gather_latest_tag",
+            ocsci_config.DEPLOYMENT["default_latest_tag"],
+        ),
+    )
+    ocs_log_dir_path = os.path.join(log_dir_path, "ocs_must_gather")
+    ocs_must_gather_image = ocsci_config.REPORTING["ocs_must_gather_image"]
+    ocs_must_gather_image_and_tag = f"{ocs_must_gather_image}:{latest_tag}"
+    if ocsci_config.DEPLOYMENT.get("disconnected"):
+        ocs_must_gather_image_and_tag = mirror_image(ocs_must_gather_image_and_tag)
+    run_must_gather(
+        ocs_log_dir_path, ocs_must_gather_image_and_tag, raise_on_error=raise_on_error
+    )
+
+
+def gather_ocp_must_gather(log_dir_path, raise_on_error=False):
+    """
+    Run the OCP must-gather and gather of the service logs of workers, the
+    logs are placed in ocp_must_gather subdirectory
+
+    Args:
+        log_dir_path (str): directory of the collected logs
+        raise_on_error (bool): raise the error of the must-gathers, after
+            both were run
+
+    """
+    ocp_log_dir_path = os.path.join(log_dir_path, "ocp_must_gather")
+    ocp_must_gather_image = ocsci_config.REPORTING["ocp_must_gather_image"]
+    if ocsci_config.DEPLOYMENT.get("disconnected"):
+        ocp_must_gather_image = mirror_image(ocp_must_gather_image)
+    error = None
+    for command in (None, "/usr/bin/gather_service_logs worker"):
+        try:
+            run_must_gather(
+                ocp_log_dir_path,
+                ocp_must_gather_image,
+                command,
+                raise_on_error=raise_on_error,
+            )
+        except (CommandFailed, TimeoutExpired) as ex:
+            error = ex
+    if error:
+        raise error
+
+
+def gather_noobaa_db_dump(log_dir_path, attempts=5, raise_on_error=False):
+    """
+    Collect the Noobaa DB dump, retried on failure
+
+    Args:
+        log_dir_path (str): directory of the collected logs
+        attempts (int): max number of attempts
+        raise_on_error (bool): raise the error of the last attempt
+
+    Raises:
+        CommandFailed: In case all attempts failed and raise_on_error
+
+    """
+    counter = 0
+    while counter < attempts:
+        counter += 1
+        try:
+            collect_noobaa_db_dump(log_dir_path)
+            break
+        except CommandFailed as ex:
+            log.error(f"Failed to dump noobaa DB! Error: {ex}")
+            if raise_on_error and counter == attempts:
+                raise
+            sleep(30)
+
+
+def kubeconfig_exists():
+    """
+    Returns:
+        bool: True if $KUBECONFIG or ~/.kube/config exists
+    """
+    if "KUBECONFIG" in os.environ or os.path.exists(
+        os.path.expanduser("~/.kube/config")
+    ):
+        return True
+    log.warning("Cannot find $KUBECONFIG or ~/.kube/config; skipping log collection")
+    return False
+
+
 def collect_ocs_logs(dir_name, ocp=True, ocs=True, mcg=False, status_failure=True):
     """
     Collects OCS logs
@@ -903,62 +1034,16 @@ def collect_ocs_logs(dir_name, ocp=True, ocs=True, mcg=False, status_failure=Tru
             allows better naming for folders under logs directory
 
     """
-    if not (
-        "KUBECONFIG" in os.environ
-        or os.path.exists(os.path.expanduser("~/.kube/config"))
-    ):
-        log.warning(
-            "Cannot find $KUBECONFIG or ~/.kube/config; " "skipping log collection"
-        )
+    if not kubeconfig_exists():
         return
-    if status_failure:
-        log_dir_path = os.path.join(
-            os.path.expanduser(ocsci_config.RUN["log_dir"]),
-            f"failed_testcase_ocs_logs_{ocsci_config.RUN['run_id']}",
-            f"{dir_name}_ocs_logs",
-        )
-    else:
-        log_dir_path = os.path.join(
-            os.path.expanduser(ocsci_config.RUN["log_dir"]),
-            f"{dir_name}_{ocsci_config.RUN['run_id']}",
-        )
+    log_dir_path = get_ocs_logs_dir_path(dir_name, status_failure)
 
     if ocs:
-        latest_tag = ocsci_config.REPORTING.get(
-            "ocs_must_gather_latest_tag",
-            ocsci_config.REPORTING.get(
-                "default_ocs_must_gather_latest_tag",
-                ocsci_config.DEPLOYMENT["default_latest_tag"],
-            ),
-        )
-        ocs_log_dir_path = os.path.join(log_dir_path, "ocs_must_gather")
-        ocs_must_gather_image = ocsci_config.REPORTING["ocs_must_gather_image"]
-        ocs_must_gather_image_and_tag = f"{ocs_must_gather_image}:{latest_tag}"
-        if ocsci_config.DEPLOYMENT.get("disconnected"):
-            ocs_must_gather_image_and_tag = mirror_image(ocs_must_gather_image_and_tag)
-        run_must_gather(ocs_log_dir_path, ocs_must_gather_image_and_tag)
-
+        gather_ocs_must_gather(log_dir_path)
     if ocp:
-        ocp_log_dir_path = os.path.join(log_dir_path, "ocp_must_gather")
-        ocp_must_gather_image = ocsci_config.REPORTING["ocp_must_gather_image"]
-        if ocsci_config.DEPLOYMENT.get("disconnected"):
-            ocp_must_gather_image = mirror_image(ocp_must_gather_image)
-        run_must_gather(ocp_log_dir_path, ocp_must_gather_image)
-        run_must_gather(
-            ocp_log_dir_path,
-            ocp_must_gather_image,
-            "/usr/bin/gather_service_logs worker",
-        )
+        gather_ocp_must_gather(log_dir_path)
     if mcg:
-        counter = 0
-        while counter < 5:
-            counter += 1
-            try:
-                collect_noobaa_db_dump(log_dir_path)
-                break
-            except CommandFailed as ex:
-                log.error(f"Failed to dump noobaa DB! Error: {ex}")
-                sleep(30)
+        gather_noobaa_db_dump(log_dir_path)
 
 
 def collect_prometheus_metrics(
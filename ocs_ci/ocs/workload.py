@@ -85,3 +85,24 @@ class WorkLoad(object):
         future_obj = self.thread_exec.submit(self.work_load_mod.run, **conf)
         log.info("Done submitting..")
         return future_obj
+
+    def run_detached(self, **conf):
+        """
+        Perform work_load_mod.run_detached in order to start io in background
+        in the pod, without a thread waiting for it on the runner. The
+        workload module collects the results, e.g. fio with the fio harvester.
+
+        Args:
+            **conf (dict): Run configuration a.k.a parameters for workload
+                io runs
+
+        Returns:
+            result (Future): Returns a concurrent.future object
+        """
+        conf["pod"] = self.pod
+        conf["path"] = self.path
+        conf["type"] = self.storage_type
+        conf["numjobs"] = self.jobs
+        future_obj = self.work_load_mod.run_detached(**conf)
+        log.info("Done starting detached..")
+        return future_obj
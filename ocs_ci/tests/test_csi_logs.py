@@ -0,0 +1,61 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.helpers import csi_logs
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+
+
+LOGS = """\
+2021-03-24T10:15:02.1Z I0324 10:15:02.100000       1 controller.go:1332] provision "ns/pvc-1" class "sc": started
+2021-03-24T10:15:02.2Z I0324 10:15:02.200000       1 controller.go:1332] provision "ns/pvc-10" class "sc": started
+2021-03-24T10:15:03.5Z I0324 10:15:03.500000       1 controller.go:1439] provision "ns/pvc-1" class "sc": volume "pv-1" provisioned
+2021-03-24T10:15:03.6Z I0324 10:15:03.600000       1 controller.go:1456] provision "ns/pvc-1" class "sc": succeeded
+2021-03-24T10:15:04Z I0324 10:15:04.000000       1 controller.go:1471] delete "pv-1": started
+2021-03-24T10:15:05.25Z I0324 10:15:05.250000       1 controller.go:1486] delete "pv-1": succeeded
+"""  # noqa: E501
+
+
+def test_index_measure():
+    index = csi_logs.ProvisionerLogIndex()
+    index.feed(LOGS.splitlines())
+    assert index.measure(["pvc-1"], csi_logs.PROVISION) == {"pvc-1": 1.5}
+    assert index.measure(["ns/pvc-1"], csi_logs.PROVISION) == {"ns/pvc-1": 1.5}
+    assert index.measure(["pv-1"], csi_logs.DELETE) == {"pv-1": 1.25}
+    # pvc-10 isn't mistaken for pvc-1 and vice versa
+    assert index.missing(["pvc-1", "pvc-10"], csi_logs.PROVISION) == ["pvc-10"]
+    with pytest.raises(UnexpectedBehaviour):
+        index.get_time("pvc-10", csi_logs.PROVISION, csi_logs.SUCCEEDED)
+
+
+def test_index_incremental_update(monkeypatch):
+    lines = LOGS.splitlines()
+    fetched = []
+    # the second fetch overlaps with the first one by since-time
+    outputs = ["\n".join(lines[:4]), "\n".join(lines[3:])]
+
+    def get_pod_logs(pod_name, container, since_time=None, timestamps=False):
+        fetched.append(since_time)
+        return outputs[len(fetched) - 1]
+
+    monkeypatch.setattr(
+        csi_logs.pod, "get_csi_provisioner_pod", lambda interface: ("provisioner",)
+    )
+    monkeypatch.setattr(csi_logs.pod, "get_pod_logs", get_pod_logs)
+    index = csi_logs.ProvisionerLogIndex("CephBlockPool")
+    index.update()
+    assert index.missing(["pv-1"], csi_logs.DELETE) == ["pv-1"]
+    index.update()
+    assert fetched == [None, "2021-03-24T10:15:03.600000000Z"]
+    assert index.lines_parsed == len(lines)
+    assert len(index.get_times("pvc-1", csi_logs.PROVISION, csi_logs.SUCCEEDED)) == 1
+    assert index.missing(["pv-1"], csi_logs.DELETE) == []
+
+
+def test_normalize_timestamp():
+    assert csi_logs.normalize_timestamp("2021-03-24T10:15:02.1234Z") == (
+        "2021-03-24T10:15:02.123400000Z"
+    )
+    assert csi_logs.normalize_timestamp("2021-03-24T10:15:02Z") == (
+        "2021-03-24T10:15:02.000000000Z"
+    )
@@ -1599,19 +1599,23 @@ def terminate_rhel_workers(worker_list):
         raise exceptions.FailedToDeleteInstance()
 
 
-def destroy_volumes(cluster_name):
+def destroy_volumes(cluster_name, volumes=None):
     """
     Destroy cluster volumes
 
     Args:
         cluster_name (str): The name of the cluster
+        volumes (list): Volumes of the cluster, like returned by
+            AWS.get_volumes_by_name_pattern, looked up by the cluster name
+            by default
 
     """
     aws = AWS()
     try:
-        volume_pattern = f"{cluster_name}*"
-        logger.debug(f"Finding volumes with pattern: {volume_pattern}")
-        volumes = aws.get_volumes_by_name_pattern(volume_pattern)
+        if volumes is None:
+            volume_pattern = f"{cluster_name}*"
+            logger.debug(f"Finding volumes with pattern: {volume_pattern}")
+            volumes = aws.get_volumes_by_name_pattern(volume_pattern)
         logger.debug(f"Found volumes: \n {volumes}")
         for volume in volumes:
             # skip root devices for deletion
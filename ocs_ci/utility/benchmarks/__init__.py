@@ -0,0 +1,9 @@
+"""
+Micro benchmarks of the framework internals
+
+The benchmarks run against local stub servers, so they don't need a cluster
+and can be executed directly, e.g.::
+
+    python -m ocs_ci.utility.benchmarks.ocp_backend --calls 500
+
+"""
@@ -0,0 +1,181 @@
+"""
+Benchmark of the NooBaa mirroring checks
+
+The incremental MirroringCheck with the pooled and concurrent
+NoobaaRpcClient is compared with the previous way of checking: new
+connection per RPC call via bare requests.post and serial read of the
+mapping of every object on every poll. Both are run against a local stub
+mgmt server with simulated latency of the calls, where the objects get
+mirrored gradually.
+"""
+import argparse
+import json
+import logging
+import threading
+import time
+
+import requests
+
+from ocs_ci.ocs.noobaa_rpc import MirroringCheck, NoobaaRpcClient, is_object_mirrored
+from ocs_ci.utility.benchmarks.stub_server import StubRequestHandler, StubServer
+
+
+log = logging.getLogger(__name__)
+
+
+class FakeNoobaaHandler(StubRequestHandler):
+    """
+    Serves list_objects and read_object_mapping of object_api
+    """
+
+    # seconds of processing of every call
+    latency = 0.0
+    # object key to the time since when it's mirrored
+    mirrored_at = {}
+    calls = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def reset(cls, objects, mirror_spread=0.0, latency=0.0):
+        """
+        Prepare the objects of the bucket
+
+        Args:
+            objects (int): number of objects in the bucket
+            mirror_spread (float): the objects get mirrored one after another
+                within these seconds from now
+            latency (float): seconds of processing of every call
+
+        """
+        now = time.time()
+        cls.latency = latency
+        cls.calls = 0
+        cls.mirrored_at = {
+            f"obj-{index:06}": now + mirror_spread * index / max(objects, 1)
+            for index in range(objects)
+        }
+
+    def handle_request(self, method, path, query, body):
+        with self._lock:
+            type(self).calls += 1
+        time.sleep(self.latency)
+        request = json.loads(body)
+        params = request.get("params") or {}
+        if request.get("method") == "list_objects":
+            marker = params.get("key_marker", "")
+            keys = sorted(key for key in self.mirrored_at if key > marker)
+            limit = params.get("limit", len(keys))
+            objects = [{"key": key, "obj_id": f"id-{key}"} for key in keys[:limit]]
+            reply = {"objects": objects, "is_truncated": len(keys) > limit}
+            if reply["is_truncated"]:
+                reply["next_marker"] = objects[-1]["key"]
+            return 200, {"reply": reply}
+        if request.get("method") == "read_object_mapping":
+            mirrored = time.time() >= self.mirrored_at[params["key"]]
+            nodes = ["node-a", "node-b"] if mirrored else ["node-a"]
+            blocks = [{"block_md": {"node": node}} for node in nodes]
+            return 200, {"reply": {"chunks": [{"frags": [{"blocks": blocks}]}]}}
+        return 200, {"error": {"rpc_code": "NO_SUCH_RPC_SERVICE"}}
+
+
+def check_mirroring_legacy(endpoint, bucket_name):
+    """
+    Mirroring check done the way MCG.check_if_mirroring_is_done did it
+    before the incremental check
+    """
+
+    def send_rpc_query(api, method, params):
+        payload = {"api": api, "method": method, "params": params, "auth_token": ""}
+        return requests.post(url=endpoint, data=json.dumps(payload)).json()
+
+    objects = send_rpc_query("object_api", "list_objects", {"bucket": bucket_name})
+    results = []
+    for obj in objects["reply"]["objects"]:
+        mapping = send_rpc_query(
+            "object_api",
+            "read_object_mapping",
+            {"bucket": bucket_name, "key": obj["key"], "obj_id": obj["obj_id"]},
+        )
+        results.append(is_object_mirrored(mapping["reply"]))
+    return all(results)
+
+
+def wait_for(check, interval):
+    """
+    Poll the check until it returns True
+
+    Returns:
+        dict: seconds until the check returned True, number of the polls
+            and seconds spent in the checks
+    """
+    start = time.perf_counter()
+    polls, busy = 0, 0.0
+    while True:
+        polls += 1
+        check_start = time.perf_counter()
+        done = check()
+        busy += time.perf_counter() - check_start
+        if done:
+            break
+        time.sleep(interval)
+    return {"seconds": time.perf_counter() - start, "polls": polls, "busy": busy}
+
+
+def run_benchmark(
+    objects=200, mirror_spread=2.0, latency=0.002, interval=0.2, max_workers=8
+):
+    """
+    Compare the legacy and the incremental mirroring check
+
+    Args:
+        objects (int): number of objects in the bucket
+        mirror_spread (float): seconds until all the objects are mirrored
+        latency (float): seconds of processing of every RPC call
+        interval (float): seconds between the polls
+        max_workers (int): max concurrent calls of the pooled client
+
+    Returns:
+        dict: per check seconds until mirroring was confirmed, number of
+            the polls, seconds spent in the checks and RPC calls, e.g.
+            {'legacy': {'seconds': 3.5, 'polls': 3, 'busy': 3.1,
+            'calls': 603}, 'pooled': {...}}
+
+    """
+    results = {}
+    with StubServer(FakeNoobaaHandler) as server:
+        endpoint = f"{server.url}/rpc"
+        FakeNoobaaHandler.reset(objects, mirror_spread, latency)
+        results["legacy"] = wait_for(
+            lambda: check_mirroring_legacy(endpoint, "bucket"), interval
+        )
+        results["legacy"]["calls"] = FakeNoobaaHandler.calls
+        FakeNoobaaHandler.reset(objects, mirror_spread, latency)
+        client = NoobaaRpcClient(endpoint, max_workers=max_workers)
+        results["pooled"] = wait_for(MirroringCheck(client, "bucket").check, interval)
+        results["pooled"]["calls"] = FakeNoobaaHandler.calls
+    log.info(f"Mirroring checks: {results}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=200)
+    parser.add_argument("--mirror-spread", type=float, default=2.0)
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--interval", type=float, default=0.2)
+    parser.add_argument("--max-workers", type=int, default=8)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    results = run_benchmark(
+        args.objects, args.mirror_spread, args.latency, args.interval, args.max_workers
+    )
+    for check, result in results.items():
+        print(
+            f"{check:>6}: confirmed in {result['seconds']:6.2f} s, "
+            f"{result['polls']:4} polls busy {result['busy']:6.2f} s, "
+            f"{result['calls']:6} RPC calls"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Benchmark of OCP.get served by the oc client and by the API backend
+
+Both backends are run against a local fake API server serving a namespace
+with pods. The oc part is skipped when the oc binary isn't available in PATH.
+"""
+import argparse
+import logging
+import os
+import re
+import tempfile
+import time
+from urllib.parse import parse_qs
+from shutil import rmtree, which
+
+import yaml
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import api_backend
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.benchmarks.stub_server import (
+    JSONLines,
+    StubRequestHandler,
+    StubServer,
+    measure_rate,
+)
+
+
+log = logging.getLogger(__name__)
+
+NAMESPACE = "benchmark"
+
+CORE_V1_RESOURCES = {
+    "kind": "APIResourceList",
+    "groupVersion": "v1",
+    "resources": [
+        {
+            "name": "pods",
+            "singularName": "",
+            "namespaced": True,
+            "kind": "Pod",
+            "verbs": ["create", "delete", "get", "list", "patch", "watch"],
+            "shortNames": ["po"],
+        },
+        {
+            "name": "namespaces",
+            "singularName": "",
+            "namespaced": False,
+            "kind": "Namespace",
+            "verbs": ["create", "delete", "get", "list", "patch", "watch"],
+            "shortNames": ["ns"],
+        },
+    ],
+}
+
+
+def pod_dict(name, namespace=NAMESPACE):
+    """
+    Minimal pod as returned by the API server
+    """
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "resourceVersion": "1",
+            "labels": {"app": "benchmark"},
+        },
+        "spec": {"containers": [{"name": "main", "image": "busybox"}]},
+        "status": {"phase": "Running"},
+    }
+
+
+class FakeAPIServerHandler(StubRequestHandler):
+    """
+    Serves discovery, read and delete pod endpoints of the core v1 API
+    """
+
+    pods = {}
+    # events sent (and the stream closed) on watch requests
+    watch_events = []
+
+    def pods_table(self, pods):
+        """
+        Pods in the Table format with Name and Status columns
+        """
+        return {
+            "kind": "Table",
+            "apiVersion": "meta.k8s.io/v1",
+            "metadata": {"resourceVersion": "1"},
+            "columnDefinitions": [
+                {"name": "Name", "type": "string"},
+                {"name": "Status", "type": "string"},
+            ],
+            "rows": [
+                {
+                    "cells": [pod["metadata"]["name"], pod["status"]["phase"]],
+                    "object": {
+                        "kind": "PartialObjectMetadata",
+                        "metadata": pod["metadata"],
+                    },
+                }
+                for pod in pods
+            ],
+        }
+
+    def handle_request(self, method, path, query, body):
+        if path == "/version":
+            return 200, {"major": "1", "minor": "20", "gitVersion": "v1.20.0"}
+        if path == "/api":
+            return 200, {"kind": "APIVersions", "versions": ["v1"]}
+        if path == "/apis":
+            return 200, {"kind": "APIGroupList", "apiVersion": "v1", "groups": []}
+        if path == "/api/v1":
+            return 200, CORE_V1_RESOURCES
+        match = re.match(r"^/api/v1/namespaces/([^/]+)/pods(?:/([^/]+))?$", path)
+        if method == "GET" and match:
+            namespace, name = match.groups()
+            params = parse_qs(query)
+            if name is None and "as=Table" in self.headers.get("Accept", ""):
+                if params.get("watch") == ["true"]:
+                    return 200, JSONLines(
+                        {"type": event_type, "object": self.pods_table([pod])}
+                        for event_type, pod in self.watch_events
+                    )
+                return 200, self.pods_table(self.pods.values())
+            if name is None and params.get("watch") == ["true"]:
+                # the real API server keeps the watch open, don't let the
+                # clients renew it in a busy loop
+                time.sleep(0.2)
+                return 200, JSONLines(
+                    {"type": event_type, "object": pod}
+                    for event_type, pod in self.watch_events
+                )
+            if name is None:
+                return 200, {
+                    "apiVersion": "v1",
+                    "kind": "PodList",
+                    "metadata": {"resourceVersion": "1"},
+                    "items": list(self.pods.values()),
+                }
+            if name in self.pods:
+                return 200, self.pods[name]
+        if method == "DELETE" and match and match.group(2) in self.pods:
+            return 200, self.pods.pop(match.group(2))
+        return 404, {
+            "kind": "Status",
+            "apiVersion": "v1",
+            "status": "Failure",
+            "reason": "NotFound",
+            "message": f"{path} not found",
+            "code": 404,
+        }
+
+
+def write_kubeconfig(server_url, path):
+    """
+    Write kubeconfig pointing to the fake API server
+    """
+    kubeconfig = {
+        "apiVersion": "v1",
+        "kind": "Config",
+        "clusters": [{"name": "fake", "cluster": {"server": server_url}}],
+        "users": [{"name": "fake", "user": {"token": "fake-token"}}],
+        "contexts": [
+            {
+                "name": "fake",
+                "context": {"cluster": "fake", "user": "fake", "namespace": NAMESPACE},
+            }
+        ],
+        "current-context": "fake",
+    }
+    with open(path, "w") as kubeconfig_file:
+        yaml.safe_dump(kubeconfig, kubeconfig_file)
+
+
+def run_benchmark(calls=200, pods=50):
+    """
+    Compare calls per second of OCP.get via oc client and via API backend
+
+    Args:
+        calls (int): number of OCP.get calls per backend and call type
+        pods (int): number of pods served by the fake API server
+
+    Returns:
+        dict: calls per second per backend and call type, e.g.
+            {'api': {'get': 950.1, 'list': 420.3}, 'oc': {...}}
+
+    """
+    FakeAPIServerHandler.pods = {
+        f"pod-{index}": pod_dict(f"pod-{index}") for index in range(pods)
+    }
+    backends = [api_backend.API_BACKEND]
+    if which("oc"):
+        backends.append(api_backend.OC_BACKEND)
+    else:
+        log.warning("oc binary not found in PATH, skipping oc backend")
+    orig_backend = config.RUN.get("ocp_backend")
+    orig_kubeconfig = os.environ.get("KUBECONFIG")
+    results = {}
+    server = StubServer(FakeAPIServerHandler).start()
+    tmp_dir = tempfile.mkdtemp()
+    kubeconfig = os.path.join(tmp_dir, "kubeconfig")
+    write_kubeconfig(server.url, kubeconfig)
+    os.environ["KUBECONFIG"] = kubeconfig
+    try:
+        for backend in backends:
+            config.RUN["ocp_backend"] = backend
+            api_backend.reset_api_backend()
+            ocp_pod = OCP(kind="Pod", namespace=NAMESPACE)
+            # warm up, the API backend does the discovery on the first call
+            ocp_pod.get("pod-0")
+            results[backend] = {
+                "get": measure_rate(lambda: ocp_pod.get("pod-0"), calls),
+                "list": measure_rate(ocp_pod.get, calls),
+            }
+            log.info(f"OCP.get calls per second with {backend}: {results[backend]}")
+    finally:
+        server.stop()
+        rmtree(tmp_dir)
+        config.RUN["ocp_backend"] = orig_backend
+        api_backend.reset_api_backend()
+        if orig_kubeconfig is None:
+            os.environ.pop("KUBECONFIG", None)
+        else:
+            os.environ["KUBECONFIG"] = orig_kubeconfig
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--pods", type=int, default=50)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    for backend, rates in run_benchmark(args.calls, args.pods).items():
+        for call, rate in rates.items():
+            print(f"{backend:>4} {call:>5}: {rate:10.1f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark of PrometheusAPI range queries
+
+The pooled session with json decoding used by PrometheusAPI is compared with
+the previous way of querying: new connection per request via bare
+requests.get and yaml decoding of the response. Both are run against a local
+stub Prometheus server returning a matrix of the requested size.
+"""
+import argparse
+import json
+import logging
+from urllib.parse import parse_qs
+
+import requests
+import yaml
+
+from ocs_ci.utility.benchmarks.stub_server import (
+    StubRequestHandler,
+    StubServer,
+    measure_rate,
+)
+from ocs_ci.utility.prometheus import PrometheusAPI
+
+
+log = logging.getLogger(__name__)
+
+STEP = 15
+
+
+def matrix_response(series, samples, start=0, step=STEP):
+    """
+    Successful range query response with the matrix result
+
+    Args:
+        series (int): number of metric series in the result
+        samples (int): number of samples of every series
+        start (int): timestamp of the first sample
+        step (int): seconds between the samples
+
+    Returns:
+        dict: response as returned by Prometheus
+
+    """
+    return {
+        "status": "success",
+        "data": {
+            "resultType": "matrix",
+            "result": [
+                {
+                    "metric": {
+                        "__name__": "ceph_osd_op_r",
+                        "ceph_daemon": f"osd.{index}",
+                        "namespace": "openshift-storage",
+                    },
+                    "values": [
+                        [start + sample * step, str(sample)]
+                        for sample in range(samples)
+                    ],
+                }
+                for index in range(series)
+            ],
+        },
+    }
+
+
+class FakePrometheusHandler(StubRequestHandler):
+    """
+    Serves query and query_range endpoints with the prepared response
+    """
+
+    # serialized response of the query endpoints
+    response = b""
+    # status codes returned before the response, to exercise the retries
+    failures = []
+
+    def handle_request(self, method, path, query, body):
+        if path not in ("/api/v1/query", "/api/v1/query_range"):
+            return 404, {"status": "error", "error": f"{path} not found"}
+        if self.failures:
+            return self.failures.pop(0), {"status": "error"}
+        if "query" not in parse_qs(query):
+            return 400, {"status": "error", "error": "query parameter missing"}
+        return 200, self.response
+
+
+def query_range_legacy(endpoint, query, start, end, step):
+    """
+    Range query done the way PrometheusAPI did it before the pooled session
+    """
+    resp = requests.get(
+        f"{endpoint}/api/v1/query_range",
+        headers={"Authorization": "Bearer fake-token"},
+        params={"query": query, "start": start, "end": end, "step": step},
+    )
+    return yaml.safe_load(resp.content)["data"]["result"]
+
+
+def run_benchmark(calls=20, series=10, samples=1000, compress=False):
+    """
+    Compare range queries per second of the legacy and the pooled client
+
+    Args:
+        calls (int): number of range queries per client
+        series (int): number of metric series in every response
+        samples (int): number of samples of every series
+        compress (bool): let the stub server gzip the responses
+
+    Returns:
+        dict: queries per second per client, e.g.
+            {'legacy': 3.2, 'pooled': 210.5}
+
+    """
+    FakePrometheusHandler.response = json.dumps(
+        matrix_response(series, samples)
+    ).encode()
+    FakePrometheusHandler.compress = compress
+    end = (samples - 1) * STEP
+    results = {}
+    with StubServer(FakePrometheusHandler) as server:
+        api = PrometheusAPI(endpoint=server.url, token="fake-token")
+        results["legacy"] = measure_rate(
+            lambda: query_range_legacy(server.url, "ceph_osd_op_r", 0, end, STEP),
+            calls,
+        )
+        results["pooled"] = measure_rate(
+            lambda: api.query_range("ceph_osd_op_r", 0, end, STEP), calls
+        )
+    log.info(f"Range queries per second: {results}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--series", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--compress", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    results = run_benchmark(args.calls, args.series, args.samples, args.compress)
+    for client, rate in results.items():
+        print(f"{client:>6}: {rate:10.1f} queries/s")
+
+
+if __name__ == "__main__":
+    main()
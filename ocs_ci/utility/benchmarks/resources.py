@@ -0,0 +1,74 @@
+"""
+Benchmark of constructing resource objects from large lists of pods
+
+Measures time, peak of allocated memory and number of files left in the temp
+directory when Pod objects are built for every pod of the list, like
+get_all_pods does.
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.resources.pod import Pod
+from ocs_ci.utility.benchmarks.ocp_backend import pod_dict
+
+
+log = logging.getLogger(__name__)
+
+
+def run_benchmark(pods=2000):
+    """
+    Construct Pod objects for the list of pods
+
+    Args:
+        pods (int): number of pods in the list
+
+    Returns:
+        dict: results, e.g. {'pods': 2000, 'seconds': 0.05,
+            'peak_memory_mb': 1.2, 'temp_files': 0}
+
+    """
+    pod_list = [pod_dict(f"pod-{index}") for index in range(pods)]
+    # don't look up the cluster proxy configuration
+    orig_proxy = config.ENV_DATA.get("http_proxy")
+    config.ENV_DATA["http_proxy"] = ""
+    temp_dir = tempfile.gettempdir()
+    files_before = set(os.listdir(temp_dir))
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        pod_objs = [Pod(**pod) for pod in pod_list]
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        if orig_proxy is None:
+            config.ENV_DATA.pop("http_proxy", None)
+        else:
+            config.ENV_DATA["http_proxy"] = orig_proxy
+    temp_files = set(os.listdir(temp_dir)) - files_before
+    results = {
+        "pods": len(pod_objs),
+        "seconds": round(seconds, 3),
+        "peak_memory_mb": round(peak / 2 ** 20, 2),
+        "temp_files": len(temp_files),
+    }
+    log.info(f"Construction of Pod objects: {results}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pods", type=int, default=2000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    for key, value in run_benchmark(args.pods).items():
+        print(f"{key:>15}: {value}")
+
+
+if __name__ == "__main__":
+    main()
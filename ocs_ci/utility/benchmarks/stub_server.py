@@ -0,0 +1,151 @@
+"""
+Local stub HTTP servers used by the benchmarks and unit tests
+"""
+import gzip
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+
+log = logging.getLogger(__name__)
+
+
+class JSONLines(list):
+    """
+    Response sent as newline delimited json documents, e.g. watch events
+    """
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """
+    Base of the stub request handlers
+
+    Keep-alive connections are supported (HTTP/1.1 with Content-Length), so
+    pooled clients can be benchmarked against the stub as well. Subclasses
+    implement ``handle_request(method, path, query, body)`` which returns
+    tuple of status code and json serializable response (JSONLines for
+    streamed responses, bytes for already serialized json).
+    """
+
+    protocol_version = "HTTP/1.1"
+    # headers and body are sent separately, don't let them wait for ACK
+    disable_nagle_algorithm = True
+    # compress the responses when the client accepts gzip
+    compress = False
+
+    def log_message(self, format, *args):
+        log.debug(format, *args)
+
+    def handle_request(self, method, path, query, body):
+        raise NotImplementedError("handle_request method is not implemented")
+
+    def _dispatch(self, method):
+        path, _, query = self.path.partition("?")
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, response = self.handle_request(method, path, query, body)
+        self.send_json(status, response)
+
+    def send_json(self, status, response):
+        """
+        Send the json response with proper headers
+        """
+        if isinstance(response, bytes):
+            data = response
+        elif isinstance(response, JSONLines):
+            data = "".join(json.dumps(item) + "\n" for item in response).encode()
+        else:
+            data = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if self.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+
+class StubServer(object):
+    """
+    Runs the stub HTTP server in a background thread
+
+    Examples::
+
+        with StubServer(MyHandler) as server:
+            requests.get(f"{server.url}/path")
+
+    """
+
+    def __init__(self, handler_class, host="127.0.0.1", port=0):
+        """
+        Initializer function
+
+        Args:
+            handler_class (class): StubRequestHandler subclass
+            host (str): address to listen on
+            port (int): port to listen on, 0 picks a free port
+
+        """
+        self.httpd = ThreadingHTTPServer((host, port), handler_class)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread.start()
+        log.info(f"Stub server listening on {self.url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def measure_rate(func, calls):
+    """
+    Measure how many calls per second func can do
+
+    Args:
+        func (function): function to call without arguments
+        calls (int): number of calls
+
+    Returns:
+        float: calls per second
+
+    """
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return calls / (time.perf_counter() - start)
@@ -0,0 +1,221 @@
+"""
+Bounded, rate limited execution pool for bulk operations against the cluster
+
+Examples::
+
+    with ExecutionPool("create-pods") as pool:
+        futures = [pool.submit(create_pod, pvc_name=name) for name in names]
+    pods = [future.result() for future in futures]
+
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.framework import config
+
+
+log = logging.getLogger(__name__)
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+class RateLimiter(object):
+    """
+    Token bucket rate limiter, allows ``qps`` acquisitions per second on
+    average with bursts of up to ``burst`` acquisitions
+    """
+
+    def __init__(self, qps, burst=None):
+        """
+        Initializer function
+
+        Args:
+            qps (float): average number of acquisitions per second
+            burst (int): max number of acquisitions without waiting
+
+        """
+        self.qps = qps
+        self.burst = burst or max(1, int(qps))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Wait till the rate allows another acquisition
+
+        Returns:
+            float: seconds waited
+
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self.updated) * self.qps
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.qps
+            time.sleep(delay)
+            waited += delay
+
+
+def get_rate_limiter():
+    """
+    Get the session wide rate limiter configured in the RUN section
+
+    Returns:
+        RateLimiter: the rate limiter, None if it's disabled
+
+    """
+    global _rate_limiter
+    qps = config.RUN.get("execution_pool_qps")
+    if not qps:
+        return None
+    burst = config.RUN.get("execution_pool_burst")
+    with _rate_limiter_lock:
+        if (
+            _rate_limiter is None
+            or _rate_limiter.qps != qps
+            or _rate_limiter.burst != burst
+        ):
+            _rate_limiter = RateLimiter(qps, burst)
+        return _rate_limiter
+
+
+class ExecutionPool(object):
+    """
+    Thread pool with concurrency limit, back-pressure, rate limiting and
+    timing of the tasks
+
+    Tasks must not submit other tasks to the same pool and wait for them,
+    the back-pressure could block them forever.
+    """
+
+    def __init__(
+        self,
+        name="execution-pool",
+        max_workers=None,
+        max_pending=None,
+        rate_limiter=None,
+    ):
+        """
+        Initializer function
+
+        Args:
+            name (str): name of the pool used in thread names and logs
+            max_workers (int): max number of tasks running at the same time,
+                execution_pool_max_workers from the RUN section by default
+            max_pending (int): max number of submitted and not finished
+                tasks, submit blocks when reached, 2 * max_workers by default
+            rate_limiter (RateLimiter): limiter of the task starts, the
+                session wide limiter by default
+
+        """
+        self.name = name
+        self.max_workers = max_workers or config.RUN.get(
+            "execution_pool_max_workers", 32
+        )
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=name
+        )
+        self._pending = threading.BoundedSemaphore(max_pending or 2 * self.max_workers)
+        self._lock = threading.Lock()
+        self.durations = []
+        self.throttled = 0.0
+        self.failed = 0
+
+    def _run(self, func, args, kwargs):
+        if self.rate_limiter:
+            waited = self.rate_limiter.acquire()
+            with self._lock:
+                self.throttled += waited
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.durations.append(time.perf_counter() - start)
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Submit the task, blocks while max_pending tasks are not finished
+
+        Args:
+            func (function): function to run
+            args: positional arguments of the function
+            kwargs: keyword arguments of the function
+
+        Returns:
+            concurrent.futures.Future: future of the task result
+
+        """
+        self._pending.acquire()
+        try:
+            future = self.executor.submit(self._run, func, args, kwargs)
+        except Exception:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _: self._pending.release())
+        return future
+
+    def map(self, func, *iterables):
+        """
+        Run the function for every item and wait for all the results
+
+        Returns:
+            list: results in the order of the items
+
+        Raises:
+            Exception: the first exception raised by a task
+
+        """
+        futures = [self.submit(func, *args) for args in zip(*iterables)]
+        return [future.result() for future in futures]
+
+    def stats(self):
+        """
+        Returns:
+            dict: number of tasks, failures and their durations in seconds,
+                e.g. {'tasks': 10, 'failed': 0, 'mean': 1.2, 'max': 2.5,
+                'p95': 2.1, 'throttled': 0.4}
+
+        """
+        with self._lock:
+            durations = sorted(self.durations)
+            stats = {"tasks": len(durations), "failed": self.failed}
+            stats["throttled"] = round(self.throttled, 3)
+        if durations:
+            stats["mean"] = round(sum(durations) / len(durations), 3)
+            stats["max"] = round(durations[-1], 3)
+            stats["p95"] = round(durations[int(0.95 * (len(durations) - 1))], 3)
+        return stats
+
+    def shutdown(self, wait=True):
+        """
+        Stop the pool and log its statistics
+
+        Args:
+            wait (bool): wait for the running and pending tasks
+
+        """
+        self.executor.shutdown(wait=wait)
+        log.info(f"Execution pool {self.name} finished: {self.stats()}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -0,0 +1,179 @@
+"""
+Analysis of the node metrics stream collected by NodeMetricsCollector
+
+The functions work on series of (timestamp, value) points and don't need the
+cluster, so a stream saved in the logs can be analyzed later too::
+
+    samples = load_samples("node-metrics.ndjson")
+    series = process_series(samples, "ceph-osd", "rss")
+    verdicts = {key: leak_verdict(points) for key, points in series.items()}
+
+"""
+import json
+import statistics
+from collections import defaultdict
+
+
+def load_samples(path):
+    """
+    Read the samples from NDJSON file
+
+    Args:
+        path (str): path of the file
+
+    Returns:
+        list: samples as written by the node metrics agent
+
+    """
+    with open(path) as samples_file:
+        return [json.loads(line) for line in samples_file if line.strip()]
+
+
+def node_series(samples, field):
+    """
+    Get series of node wide value
+
+    Args:
+        samples (list): samples of the agents
+        field (str): 'cpu' or 'mem'
+
+    Returns:
+        dict: node name to list of (timestamp, value) points
+
+    """
+    series = defaultdict(list)
+    for sample in samples:
+        series[sample["node"]].append((sample["t"], sample[field]))
+    return dict(series)
+
+
+def process_series(samples, name, field, per_node=False):
+    """
+    Get series of value of the processes
+
+    Args:
+        samples (list): samples of the agents
+        name (str): process name, e.g. 'ceph-osd'
+        field (str): 'rss' or 'cpu'
+        per_node (bool): sum the values of all the processes of the node,
+            e.g. RSS of all the OSDs of the node
+
+    Returns:
+        dict: (node, daemon id or pid) to list of (timestamp, value) points,
+            node to the points when per_node is True
+
+    """
+    series = defaultdict(list)
+    for sample in samples:
+        processes = [
+            proc for proc in sample["procs"] if proc["name"] == name and field in proc
+        ]
+        if per_node:
+            if processes:
+                total = sum(proc[field] for proc in processes)
+                series[sample["node"]].append((sample["t"], total))
+            continue
+        for proc in processes:
+            key = (sample["node"], proc["id"] or str(proc["pid"]))
+            series[key].append((sample["t"], proc[field]))
+    return dict(series)
+
+
+def window(points, start=None, end=None):
+    """
+    Get the points between the timestamps
+
+    Args:
+        points (list): (timestamp, value) points
+        start (float): the first timestamp, the first point by default
+        end (float): the last timestamp, the last point by default
+
+    Returns:
+        list: the points in the window
+
+    """
+    return [
+        (timestamp, value)
+        for timestamp, value in points
+        if (start is None or timestamp >= start) and (end is None or timestamp <= end)
+    ]
+
+
+def median(points):
+    """
+    Returns:
+        float: median of the values of the points, None if there are none
+    """
+    if not points:
+        return None
+    return statistics.median(value for _, value in points)
+
+
+def slope(points):
+    """
+    Least squares slope of the values
+
+    Args:
+        points (list): (timestamp, value) points
+
+    Returns:
+        float: change of the value per hour, 0 for less than two points
+
+    """
+    if len(points) < 2:
+        return 0.0
+    times = [timestamp for timestamp, _ in points]
+    values = [value for _, value in points]
+    mean_time = sum(times) / len(times)
+    mean_value = sum(values) / len(values)
+    variance = sum((timestamp - mean_time) ** 2 for timestamp in times)
+    if not variance:
+        return 0.0
+    covariance = sum(
+        (timestamp - mean_time) * (value - mean_value) for timestamp, value in points
+    )
+    return covariance / variance * 3600
+
+
+def leak_verdict(points, baseline=None, baseline_seconds=180, threshold=20):
+    """
+    Decide whether the value (e.g. RSS) grew more than allowed
+
+    The medians of the first baseline_seconds and of the last
+    baseline_seconds of the series are compared, so single spikes don't
+    decide the verdict. Leak is reported when the value grew by more than the
+    threshold percentage and the trend of the whole series is growing.
+
+    Args:
+        points (list): (timestamp, value) points
+        baseline (float): the baseline value, median of the beginning of the
+            series by default
+        baseline_seconds (int): length of the windows used for the medians
+        threshold (int): allowed growth in percentage
+
+    Returns:
+        dict: verdict, e.g. {'baseline': 1024.0, 'end': 1536.0,
+            'growth': 50.0, 'slope': 2048.0, 'leak': True}
+
+    """
+    if not points:
+        return {
+            "baseline": baseline,
+            "end": None,
+            "growth": None,
+            "slope": 0.0,
+            "leak": False,
+        }
+    first, last = points[0][0], points[-1][0]
+    if baseline is None:
+        baseline = median(window(points, end=first + baseline_seconds))
+    end = median(window(points, start=last - baseline_seconds))
+    growth = (end - baseline) / baseline * 100 if baseline else 0.0
+    trend = slope(points)
+    return {
+        "baseline": baseline,
+        "end": end,
+        "growth": round(growth, 2),
+        "slope": round(trend, 2),
+        "leak": growth > threshold and trend > 0,
+    }
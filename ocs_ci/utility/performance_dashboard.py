@@ -18,6 +18,7 @@ import logging
 from ocs_ci.ocs import constants
 from ocs_ci.framework import config
 from ocs_ci.ocs.node import get_nodes
+from ocs_ci.ocs.perf_store import record_results
 from ocs_ci.ocs.version import get_ocs_version
 
 log = logging.getLogger(__name__)
@@ -79,6 +80,22 @@ def push_results(json_data):
 
     """
 
+    # keep the results in the local store of the run as well
+    samples = json.loads(json_data["json"])
+    metrics = {}
+    for sample in samples:
+        try:
+            metrics[sample["benchmark"]] = float(sample["result_value"])
+        except (TypeError, ValueError):
+            log.warning(f"Not a numeric result: {sample}")
+    if metrics:
+        record_results(
+            "codespeed",
+            metrics,
+            params={"environment": samples[0]["environment"]},
+            metadata={"commitid": samples[0]["commitid"]},
+        )
+
     log.info(
         f"Trying to push {json_data} to codespeed server:  {constants.CODESPEED_URL}result/add/json/"
     )
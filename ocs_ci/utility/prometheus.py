@@ -6,6 +6,8 @@ import tempfile
 import time
 import yaml
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants, defaults
@@ -284,9 +286,47 @@ def log_parsing_error(query, resp_content, ex):
     logger.debug("prometheus reply which failed to load:\n%s\n", resp_content)
 
 
+def create_session(pool_maxsize=10, retries=3, backoff_factor=0.5, gzip=True):
+    """
+    Create HTTP session keeping the connections alive in a pool, so the
+    TLS handshake isn't done again for every request.
+
+    Args:
+        pool_maxsize (int): Max number of connections kept in the pool
+        retries (int): Number of retries of failed connections and responses
+            with 502, 503 and 504 status codes
+        backoff_factor (float): Factor of the exponential delay between
+            the retries
+        gzip (bool): Ask the server for gzip compressed responses, saves
+            network transfer of large range queries for some CPU time
+
+    Returns:
+        requests.Session: The session
+
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(502, 503, 504),
+        # return the last response like without retries
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip" if gzip else "identity"
+    return session
+
+
 class PrometheusAPI(object):
     """
     This is wrapper class for Prometheus API.
+
+    All requests of the instance are sent via one pooled keep-alive
+    session, see create_session.
     """
 
     _token = None
@@ -294,14 +334,26 @@ class PrometheusAPI(object):
     _password = None
     _endpoint = None
     _cacert = False
+    _session = None
 
-    def __init__(self, user=None, password=None):
+    def __init__(self, user=None, password=None, endpoint=None, token=None, gzip=True):
         """
         Constructor for PrometheusAPI class.
 
         Args:
             user (str): OpenShift username used to connect to API
+            password (str): Password of the user
+            endpoint (str): Prometheus URL, when provided together with token
+                the login to OCP and route lookup are skipped (e.g. for
+                Prometheus exposed outside of the cluster)
+            token (str): Bearer token used with the endpoint
+            gzip (bool): Ask Prometheus for gzip compressed responses
         """
+        self._session = create_session(gzip=gzip)
+        if endpoint:
+            self._endpoint = endpoint
+            self._token = token
+            return
         if config.ENV_DATA["platform"].lower() == "ibm_cloud":
             self._user = user or "apikey"
             self._password = password or config.AUTH["ibmcloud"]["api_key"]
@@ -378,7 +430,7 @@ class PrometheusAPI(object):
         logger.debug(f"verify={self._cacert}")
         logger.debug(f"params={payload}")
 
-        response = requests.get(
+        response = self._session.get(
             self._endpoint + pattern,
             headers=headers,
             verify=self._cacert,
@@ -421,7 +473,7 @@ class PrometheusAPI(object):
             logger.info(log_msg)
         resp = self.get("query", payload=query_payload)
         try:
-            content = yaml.safe_load(resp.content)
+            content = resp.json()
         except Exception as ex:
             log_parsing_error(query_payload, resp.content, ex)
             raise
@@ -468,7 +520,7 @@ class PrometheusAPI(object):
         )
         resp = self.get("query_range", payload=query_payload)
         try:
-            content = yaml.safe_load(resp.content)
+            content = resp.json()
         except Exception as ex:
             log_parsing_error(query_payload, resp.content, ex)
             raise
@@ -181,14 +181,13 @@ def get_n_document_from_yaml(yaml_generator, index=0):
     raise IndexError(f"Passed yaml generator doesn't have index {index}")
 
 
-def dump_data_to_temp_yaml(data, temp_yaml):
+def dump_data_to_yaml(data):
     """
-    Dump data to temporary yaml file
+    Dump data to yaml string, the data with censored secrets are logged
 
     Args:
         data (dict or list): dict or list (in case of multi_document) with
-            data to dump to the yaml file.
-        temp_yaml (str): file path of yaml file
+            data to dump.
 
     Returns:
         str: dumped yaml data
@@ -196,8 +195,6 @@ def dump_data_to_temp_yaml(data, temp_yaml):
     """
     dumper = yaml.dump if isinstance(data, dict) else yaml.dump_all
     yaml_data = dumper(data)
-    with open(temp_yaml, "w") as yaml_file:
-        yaml_file.write(yaml_data)
     if isinstance(data, dict):
         yaml_data_censored = dumper(censor_values(deepcopy(data)))
     else:
@@ -206,6 +203,25 @@ def dump_data_to_temp_yaml(data, temp_yaml):
     return yaml_data
 
 
+def dump_data_to_temp_yaml(data, temp_yaml):
+    """
+    Dump data to temporary yaml file
+
+    Args:
+        data (dict or list): dict or list (in case of multi_document) with
+            data to dump to the yaml file.
+        temp_yaml (str): file path of yaml file
+
+    Returns:
+        str: dumped yaml data
+
+    """
+    yaml_data = dump_data_to_yaml(data)
+    with open(temp_yaml, "w") as yaml_file:
+        yaml_file.write(yaml_data)
+    return yaml_data
+
+
 def dump_data_to_json(data, json_file):
     """
     Dump data to json file
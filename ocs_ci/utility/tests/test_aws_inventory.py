@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from ocs_ci.cleanup.aws.cleanup import get_clusters
+from ocs_ci.cleanup.aws.inventory import AWSInventory
+from ocs_ci.ocs.constants import AWS_CLOUDFORMATION_TAG
+from ocs_ci.utility.aws import AWS
+
+moto = pytest.importorskip("moto")
+
+REGION = "us-east-2"
+TEMPLATE = json.dumps(
+    {
+        "Resources": {
+            "Topic": {"Type": "AWS::SNS::Topic", "Properties": {"TopicName": "t"}}
+        }
+    }
+)
+
+
+def tags(**kwargs):
+    return [{"Key": key, "Value": value} for key, value in kwargs.items()]
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    for key in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"):
+        monkeypatch.setenv(key, "testing")
+    with moto.mock_aws():
+        yield AWS(region_name=REGION)
+
+
+def create_vpc(aws, vpc_tags, instance_names, instance_tags=None, count=1):
+    vpc_id = aws.ec2_client.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+    aws.ec2_client.create_tags(Resources=[vpc_id], Tags=vpc_tags)
+    subnet_id = aws.ec2_client.create_subnet(VpcId=vpc_id, CidrBlock="10.0.0.0/24")[
+        "Subnet"
+    ]["SubnetId"]
+    image_id = aws.ec2_client.describe_images()["Images"][0]["ImageId"]
+    for name in instance_names:
+        aws.ec2_client.run_instances(
+            ImageId=image_id,
+            MinCount=count,
+            MaxCount=count,
+            SubnetId=subnet_id,
+            TagSpecifications=[
+                {
+                    "ResourceType": "instance",
+                    "Tags": tags(Name=name, **(instance_tags or {})),
+                }
+            ],
+        )
+    return vpc_id
+
+
+@pytest.fixture
+def resources(aws):
+    create_vpc(aws, tags(Name="jdoe-a1b2c-vpc"), ["jdoe-a1b2c-master-0"])
+    create_vpc(aws, tags(Name="dnd-q1w2e-vpc"), ["dnd-q1w2e-master-0"])
+    create_vpc(aws, tags(Name="empty-z9y8x-vpc"), [])
+    create_vpc(
+        aws,
+        tags(Name="cf-vpc", **{AWS_CLOUDFORMATION_TAG: "jcf-vpc"}),
+        ["jcf-master-0", "jcf-worker-0"],
+        {"kubernetes.io/cluster/jcf-x7k2m": "owned"},
+        count=3,
+    )
+    for stack_name in ("jcf-ma", "jcf-sg", "jcf-no0", "jcf-no1", "jcf-no3"):
+        aws.cf_client.create_stack(StackName=stack_name, TemplateBody=TEMPLATE)
+    aws.ec2_client.create_volume(
+        AvailabilityZone=f"{REGION}a",
+        Size=10,
+        TagSpecifications=[{"ResourceType": "volume", "Tags": tags(Name="jcf-vol")}],
+    )
+    aws.route53_client.create_hosted_zone(Name="jcf.example.com", CallerReference="jcf")
+    return AWSInventory.snapshot(aws)
+
+
+def test_snapshot(resources):
+    inventory = resources
+    assert len(inventory.instances) == 8
+    assert len(inventory.get_instances_by_name_pattern("jcf*")) == 6
+    assert inventory.get_stack_names("jcf", ["ma", "bs", "sg"]) == ["jcf-ma", "jcf-sg"]
+    assert inventory.get_worker_stack_names("jcf") == ["jcf-no0", "jcf-no1"]
+    assert [
+        volume["attachments"]
+        for volume in inventory.get_volumes_by_name_pattern("jcf*")
+    ] == [[]]
+    assert inventory.has_hosted_zone("jcf")
+    assert not inventory.has_hosted_zone("jdoe-a1b2c")
+    instances = inventory.get_instances_by_name_pattern("jcf-master*")
+    assert inventory.get_cluster_name(instances) == "jcf-x7k2m"
+
+
+def test_get_clusters(resources, aws, monkeypatch):
+    # no more API calls after the snapshot
+    monkeypatch.setattr(
+        AWS, "ec2_client", property(lambda self: pytest.fail("API call"))
+    )
+    to_delete, cf_to_delete, remaining = get_clusters(
+        0, REGION, {"dnd": "never"}, inventory=resources
+    )
+    assert to_delete == ["jdoe-a1b2c"]
+    assert cf_to_delete == ["jcf-x7k2m"]
+    assert sorted(remaining) == ["dnd-q1w2e", "empty-z9y8x"]
+
+    to_delete, cf_to_delete, remaining = get_clusters(
+        3600, REGION, {}, inventory=resources
+    )
+    assert not to_delete and not cf_to_delete
+    assert len(remaining) == 4
@@ -0,0 +1,52 @@
+# -*- coding: utf8 -*-
+
+import threading
+import time
+
+import pytest
+
+from ocs_ci.utility.execution_pool import ExecutionPool, RateLimiter
+
+
+def test_pool_limits_concurrency():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def task(index):
+        with lock:
+            running.append(index)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(index)
+        return index * 2
+
+    with ExecutionPool("test", max_workers=3) as pool:
+        results = pool.map(task, range(20))
+    assert results == [index * 2 for index in range(20)]
+    assert max(peak) <= 3
+    assert pool.stats()["tasks"] == 20
+
+
+def test_pool_propagates_failures():
+    def task(index):
+        if index == 1:
+            raise ValueError("task failed")
+        return index
+
+    with ExecutionPool("test", max_workers=2) as pool:
+        futures = [pool.submit(task, index) for index in range(3)]
+    with pytest.raises(ValueError):
+        futures[1].result()
+    assert futures[2].result() == 2
+    assert pool.stats()["failed"] == 1
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(qps=100, burst=5)
+    start = time.monotonic()
+    waited = [limiter.acquire() for _ in range(15)]
+    # first 5 calls use the burst, the other 10 need ~0.1s at 100 qps
+    assert waited[:5] == [0.0] * 5
+    assert time.monotonic() - start >= 0.09
@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+
+from ocs_ci.ocs import node_metrics_agent
+from ocs_ci.utility import node_metrics_analysis as analysis
+
+
+def make_samples(rss_values, node="worker-0", interval=10):
+    return [
+        {
+            "t": index * interval,
+            "node": node,
+            "cpu": 10.0,
+            "mem": 50.0,
+            "procs": [
+                {"name": "ceph-osd", "pid": 10, "id": "0", "rss": rss, "cpu": 1.0},
+                {"name": "ceph-osd", "pid": 11, "id": "1", "rss": rss, "cpu": 1.0},
+                {"name": "ceph-mon", "pid": 12, "id": "a", "rss": 100},
+            ],
+        }
+        for index, rss in enumerate(rss_values)
+    ]
+
+
+def test_series():
+    samples = make_samples([1000, 1100])
+    per_osd = analysis.process_series(samples, "ceph-osd", "rss")
+    assert per_osd[("worker-0", "0")] == [(0, 1000), (10, 1100)]
+    per_node = analysis.process_series(samples, "ceph-osd", "rss", per_node=True)
+    assert per_node == {"worker-0": [(0, 2000), (10, 2200)]}
+    # the first sample of the process has no cpu value
+    assert analysis.process_series(samples, "ceph-mon", "cpu") == {}
+    assert analysis.node_series(samples, "mem") == {"worker-0": [(0, 50.0), (10, 50.0)]}
+
+
+def test_slope_and_median():
+    points = [(0, 100), (1800, 150), (3600, 200)]
+    assert analysis.slope(points) == 100
+    assert analysis.slope(points[:1]) == 0
+    assert analysis.median(points) == 150
+    assert analysis.median([]) is None
+
+
+def test_leak_verdict():
+    # one spike in the middle doesn't count as leak
+    stable = [(t, 5000 if t == 300 else 1000) for t in range(0, 600, 10)]
+    assert not analysis.leak_verdict(stable, baseline_seconds=60)["leak"]
+    growing = [(t, 1000 + t) for t in range(0, 600, 10)]
+    verdict = analysis.leak_verdict(growing, baseline_seconds=60)
+    assert verdict["leak"]
+    assert verdict["growth"] > 20
+    shrinking = analysis.leak_verdict(growing, baseline=5000, baseline_seconds=60)
+    assert not shrinking["leak"]
+    assert not analysis.leak_verdict([])["leak"]
+
+
+def test_agent_stream(tmp_path):
+    env = dict(os.environ, INTERVAL="0.2", NODE_NAME="local", PROCESSES="sleep")
+    sleeper = subprocess.Popen(["sleep", "30"])
+    try:
+        agent = subprocess.Popen(
+            [sys.executable, node_metrics_agent.__file__],
+            env=env,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        lines = [agent.stdout.readline() for _ in range(3)]
+        agent.kill()
+        agent.wait()
+    finally:
+        sleeper.kill()
+        sleeper.wait()
+    path = tmp_path / "node-metrics.ndjson"
+    path.write_text("".join(lines))
+    samples = analysis.load_samples(str(path))
+    assert [json.loads(line) for line in lines] == samples
+    series = analysis.process_series(samples, "sleep", "rss", per_node=True)
+    assert len(series["local"]) == 3
+    assert all(rss > 0 for _, rss in series["local"])
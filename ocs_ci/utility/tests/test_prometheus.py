@@ -1,8 +1,12 @@
 # -*- coding: utf8 -*-
 
+import json
+
 import pytest
 
-from ocs_ci.utility.prometheus import check_query_range_result_enum
+from ocs_ci.utility.benchmarks import prometheus as prometheus_benchmark
+from ocs_ci.utility.benchmarks.stub_server import StubServer
+from ocs_ci.utility.prometheus import PrometheusAPI, check_query_range_result_enum
 
 
 @pytest.fixture
@@ -204,3 +208,31 @@ def test_check_query_range_result_exp_good_time(query_range_result_bad_last_90s)
         exp_good_time=150,
     )
     assert result2, "taking exp_good_time into account, validation should pass"
+
+
+@pytest.fixture
+def fake_prometheus():
+    """
+    Stub Prometheus server returning matrix of 2 series with 5 samples
+    """
+    handler = prometheus_benchmark.FakePrometheusHandler
+    handler.response = json.dumps(
+        prometheus_benchmark.matrix_response(series=2, samples=5)
+    ).encode()
+    with StubServer(handler) as server:
+        yield server
+    handler.failures = []
+
+
+def test_query_range_via_session(fake_prometheus):
+    api = PrometheusAPI(endpoint=fake_prometheus.url, token="fake-token")
+    result = api.query_range("ceph_osd_op_r", 0, 60, prometheus_benchmark.STEP)
+    assert len(result) == 2
+    assert result[0]["values"][-1] == [60, "4"]
+    assert api.query("ceph_osd_op_r")[1]["metric"]["ceph_daemon"] == "osd.1"
+
+
+def test_query_retried_on_unavailable(fake_prometheus):
+    prometheus_benchmark.FakePrometheusHandler.failures = [503]
+    api = PrometheusAPI(endpoint=fake_prometheus.url, token="fake-token")
+    assert len(api.query("ceph_osd_op_r")) == 2
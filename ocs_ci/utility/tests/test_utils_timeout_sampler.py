@@ -1,12 +1,19 @@
 # -*- coding: utf8 -*-
 
+import asyncio
 import logging
+import threading
 import time
 
 import pytest
 
-from ocs_ci.ocs.exceptions import TimeoutExpiredError
-from ocs_ci.utility.utils import TimeoutSampler, TimeoutIterator
+from ocs_ci.ocs.exceptions import SamplingCancelled, TimeoutExpiredError
+from ocs_ci.utility.utils import (
+    TimeoutSampler,
+    TimeoutIterator,
+    get_sampler_stats,
+    reset_sampler_stats,
+)
 
 
 @pytest.mark.parametrize("timeout_cls", [TimeoutSampler, TimeoutIterator])
@@ -195,3 +202,85 @@ def test_ts_wait_for_value_negative(caplog):
         assert "function <lambda> failed" in log_msg
         assert "failed to return expected value 2" in log_msg
         assert "during 3 second timeout" in log_msg
+
+
+def test_ts_backoff_intervals():
+    """
+    With backoff, the sleep interval grows exponentially up to max_sleep.
+    """
+    sampler = TimeoutSampler(60, 1, lambda: 1)
+    sampler.backoff = 2
+    sampler.max_sleep = 5
+    intervals = []
+    for samples in range(1, 6):
+        sampler.stats["samples"] = samples
+        intervals.append(sampler.next_sleep())
+    assert intervals == [1, 2, 4, 5, 5]
+    sampler.jitter = 0.5
+    assert 2.5 <= sampler.next_sleep() <= 7.5
+
+
+def test_ts_wait_for_condition_stats():
+    """
+    wait_for_condition returns the first matching value and the wait is
+    recorded in the session statistics.
+    """
+    reset_sampler_stats()
+    values = iter([1, 2, 3])
+
+    def counter():
+        return next(values)
+
+    sampler = TimeoutSampler(10, 0.01, counter)
+    assert sampler.wait_for_condition(lambda value: value >= 2) == 2
+    assert sampler.stats["samples"] == 2
+    assert "time_to_condition" in sampler.stats
+    stats = get_sampler_stats()["counter"]
+    assert stats["waits"] == 1
+    assert stats["samples"] == 2
+    assert stats["timeouts"] == 0
+
+
+def test_ts_cancel_event():
+    """
+    Setting the cancel event stops the sampling during the sleep.
+    """
+    cancel_event = threading.Event()
+    sampler = TimeoutSampler(60, 30, lambda: False)
+    sampler.cancel_event = cancel_event
+    threading.Timer(0.1, cancel_event.set).start()
+    start = time.time()
+    with pytest.raises(SamplingCancelled):
+        sampler.wait_for_condition(bool)
+    assert time.time() - start < 5
+
+
+def test_ts_repeated_exception_logged_once_with_traceback(caplog):
+    """
+    The traceback of the same repeated failure is logged only once.
+    """
+
+    def func():
+        raise Exception("oh no")
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(TimeoutExpiredError):
+        for _ in TimeoutSampler(0.1, 0.01, func):
+            pass
+    assert len(caplog.records) > 1
+    assert [rec.exc_info is not None for rec in caplog.records].count(True) == 1
+
+
+def test_ts_async():
+    """
+    The async variant supports coroutine functions.
+    """
+    values = iter(["Pending", "Running"])
+
+    async def get_status():
+        return next(values)
+
+    sampler = TimeoutSampler(10, 0.01, get_status)
+    condition = sampler.async_wait_for_condition(lambda value: value == "Running")
+    assert asyncio.run(condition) == "Running"
+    assert sampler.stats["samples"] == 2
@@ -0,0 +1,77 @@
+import json
+
+from ocs_ci.utility.workloads.provisioning import WorkloadProvisioner
+
+
+class FakePod(object):
+    def __init__(self, name, image, container_id):
+        self.name = name
+        self.pod_data = {
+            "metadata": {"uid": name},
+            "spec": {"containers": [{"image": image}]},
+            "status": {"containerStatuses": [{"containerID": container_id}]},
+        }
+
+
+def test_provision(tmp_path):
+    probed, installed = [], []
+
+    def probe(pod):
+        probed.append(pod.name)
+        return pod.pod_data["spec"]["containers"][0]["image"] == "fio-image"
+
+    def install(pod):
+        installed.append(pod.name)
+        return True
+
+    provisioner = WorkloadProvisioner({"fio": ["known-image"]})
+    pods = [
+        FakePod("known", "known-image", "c1"),
+        FakePod("probed", "fio-image", "c2"),
+        FakePod("same-image", "fio-image", "c3"),
+        FakePod("plain", "nginx", "c4"),
+    ]
+    for pod in pods:
+        assert provisioner.provision(pod, "fio", probe, install)
+    # reuse of the pod
+    assert provisioner.provision(pods[3], "fio", probe, install)
+    assert probed == ["probed", "same-image", "plain"]
+    assert installed == ["plain"]
+    # restarted container loses the installed fio
+    pods[3].pod_data["status"]["containerStatuses"][0]["containerID"] = "c5"
+    assert provisioner.provision(pods[3], "fio", probe, install)
+    assert installed == ["plain", "plain"]
+
+    path = tmp_path / "setup_times.json"
+    assert provisioner.write_setup_times(str(path))
+    methods = {
+        key: value["method"] for key, value in json.loads(path.read_text()).items()
+    }
+    assert methods == {
+        "known/fio": "image",
+        "probed/fio": "probe",
+        "same-image/fio": "probe",
+        "plain/fio": "install",
+    }
+
+
+def test_probe_doesnt_mark_image():
+    installed = set()
+
+    def probe(pod):
+        return pod.name in installed
+
+    def install(pod):
+        installed.add(pod.name)
+        return True
+
+    provisioner = WorkloadProvisioner()
+    assert provisioner.provision(FakePod("pod-1", "nginx", "c1"), "fio", probe, install)
+    # another object of the same pod, without the container status
+    same_pod = FakePod("pod-1", "nginx", None)
+    same_pod.pod_data["status"] = {}
+    assert provisioner.provision(same_pod, "fio", probe, install)
+    # fio found in pod-1 only because it was installed there
+    assert provisioner.provision(FakePod("pod-2", "nginx", "c2"), "fio", probe, install)
+    assert installed == {"pod-1", "pod-2"}
+    assert provisioner.setup_times["pod-2/fio"]["method"] == "install"
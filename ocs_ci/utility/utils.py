@@ -1,3 +1,4 @@
+import asyncio
 import io
 import json
 import logging
@@ -9,6 +10,7 @@ import shlex
 import smtplib
 import string
 import subprocess
+import threading
 import time
 import traceback
 import stat
@@ -33,6 +35,7 @@ from ocs_ci.ocs import constants, defaults
 from ocs_ci.ocs.exceptions import (
     CephHealthException,
     CommandFailed,
+    SamplingCancelled,
     TagNotFoundException,
     TimeoutException,
     TimeoutExpiredError,
@@ -483,11 +486,13 @@ def exec_cmd(cmd, secrets=None, timeout=600, ignore_error=False, **kwargs):
     log.info(f"Executing command: {masked_cmd}")
     if isinstance(cmd, str):
         cmd = shlex.split(cmd)
+    if "input" not in kwargs:
+        # input (e.g. manifest for 'oc create -f -') opens the stdin itself
+        kwargs["stdin"] = subprocess.PIPE
     completed_process = subprocess.run(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        stdin=subprocess.PIPE,
         timeout=timeout,
         **kwargs,
     )
@@ -871,6 +876,32 @@ def delete_dir(dir_name):
         log.error(f"Failed to delete the directory {dir_name}. Error: {e.strerror}")
 
 
+_sampler_stats = {}
+_sampler_stats_lock = threading.Lock()
+
+
+def get_sampler_stats():
+    """
+    Get statistics of the TimeoutSampler waits finished in this session
+
+    Returns:
+        dict: statistics per sampled function, e.g.
+            {'get_pods': {'waits': 3, 'samples': 12, 'failures': 1,
+            'timeouts': 0, 'cancelled': 0, 'seconds': 40.2}}
+
+    """
+    with _sampler_stats_lock:
+        return {name: dict(stats) for name, stats in _sampler_stats.items()}
+
+
+def reset_sampler_stats():
+    """
+    Remove statistics of the finished TimeoutSampler waits
+    """
+    with _sampler_stats_lock:
+        _sampler_stats.clear()
+
+
 class TimeoutSampler(object):
     """
     Samples the function output.
@@ -881,14 +912,25 @@ class TimeoutSampler(object):
 
     Yielding the output allows you to handle every value as you wish.
 
-    Feel free to set the instance variables.
+    Feel free to set the instance variables, e.g. to switch to adaptive
+    polling with exponential backoff, jitter and cancellation::
+
+        sampler = TimeoutSampler(300, 1, get_pod_status, pod_name)
+        sampler.backoff = 2
+        sampler.max_sleep = 30
+        sampler.jitter = 0.1
+        sampler.cancel_event = stop_event
+        sampler.wait_for_condition(lambda status: status == "Running")
+
+    Statistics of every wait (samples taken, time to condition) are kept in
+    `stats` and summarized per sampled function by get_sampler_stats.
     """
 
     def __init__(self, timeout, sleep, func, *func_args, **func_kwargs):
         self.timeout = timeout
         """ Timeout in seconds. """
         self.sleep = sleep
-        """ Sleep interval seconds. """
+        """ Sleep interval seconds, the minimal one when backoff is used. """
         # check that given timeout and sleep values makes sense
         if self.timeout < self.sleep:
             raise ValueError("timeout should be larger than sleep time")
@@ -910,22 +952,191 @@ class TimeoutSampler(object):
         self.timeout_exc_args = (self.timeout,)
         """ An args for __init__ of the timeout exception. """
 
+        self.backoff = 1
+        """ Multiplier of the sleep interval after every sample. """
+        self.max_sleep = None
+        """ Max sleep interval seconds when backoff is used. """
+        self.jitter = 0
+        """ Random deviation of the sleep interval, e.g. 0.1 for +-10%. """
+        self.cancel_event = None
+        """ threading.Event which stops the sampling when set. """
+        self.stats = {"samples": 0, "failures": 0, "slept": 0.0}
+        """ Statistics of the sampling. """
+        self._stats_recorded = False
+        self._last_error = None
+
+    @property
+    def func_name(self):
+        return getattr(self.func, "__name__", repr(self.func))
+
+    def next_sleep(self):
+        """
+        Get the interval to sleep before the next sample
+
+        Returns:
+            float: seconds to sleep
+
+        """
+        interval = self.sleep * self.backoff ** max(self.stats["samples"] - 1, 0)
+        if self.max_sleep is not None:
+            interval = min(interval, self.max_sleep)
+        if self.jitter:
+            interval *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(interval, 0)
+
+    def _check_cancelled(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            self.record_stats("cancelled")
+            raise SamplingCancelled(f"Sampling of {self.func_name} was cancelled")
+
+    def _check_timeout(self):
+        if self.timeout <= (time.time() - self.start_time):
+            self.record_stats("timeouts")
+            raise self.timeout_exc_cls(*self.timeout_exc_args)
+
+    def _log_error(self, ex):
+        msg = f"Exception raised during iteration: {ex}"
+        error = (type(ex), str(ex))
+        if error == self._last_error:
+            # the same failure again, the traceback was already logged
+            log.error(msg)
+        else:
+            log.exception(msg)
+        self._last_error = error
+
+    def _sleep(self, interval):
+        if self.sleep == interval:
+            log.info("Going to sleep for %d seconds before next iteration", interval)
+        else:
+            log.info("Going to sleep for %.2f seconds before next iteration", interval)
+        self.stats["slept"] += interval
+        if self.cancel_event is not None:
+            self.cancel_event.wait(interval)
+        else:
+            time.sleep(interval)
+
+    def record_stats(self, outcome=None):
+        """
+        Add statistics of this wait to the session statistics, only the
+        first call of the sampler counts
+
+        Args:
+            outcome (str): 'timeouts' or 'cancelled' when the wait failed
+
+        """
+        if self._stats_recorded or self.start_time is None:
+            return
+        self._stats_recorded = True
+        self.stats["seconds"] = time.time() - self.start_time
+        with _sampler_stats_lock:
+            stats = _sampler_stats.setdefault(
+                self.func_name,
+                {
+                    "waits": 0,
+                    "samples": 0,
+                    "failures": 0,
+                    "timeouts": 0,
+                    "cancelled": 0,
+                    "seconds": 0.0,
+                },
+            )
+            stats["waits"] += 1
+            stats["samples"] += self.stats["samples"]
+            stats["failures"] += self.stats["failures"]
+            stats["seconds"] += self.stats["seconds"]
+            if outcome:
+                stats[outcome] += 1
+
+    def _sample(self):
+        """
+        Call the func once, returns tuple of success flag and the result
+        """
+        self.stats["samples"] += 1
+        try:
+            return True, self.func(*self.func_args, **self.func_kwargs)
+        except Exception as ex:
+            self.stats["failures"] += 1
+            self._log_error(ex)
+            return False, None
+
     def __iter__(self):
         if self.start_time is None:
             self.start_time = time.time()
-        while True:
-            self.last_sample_time = time.time()
-            if self.timeout <= (self.last_sample_time - self.start_time):
-                raise self.timeout_exc_cls(*self.timeout_exc_args)
-            try:
-                yield self.func(*self.func_args, **self.func_kwargs)
-            except Exception as ex:
-                msg = f"Exception raised during iteration: {ex}"
-                log.exception(msg)
-            if self.timeout <= (time.time() - self.start_time):
-                raise self.timeout_exc_cls(*self.timeout_exc_args)
-            log.info("Going to sleep for %d seconds before next iteration", self.sleep)
-            time.sleep(self.sleep)
+        try:
+            while True:
+                self._check_cancelled()
+                self.last_sample_time = time.time()
+                if self.timeout <= (self.last_sample_time - self.start_time):
+                    self.record_stats("timeouts")
+                    raise self.timeout_exc_cls(*self.timeout_exc_args)
+                success, result = self._sample()
+                if success:
+                    yield result
+                self._check_timeout()
+                self._sleep(self.next_sleep())
+        finally:
+            # e.g. the caller stopped the iteration after the expected value
+            self.record_stats()
+
+    async def __aiter__(self):
+        """
+        Async variant of the sampling, func may be a coroutine function
+        """
+        if self.start_time is None:
+            self.start_time = time.time()
+        try:
+            while True:
+                self._check_cancelled()
+                self.last_sample_time = time.time()
+                if self.timeout <= (self.last_sample_time - self.start_time):
+                    self.record_stats("timeouts")
+                    raise self.timeout_exc_cls(*self.timeout_exc_args)
+                self.stats["samples"] += 1
+                try:
+                    result = self.func(*self.func_args, **self.func_kwargs)
+                    if asyncio.iscoroutine(result):
+                        result = await result
+                except Exception as ex:
+                    self.stats["failures"] += 1
+                    self._log_error(ex)
+                else:
+                    yield result
+                self._check_timeout()
+                interval = self.next_sleep()
+                self.stats["slept"] += interval
+                await asyncio.sleep(interval)
+        finally:
+            self.record_stats()
+
+    def wait_for_condition(self, predicate):
+        """
+        Sample the func till its result meets the condition
+
+        Args:
+            predicate (function): called with every result of func, returns
+                True when the condition is met
+
+        Returns:
+            The first result of func which meets the condition
+
+        Raises:
+            timeout_exc_cls: In case the condition isn't met in time
+            SamplingCancelled: In case the cancel_event was set
+
+        """
+        for value in self:
+            if predicate(value):
+                self.stats["time_to_condition"] = time.time() - self.start_time
+                return value
+
+    async def async_wait_for_condition(self, predicate):
+        """
+        Async variant of wait_for_condition
+        """
+        async for value in self:
+            if predicate(value):
+                self.stats["time_to_condition"] = time.time() - self.start_time
+                return value
 
     def wait_for_func_value(self, value):
         """
@@ -1551,45 +1762,55 @@ def parse_pgsql_logs(data):
     match = data.split("PGBench Results")
     list_data = []
     for i in range(2, len(match)):
-        log = "".join(match[i].split("\n"))
-        pgsql_data = dict()
-        pgsql_data[i - 1] = {}
-        clients = re.search(r"scaling_factor\':\s+(\d+),", log)
-        if clients and clients.group(1):
-            pgsql_data[i - 1]["scaling_factor"] = clients.group(1)
-        clients = re.search(r"number_of_clients\':\s+(\d+),", log)
-        if clients and clients.group(1):
-            pgsql_data[i - 1]["num_clients"] = clients.group(1)
-        threads = re.search(r"number_of_threads\':\s+(\d+)", log)
-        if threads and threads.group(1):
-            pgsql_data[i - 1]["num_threads"] = threads.group(1)
-        clients = re.search(r"number_of_transactions_per_client\':\s+(\d+),", log)
-        if clients and clients.group(1):
-            pgsql_data[i - 1]["number_of_transactions_per_client"] = clients.group(1)
-        clients = re.search(
-            r"number_of_transactions_actually_processed\':\s+(\d+),", log
-        )
-        if clients and clients.group(1):
-            pgsql_data[i - 1][
-                "number_of_transactions_actually_processed"
-            ] = clients.group(1)
-        lat_avg = re.search(r"latency_average_ms\':\s+(\d+)", log)
-        if lat_avg and lat_avg.group(1):
-            pgsql_data[i - 1]["latency_avg"] = lat_avg.group(1)
-        lat_stddev = re.search(r"latency_stddev_ms\':\s+(\d+)", log)
-        if lat_stddev and lat_stddev.group(1):
-            pgsql_data[i - 1]["lat_stddev"] = lat_stddev.group(1)
-        tps_incl = re.search(r"tps_incl_con_est\':\s+(\w+)", log)
-        if tps_incl and tps_incl.group(1):
-            pgsql_data[i - 1]["tps_incl"] = tps_incl.group(1)
-        tps_excl = re.search(r"tps_excl_con_est\':\s+(\w+)", log)
-        if tps_excl and tps_excl.group(1):
-            pgsql_data[i - 1]["tps_excl"] = tps_excl.group(1)
-        list_data.append(pgsql_data)
-
+        list_data.append({i - 1: parse_pgsql_result(match[i])})
     return list_data
 
 
+def parse_pgsql_result(data):
+    """
+    Parse the log of one pgsql benchmark run from ripsaw, the text following
+    'PGBench Results'
+
+    Args:
+        data (str): log data of the run
+
+    Returns:
+        dict: e.g. {'num_clients': '2','num_threads': '7','latency_avg': '7',
+            'lat_stddev': '0', 'tps_incl': '234', 'tps_excl': '243'}
+
+    """
+    log = "".join(data.split("\n"))
+    pgsql_data = dict()
+    clients = re.search(r"scaling_factor\':\s+(\d+),", log)
+    if clients and clients.group(1):
+        pgsql_data["scaling_factor"] = clients.group(1)
+    clients = re.search(r"number_of_clients\':\s+(\d+),", log)
+    if clients and clients.group(1):
+        pgsql_data["num_clients"] = clients.group(1)
+    threads = re.search(r"number_of_threads\':\s+(\d+)", log)
+    if threads and threads.group(1):
+        pgsql_data["num_threads"] = threads.group(1)
+    clients = re.search(r"number_of_transactions_per_client\':\s+(\d+),", log)
+    if clients and clients.group(1):
+        pgsql_data["number_of_transactions_per_client"] = clients.group(1)
+    clients = re.search(r"number_of_transactions_actually_processed\':\s+(\d+),", log)
+    if clients and clients.group(1):
+        pgsql_data["number_of_transactions_actually_processed"] = clients.group(1)
+    lat_avg = re.search(r"latency_average_ms\':\s+(\d+)", log)
+    if lat_avg and lat_avg.group(1):
+        pgsql_data["latency_avg"] = lat_avg.group(1)
+    lat_stddev = re.search(r"latency_stddev_ms\':\s+(\d+)", log)
+    if lat_stddev and lat_stddev.group(1):
+        pgsql_data["lat_stddev"] = lat_stddev.group(1)
+    tps_incl = re.search(r"tps_incl_con_est\':\s+(\w+)", log)
+    if tps_incl and tps_incl.group(1):
+        pgsql_data["tps_incl"] = tps_incl.group(1)
+    tps_excl = re.search(r"tps_excl_con_est\':\s+(\w+)", log)
+    if tps_excl and tps_excl.group(1):
+        pgsql_data["tps_excl"] = tps_excl.group(1)
+    return pgsql_data
+
+
 def create_directory_path(path):
     """
     Creates directory if path doesn't exists
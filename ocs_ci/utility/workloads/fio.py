@@ -7,38 +7,57 @@ This module implements few functions::
     setup(): for setting up fio utility on the pod and any necessary
         environmental params.
     run(): for running fio on pod on specified mount point
+    run_detached(): for starting fio in background on pod, its results are
+        collected by the fio harvester
 
 Note: The above mentioned functions will be invoked from Workload.setup()
 and Workload.run() methods along with user provided parameters.
 """
 import logging
+import time
+import uuid
 from time import sleep
 
 from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.fio_harvester import DetachedFio, get_fio_harvester
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.workloads.helpers import find_distro, DISTROS
+from ocs_ci.utility.workloads.provisioning import get_workload_provisioner
 
 log = logging.getLogger(__name__)
 
+# seconds detached fio may run over its timeout, e.g. laying out the files
+# before the time based runtime starts
+DETACHED_MARGIN = 120
+# polls of the harvester which may miss the finished fio before its deadline
+DETACHED_HARVEST_POLLS = 3
+
+
+def _has_fio(io_pod):
+    """
+    Returns:
+        bool: True if fio is present in the pod
+    """
+    try:
+        io_pod.exec_cmd_on_pod("fio --version", out_yaml_format=False)
+    except CommandFailed:
+        return False
+    return True
+
 
 # Adding retry here to make this more stable for dpkg lock issues and network
 # issues when installing some packages.
 @retry(CommandFailed, tries=10, delay=10, backoff=1)
-def setup(**kwargs):
+def install(io_pod):
     """
-    setup fio workload
+    Install fio in the pod with its package manager
 
     Args:
-        **kwargs (dict): fio setup configuration.
-            At this point in time only argument present in kwargs will be
-            'pod' on which we want to setup. In future if we move to
-            containerized fio then pod.yaml will be presented in kwargs.
+        io_pod (Pod): app pod object
 
     Returns:
-        bool: True if setup succeeds else False
+        str: output of the installation
     """
-    io_pod = kwargs["pod"]
-    # For first cut doing simple fio install
     distro = find_distro(io_pod)
     pkg_mgr = DISTROS[distro]
 
@@ -52,20 +71,30 @@ def setup(**kwargs):
     return io_pod.exec_cmd_on_pod(cmd, out_yaml_format=False)
 
 
-def run(**kwargs):
+def setup(**kwargs):
     """
-    Run fio with params from kwargs.
-    Default parameter list can be found in
-    templates/workloads/fio/workload_io.yaml and user can update the
-    dict as per the requirement.
+    setup fio workload, fio is installed only when it's not present in the
+    pod already (see ocs_ci.utility.workloads.provisioning)
 
     Args:
-        kwargs (dict): IO params for fio
+        **kwargs (dict): fio setup configuration.
+            At this point in time only argument present in kwargs will be
+            'pod' on which we want to setup. In future if we move to
+            containerized fio then pod.yaml will be presented in kwargs.
 
-    Result:
-        result of command
+    Returns:
+        bool: True if setup succeeds else False
+    """
+    io_pod = kwargs["pod"]
+    return get_workload_provisioner().provision(io_pod, "fio", _has_fio, install)
+
+
+def _fio_command(kwargs):
+    """
+    Returns:
+        tuple: fio command with the params from kwargs (str), timeout of
+            the command (int)
     """
-    io_pod = kwargs.pop("pod")
     st_type = kwargs.pop("type")
     path = kwargs.pop("path")
     timeout = 600  # default timeout for the FIO test
@@ -85,6 +114,66 @@ def run(**kwargs):
             timeout = v  # for FIO with longer runtime, change the timeout
     fio_cmd = fio_cmd + args
     fio_cmd += " --output-format=json"
+    return fio_cmd, timeout
+
+
+def run(**kwargs):
+    """
+    Run fio with params from kwargs.
+    Default parameter list can be found in
+    templates/workloads/fio/workload_io.yaml and user can update the
+    dict as per the requirement.
+
+    Args:
+        kwargs (dict): IO params for fio
+
+    Result:
+        result of command
+    """
+    io_pod = kwargs.pop("pod")
+    fio_cmd, timeout = _fio_command(kwargs)
     log.info(f"Running cmd: {fio_cmd}")
 
     return io_pod.exec_cmd_on_pod(fio_cmd, out_yaml_format=False, timeout=timeout)
+
+
+def run_detached(**kwargs):
+    """
+    Start fio with params from kwargs in background in the pod, its json
+    output is written to a file in the pod and collected by the fio
+    harvester (see ocs_ci.ocs.fio_harvester).
+
+    Args:
+        kwargs (dict): IO params for fio
+
+    Returns:
+        Future: resolved with the fio output when fio finishes
+
+    """
+    io_pod = kwargs.pop("pod")
+    time_based = kwargs.get("time_based") and kwargs.get("runtime")
+    fio_cmd, timeout = _fio_command(kwargs)
+    name = f"/tmp/fio-{uuid.uuid4().hex[:8]}"
+    output_file, rc_file = f"{name}.json", f"{name}.rc"
+    # the inner shell writes the return code when fio finishes, $? is
+    # escaped from the outer one
+    fio_cmd += f" --output={output_file}"
+    command = (
+        f"sh -c 'nohup sh -c \"{fio_cmd} > {name}.log 2>&1; "
+        f"echo \\$? > {rc_file}\" > /dev/null 2>&1 &'"
+    )
+    log.info(f"Starting detached fio on pod {io_pod.name}: {fio_cmd}")
+    harvester = get_fio_harvester()
+    start = time.time()
+    io_pod.exec_cmd_on_pod(command, out_yaml_format=False)
+    # the timeout equals the runtime of long time based fio, which is the
+    # earliest time it finishes
+    grace = DETACHED_MARGIN + DETACHED_HARVEST_POLLS * harvester.interval
+    detached = DetachedFio(
+        io_pod,
+        output_file,
+        rc_file,
+        deadline=start + timeout + grace,
+        not_before=start + time_based if time_based else 0,
+    )
+    return harvester.add(detached)
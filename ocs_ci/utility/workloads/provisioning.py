@@ -0,0 +1,172 @@
+"""
+Provisioning of the workload tools in the app pods, installed only when missing
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from ocs_ci.framework import config
+
+
+log = logging.getLogger(__name__)
+
+SETUP_TIMES_FILE = "workload_setup_times.json"
+
+_provisioner = None
+_provisioner_lock = threading.Lock()
+
+
+def get_container_info(pod):
+    """
+    Get identity of the container of the pod, which changes when the
+    container is restarted (and loses the installed packages)
+
+    Args:
+        pod (Pod): the pod
+
+    Returns:
+        tuple: image of the container, id of the container (the uid of the pod
+            when the status isn't known)
+
+    """
+    pod_data = getattr(pod, "pod_data", None) or {}
+    containers = pod_data.get("spec", {}).get("containers") or [{}]
+    statuses = pod_data.get("status", {}).get("containerStatuses") or [{}]
+    container_id = statuses[0].get("containerID") or (
+        pod_data.get("metadata", {}).get("uid") or pod.name
+    )
+    return containers[0].get("image"), container_id
+
+
+class WorkloadProvisioner(object):
+    """
+    Cache of the pods and images ready for the workloads
+    """
+
+    def __init__(self, images=None):
+        """
+        Initializer function
+
+        Args:
+            images (dict): workload name to the list of images containing it,
+                e.g. {'fio': ['quay.io/ocsci/nginx-fio:latest']}
+
+        """
+        # (workload, image) of the images containing the workload
+        self._images = {
+            (workload, image)
+            for workload, workload_images in (images or {}).items()
+            for image in workload_images
+        }
+        # (workload, container id) of the ready containers
+        self._containers = set()
+        self.setup_times = OrderedDict()
+        self._lock = threading.Lock()
+
+    def provision(self, pod, workload, probe, install):
+        """
+        Make the workload ready in the pod, the pods with a container which
+        got the workload already or with an image known to contain it are
+        ready without any command, otherwise the workload is probed and
+        installed only when it's missing
+
+        Args:
+            pod (Pod): the pod
+            workload (str): name of the workload, e.g. 'fio'
+            probe (function): called with the pod, returns True if the
+                workload is present in it
+            install (function): called with the pod, installs the workload,
+                returns False or raises an exception on failure
+
+        Returns:
+            bool: True if the workload is ready
+
+        """
+        start = time.time()
+        image, container_id = get_container_info(pod)
+        with self._lock:
+            if (workload, container_id) in self._containers:
+                method = "cached"
+            elif image and (workload, image) in self._images:
+                method = "image"
+            else:
+                method = None
+        if method is None:
+            if probe(pod):
+                method = "probe"
+            elif install(pod):
+                method = "install"
+            else:
+                log.error(f"Failed to install {workload} on pod {pod.name}")
+                return False
+        seconds = time.time() - start
+        with self._lock:
+            self._containers.add((workload, container_id))
+            self.setup_times[f"{pod.name}/{workload}"] = {
+                "seconds": round(seconds, 3),
+                "method": method,
+                "image": image,
+            }
+        log.info(f"{workload} ready on pod {pod.name} in {seconds:.1f}s ({method})")
+        return True
+
+    def write_setup_times(self, path):
+        """
+        Write the setup times of the pods
+
+        Args:
+            path (str): path of the json file
+
+        Returns:
+            bool: True if written, False when there are no setup times
+
+        """
+        with self._lock:
+            setup_times = dict(self.setup_times)
+        if not setup_times:
+            return False
+        methods = {}
+        for setup_time in setup_times.values():
+            methods[setup_time["method"]] = methods.get(setup_time["method"], 0) + 1
+        log.info(f"Workload setup of {len(setup_times)} pods: {methods}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as setup_times_file:
+            json.dump(setup_times, setup_times_file, indent=2)
+        return True
+
+
+def get_workload_provisioner():
+    """
+    Returns:
+        WorkloadProvisioner: the shared provisioner, created on the first call
+    """
+    global _provisioner
+    with _provisioner_lock:
+        if _provisioner is None:
+            images = {
+                workload: list(workload_images)
+                for workload, workload_images in (
+                    config.RUN.get("workload_images") or {}
+                ).items()
+            }
+            if config.RUN.get("io_pod_image"):
+                images.setdefault("fio", []).append(config.RUN["io_pod_image"])
+            _provisioner = WorkloadProvisioner(images)
+        return _provisioner
+
+
+def report_setup_times(log_dir):
+    """
+    Write the setup times of the shared provisioner, if it's used
+
+    Args:
+        log_dir (str): directory of the json file
+
+    """
+    with _provisioner_lock:
+        provisioner = _provisioner
+    if provisioner is not None:
+        provisioner.write_setup_times(os.path.join(log_dir, SETUP_TIMES_FILE))
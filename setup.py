@@ -71,6 +71,7 @@ setup(
         "console_scripts": [
             "run-ci=ocs_ci.framework.main:main",
             "report-version=ocs_ci.ocs.version:main",
+            "perf-compare=ocs_ci.ocs.perf_store:main",
             "ci-cleanup=ocs_ci.cleanup.aws.cleanup:cluster_cleanup",
             "ci-pause=ocs_ci.pause.pause:cluster_pause",
             "aws-cleanup=ocs_ci.cleanup.aws.cleanup:aws_cleanup",
@@ -2,12 +2,10 @@ import logging
 import os
 import random
 import time
-import tempfile
 import threading
 from concurrent.futures.thread import ThreadPoolExecutor
 from datetime import datetime
 from math import floor
-from shutil import copyfile
 from functools import partial
 
 from botocore.exceptions import ClientError
@@ -33,6 +31,7 @@ from ocs_ci.ocs.exceptions import (
 from ocs_ci.ocs.mcg_workload import mcg_job_factory as mcg_job_factory_implementation
 from ocs_ci.ocs.node import get_node_objs, schedule_nodes
 from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resource_cache import stop_resource_cache
 from ocs_ci.ocs.resources import pvc
 from ocs_ci.ocs.utils import setup_ceph_toolbox, collect_ocs_logs
 from ocs_ci.ocs.resources.backingstore import (
@@ -60,6 +59,7 @@ from ocs_ci.ocs.resources.pod import (
     Pod,
 )
 from ocs_ci.ocs.resources.pvc import PVC, create_restore_pvc
+from ocs_ci.ocs.teardown import TeardownEngine
 from ocs_ci.ocs.version import get_ocs_version, report_ocs_version
 from ocs_ci.ocs.cluster_load import ClusterLoad, wrap_msg
 from ocs_ci.utility import aws
@@ -77,6 +77,7 @@ from ocs_ci.utility.utils import (
     ceph_health_check,
     ceph_health_check_base,
     get_running_ocp_version,
+    get_sampler_stats,
     get_openshift_client,
     get_system_architecture,
     get_testrun_name,
@@ -91,6 +92,11 @@ from ocs_ci.utility.utils import (
 from ocs_ci.helpers import helpers
 from ocs_ci.helpers.helpers import create_unique_resource_name
 from ocs_ci.ocs.bucket_utils import get_rgw_restart_counts
+from ocs_ci.ocs.ceph_sampler import stop_ceph_sampler
+from ocs_ci.ocs.node_metrics import (
+    start_node_metrics_collector,
+    stop_node_metrics_collector,
+)
 from ocs_ci.ocs.pgsql import Postgresql
 from ocs_ci.ocs.resources.rgw import RGW
 from ocs_ci.ocs.jenkins import Jenkins
@@ -640,6 +646,12 @@ def pvc_factory_fixture(request, project_factory):
         """
         Delete the PVC
         """
+        if config.RUN.get("bulk_teardown"):
+            engine = TeardownEngine()
+            engine.add_resources(instances)
+            engine.run()
+            return
+
         pv_objs = []
 
         # Get PV form PVC instances and delete PVCs
@@ -777,6 +789,12 @@ def pod_factory_fixture(request, pvc_factory):
         """
         Delete the Pod or the DeploymentConfig
         """
+        if config.RUN.get("bulk_teardown"):
+            engine = TeardownEngine()
+            engine.add_resources(instances)
+            engine.run()
+            return
+
         for instance in instances:
             instance.delete()
             instance.ocp.wait_for_delete(instance.name)
@@ -828,6 +846,12 @@ def teardown_factory_fixture(request):
         """
         Delete the resources created in the test
         """
+        if config.RUN.get("bulk_teardown"):
+            engine = TeardownEngine()
+            engine.add_resources(instances)
+            engine.run()
+            return
+
         for instance in instances[::-1]:
             if not instance.is_deleted:
                 reclaim_policy = (
@@ -1024,6 +1048,60 @@ def additional_testsuite_properties(record_testsuite_property, pytestconfig):
         record_testsuite_property("logs-url", logs_url)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def resource_cache_stats(record_testsuite_property):
+    """
+    Stop informers of the session resource cache at the end of the session
+    and report its hit/miss counters
+    """
+    yield
+    stats = stop_resource_cache()
+    if not stats:
+        return
+    for key, counters in sorted(stats.items()):
+        log.info(f"Resource cache of {key}: {counters}")
+    hits = sum(counters.get("hits", 0) for counters in stats.values())
+    misses = sum(counters.get("misses", 0) for counters in stats.values())
+    record_testsuite_property("resource-cache-hits", hits)
+    record_testsuite_property("resource-cache-misses", misses)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def sampler_stats(record_testsuite_property):
+    """
+    Report statistics of the TimeoutSampler waits at the end of the session
+    """
+    yield
+    stats = get_sampler_stats()
+    if not stats:
+        return
+    slowest = sorted(stats.items(), key=lambda item: -item[1]["seconds"])[:10]
+    for name, counters in slowest:
+        log.info(f"TimeoutSampler waits of {name}: {counters}")
+    record_testsuite_property(
+        "sampler-samples", sum(counters["samples"] for counters in stats.values())
+    )
+    record_testsuite_property(
+        "sampler-timeouts", sum(counters["timeouts"] for counters in stats.values())
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ceph_status_sampler(record_testsuite_property):
+    """
+    Stop the background Ceph status sampler at the end of the session and
+    dump its snapshots to the log directory
+    """
+    yield
+    sampler = stop_ceph_sampler(
+        dump_path=os.path.join(ocsci_log_path(), "ceph_status_samples.json.gz")
+    )
+    if sampler is None:
+        return
+    record_testsuite_property("ceph-sampler-snapshots", len(sampler.samples))
+    record_testsuite_property("ceph-sampler-errors", sampler.errors)
+
+
 @pytest.fixture(scope="session")
 def tier_marks_name():
     """
@@ -1516,10 +1594,11 @@ def multi_pvc_factory_fixture(project_factory, pvc_factory):
 @pytest.fixture(scope="function")
 def memory_leak_function(request):
     """
-    Function to start Memory leak thread which will be executed parallel with test run
-    Memory leak data will be captured in all worker nodes for ceph-osd process
-    Data will be appended in /tmp/(worker)-top-output.txt file for each worker
-    During teardown created tmp files will be deleted
+    Function to start collection of node metrics which will be executed
+    parallel with test run. RSS and CPU of ceph-osd (and other Ceph daemons)
+    are sampled by agents running on all worker nodes, the samples are
+    written to node-metrics.ndjson in the log directory.
+    During teardown the agents are deleted.
 
     Usage:
         test_case(.., memory_leak_function):
@@ -1534,72 +1613,15 @@ def memory_leak_function(request):
 
     def finalizer():
         """
-        Finalizer to stop memory leak data capture thread and cleanup the files
+        Finalizer to stop the node metrics collection
         """
-        set_flag_status("terminated")
-        try:
-            for status in TimeoutSampler(90, 3, get_flag_status):
-                if status == "terminated":
-                    break
-        except TimeoutExpiredError:
-            log.warning(
-                "Background test execution still in progress before"
-                "memory leak thread terminated"
-            )
-        if thread:
-            thread.join()
-        log_path = ocsci_log_path()
-        for worker in node.get_worker_nodes():
-            if os.path.exists(f"/tmp/{worker}-top-output.txt"):
-                copyfile(
-                    f"/tmp/{worker}-top-output.txt",
-                    f"{log_path}/{worker}-top-output.txt",
-                )
-                os.remove(f"/tmp/{worker}-top-output.txt")
+        stop_node_metrics_collector()
         log.info("Memory leak capture has stopped")
 
     request.addfinalizer(finalizer)
 
-    temp_file = tempfile.NamedTemporaryFile(
-        mode="w+", prefix="test_status", delete=False
-    )
-
-    def get_flag_status():
-        with open(temp_file.name, "r") as t_file:
-            return t_file.readline()
-
-    def set_flag_status(value):
-        with open(temp_file.name, "w") as t_file:
-            t_file.writelines(value)
-
-    set_flag_status("running")
-
-    def run_memory_leak_in_bg():
-        """
-        Function to run memory leak in background thread
-        Memory leak data is written in below format
-        date time PID USER PR NI VIRT RES SHR S %CPU %MEM TIME+ COMMAND
-        """
-        oc = ocp.OCP(namespace=config.ENV_DATA["cluster_namespace"])
-        while get_flag_status() == "running":
-            for worker in node.get_worker_nodes():
-                filename = f"/tmp/{worker}-top-output.txt"
-                top_cmd = f"debug nodes/{worker} -- chroot /host top -n 2 b"
-                with open("/tmp/file.txt", "w+") as temp:
-                    temp.write(
-                        str(oc.exec_oc_cmd(command=top_cmd, out_yaml_format=False))
-                    )
-                    temp.seek(0)
-                    for line in temp:
-                        if line.__contains__("ceph-osd"):
-                            with open(filename, "a+") as f:
-                                f.write(str(datetime.now()))
-                                f.write(" ")
-                                f.write(line)
-
     log.info("Start memory leak data capture in the test background")
-    thread = threading.Thread(target=run_memory_leak_in_bg)
-    thread.start()
+    start_node_metrics_collector()
 
 
 @pytest.fixture()
@@ -418,6 +418,7 @@ class TestFIOBenchmark(PASTest):
         self.copy_es_data(es)
 
         full_results.analyze_results()  # Analyze the results
+        full_results.store_write()  # Write the results to the local store
 
         # Writing the analyzed test results to the Elastic-Search server
         if self.main_es is not None:
@@ -520,6 +521,7 @@ class TestFIOBenchmark(PASTest):
             )
         else:
             log.info(f"The compression ratio is {ratio}%")
+        full_results.store_write()  # Write the results to the local store
 
         # Writing the analyzed test results to the Elastic-Search server
         if self.main_es is not None:
@@ -7,6 +7,7 @@ from ocs_ci.framework.testlib import performance, E2ETest
 from ocs_ci.helpers import helpers
 from ocs_ci.ocs import constants, node
 from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.perf_store import record_results
 
 log = logging.getLogger(__name__)
 
@@ -134,6 +135,11 @@ class TestPVCCreationPerformance(E2ETest):
         )
         end_time = time.time()
         total_time = end_time - start_time
+        record_results(
+            "pod-reattach-time",
+            {"reattach_time": total_time},
+            params={"interface": self.interface, "kernel_copies": copies},
+        )
         if total_time > 60:
             raise ex.PerformanceException(
                 f"Pod creation time is {total_time} and " f"greater than 60 seconds"
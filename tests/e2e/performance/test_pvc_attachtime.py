@@ -4,6 +4,7 @@ from ocs_ci.ocs import constants
 import ocs_ci.ocs.exceptions as ex
 from ocs_ci.framework.testlib import E2ETest, performance
 from ocs_ci.helpers.helpers import pod_start_time
+from ocs_ci.ocs.perf_store import record_results
 
 log = logging.getLogger(__name__)
 
@@ -40,13 +41,18 @@ class TestPodStartTime(E2ETest):
         pod_obj = pod_factory(pvc=pvc_obj)
         return pod_obj
 
-    def test_pod_start_time(self, pod):
+    def test_pod_start_time(self, interface, pod):
         """
         Test to log pod start time
         """
         start_time_dict = pod_start_time(pod)
         start_time = start_time_dict["web-server"]
         logging.info(f"pod start time: {start_time} seconds")
+        record_results(
+            "pod-start-time",
+            {"start_time": start_time},
+            params={"interface": interface, "pvc_size": self.pvc_size},
+        )
         if start_time > 30:
             raise ex.PerformanceException(
                 f"pod start time is {start_time}," f"which is greater than 30 seconds"
@@ -9,6 +9,7 @@ import pytest
 from ocs_ci.framework.testlib import performance, E2ETest
 from ocs_ci.helpers import helpers, performance_lib
 from ocs_ci.ocs import constants, scale_lib
+from ocs_ci.ocs.perf_store import record_results
 from ocs_ci.ocs.resources import pvc
 from ocs_ci.ocs.resources.objectconfigfile import ObjectConfFile
 
@@ -126,6 +127,15 @@ class TestBulkCloneCreation(E2ETest):
             f"Total creation time = {total_time} secs, data size = {total_files_size} MB, speed = {speed} MB/sec "
             f"for {self.interface} clone in bulk of {pvc_count} clones."
         )
+        record_results(
+            "pvc-bulk-clone-performance",
+            {"create": {"time": total_time, "speed": speed}},
+            params={
+                "interface": self.interface,
+                "clones": pvc_count,
+                "pvc_size": "5Gi",
+            },
+        )
 
     def run_fio_on_pvcs(self, pvc_dict_list, pod_factory):
         total_files_size = 0
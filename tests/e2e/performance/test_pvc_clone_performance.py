@@ -7,6 +7,7 @@ import pytest
 
 from ocs_ci.ocs import constants
 from ocs_ci.framework.testlib import skipif_ocs_version, performance, E2ETest
+from ocs_ci.ocs.perf_store import record_results
 from ocs_ci.ocs.resources import pvc
 from ocs_ci.helpers import helpers, performance_lib
 from ocs_ci.utility.utils import convert_device_size
@@ -202,4 +203,24 @@ class TestPVCSingleClonePerformance(E2ETest):
                 f"Clone number {d['clone_num']} deletion speed is {d['speed']} MB/sec for {pvc_size} GB pvc."
             )
 
+        # every clone is a sample of the times and speeds
+        record_results(
+            "pvc-clone-performance",
+            {
+                action: {
+                    metric: [measure[metric] for measure in measures]
+                    for metric in ("time", "speed")
+                }
+                for action, measures in (
+                    ("create", clone_creation_measures),
+                    ("delete", clone_deletion_measures),
+                )
+            },
+            params={
+                "interface": interface_type,
+                "pvc_size": pvc_size,
+                "file_size": file_size,
+            },
+        )
+
         logger.info("test_clones_creation_performance finished successfully.")
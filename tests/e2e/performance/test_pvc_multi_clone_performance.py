@@ -16,6 +16,7 @@ from ocs_ci.framework.testlib import (
 )
 from ocs_ci.ocs import constants, exceptions
 from ocs_ci.ocs.cluster import CephCluster
+from ocs_ci.ocs.perf_store import record_results
 from ocs_ci.ocs.resources import pod
 from ocs_ci.utility.utils import ocsci_log_path
 
@@ -130,6 +131,20 @@ class TestPvcMultiClonePerformance(E2ETest):
             log.info(
                 f"Clone number {r['Clone Num']} creation speed is {r['speed']} MB/sec."
             )
+        # every clone is a sample of the times and speeds
+        record_results(
+            "pvc-multi-clone-performance",
+            {
+                "create": {
+                    metric: [r[metric] for r in results] for metric in ("time", "speed")
+                }
+            },
+            params={
+                "interface": self.interface,
+                "clones": num_of_clones,
+                "pvc_size": pvc_size,
+            },
+        )
 
     def build_params(self):
         log.info("Start building params")
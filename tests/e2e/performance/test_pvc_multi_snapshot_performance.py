@@ -1,9 +1,11 @@
+import ast
 import os
 import logging
 import subprocess
 
 from ocs_ci.ocs import constants, exceptions
 from ocs_ci.ocs.cluster import CephCluster
+from ocs_ci.ocs.perf_store import record_results
 from ocs_ci.utility.utils import ocsci_log_path
 from ocs_ci.framework.testlib import (
     skipif_ocs_version,
@@ -117,4 +119,23 @@ class TestPvcMultiSnapshotPerformance(E2ETest):
             log.error("Test did not completed")
             raise Exception("Test did not completed")
 
+        # the main script prints the list of the results of the snapshots
+        for line in result.stdout.decode("utf-8").splitlines():
+            if line.startswith("All results are : "):
+                results = ast.literal_eval(line[len("All results are : ") :])
+        # every snapshot is a sample of the times and speeds
+        record_results(
+            "pvc-multi-snapshot-performance",
+            {
+                "create": {
+                    metric: [r[metric] for r in results] for metric in ("time", "speed")
+                }
+            },
+            params={
+                "interface": self.interface,
+                "snapshots": num_of_snaps,
+                "pvc_size": pvc_size,
+            },
+        )
+
         # TODO: push all results to elasticsearch server
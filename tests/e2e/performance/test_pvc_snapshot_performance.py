@@ -15,6 +15,7 @@ from ocs_ci.ocs.utils import get_pod_name_by_pattern
 from ocs_ci.ocs.ripsaw import RipSaw
 from ocs_ci.ocs.version import get_environment_info
 from ocs_ci.ocs.cluster import CephCluster
+from ocs_ci.ocs.perf_store import record_results
 from ocs_ci.ocs.resources import pod, pvc
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.helpers import helpers
@@ -335,6 +336,18 @@ class TestPvcSnapshotPerformance(E2ETest):
         log.info(
             f" Average snapshot restore speed is {r_speed / self.tests_numbers} MiB/sec"
         )
+        # every test phase is a sample of the times and speeds
+        record_results(
+            "pvc-snapshot-performance",
+            {
+                action: {
+                    metric: [tst[action][metric] for tst in all_results]
+                    for metric in ("time", "speed")
+                }
+                for action in ("create", "restore")
+            },
+            params={"interface": self.interface, "pvc_size": pvc_size},
+        )
 
     @pytest.mark.parametrize(
         argnames=["file_size", "files", "threads", "interface"],
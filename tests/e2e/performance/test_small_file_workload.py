@@ -446,6 +446,7 @@ class TestSmallFileWorkload(PASTest):
                 full_results.init_full_results()
                 full_results.aggregate_host_results()
                 test_status = full_results.aggregate_samples_results()
+                full_results.store_write(results=full_results.results["full-res"])
                 full_results.es_write()
 
                 # Creating full link to the results on the ES server
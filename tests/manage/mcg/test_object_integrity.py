@@ -9,6 +9,7 @@ from ocs_ci.ocs.bucket_utils import (
     sync_object_directory,
     craft_s3_command,
     verify_s3_object_integrity,
+    verify_s3_objects_integrity,
     retrieve_anon_s3_resource,
 )
 from ocs_ci.framework.pytest_customization.marks import skipif_openshift_dedicated
@@ -79,12 +80,12 @@ class TestObjectIntegrity(MCGTest):
         sync_object_directory(awscli_pod, full_object_path, result_dir, mcg_obj)
 
         # Checksum is compared between original and result object
-        for obj in downloaded_files:
-            assert verify_s3_object_integrity(
-                original_object_path=f"{original_dir}/{obj}",
-                result_object_path=f"{result_dir}/{obj}",
-                awscli_pod=awscli_pod,
-            ), "Checksum comparison between original and result object failed"
+        assert verify_s3_objects_integrity(
+            original_dir=original_dir,
+            result_dir=result_dir,
+            object_names=downloaded_files,
+            awscli_pod=awscli_pod,
+        ), "Checksum comparison between original and result object failed"
 
     @pytest.mark.parametrize(
         argnames="amount,file_type",
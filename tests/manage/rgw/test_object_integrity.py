@@ -4,7 +4,7 @@ import pytest
 from ocs_ci.ocs.bucket_utils import (
     retrieve_test_objects_to_pod,
     sync_object_directory,
-    verify_s3_object_integrity,
+    verify_s3_objects_integrity,
 )
 
 from ocs_ci.framework.testlib import ManageTest, tier1, tier2
@@ -40,12 +40,12 @@ class TestObjectIntegrity(ManageTest):
         sync_object_directory(awscli_pod, full_object_path, result_dir, obc_obj)
 
         # Checksum is compared between original and result object
-        for obj in downloaded_files:
-            assert verify_s3_object_integrity(
-                original_object_path=f"{original_dir}/{obj}",
-                result_object_path=f"{result_dir}/{obj}",
-                awscli_pod=awscli_pod,
-            ), "Checksum comparision between original and result object failed"
+        assert verify_s3_objects_integrity(
+            original_dir=original_dir,
+            result_dir=result_dir,
+            object_names=downloaded_files,
+            awscli_pod=awscli_pod,
+        ), "Checksum comparision between original and result object failed"
 
     @pytest.mark.polarion_id("OCS-2243")
     @tier2